@@ -0,0 +1,9 @@
+const aquaDb = db.getSiblingDB("db");
+
+const addVersions = collection => console.log(collection.updateMany(
+    {version: {$exists: false}},
+    {$set: {version: 0}},
+));
+
+addVersions(aquaDb.users);
+addVersions(aquaDb.days);
@@ -0,0 +1,16 @@
+const aquaDb = db.getSiblingDB("db");
+
+const moveArray = (arrayName, collectionName) => aquaDb.users.aggregate([
+    {$match: {[arrayName]: {$exists: true}}},
+    {$unwind: `$${arrayName}`},
+    {$replaceWith: {$mergeObjects: [`$${arrayName}`, {user_id: "$_id"}]}},
+    {$merge: {into: collectionName, on: "_id", whenMatched: "keepExisting"}},
+])
+
+moveArray("days", "days");
+moveArray("records", "records");
+
+console.log(aquaDb.users.updateMany(
+    {},
+    {$unset: {days: "", records: ""}},
+));
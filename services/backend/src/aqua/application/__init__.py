@@ -1,3 +1,7 @@
+from aqua.application import analytics as analytics
+from aqua.application import archive as archive
 from aqua.application import cases as cases
 from aqua.application import output as output
 from aqua.application import ports as ports
+from aqua.application import retries as retries
+from aqua.application import rollups as rollups
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from datetime import date
+from statistics import quantiles
+from typing import Sequence
+
+
+glass_percentile = 90
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Analytics:
+    good_day_streak: int
+    average_milliliters_by_weekday: tuple[int, ...]
+    glass_percentile_milliliters: int | None
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class HistoryColumns:
+    day_ordinals: Sequence[int]
+    day_milliliters: Sequence[int]
+    good_day_flags: Sequence[int]
+    record_milliliters: Sequence[int]
+
+
+def analytics_of(columns: HistoryColumns, *, today: date) -> Analytics:
+    return Analytics(
+        good_day_streak=good_day_streak_of(columns, today=today),
+        average_milliliters_by_weekday=average_milliliters_by_weekday_of(
+            columns
+        ),
+        glass_percentile_milliliters=glass_percentile_milliliters_of(columns),
+    )
+
+
+def good_day_streak_of(columns: HistoryColumns, *, today: date) -> int:
+    ordinals = columns.day_ordinals
+    good_day_flags = columns.good_day_flags
+    today_ordinal = today.toordinal()
+    index = len(ordinals) - 1
+
+    if (
+        index >= 0
+        and ordinals[index] == today_ordinal
+        and not good_day_flags[index]
+    ):
+        index -= 1
+
+    if index >= 0 and ordinals[index] == today_ordinal:
+        expected_ordinal = today_ordinal
+    else:
+        expected_ordinal = today_ordinal - 1
+
+    streak = 0
+
+    while (
+        index >= 0
+        and ordinals[index] == expected_ordinal
+        and good_day_flags[index]
+    ):
+        streak += 1
+        index -= 1
+        expected_ordinal -= 1
+
+    return streak
+
+
+def average_milliliters_by_weekday_of(
+    columns: HistoryColumns,
+) -> tuple[int, ...]:
+    milliliters_by_weekday = [0] * 7
+    day_counts_by_weekday = [0] * 7
+
+    for ordinal, milliliters in zip(
+        columns.day_ordinals, columns.day_milliliters, strict=True
+    ):
+        weekday = (ordinal - 1) % 7
+        milliliters_by_weekday[weekday] += milliliters
+        day_counts_by_weekday[weekday] += 1
+
+    return tuple(
+        milliliters // day_count if day_count else 0
+        for milliliters, day_count in zip(
+            milliliters_by_weekday, day_counts_by_weekday, strict=True
+        )
+    )
+
+
+def glass_percentile_milliliters_of(columns: HistoryColumns) -> int | None:
+    record_milliliters = columns.record_milliliters
+
+    if not record_milliliters:
+        return None
+
+    if len(record_milliliters) == 1:
+        return record_milliliters[0]
+
+    percentiles = quantiles(record_milliliters, n=100, method="inclusive")
+
+    return round(percentiles[glass_percentile - 1])
@@ -0,0 +1,5 @@
+from datetime import date, timedelta
+
+
+def archive_horizon_date_of(current_date: date, *, horizon_days: int) -> date:
+    return current_date - timedelta(days=horizon_days)
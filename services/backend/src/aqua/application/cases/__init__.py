@@ -1,5 +1,15 @@
 from aqua.application.cases import cancel_record as cancel_record
 from aqua.application.cases import register_user as register_user
+from aqua.application.cases import view_analytics as view_analytics
 from aqua.application.cases import view_day as view_day
+from aqua.application.cases import view_days as view_days
+from aqua.application.cases import view_history as view_history
+from aqua.application.cases import view_ledger as view_ledger
+from aqua.application.cases import view_records as view_records
+from aqua.application.cases import view_rollup as view_rollup
 from aqua.application.cases import view_user as view_user
+from aqua.application.cases import (
+    write_coalesced_water as write_coalesced_water,
+)
 from aqua.application.cases import write_water as write_water
+from aqua.application.cases import write_water_batch as write_water_batch
@@ -9,10 +9,13 @@ from aqua.application.output.output_effect import output_effect
 from aqua.application.ports import loggers, repos, views
 from aqua.application.ports.mappers import (
     DayMapperTo,
+    LedgerMapperTo,
     RecordMapperTo,
+    RollupMapperTo,
     UserMapperTo,
 )
 from aqua.application.ports.transactions import TransactionFor
+from aqua.application.retries import RetryMetrics, retried
 from aqua.domain.framework.effects.searchable import SearchableEffect
 from aqua.domain.framework.fp.env import Env
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
@@ -38,9 +41,12 @@ async def cancel_record[UsersT: repos.Users, ViewT](
     users: UsersT,
     transaction_for: TransactionFor[UsersT],
     logger: loggers.Logger,
+    retry_metrics: RetryMetrics,
     user_mapper_to: UserMapperTo[UsersT],
     day_mapper_to: DayMapperTo[UsersT],
     record_mapper_to: RecordMapperTo[UsersT],
+    rollup_mapper_to: RollupMapperTo[UsersT],
+    ledger_mapper_to: LedgerMapperTo[UsersT],
 ) -> AsyncIterator[
     Result[
         ViewT,
@@ -52,30 +58,46 @@ async def cancel_record[UsersT: repos.Users, ViewT](
         ),
     ]
 ]:
-    async with transaction_for(users):
-        user = await users.user_with_id(user_id)
+    async def attempt() -> Result[
+        ViewT,
+        (
+            NoUserError
+            | NoRecordToCancelError
+            | CancelledRecordToCancelError
+            | NoRecordDayToCancelError
+        ),
+    ]:
+        async with transaction_for(users):
+            user = await users.user_with_record(user_id, record_id=record_id)
 
-        if not user:
-            yield Err(NoUserError())
-            return
+            if not user:
+                return Err(NoUserError())
 
-        effect = SearchableEffect()
-        result = user.cancel_record(record_id=record_id, effect=effect)
+            effect = SearchableEffect()
+            result = user.cancel_record(record_id=record_id, effect=effect)
 
-        match result:
-            case Err(Env(RecordContext(record), NoRecordDayToCancelError())):
-                await logger.log_record_without_day(record)
+            match result:
+                case Err(
+                    Env(RecordContext(record), NoRecordDayToCancelError())
+                ):
+                    await logger.log_record_without_day(record)
 
-        await result.map_async(
-            lambda _: output_effect(
-                effect,
-                user_mapper=user_mapper_to(users),
-                day_mapper=day_mapper_to(users),
-                record_mapper=record_mapper_to(users),
-                logger=logger,
+            await result.map_async(
+                lambda _: output_effect(
+                    effect,
+                    user_mapper=user_mapper_to(users),
+                    day_mapper=day_mapper_to(users),
+                    record_mapper=record_mapper_to(users),
+                    rollup_mapper=rollup_mapper_to(users),
+                    ledger_mapper=ledger_mapper_to(users),
+                    logger=logger,
+                )
             )
-        )
 
-        yield result.map(
-            lambda output: view_of(user=user, output=output)
-        ).map_err(lambda env: env.value)
+            return result.map(
+                lambda output: view_of(user=user, output=output)
+            ).map_err(lambda env: env.value)
+
+    yield await retried(
+        attempt, user_id=user_id, logger=logger, metrics=retry_metrics
+    )
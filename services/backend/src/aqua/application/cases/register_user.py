@@ -9,10 +9,13 @@ from aqua.application.output.output_effect import output_effect
 from aqua.application.ports import loggers, repos, views
 from aqua.application.ports.mappers import (
     DayMapperTo,
+    LedgerMapperTo,
     RecordMapperTo,
+    RollupMapperTo,
     UserMapperTo,
 )
 from aqua.application.ports.transactions import TransactionFor
+from aqua.application.retries import RetryMetrics, retried
 from aqua.domain.framework.effects.searchable import SearchableEffect
 from aqua.domain.framework.fp.result import ErrList, OkList, rlist
 from aqua.domain.model.access.entities.user import User as AccessUser
@@ -53,9 +56,12 @@ async def register_user[UsersT: repos.Users, ViewT](
     users: UsersT,
     transaction_for: TransactionFor[UsersT],
     logger: loggers.Logger,
+    retry_metrics: RetryMetrics,
     user_mapper_to: UserMapperTo[UsersT],
     day_mapper_to: DayMapperTo[UsersT],
     record_mapper_to: RecordMapperTo[UsersT],
+    rollup_mapper_to: RollupMapperTo[UsersT],
+    ledger_mapper_to: LedgerMapperTo[UsersT],
 ) -> AsyncIterator[
     Result[
         ViewT,
@@ -106,32 +112,44 @@ async def register_user[UsersT: repos.Users, ViewT](
         case OkList(list_):
             target, glass, weight = list_
 
-    effect = SearchableEffect()
-
-    async with transaction_for(users):
-        user = await users.user_with_id(user_id)
-
-        if user is not None:
-            await logger.log_registered_user_registration(user)
-            yield Ok(view_of(user))
-            return
-
-        user_result = User.translated_from(
-            AccessUser(id=user_id, events=list()),
-            weight=weight,
-            glass=glass,
-            target=target,
-            effect=effect,
-        )
+    async def attempt() -> Result[
+        ViewT,
+        (
+            ExtremeWeightForSuitableWaterBalanceError
+            | NoWeightForSuitableWaterBalanceError
+        ),
+    ]:
+        effect = SearchableEffect()
+
+        async with transaction_for(users):
+            user = await users.user_without_history(user_id)
+
+            if user is not None:
+                await logger.log_registered_user_registration(user)
+                return Ok(view_of(user))
+
+            user_result = User.translated_from(
+                AccessUser(id=user_id, events=list()),
+                weight=weight,
+                glass=glass,
+                target=target,
+                effect=effect,
+            )
 
-        await user_result.map_async(
-            lambda _: output_effect(
-                effect,
-                user_mapper=user_mapper_to(users),
-                day_mapper=day_mapper_to(users),
-                record_mapper=record_mapper_to(users),
-                logger=logger,
+            await user_result.map_async(
+                lambda _: output_effect(
+                    effect,
+                    user_mapper=user_mapper_to(users),
+                    day_mapper=day_mapper_to(users),
+                    record_mapper=record_mapper_to(users),
+                    rollup_mapper=rollup_mapper_to(users),
+                    ledger_mapper=ledger_mapper_to(users),
+                    logger=logger,
+                )
             )
-        )
 
-        yield user_result.map(lambda user: view_of(user))
+            return user_result.map(lambda user: view_of(user))
+
+    yield await retried(
+        attempt, user_id=user_id, logger=logger, metrics=retry_metrics
+    )
@@ -0,0 +1,14 @@
+from datetime import date
+from uuid import UUID
+
+from aqua.application.ports import repos, views
+
+
+async def view_analytics[UsersT: repos.Users, ViewT](
+    user_id: UUID,
+    today: date,
+    *,
+    view_from: views.AnalyticsViewFrom[UsersT, ViewT],
+    users: UsersT,
+) -> ViewT:
+    return await view_from(users, user_id=user_id, today=today)
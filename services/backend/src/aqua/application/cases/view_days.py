@@ -0,0 +1,16 @@
+from datetime import date
+from typing import AsyncIterator
+from uuid import UUID
+
+from aqua.application.ports import repos, views
+
+
+def view_days[UsersT: repos.Users, ViewT](
+    user_id: UUID,
+    from_: date,
+    to: date,
+    *,
+    view_from: views.DaysViewFrom[UsersT, ViewT],
+    users: UsersT,
+) -> AsyncIterator[ViewT]:
+    return view_from(users, user_id=user_id, from_=from_, to=to)
@@ -0,0 +1,13 @@
+from typing import AsyncIterator
+from uuid import UUID
+
+from aqua.application.ports import repos, views
+
+
+def view_history[UsersT: repos.Users, ViewT](
+    user_id: UUID,
+    *,
+    view_from: views.HistoryViewFrom[UsersT, ViewT],
+    users: UsersT,
+) -> AsyncIterator[ViewT]:
+    return view_from(users, user_id=user_id)
@@ -0,0 +1,15 @@
+from datetime import date
+from uuid import UUID
+
+from aqua.application.ports import repos, views
+
+
+async def view_ledger[UsersT: repos.Users, ViewT](
+    user_id: UUID,
+    from_: date,
+    to: date,
+    *,
+    view_from: views.LedgerViewFrom[UsersT, ViewT],
+    users: UsersT,
+) -> ViewT:
+    return await view_from(users, user_id=user_id, from_=from_, to=to)
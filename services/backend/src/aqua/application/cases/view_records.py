@@ -0,0 +1,21 @@
+from uuid import UUID
+
+from aqua.application.ports import repos, views
+
+
+async def view_records[UsersT: repos.Users, CursorT, ViewT](
+    user_id: UUID,
+    *,
+    after: CursorT | None,
+    limit: int,
+    is_cancelled_hidden: bool,
+    view_from: views.RecordsViewFrom[UsersT, CursorT, ViewT],
+    users: UsersT,
+) -> ViewT:
+    return await view_from(
+        users,
+        user_id=user_id,
+        after=after,
+        limit=limit,
+        is_cancelled_hidden=is_cancelled_hidden,
+    )
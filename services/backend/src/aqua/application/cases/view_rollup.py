@@ -0,0 +1,16 @@
+from datetime import date
+from uuid import UUID
+
+from aqua.application.ports import repos, views
+from aqua.application.rollups import Period
+
+
+async def view_rollup[UsersT: repos.Users, ViewT](
+    user_id: UUID,
+    date_: date,
+    *,
+    period: Period,
+    view_from: views.RollupViewFrom[UsersT, ViewT],
+    users: UsersT,
+) -> ViewT:
+    return await view_from(users, user_id=user_id, period=period, date_=date_)
@@ -0,0 +1,97 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import AsyncIterator, Sequence
+from uuid import UUID
+
+from result import Err, Ok, Result
+
+from aqua.application.output.output_effect import output_effect
+from aqua.application.ports import loggers, repos, views
+from aqua.application.ports.mappers import (
+    DayMapperTo,
+    LedgerMapperTo,
+    RecordMapperTo,
+    RollupMapperTo,
+    UserMapperTo,
+)
+from aqua.application.ports.transactions import TransactionFor
+from aqua.application.retries import RetryMetrics, retried
+from aqua.domain.framework.effects.searchable import SearchableEffect
+from aqua.domain.model.primitives.vos.time import Time
+from aqua.domain.model.primitives.vos.water import (
+    NegativeWaterAmountError,
+    Water,
+)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class NoUserError: ...
+
+
+@asynccontextmanager
+async def write_coalesced_water[UsersT: repos.Users, ViewT](
+    user_id: UUID,
+    milliliters_of_writes: Sequence[int | None],
+    *,
+    view_of: views.WritingViewOf[ViewT],
+    users: UsersT,
+    transaction_for: TransactionFor[UsersT],
+    logger: loggers.Logger,
+    retry_metrics: RetryMetrics,
+    user_mapper_to: UserMapperTo[UsersT],
+    day_mapper_to: DayMapperTo[UsersT],
+    record_mapper_to: RecordMapperTo[UsersT],
+    rollup_mapper_to: RollupMapperTo[UsersT],
+    ledger_mapper_to: LedgerMapperTo[UsersT],
+) -> AsyncIterator[
+    Result[tuple[ViewT, ...], NoUserError | NegativeWaterAmountError]
+]:
+    current_time = Time.with_(datetime_=datetime.now(UTC)).unwrap()
+    waters = list[Water | None]()
+
+    for milliliters in milliliters_of_writes:
+        if milliliters is None:
+            waters.append(None)
+            continue
+
+        match Water.with_(milliliters=milliliters):
+            case Ok(water):
+                waters.append(water)
+            case Err(_) as result:
+                yield result
+                return
+
+    async def attempt() -> Result[tuple[ViewT, ...], NoUserError]:
+        async with transaction_for(users):
+            user = await users.user_with_day(
+                user_id, date_=current_time.datetime_.date()
+            )
+
+            if user is None:
+                return Err(NoUserError())
+
+            effect = SearchableEffect()
+            written_views = list[ViewT]()
+
+            for water in waters:
+                output = user.write_water(
+                    water, current_time=current_time, effect=effect
+                )
+                written_views.append(view_of(user=user, output=output))
+
+            await output_effect(
+                effect,
+                user_mapper=user_mapper_to(users),
+                day_mapper=day_mapper_to(users),
+                record_mapper=record_mapper_to(users),
+                rollup_mapper=rollup_mapper_to(users),
+                ledger_mapper=ledger_mapper_to(users),
+                logger=logger,
+            )
+
+            return Ok(tuple(written_views))
+
+    yield await retried(
+        attempt, user_id=user_id, logger=logger, metrics=retry_metrics
+    )
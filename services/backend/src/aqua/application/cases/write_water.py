@@ -10,10 +10,13 @@ from aqua.application.output.output_effect import output_effect
 from aqua.application.ports import loggers, repos, views
 from aqua.application.ports.mappers import (
     DayMapperTo,
+    LedgerMapperTo,
     RecordMapperTo,
+    RollupMapperTo,
     UserMapperTo,
 )
 from aqua.application.ports.transactions import TransactionFor
+from aqua.application.retries import RetryMetrics, retried
 from aqua.domain.framework.effects.searchable import SearchableEffect
 from aqua.domain.model.primitives.vos.time import Time
 from aqua.domain.model.primitives.vos.water import (
@@ -35,9 +38,12 @@ async def write_water[UsersT: repos.Users, ViewT](
     users: UsersT,
     transaction_for: TransactionFor[UsersT],
     logger: loggers.Logger,
+    retry_metrics: RetryMetrics,
     user_mapper_to: UserMapperTo[UsersT],
     day_mapper_to: DayMapperTo[UsersT],
     record_mapper_to: RecordMapperTo[UsersT],
+    rollup_mapper_to: RollupMapperTo[UsersT],
+    ledger_mapper_to: LedgerMapperTo[UsersT],
 ) -> AsyncIterator[Result[ViewT, NoUserError | NegativeWaterAmountError]]:
     current_time = Time.with_(datetime_=datetime.now(UTC)).unwrap()
 
@@ -51,24 +57,32 @@ async def write_water[UsersT: repos.Users, ViewT](
                 yield result
                 return
 
-    async with transaction_for(users):
-        user = await users.user_with_id(user_id)
+    async def attempt() -> Result[ViewT, NoUserError]:
+        async with transaction_for(users):
+            user = await users.user_with_day(
+                user_id, date_=current_time.datetime_.date()
+            )
 
-        if user is None:
-            yield Err(NoUserError())
-            return
+            if user is None:
+                return Err(NoUserError())
 
-        effect = SearchableEffect()
-        output = user.write_water(
-            water, current_time=current_time, effect=effect
-        )
+            effect = SearchableEffect()
+            output = user.write_water(
+                water, current_time=current_time, effect=effect
+            )
 
-        await output_effect(
-            effect,
-            user_mapper=user_mapper_to(users),
-            day_mapper=day_mapper_to(users),
-            record_mapper=record_mapper_to(users),
-            logger=logger,
-        )
+            await output_effect(
+                effect,
+                user_mapper=user_mapper_to(users),
+                day_mapper=day_mapper_to(users),
+                record_mapper=record_mapper_to(users),
+                rollup_mapper=rollup_mapper_to(users),
+                ledger_mapper=ledger_mapper_to(users),
+                logger=logger,
+            )
 
-        yield Ok(view_of(user=user, output=output))
+            return Ok(view_of(user=user, output=output))
+
+    yield await retried(
+        attempt, user_id=user_id, logger=logger, metrics=retry_metrics
+    )
@@ -0,0 +1,139 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from typing import AsyncIterator, Iterable
+from uuid import UUID
+
+from result import Err, Ok, Result
+
+from aqua.application.archive import archive_horizon_date_of
+from aqua.application.output.output_effect import output_effect
+from aqua.application.ports import loggers, repos, views
+from aqua.application.ports.mappers import (
+    DayMapperTo,
+    LedgerMapperTo,
+    RecordMapperTo,
+    RollupMapperTo,
+    UserMapperTo,
+)
+from aqua.application.ports.transactions import TransactionFor
+from aqua.application.retries import RetryMetrics, retried
+from aqua.domain.framework.effects.searchable import SearchableEffect
+from aqua.domain.model.core.aggregates.user.root import WaterEntry
+from aqua.domain.model.primitives.vos.time import NotUTCTimeError, Time
+from aqua.domain.model.primitives.vos.water import (
+    NegativeWaterAmountError,
+    Water,
+)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class NoUserError: ...
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class FutureRecordingTimeError: ...
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class ArchivedRecordingTimeError: ...
+
+
+type EntryError = (
+    NegativeWaterAmountError
+    | NotUTCTimeError
+    | FutureRecordingTimeError
+    | ArchivedRecordingTimeError
+)
+
+
+@asynccontextmanager
+async def write_water_batch[UsersT: repos.Users, ViewT](
+    user_id: UUID,
+    raw_entries: Iterable[tuple[int, datetime]],
+    *,
+    view_of: views.BatchWritingViewOf[ViewT],
+    users: UsersT,
+    transaction_for: TransactionFor[UsersT],
+    logger: loggers.Logger,
+    retry_metrics: RetryMetrics,
+    user_mapper_to: UserMapperTo[UsersT],
+    day_mapper_to: DayMapperTo[UsersT],
+    record_mapper_to: RecordMapperTo[UsersT],
+    rollup_mapper_to: RollupMapperTo[UsersT],
+    ledger_mapper_to: LedgerMapperTo[UsersT],
+    archive_horizon_days: int,
+) -> AsyncIterator[Result[ViewT, NoUserError | EntryError]]:
+    current_time = Time.with_(datetime_=datetime.now(UTC)).unwrap()
+    horizon_date = archive_horizon_date_of(
+        current_time.datetime_.date(), horizon_days=archive_horizon_days
+    )
+    entries = list[WaterEntry]()
+
+    for milliliters, recording_datetime in raw_entries:
+        match _entry_of(
+            milliliters,
+            recording_datetime,
+            current_time=current_time,
+            horizon_date=horizon_date,
+        ):
+            case Ok(entry):
+                entries.append(entry)
+            case Err(_) as result:
+                yield result
+                return
+
+    dates = {entry.recording_time.datetime_.date() for entry in entries}
+
+    async def attempt() -> Result[ViewT, NoUserError]:
+        async with transaction_for(users):
+            user = await users.user_with_days(user_id, dates=dates)
+
+            if user is None:
+                return Err(NoUserError())
+
+            effect = SearchableEffect()
+            output = user.write_water_batch(entries, effect=effect)
+
+            await output_effect(
+                effect,
+                user_mapper=user_mapper_to(users),
+                day_mapper=day_mapper_to(users),
+                record_mapper=record_mapper_to(users),
+                rollup_mapper=rollup_mapper_to(users),
+                ledger_mapper=ledger_mapper_to(users),
+                logger=logger,
+            )
+
+            return Ok(view_of(user=user, output=output))
+
+    yield await retried(
+        attempt, user_id=user_id, logger=logger, metrics=retry_metrics
+    )
+
+
+def _entry_of(
+    milliliters: int,
+    recording_datetime: datetime,
+    *,
+    current_time: Time,
+    horizon_date: date,
+) -> Result[WaterEntry, EntryError]:
+    water_result = Water.with_(milliliters=milliliters)
+    time_result = Time.with_(datetime_=recording_datetime)
+
+    match water_result, time_result:
+        case Err(_) as result, _:
+            return result
+        case _, Err(_) as result:
+            return result
+        case Ok(water), Ok(recording_time):
+            pass
+
+    if recording_time.datetime_ > current_time.datetime_:
+        return Err(FutureRecordingTimeError())
+
+    if recording_time.datetime_.date() < horizon_date:
+        return Err(ArchivedRecordingTimeError())
+
+    return Ok(WaterEntry(water=water, recording_time=recording_time))
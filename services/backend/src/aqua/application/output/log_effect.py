@@ -13,17 +13,19 @@ from aqua.domain.model.core.aggregates.user.root import (
 
 
 async def log_effect(effect: SearchableEffect, logger: Logger) -> None:
-    translated_users = effect.entities_that(User).with_event(
-        TranslatedFromAccess
+    translated_users = effect.entities_that(
+        User, with_event=TranslatedFromAccess
     )
 
-    days = effect.entities_that(Day)
-    created_days = days.with_event(Created)
-    mutated_days = days.with_event(Mutated).without_event(Created)
+    created_days = effect.entities_that(Day, with_event=Created)
+    mutated_days = effect.entities_that(
+        Day, with_event=Mutated, without_event=Created
+    )
 
-    records = effect.entities_that(Record)
-    created_records = records.with_event(Created)
-    cancelled_records = records.with_event(Cancelled).without_event(Created)
+    created_records = effect.entities_that(Record, with_event=Created)
+    cancelled_records = effect.entities_that(
+        Record, with_event=Cancelled, without_event=Created
+    )
 
     for translated_user in translated_users:
         await logger.log_registered_user(translated_user)
@@ -1,4 +1,11 @@
-from aqua.application.ports.mappers import DayMapper, RecordMapper, UserMapper
+from aqua.application.ports.mappers import (
+    DayMapper,
+    LedgerMapper,
+    RecordMapper,
+    RollupMapper,
+    UserMapper,
+)
+from aqua.application.rollups import day_changes_of
 from aqua.domain.framework.effects.searchable import SearchableEffect
 from aqua.domain.framework.entity import Created, Mutated
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
@@ -17,18 +24,26 @@ async def map_effect(
     user_mapper: UserMapper,
     day_mapper: DayMapper,
     record_mapper: RecordMapper,
+    rollup_mapper: RollupMapper,
+    ledger_mapper: LedgerMapper,
 ) -> None:
-    translated_users = effect.entities_that(User).with_event(
-        TranslatedFromAccess
+    translated_users = effect.entities_that(
+        User, with_event=TranslatedFromAccess
     )
     await user_mapper.add_all(translated_users)
 
-    days = effect.entities_that(Day)
-    await day_mapper.add_all(days.with_event(Created))
-    await day_mapper.update_all(days.with_event(Mutated).without_event(Created))
+    await day_mapper.add_all(effect.entities_that(Day, with_event=Created))
+    await day_mapper.update_all(
+        effect.entities_that(Day, with_event=Mutated, without_event=Created)
+    )
 
-    records = effect.entities_that(Record)
-    await record_mapper.add_all(records.with_event(Created))
+    await record_mapper.add_all(
+        effect.entities_that(Record, with_event=Created)
+    )
     await record_mapper.update_all(
-        records.with_event(Mutated).without_event(Created)
+        effect.entities_that(Record, with_event=Mutated, without_event=Created)
     )
+
+    day_changes = tuple(day_changes_of(effect))
+    await rollup_mapper.add_all(day_changes)
+    await ledger_mapper.add_all(day_changes)
@@ -1,7 +1,13 @@
 from aqua.application.output.log_effect import log_effect
 from aqua.application.output.map_effect import map_effect
 from aqua.application.ports.loggers import Logger
-from aqua.application.ports.mappers import DayMapper, RecordMapper, UserMapper
+from aqua.application.ports.mappers import (
+    DayMapper,
+    LedgerMapper,
+    RecordMapper,
+    RollupMapper,
+    UserMapper,
+)
 from aqua.domain.framework.effects.searchable import SearchableEffect
 
 
@@ -11,12 +17,16 @@ async def output_effect(
     user_mapper: UserMapper,
     day_mapper: DayMapper,
     record_mapper: RecordMapper,
+    rollup_mapper: RollupMapper,
+    ledger_mapper: LedgerMapper,
     logger: Logger,
 ) -> None:
-    await log_effect(effect, logger)
     await map_effect(
         effect,
         user_mapper=user_mapper,
         day_mapper=day_mapper,
         record_mapper=record_mapper,
+        rollup_mapper=rollup_mapper,
+        ledger_mapper=ledger_mapper,
     )
+    await log_effect(effect, logger)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from uuid import UUID
 
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
@@ -28,3 +29,8 @@ class Logger(ABC):
 
     @abstractmethod
     async def log_record_cancellation(self, *, record: Record) -> None: ...
+
+    @abstractmethod
+    async def log_conflict_retry(
+        self, *, user_id: UUID, attempt_number: int
+    ) -> None: ...
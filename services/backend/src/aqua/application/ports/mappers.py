@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Iterable
 
 from aqua.application.ports.repos import Users
+from aqua.application.rollups import DayChange
 from aqua.domain.framework.fp.act import Act
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
@@ -10,6 +11,12 @@ from aqua.domain.model.core.aggregates.user.internal.entities.record import (
 from aqua.domain.model.core.aggregates.user.root import User
 
 
+class ConflictError(Exception): ...
+
+
+class ArchivedDayError(Exception): ...
+
+
 class DayMapper(ABC):
     @abstractmethod
     async def add_all(self, days: Iterable[Day]) -> None: ...
@@ -31,6 +38,16 @@ class UserMapper(ABC):
     async def add_all(self, users: Iterable[User]) -> None: ...
 
 
+class RollupMapper(ABC):
+    @abstractmethod
+    async def add_all(self, day_changes: Iterable[DayChange]) -> None: ...
+
+
+class LedgerMapper(ABC):
+    @abstractmethod
+    async def add_all(self, day_changes: Iterable[DayChange]) -> None: ...
+
+
 class UserMapperTo[UsersT: Users](Act[UsersT, UserMapper]): ...
 
 
@@ -38,3 +55,9 @@ class RecordMapperTo[UsersT: Users](Act[UsersT, RecordMapper]): ...
 
 
 class DayMapperTo[UsersT: Users](Act[UsersT, DayMapper]): ...
+
+
+class RollupMapperTo[UsersT: Users](Act[UsersT, RollupMapper]): ...
+
+
+class LedgerMapperTo[UsersT: Users](Act[UsersT, LedgerMapper]): ...
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterable
 from uuid import UUID
 
 from aqua.domain.model.core.aggregates.user.root import User
@@ -7,3 +9,21 @@ from aqua.domain.model.core.aggregates.user.root import User
 class Users(ABC):
     @abstractmethod
     async def user_with_id(self, user_id: UUID) -> User | None: ...
+
+    @abstractmethod
+    async def user_with_day(
+        self, user_id: UUID, *, date_: date
+    ) -> User | None: ...
+
+    @abstractmethod
+    async def user_with_days(
+        self, user_id: UUID, *, dates: Iterable[date]
+    ) -> User | None: ...
+
+    @abstractmethod
+    async def user_with_record(
+        self, user_id: UUID, *, record_id: UUID
+    ) -> User | None: ...
+
+    @abstractmethod
+    async def user_without_history(self, user_id: UUID) -> User | None: ...
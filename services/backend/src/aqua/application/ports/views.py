@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from datetime import date
+from typing import AsyncIterator
 from uuid import UUID
 
 from aqua.application.ports.repos import Users
+from aqua.application.rollups import Period
 from aqua.domain.model.core.aggregates.user.root import (
+    BatchWritingOutput,
     CancellationOutput,
     User,
     WritingOutput,
@@ -24,11 +27,64 @@ class DayViewFrom[UsersT: Users, ViewT](ABC):
     ) -> ViewT: ...
 
 
+class DaysViewFrom[UsersT: Users, ViewT](ABC):
+    @abstractmethod
+    def __call__(
+        self, users: UsersT, *, user_id: UUID, from_: date, to: date
+    ) -> AsyncIterator[ViewT]: ...
+
+
+class HistoryViewFrom[UsersT: Users, ViewT](ABC):
+    @abstractmethod
+    def __call__(
+        self, users: UsersT, *, user_id: UUID
+    ) -> AsyncIterator[ViewT]: ...
+
+
+class RecordsViewFrom[UsersT: Users, CursorT, ViewT](ABC):
+    @abstractmethod
+    async def __call__(
+        self,
+        users: UsersT,
+        *,
+        user_id: UUID,
+        after: CursorT | None,
+        limit: int,
+        is_cancelled_hidden: bool,
+    ) -> ViewT: ...
+
+
+class RollupViewFrom[UsersT: Users, ViewT](ABC):
+    @abstractmethod
+    async def __call__(
+        self, users: UsersT, *, user_id: UUID, period: Period, date_: date
+    ) -> ViewT: ...
+
+
+class LedgerViewFrom[UsersT: Users, ViewT](ABC):
+    @abstractmethod
+    async def __call__(
+        self, users: UsersT, *, user_id: UUID, from_: date, to: date
+    ) -> ViewT: ...
+
+
+class AnalyticsViewFrom[UsersT: Users, ViewT](ABC):
+    @abstractmethod
+    async def __call__(
+        self, users: UsersT, *, user_id: UUID, today: date
+    ) -> ViewT: ...
+
+
 class WritingViewOf[ViewT](ABC):
     @abstractmethod
     def __call__(self, *, user: User, output: WritingOutput) -> ViewT: ...
 
 
+class BatchWritingViewOf[ViewT](ABC):
+    @abstractmethod
+    def __call__(self, *, user: User, output: BatchWritingOutput) -> ViewT: ...
+
+
 class CancellationViewOf[ViewT](ABC):
     @abstractmethod
     def __call__(self, *, user: User, output: CancellationOutput) -> ViewT: ...
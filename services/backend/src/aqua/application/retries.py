@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from aqua.application.ports.loggers import Logger
+from aqua.application.ports.mappers import ConflictError
+
+
+default_max_attempt_count = 5
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class RetryMetricsSnapshot:
+    retry_count: int
+    exhausted_retry_count: int
+
+
+class RetryMetrics:
+    def __init__(self) -> None:
+        self.__retry_count = 0
+        self.__exhausted_retry_count = 0
+
+    def snapshot(self) -> RetryMetricsSnapshot:
+        return RetryMetricsSnapshot(
+            retry_count=self.__retry_count,
+            exhausted_retry_count=self.__exhausted_retry_count,
+        )
+
+    def count_retry(self) -> None:
+        self.__retry_count += 1
+
+    def count_exhausted_retries(self) -> None:
+        self.__exhausted_retry_count += 1
+
+
+async def retried[ValueT](
+    attempt: Callable[[], Awaitable[ValueT]],
+    *,
+    user_id: UUID,
+    logger: Logger,
+    metrics: RetryMetrics,
+    max_attempt_count: int = default_max_attempt_count,
+) -> ValueT:
+    for attempt_number in range(1, max_attempt_count):
+        try:
+            return await attempt()
+        except ConflictError:  # noqa: PERF203
+            metrics.count_retry()
+            await logger.log_conflict_retry(
+                user_id=user_id, attempt_number=attempt_number
+            )
+
+    try:
+        return await attempt()
+    except ConflictError:
+        metrics.count_exhausted_retries()
+        raise
@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from enum import Enum, auto
+from typing import Iterable
+from uuid import UUID
+
+from aqua.domain.framework.effects.searchable import SearchableEffect
+from aqua.domain.framework.entity import Created
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Cancelled,
+    Record,
+)
+from aqua.domain.model.core.vos.target import Result, result_of
+from aqua.domain.model.core.vos.water_balance import WaterBalance
+from aqua.domain.model.primitives.vos.water import Water
+
+
+class Period(Enum):
+    week = auto()
+    month = auto()
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DayChange:
+    user_id: UUID
+    date_: date
+    water_milliliters: int
+    is_day_new: bool
+    previous_result: Result | None
+    result: Result
+
+
+def period_start_of(period: Period, date_: date) -> date:
+    match period:
+        case Period.week:
+            return date_ - timedelta(days=date_.weekday())
+        case Period.month:
+            return date_.replace(day=1)
+
+
+def day_changes_of(effect: SearchableEffect) -> tuple[DayChange, ...]:
+    created_records = tuple(effect.entities_that(Record, with_event=Created))
+    cancelled_records = tuple(
+        effect.entities_that(
+            Record, with_event=Cancelled, without_event=Created
+        )
+    )
+
+    return tuple(
+        _day_change_of(
+            day,
+            created_records=created_records,
+            cancelled_records=cancelled_records,
+        )
+        for day in effect.entities_that(Day)
+    )
+
+
+def _day_change_of(
+    day: Day,
+    *,
+    created_records: Iterable[Record],
+    cancelled_records: Iterable[Record],
+) -> DayChange:
+    if day.events_with_type(Created):
+        return DayChange(
+            user_id=day.user_id,
+            date_=day.date_,
+            water_milliliters=day.water_balance.water.milliliters,
+            is_day_new=True,
+            previous_result=None,
+            result=day.result,
+        )
+
+    water_milliliters = _milliliters_on(day, created_records) - (
+        _milliliters_on(day, cancelled_records)
+    )
+    previous_water = Water.with_(
+        milliliters=day.water_balance.water.milliliters - water_milliliters
+    ).unwrap()
+    previous_result = day.pinned_result or result_of(
+        day.target, water_balance=WaterBalance(water=previous_water)
+    )
+
+    return DayChange(
+        user_id=day.user_id,
+        date_=day.date_,
+        water_milliliters=water_milliliters,
+        is_day_new=False,
+        previous_result=previous_result,
+        result=day.result,
+    )
+
+
+def _milliliters_on(day: Day, records: Iterable[Record]) -> int:
+    return sum(
+        record.drunk_water.milliliters
+        for record in records
+        if record.user_id == day.user_id
+        and record.recording_time.datetime_.date() == day.date_
+    )
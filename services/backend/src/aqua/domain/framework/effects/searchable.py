@@ -1,26 +1,53 @@
-from typing import Iterable, cast
+from typing import Any, Iterable, cast
 
 from aqua.domain.framework.effects.base import Effect
 from aqua.domain.framework.entity import AnyEntity, Entities, FrozenEntities
 
 
 type _EntityMap = dict[type[AnyEntity], Entities[AnyEntity]]
+type _EventIndex = dict[type[AnyEntity], dict[type[Any], set[Any]]]
+type _EventTypeMap = dict[tuple[type[AnyEntity], Any], frozenset[type[Any]]]
 
 
 class SearchableEffect(Effect):
     def __init__(self, entities: Iterable[AnyEntity] = tuple()) -> None:
         self.__entity_map: _EntityMap = dict()
+        self.__event_index: _EventIndex = dict()
+        self.__event_type_map: _EventTypeMap = dict()
         self.consider(*entities)
 
     def entities_that[EntityT: AnyEntity](
-        self, entity_type: type[EntityT]
+        self,
+        entity_type: type[EntityT],
+        *,
+        with_event: type[Any] | None = None,
+        without_event: type[Any] | None = None,
     ) -> FrozenEntities[EntityT]:
         entities = self.__entities_of(entity_type)
 
         if entities is None:
             return FrozenEntities()
 
-        return FrozenEntities(entities)
+        if with_event is None and without_event is None:
+            return FrozenEntities(entities)
+
+        ids_with_event = (
+            None
+            if with_event is None
+            else self.__ids_of(entity_type, with_event)
+        )
+        ids_without_event = (
+            frozenset()
+            if without_event is None
+            else self.__ids_of(entity_type, without_event)
+        )
+
+        return FrozenEntities(
+            entity
+            for entity in entities
+            if (ids_with_event is None or entity.id in ids_with_event)
+            and entity.id not in ids_without_event
+        )
 
     def consider(self, *entities: AnyEntity) -> None:
         for entity in entities:
@@ -32,6 +59,8 @@ class SearchableEffect(Effect):
 
     def cancel(self) -> None:
         self.__entity_map = dict()
+        self.__event_index = dict()
+        self.__event_type_map = dict()
 
     def __consider_one(self, entity: AnyEntity) -> None:
         entities = self.__entities_of(type(entity))
@@ -41,6 +70,7 @@ class SearchableEffect(Effect):
             self.__entity_map[type(entity)] = entities
 
         entities.add(entity)
+        self.__index_events_of(entity)
 
     def __ignore_one(self, entity: AnyEntity) -> None:
         entities = self.__entities_of(type(entity))
@@ -49,6 +79,46 @@ class SearchableEffect(Effect):
             return
 
         entities.remove(entity)
+        self.__unindex_events_of(entity)
+
+    def __index_events_of(self, entity: AnyEntity) -> None:
+        event_types = frozenset(
+            event_type
+            for event in entity.events
+            for event_type in type(event).__mro__
+        )
+        previous_event_types = self.__event_type_map.get(
+            (type(entity), entity.id), frozenset()
+        )
+
+        if event_types == previous_event_types:
+            return
+
+        self.__unindex_events_of(entity)
+        self.__event_type_map[type(entity), entity.id] = event_types
+        index = self.__event_index.setdefault(type(entity), dict())
+
+        for event_type in event_types:
+            index.setdefault(event_type, set()).add(entity.id)
+
+    def __unindex_events_of(self, entity: AnyEntity) -> None:
+        event_types = self.__event_type_map.pop(
+            (type(entity), entity.id), frozenset()
+        )
+        index = self.__event_index.get(type(entity), dict())
+
+        for event_type in event_types:
+            index[event_type].discard(entity.id)
+
+    def __ids_of(
+        self, entity_type: type[AnyEntity], event_type: type[Any]
+    ) -> set[Any] | frozenset[Any]:
+        index = self.__event_index.get(entity_type)
+
+        if index is None:
+            return frozenset()
+
+        return index.get(event_type, frozenset())
 
     def __entities_of[EntityT: AnyEntity](
         self, entity_type: type[EntityT]
@@ -1,6 +1,5 @@
-from copy import deepcopy
-from dataclasses import dataclass, field
-from typing import Any, Iterable, Iterator, Self
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Iterable, Iterator, Self, cast
 
 from aqua.domain.framework.effects.base import Effect
 
@@ -43,11 +42,16 @@ class Entity[IDT, EventT]:
         return isinstance(other, type(self)) and self.id == other.id
 
     def without_aggregation(self) -> Self:
-        entity = deepcopy(self)
-
-        for attribute_name, attribute in entity.__dict__.items():
-            if isinstance(attribute, Entities):
-                entity.__dict__[attribute_name] = Entities()
+        entity = object.__new__(type(self))
+        entity.__dict__.update({
+            attribute_name: (
+                Entities() if isinstance(attribute, Entities) else attribute
+            )
+            for attribute_name, attribute in self.__dict__.items()
+        })
+        entity.events = [
+            _retargeted(event, from_=self, to=entity) for event in self.events
+        ]
 
         return entity
 
@@ -55,9 +59,48 @@ class Entity[IDT, EventT]:
 type AnyEntity = Entity[Any, Any]
 
 
+type Key[EntityT: AnyEntity, KeyT] = Callable[[EntityT], KeyT]
+
+
+class _Index[EntityT: AnyEntity, KeyT]:
+    def __init__(
+        self, key: Key[EntityT, KeyT], entities: Iterable[EntityT]
+    ) -> None:
+        self.__key = key
+        self.__buckets = dict[KeyT, _Map[EntityT]]()
+        self.__keys = dict[Any, KeyT]()
+
+        for entity in entities:
+            self.add(entity)
+
+    def entities_with(self, key: KeyT) -> tuple[EntityT, ...]:
+        bucket = self.__buckets.get(key)
+
+        return tuple() if bucket is None else tuple(bucket.values())
+
+    def add(self, entity: EntityT) -> None:
+        self.remove(entity)
+
+        key = self.__key(entity)
+        self.__keys[entity.id] = key
+        self.__buckets.setdefault(key, dict())[entity.id] = entity
+
+    def remove(self, entity: EntityT) -> None:
+        if entity.id not in self.__keys:
+            return
+
+        key = self.__keys.pop(entity.id)
+        bucket = self.__buckets[key]
+        del bucket[entity.id]
+
+        if not bucket:
+            del self.__buckets[key]
+
+
 class _BaseEntities[EntityT: AnyEntity]:
     def __init__(self, entities: Iterable[EntityT] = tuple()) -> None:
         self._map: _Map[EntityT] = _map_of(entities)
+        self._indexes = dict[Key[EntityT, Any], _Index[EntityT, Any]]()
 
     def __iter__(self) -> Iterator[EntityT]:
         return iter(self._map.values())
@@ -77,6 +120,20 @@ class _BaseEntities[EntityT: AnyEntity]:
     def __repr__(self) -> str:
         return f"{type(self).__name__}({list(self)})"
 
+    def with_id(self, id: Any) -> EntityT | None:  # noqa: ANN401
+        return self._map.get(id)
+
+    def with_key[KeyT](
+        self, key: Key[EntityT, KeyT], value: KeyT
+    ) -> tuple[EntityT, ...]:
+        index = self._indexes.get(key)
+
+        if index is None:
+            index = _Index(key, self)
+            self._indexes[key] = index
+
+        return index.entities_with(value)
+
     def with_event[EventT](
         self, event_type: type[EventT]
     ) -> "FrozenEntities[EntityT]":
@@ -106,10 +163,16 @@ class Entities[EntityT: AnyEntity](_BaseEntities[EntityT]):
     def add(self, entity: EntityT) -> None:
         self._map[entity.id] = entity
 
+        for index in self._indexes.values():
+            index.add(entity)
+
     def remove(self, entity: EntityT) -> None:
         if entity.id in self._map:
             del self._map[entity.id]
 
+        for index in self._indexes.values():
+            index.remove(entity)
+
 
 class FrozenEntities[EntityT: AnyEntity](_BaseEntities[EntityT]): ...
 
@@ -128,5 +191,12 @@ type SearchableEntities[EntityT: AnyEntity] = (
 type _Map[EntityT: AnyEntity] = dict[Any, EntityT]
 
 
+def _retargeted[EventT](event: EventT, *, from_: object, to: object) -> EventT:
+    if isinstance(event, Event) and event.entity is from_:
+        return cast(EventT, replace(event, entity=to))
+
+    return event
+
+
 def _map_of[EntityT: AnyEntity](entities: Iterable[EntityT]) -> _Map[EntityT]:
     return {entity.id: entity for entity in entities}
@@ -20,6 +20,15 @@ class SafeMutable:
 type Safe = SafeImmutable | SafeMutable
 
 
+def trusted_new[SafeImmutableT: SafeImmutable](
+    type_: type[SafeImmutableT],
+) -> SafeImmutableT:
+    value = object.__new__(type_)
+    object.__setattr__(value, "is_safe", True)  # noqa: PLC2801
+
+    return value
+
+
 class UnsafeValueError(Exception): ...
 
 
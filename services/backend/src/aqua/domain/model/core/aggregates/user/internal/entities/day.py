@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import date
+from typing import Iterable
 from uuid import UUID, uuid4
 
 from aqua.domain.framework.effects.base import Effect
@@ -72,7 +73,19 @@ class Day(Entity[UUID, DayEvent]):
         *,
         effect: Effect,
     ) -> None:
-        water = self.water_balance.water + record.drunk_water
+        self.take_all_into_consideration([record], effect=effect)
+
+    def take_all_into_consideration(
+        self,
+        records: Iterable[_record.Record],
+        *,
+        effect: Effect,
+    ) -> None:
+        water = self.water_balance.water
+
+        for record in records:
+            water += record.drunk_water
+
         new_water_balance = WaterBalance(water=water)
 
         if self.water_balance == new_water_balance:
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import date
 from functools import reduce
 from operator import add
 from uuid import UUID, uuid4
@@ -66,6 +67,10 @@ def cancel(
     return Ok(None)
 
 
+def recording_date_of(record: Record) -> date:
+    return record.recording_time.datetime_.date()
+
+
 def water_balance_from(*records: Record) -> WaterBalance:
     if len(records) == 0:
         return WaterBalance(water=Water.with_(milliliters=0).unwrap())
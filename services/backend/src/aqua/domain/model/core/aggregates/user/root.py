@@ -1,3 +1,4 @@
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
 from typing import Iterable
@@ -13,6 +14,7 @@ from aqua.domain.framework.entity import (
     Translated,
 )
 from aqua.domain.framework.fp.env import Env, Just, env, just
+from aqua.domain.framework.iterable import one_from
 from aqua.domain.model.access.entities.user import User as AccessUser
 from aqua.domain.model.core.aggregates.user.internal.entities import (
     day as _day,
@@ -44,6 +46,18 @@ class WritingOutput:
     day: _day.Day
 
 
+@dataclass(kw_only=True, frozen=True, slots=True)
+class WaterEntry:
+    water: Water
+    recording_time: Time
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class BatchWritingOutput:
+    new_records: tuple[_record.Record, ...]
+    days: tuple[_day.Day, ...]
+
+
 @dataclass(kw_only=True, frozen=True, slots=True)
 class CancellationOutput:
     day: _day.Day
@@ -177,7 +191,7 @@ class User(Entity[UUID, UserEvent]):
             current_time=current_time,
             effect=effect,
         )
-        previous_records = FrozenEntities(self.__records_on(current_day.date_))
+        previous_records = FrozenEntities(self.records_on(current_day.date_))
         self.records.add(new_record)
         current_day.take_into_consideration(new_record, effect=effect)
 
@@ -187,6 +201,51 @@ class User(Entity[UUID, UserEvent]):
             previous_records=previous_records,
         )
 
+    def write_water_batch(
+        self, entries: Iterable[WaterEntry], *, effect: Effect
+    ) -> BatchWritingOutput:
+        entries_by_date = defaultdict[date, list[WaterEntry]](list)
+
+        for entry in entries:
+            entries_by_date[entry.recording_time.datetime_.date()].append(entry)
+
+        new_records = list[_record.Record]()
+        days = list[_day.Day]()
+
+        for date_entries in entries_by_date.values():
+            day = self.__day_of(date_entries[0].recording_time)
+
+            if day is None:
+                day = _day.Day.create(
+                    user_id=self.id,
+                    current_time=date_entries[0].recording_time,
+                    target=self.target,
+                    effect=effect,
+                )
+                self.days.add(day)
+
+            day_records = tuple(
+                _record.Record.create(
+                    user_id=self.id,
+                    drunk_water=entry.water,
+                    current_time=entry.recording_time,
+                    effect=effect,
+                )
+                for entry in date_entries
+            )
+
+            for record in day_records:
+                self.records.add(record)
+
+            day.take_all_into_consideration(day_records, effect=effect)
+
+            new_records.extend(day_records)
+            days.append(day)
+
+        return BatchWritingOutput(
+            new_records=tuple(new_records), days=tuple(days)
+        )
+
     def cancel_record(
         self, *, record_id: UUID, effect: Effect
     ) -> Result[
@@ -217,21 +276,15 @@ class User(Entity[UUID, UserEvent]):
             lambda _: CancellationOutput(day=day, cancelled_record=record)
         )
 
-    def __day_of(self, time: Time) -> _day.Day | None:
-        for day in self.days:
-            if day.date_ == time.datetime_.date():
-                return day
-
-        return None
+    def records_on(self, date_: date) -> tuple[_record.Record, ...]:
+        return self.records.with_key(_record.recording_date_of, date_)
 
-    def __records_on(self, date_: date) -> Iterable[_record.Record]:
-        for record in self.records:
-            if record.recording_time.datetime_.date() == date_:
-                yield record
+    def __day_of(self, time: Time) -> _day.Day | None:
+        return one_from(self.days.with_key(_date_of_day, time.datetime_.date()))
 
     def __record_with(self, record_id: UUID) -> _record.Record | None:
-        for record in self.records:
-            if record.id == record_id:
-                return record
+        return self.records.with_id(record_id)
+
 
-        return None
+def _date_of_day(day: _day.Day) -> date:
+    return day.date_
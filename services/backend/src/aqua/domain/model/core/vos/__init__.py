@@ -1,3 +1,4 @@
 from aqua.domain.model.core.vos import glass as glass
+from aqua.domain.model.core.vos import ledger as ledger
 from aqua.domain.model.core.vos import target as target
 from aqua.domain.model.core.vos import water_balance as water_balance
@@ -0,0 +1,89 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import date
+
+from aqua.domain.model.primitives.vos.water import Water
+
+
+ledger_capacity = 1 << (date.max.toordinal().bit_length())
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Ledger:
+    partial_sums: Mapping[int, int] = field(default_factory=dict)
+
+    @classmethod
+    def of(cls, water_by_date: Iterable[tuple[date, Water]]) -> "Ledger":
+        partial_sums = dict[int, int]()
+
+        for date_, water in water_by_date:
+            _add(partial_sums, water.milliliters, on=date_)
+
+        return Ledger(partial_sums=partial_sums)
+
+    def with_added(self, milliliters: int, *, on: date) -> "Ledger":
+        partial_sums = dict(self.partial_sums)
+        _add(partial_sums, milliliters, on=on)
+
+        return Ledger(partial_sums=partial_sums)
+
+    def water_between(self, from_: date, to: date) -> Water:
+        if from_ > to:
+            return Water.trusted(milliliters=0)
+
+        milliliters = self.__sum_of(summed_indexes_through(to))
+        milliliters -= self.__sum_of(summed_indexes_before(from_))
+
+        return Water.trusted(milliliters=milliliters)
+
+    def average_water_between(self, from_: date, to: date) -> Water:
+        day_count = day_count_between(from_, to)
+
+        if day_count == 0:
+            return Water.trusted(milliliters=0)
+
+        milliliters = self.water_between(from_, to).milliliters // day_count
+
+        return Water.trusted(milliliters=milliliters)
+
+    def __sum_of(self, indexes: Iterable[int]) -> int:
+        return sum(self.partial_sums.get(index, 0) for index in indexes)
+
+
+def updated_indexes_of(date_: date) -> tuple[int, ...]:
+    indexes = list[int]()
+    index = date_.toordinal()
+
+    while index < ledger_capacity:
+        indexes.append(index)
+        index += index & -index
+
+    return tuple(indexes)
+
+
+def summed_indexes_through(date_: date) -> tuple[int, ...]:
+    return _prefix_indexes_of(date_.toordinal())
+
+
+def summed_indexes_before(date_: date) -> tuple[int, ...]:
+    return _prefix_indexes_of(date_.toordinal() - 1)
+
+
+def day_count_between(from_: date, to: date) -> int:
+    return max((to - from_).days + 1, 0)
+
+
+def _prefix_indexes_of(ordinal: int) -> tuple[int, ...]:
+    indexes = list[int]()
+    index = ordinal
+
+    while index > 0:
+        indexes.append(index)
+        index -= index & -index
+
+    return tuple(indexes)
+
+
+def _add(partial_sums: dict[int, int], milliliters: int, *, on: date) -> None:
+    for index in updated_indexes_of(on):
+        partial_sums[index] = partial_sums.get(index, 0) + milliliters
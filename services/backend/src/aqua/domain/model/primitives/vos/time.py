@@ -3,7 +3,7 @@ from datetime import UTC, datetime
 
 from result import Err, Ok, Result
 
-from aqua.domain.framework.safe import SafeImmutable
+from aqua.domain.framework.safe import SafeImmutable, trusted_new
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -22,3 +22,10 @@ class Time(SafeImmutable):
             return Err(NotUTCTimeError())
 
         return Ok(time)
+
+    @classmethod
+    def trusted(cls, *, datetime_: datetime) -> "Time":
+        time = trusted_new(Time)
+        object.__setattr__(time, "datetime_", datetime_)  # noqa: PLC2801
+
+        return time
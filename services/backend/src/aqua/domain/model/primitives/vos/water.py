@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from result import Err, Ok, Result
 
-from aqua.domain.framework.safe import SafeImmutable
+from aqua.domain.framework.safe import SafeImmutable, trusted_new
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -22,6 +22,13 @@ class Water(SafeImmutable):
 
         return Ok(Water(milliliters=milliliters, is_safe=True))
 
+    @classmethod
+    def trusted(cls, *, milliliters: int) -> "Water":
+        water = trusted_new(Water)
+        object.__setattr__(water, "milliliters", milliliters)  # noqa: PLC2801
+
+        return water
+
     def __add__(self, water: "Water") -> "Water":
         return Water(
             milliliters=self.milliliters + water.milliliters,
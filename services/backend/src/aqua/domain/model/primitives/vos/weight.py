@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from result import Err, Ok, Result
 
-from aqua.domain.framework.safe import SafeImmutable
+from aqua.domain.framework.safe import SafeImmutable, trusted_new
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -21,3 +21,10 @@ class Weight(SafeImmutable):
             return Err(NegativeWeightAmountError())
 
         return Ok(Weight(kilograms=kilograms, is_safe=True))
+
+    @classmethod
+    def trusted(cls, *, kilograms: int) -> "Weight":
+        weight = trusted_new(Weight)
+        object.__setattr__(weight, "kilograms", kilograms)  # noqa: PLC2801
+
+        return weight
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from uuid import UUID
 
 from aqua.application.ports import loggers
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
@@ -7,6 +8,7 @@ from aqua.domain.model.core.aggregates.user.internal.entities.record import (
 )
 from aqua.domain.model.core.aggregates.user.root import User
 from aqua.infrastructure.periphery.logs.in_memory_logs import (
+    ConflictRetryLog,
     NewDayLog,
     NewDayStateLog,
     NewRecordLog,
@@ -28,6 +30,7 @@ class InMemoryLogger(loggers.Logger):
         self.__new_day_state_logs = list[NewDayStateLog]()
         self.__new_record_logs = list[NewRecordLog]()
         self.__record_cancellation_logs = list[RecordCancellationLog]()
+        self.__conflict_retry_logs = list[ConflictRetryLog]()
 
     @property
     def is_empty(self) -> bool:
@@ -39,6 +42,7 @@ class InMemoryLogger(loggers.Logger):
             or not self.__new_day_state_logs
             or not self.__new_record_logs
             or not self.__record_cancellation_logs
+            or not self.__conflict_retry_logs
         )
 
     @property
@@ -71,6 +75,10 @@ class InMemoryLogger(loggers.Logger):
     def record_cancellation_logs(self) -> tuple[RecordCancellationLog, ...]:
         return tuple(self.__record_cancellation_logs)
 
+    @property
+    def conflict_retry_logs(self) -> tuple[ConflictRetryLog, ...]:
+        return tuple(self.__conflict_retry_logs)
+
     async def log_registered_user(self, user: User) -> None:
         log = RegistredUserLog(user=deepcopy(user))
         self.__registred_user_logs.append(log)
@@ -98,3 +106,9 @@ class InMemoryLogger(loggers.Logger):
     async def log_record_cancellation(self, *, record: Record) -> None:
         log = RecordCancellationLog(record=deepcopy(record))
         self.__record_cancellation_logs.append(log)
+
+    async def log_conflict_retry(
+        self, *, user_id: UUID, attempt_number: int
+    ) -> None:
+        log = ConflictRetryLog(user_id=user_id, attempt_number=attempt_number)
+        self.__conflict_retry_logs.append(log)
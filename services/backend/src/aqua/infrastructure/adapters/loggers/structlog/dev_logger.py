@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from aqua.application.ports import loggers
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
@@ -32,3 +34,12 @@ class StructlogDevLogger(loggers.Logger):
 
     async def log_record_cancellation(self, *, record: Record) -> None:
         await dev_logger.ainfo(logs.record_cancellation_log, record=record)
+
+    async def log_conflict_retry(
+        self, *, user_id: UUID, attempt_number: int
+    ) -> None:
+        await dev_logger.ainfo(
+            logs.conflict_retry_log,
+            user_id=user_id,
+            attempt_number=attempt_number,
+        )
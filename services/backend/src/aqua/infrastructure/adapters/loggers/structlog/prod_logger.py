@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from aqua.application.ports import loggers
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
@@ -46,3 +48,12 @@ class StructlogProdLogger(loggers.Logger):
         await prod_logger.ainfo(
             logs.record_cancellation_log, **prod_log_record_of(record)
         )
+
+    async def log_conflict_retry(
+        self, *, user_id: UUID, attempt_number: int
+    ) -> None:
+        await prod_logger.ainfo(
+            logs.conflict_retry_log,
+            user_id=user_id,
+            attempt_number=attempt_number,
+        )
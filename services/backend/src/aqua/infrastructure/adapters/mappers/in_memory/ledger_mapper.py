@@ -0,0 +1,37 @@
+from typing import Iterable
+from uuid import UUID
+
+from aqua.application.ports.mappers import LedgerMapper, LedgerMapperTo
+from aqua.application.rollups import DayChange
+from aqua.domain.model.core.vos.ledger import Ledger
+from aqua.infrastructure.adapters.repos.in_memory.users import InMemoryUsers
+
+
+class InMemoryLedgerMapper(LedgerMapper):
+    def __init__(self, ledgers: dict[UUID, Ledger]) -> None:
+        self.__ledgers = ledgers
+
+    async def add_all(self, day_changes: Iterable[DayChange]) -> None:
+        for day_change in day_changes:
+            if not day_change.water_milliliters:
+                continue
+
+            ledger = self.__ledgers.get(day_change.user_id, Ledger())
+            self.__ledgers[day_change.user_id] = ledger.with_added(
+                day_change.water_milliliters, on=day_change.date_
+            )
+
+
+class InMemoryLedgerMapperTo(LedgerMapperTo[InMemoryUsers]):
+    def __init__(self) -> None:
+        self.__ledgers = dict[UUID, Ledger]()
+
+    @property
+    def ledgers(self) -> dict[UUID, Ledger]:
+        return dict(self.__ledgers)
+
+    def __call__(
+        self,
+        in_memory_users: InMemoryUsers,
+    ) -> InMemoryLedgerMapper:
+        return InMemoryLedgerMapper(self.__ledgers)
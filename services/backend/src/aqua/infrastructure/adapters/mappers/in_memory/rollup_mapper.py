@@ -0,0 +1,28 @@
+from typing import Iterable
+
+from aqua.application.ports.mappers import RollupMapper, RollupMapperTo
+from aqua.application.rollups import DayChange
+from aqua.infrastructure.adapters.repos.in_memory.users import InMemoryUsers
+
+
+class InMemoryRollupMapper(RollupMapper):
+    def __init__(self, day_changes: list[DayChange]) -> None:
+        self.__day_changes = day_changes
+
+    async def add_all(self, day_changes: Iterable[DayChange]) -> None:
+        self.__day_changes.extend(day_changes)
+
+
+class InMemoryRollupMapperTo(RollupMapperTo[InMemoryUsers]):
+    def __init__(self) -> None:
+        self.__day_changes = list[DayChange]()
+
+    @property
+    def day_changes(self) -> tuple[DayChange, ...]:
+        return tuple(self.__day_changes)
+
+    def __call__(
+        self,
+        in_memory_users: InMemoryUsers,
+    ) -> InMemoryRollupMapper:
+        return InMemoryRollupMapper(self.__day_changes)
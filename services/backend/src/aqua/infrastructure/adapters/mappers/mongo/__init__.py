@@ -1,9 +1,15 @@
 from aqua.infrastructure.adapters.mappers.mongo import (
     day_mapper as day_mapper,
 )
+from aqua.infrastructure.adapters.mappers.mongo import (
+    ledger_mapper as ledger_mapper,
+)
 from aqua.infrastructure.adapters.mappers.mongo import (
     record_mapper as record_mapper,
 )
+from aqua.infrastructure.adapters.mappers.mongo import (
+    rollup_mapper as rollup_mapper,
+)
 from aqua.infrastructure.adapters.mappers.mongo import (
     user_mapper as user_mapper,
 )
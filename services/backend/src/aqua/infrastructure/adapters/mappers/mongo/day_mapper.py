@@ -1,15 +1,27 @@
+from datetime import UTC, datetime
 from typing import Iterable
+from uuid import UUID
 
+from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import AsyncClientSession
 
-from aqua.application.ports.mappers import DayMapper, DayMapperTo
+from aqua.application.archive import archive_horizon_date_of
+from aqua.application.ports.mappers import (
+    ArchivedDayError,
+    ConflictError,
+    DayMapper,
+    DayMapperTo,
+)
 from aqua.domain.model.core.aggregates.user.internal.entities.day import (
     Day,
 )
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.periphery.pymongo.document import Document
 from aqua.infrastructure.periphery.pymongo.operations import (
-    ArrayOperations,
+    DuplicateKeyError,
+    Operation,
+    OperationBatch,
+    RootOperations,
     execute,
 )
 from aqua.infrastructure.periphery.serializing.from_model.to_document import (
@@ -24,34 +36,81 @@ from aqua.infrastructure.periphery.serializing.from_native.to_document import (
 
 
 class MongoDayMapper(DayMapper):
-    __operations = ArrayOperations(namespace="db.users", prefix="day")
+    __operations = RootOperations(namespace="db.days")
 
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(
+        self,
+        client: AsyncMongoClient[Document],
+        *,
+        session: AsyncClientSession | None = None,
+        versions: dict[UUID, int] | None = None,
+        batch: OperationBatch | None = None,
+        archive_horizon_days: int | None = None,
+    ) -> None:
+        self.__client = client
         self.__session = session
+        self.__batch = batch
+        self.__versions = dict[UUID, int]() if versions is None else versions
+        self.__archive_horizon_days = archive_horizon_days
 
     async def add_all(self, days: Iterable[Day]) -> None:
+        days = tuple(days)
+        self.__ensure_not_archived(days)
         operations = (
-            self.__operations.to_push(self._document_of(day), id=day.user_id)
+            self.__operations.to_insert(self._document_of(day) | {"version": 0})
             for day in days
         )
 
-        await execute(
-            operations, session=self.__session, comment="push user days"
-        )
+        await self.__execute(operations, comment="add days")
+
+        for day in days:
+            self.__versions[day.id] = 0
 
     async def update_all(self, days: Iterable[Day]) -> None:
+        days = tuple(days)
+        self.__ensure_not_archived(days)
         operations = (
-            self.__operations.to_map(self._document_of(day), id=day.user_id)
+            self.__operations.to_put_versioned(
+                self._document_of(day), version=self.__versions.get(day.id)
+            )
             for day in days
         )
 
-        await execute(
-            operations, session=self.__session, comment="update user days"
+        await self.__execute(operations, comment="update days")
+
+        for day in days:
+            if day.id in self.__versions:
+                self.__versions[day.id] += 1
+
+    def __ensure_not_archived(self, days: tuple[Day, ...]) -> None:
+        if self.__archive_horizon_days is None:
+            return
+
+        horizon_date = archive_horizon_date_of(
+            datetime.now(UTC).date(), horizon_days=self.__archive_horizon_days
         )
 
+        if any(day.date_ < horizon_date for day in days):
+            raise ArchivedDayError
+
+    async def __execute(
+        self, operations: Iterable[Operation], *, comment: str
+    ) -> None:
+        try:
+            await execute(
+                operations,
+                client=self.__client,
+                session=self.__session,
+                batch=self.__batch,
+                comment=comment,
+            )
+        except DuplicateKeyError as error:
+            raise ConflictError from error
+
     def _document_of(self, day: Day) -> Document:
         return {
             "_id": day.id,
+            "user_id": day.user_id,
             "water_balance": document_water_balance_of(day.water_balance),
             "target": document_target_of(day.target),
             "date": document_date_of(day.date_),
@@ -62,5 +121,14 @@ class MongoDayMapper(DayMapper):
 
 
 class MongoDayMapperTo(DayMapperTo[MongoUsers]):
+    def __init__(self, *, archive_horizon_days: int | None = None) -> None:
+        self.__archive_horizon_days = archive_horizon_days
+
     def __call__(self, mongo_users: MongoUsers) -> MongoDayMapper:
-        return MongoDayMapper(mongo_users.session)
+        return MongoDayMapper(
+            mongo_users.client,
+            session=mongo_users.session,
+            versions=mongo_users.day_versions,
+            batch=mongo_users.operation_batch,
+            archive_horizon_days=self.__archive_horizon_days,
+        )
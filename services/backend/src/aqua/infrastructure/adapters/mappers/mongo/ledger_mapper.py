@@ -0,0 +1,62 @@
+from typing import Iterable
+
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import AsyncClientSession
+
+from aqua.application.ports.mappers import LedgerMapper, LedgerMapperTo
+from aqua.application.rollups import DayChange
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.ledgers import (
+    ledger_filter_of,
+    ledger_increments_with,
+)
+from aqua.infrastructure.periphery.pymongo.operations import (
+    OperationBatch,
+    RootOperations,
+    execute,
+)
+
+
+class MongoLedgerMapper(LedgerMapper):
+    __operations = RootOperations(namespace="db.ledgers")
+
+    def __init__(
+        self,
+        client: AsyncMongoClient[Document],
+        *,
+        session: AsyncClientSession | None = None,
+        batch: OperationBatch | None = None,
+    ) -> None:
+        self.__client = client
+        self.__session = session
+        self.__batch = batch
+
+    async def add_all(self, day_changes: Iterable[DayChange]) -> None:
+        operations = (
+            self.__operations.to_increment(
+                ledger_filter_of(user_id=day_change.user_id),
+                ledger_increments_with(
+                    milliliters=day_change.water_milliliters,
+                    date_=day_change.date_,
+                ),
+            )
+            for day_change in day_changes
+        )
+
+        await execute(
+            operations,
+            client=self.__client,
+            session=self.__session,
+            batch=self.__batch,
+            comment="add ledgers",
+        )
+
+
+class MongoLedgerMapperTo(LedgerMapperTo[MongoUsers]):
+    def __call__(self, mongo_users: MongoUsers) -> MongoLedgerMapper:
+        return MongoLedgerMapper(
+            mongo_users.client,
+            session=mongo_users.session,
+            batch=mongo_users.operation_batch,
+        )
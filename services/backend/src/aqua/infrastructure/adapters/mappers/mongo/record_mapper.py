@@ -1,5 +1,6 @@
 from typing import Iterable
 
+from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import AsyncClientSession
 
 from aqua.application.ports.mappers import RecordMapper, RecordMapperTo
@@ -9,7 +10,8 @@ from aqua.domain.model.core.aggregates.user.internal.entities.record import (
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.periphery.pymongo.document import Document
 from aqua.infrastructure.periphery.pymongo.operations import (
-    ArrayOperations,
+    OperationBatch,
+    RootOperations,
     execute,
 )
 from aqua.infrastructure.periphery.serializing.from_model.to_document import (
@@ -19,41 +21,51 @@ from aqua.infrastructure.periphery.serializing.from_model.to_document import (
 
 
 class MongoRecordMapper(RecordMapper):
-    __operations = ArrayOperations(
-        namespace="db.users", prefix="record", sort={"recording_time": -1}
-    )
+    __operations = RootOperations(namespace="db.records")
 
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(
+        self,
+        client: AsyncMongoClient[Document],
+        *,
+        session: AsyncClientSession | None = None,
+        batch: OperationBatch | None = None,
+    ) -> None:
+        self.__client = client
         self.__session = session
+        self.__batch = batch
 
     async def add_all(self, records: Iterable[Record]) -> None:
         operations = (
-            self.__operations.to_push(
-                self._document_of(record),
-                id=record.user_id,
-            )
+            self.__operations.to_insert(self._document_of(record))
             for record in records
         )
 
         await execute(
-            operations, session=self.__session, comment="push user records"
+            operations,
+            client=self.__client,
+            session=self.__session,
+            batch=self.__batch,
+            comment="add records",
         )
 
     async def update_all(self, records: Iterable[Record]) -> None:
         operations = (
-            self.__operations.to_map(
-                self._document_of(record), id=record.user_id
-            )
+            self.__operations.to_put(self._document_of(record))
             for record in records
         )
 
         await execute(
-            operations, session=self.__session, comment="update user records"
+            operations,
+            client=self.__client,
+            session=self.__session,
+            batch=self.__batch,
+            comment="update records",
         )
 
     def _document_of(self, record: Record) -> Document:
         return {
             "_id": record.id,
+            "user_id": record.user_id,
             "drunk_water": document_water_of(record.drunk_water),
             "recording_time": document_time_of(record.recording_time),
             "is_cancelled": record.is_cancelled,
@@ -62,4 +74,8 @@ class MongoRecordMapper(RecordMapper):
 
 class MongoRecordMapperTo(RecordMapperTo[MongoUsers]):
     def __call__(self, mongo_users: MongoUsers) -> MongoRecordMapper:
-        return MongoRecordMapper(mongo_users.session)
+        return MongoRecordMapper(
+            mongo_users.client,
+            session=mongo_users.session,
+            batch=mongo_users.operation_batch,
+        )
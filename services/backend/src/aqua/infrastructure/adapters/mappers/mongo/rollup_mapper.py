@@ -0,0 +1,81 @@
+from typing import Iterable
+
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import AsyncClientSession
+
+from aqua.application.ports.mappers import RollupMapper, RollupMapperTo
+from aqua.application.rollups import DayChange, Period
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import (
+    OperationBatch,
+    RootOperations,
+    execute,
+)
+from aqua.infrastructure.periphery.pymongo.rollups import (
+    day_count_field_of,
+    rollup_filter_of,
+)
+
+
+class MongoRollupMapper(RollupMapper):
+    __operations = RootOperations(namespace="db.rollups")
+
+    def __init__(
+        self,
+        client: AsyncMongoClient[Document],
+        *,
+        session: AsyncClientSession | None = None,
+        batch: OperationBatch | None = None,
+    ) -> None:
+        self.__client = client
+        self.__session = session
+        self.__batch = batch
+
+    async def add_all(self, day_changes: Iterable[DayChange]) -> None:
+        operations = (
+            self.__operations.to_increment(
+                rollup_filter_of(
+                    user_id=day_change.user_id,
+                    period=period,
+                    date_=day_change.date_,
+                ),
+                self._increments_of(day_change),
+            )
+            for day_change in day_changes
+            for period in Period
+        )
+
+        await execute(
+            operations,
+            client=self.__client,
+            session=self.__session,
+            batch=self.__batch,
+            comment="add rollups",
+        )
+
+    def _increments_of(self, day_change: DayChange) -> Document:
+        increments = {
+            "water_balance": day_change.water_milliliters,
+            "day_count": int(day_change.is_day_new),
+        }
+
+        if day_change.previous_result is day_change.result:
+            return increments
+
+        if day_change.previous_result is not None:
+            field = day_count_field_of(day_change.previous_result)
+            increments[field] = -1
+
+        increments[day_count_field_of(day_change.result)] = 1
+
+        return increments
+
+
+class MongoRollupMapperTo(RollupMapperTo[MongoUsers]):
+    def __call__(self, mongo_users: MongoUsers) -> MongoRollupMapper:
+        return MongoRollupMapper(
+            mongo_users.client,
+            session=mongo_users.session,
+            batch=mongo_users.operation_batch,
+        )
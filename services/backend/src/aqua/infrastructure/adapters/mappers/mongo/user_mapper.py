@@ -1,12 +1,21 @@
 from typing import Iterable
+from uuid import UUID
 
+from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import AsyncClientSession
 
-from aqua.application.ports.mappers import UserMapper, UserMapperTo
+from aqua.application.ports.mappers import (
+    ConflictError,
+    UserMapper,
+    UserMapperTo,
+)
 from aqua.domain.model.core.aggregates.user.root import User
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.periphery.pymongo.document import Document
 from aqua.infrastructure.periphery.pymongo.operations import (
+    DuplicateKeyError,
+    Operation,
+    OperationBatch,
     RootOperations,
     execute,
 )
@@ -20,21 +29,61 @@ from aqua.infrastructure.periphery.serializing.from_model.to_document import (
 class MongoUserMapper(UserMapper):
     __operations = RootOperations(namespace="db.users")
 
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(
+        self,
+        client: AsyncMongoClient[Document],
+        *,
+        session: AsyncClientSession | None = None,
+        versions: dict[UUID, int] | None = None,
+        batch: OperationBatch | None = None,
+    ) -> None:
+        self.__client = client
         self.__session = session
+        self.__batch = batch
+        self.__versions = dict[UUID, int]() if versions is None else versions
 
     async def add_all(self, users: Iterable[User]) -> None:
-        await self.__put(users)
+        users = tuple(users)
+        operations = (
+            self.__operations.to_insert(
+                self.__document_of(user) | {"version": 0}
+            )
+            for user in users
+        )
 
-    async def update_all(self, users: Iterable[User]) -> None:
-        await self.__put(users)
+        await self.__execute(operations, comment="add users")
+
+        for user in users:
+            self.__versions[user.id] = 0
 
-    async def __put(self, users: Iterable[User]) -> None:
+    async def update_all(self, users: Iterable[User]) -> None:
+        users = tuple(users)
         operations = (
-            self.__operations.to_put(self.__document_of(user)) for user in users
+            self.__operations.to_put_versioned(
+                self.__document_of(user), version=self.__versions.get(user.id)
+            )
+            for user in users
         )
 
-        await execute(operations, session=self.__session, comment="put users")
+        await self.__execute(operations, comment="update users")
+
+        for user in users:
+            if user.id in self.__versions:
+                self.__versions[user.id] += 1
+
+    async def __execute(
+        self, operations: Iterable[Operation], *, comment: str
+    ) -> None:
+        try:
+            await execute(
+                operations,
+                client=self.__client,
+                session=self.__session,
+                batch=self.__batch,
+                comment=comment,
+            )
+        except DuplicateKeyError as error:
+            raise ConflictError from error
 
     def __document_of(self, user: User) -> Document:
         return {
@@ -47,4 +96,9 @@ class MongoUserMapper(UserMapper):
 
 class MongoUserMapperTo(UserMapperTo[MongoUsers]):
     def __call__(self, mongo_users: MongoUsers) -> MongoUserMapper:
-        return MongoUserMapper(mongo_users.session)
+        return MongoUserMapper(
+            mongo_users.client,
+            session=mongo_users.session,
+            versions=mongo_users.user_versions,
+            batch=mongo_users.operation_batch,
+        )
@@ -1,6 +1,6 @@
 from copy import deepcopy
 from datetime import date
-from typing import Iterator
+from typing import Callable, Iterable, Iterator
 from uuid import UUID
 
 from aqua.application.ports.repos import Users
@@ -41,6 +41,60 @@ class InMemoryUsers(
 
         return None if root is None else self.__with_aggregation(root)
 
+    async def user_with_day(self, user_id: UUID, *, date_: date) -> User | None:
+        root = self._storage.user_with_id(user_id)
+
+        if root is None:
+            return None
+
+        return self.__with_aggregation(
+            root,
+            is_day_loaded=lambda day: day.date_ == date_,
+            is_record_loaded=lambda record: (
+                record.recording_time.datetime_.date() == date_
+            ),
+        )
+
+    async def user_with_days(
+        self, user_id: UUID, *, dates: Iterable[date]
+    ) -> User | None:
+        root = self._storage.user_with_id(user_id)
+
+        if root is None:
+            return None
+
+        dates = frozenset(dates)
+
+        return self.__with_aggregation(
+            root,
+            is_day_loaded=lambda day: day.date_ in dates,
+            is_record_loaded=lambda record: (
+                record.recording_time.datetime_.date() in dates
+            ),
+        )
+
+    async def user_with_record(
+        self, user_id: UUID, *, record_id: UUID
+    ) -> User | None:
+        for record in self._storage.records_with_user_id(user_id):
+            if record.id == record_id:
+                date_ = record.recording_time.datetime_.date()
+                return await self.user_with_day(user_id, date_=date_)
+
+        return await self.user_without_history(user_id)
+
+    async def user_without_history(self, user_id: UUID) -> User | None:
+        root = self._storage.user_with_id(user_id)
+
+        if root is None:
+            return None
+
+        return self.__with_aggregation(
+            root,
+            is_day_loaded=lambda _: False,
+            is_record_loaded=lambda _: False,
+        )
+
     def day_with_user_id_and_date(
         self, *, user_id: UUID, date_: date
     ) -> Day | None:
@@ -66,9 +120,21 @@ class InMemoryUsers(
     def update_record(self, record: Record) -> None:
         self._storage.update_record(record)
 
-    def __with_aggregation(self, root: User) -> User:
-        days = Entities(self._storage.days_with_user_id(root.id))
-        records = Entities(self._storage.records_with_user_id(root.id))
+    def __with_aggregation(
+        self,
+        root: User,
+        *,
+        is_day_loaded: Callable[[Day], bool] = lambda _: True,
+        is_record_loaded: Callable[[Record], bool] = lambda _: True,
+    ) -> User:
+        days = Entities(
+            filter(is_day_loaded, self._storage.days_with_user_id(root.id))
+        )
+        records = Entities(
+            filter(
+                is_record_loaded, self._storage.records_with_user_id(root.id)
+            )
+        )
 
         return User(
             id=root.id,
@@ -1,16 +1,29 @@
-from datetime import datetime
-from typing import Any
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from typing import AsyncIterator, Iterable
 from uuid import UUID
 
+from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.database import AsyncDatabase
 
 from aqua.application.ports.repos import Users
 from aqua.domain.framework.entity import Entities
+from aqua.domain.framework.iterable import one_from
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
     Record,
 )
 from aqua.domain.model.core.aggregates.user.root import User
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.causality import (
+    CausalityToken,
+    causal_session_with,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import OperationBatch
+from aqua.infrastructure.periphery.pymongo.operators import in_date_range
+from aqua.infrastructure.periphery.pymongo.reads import db_with, primary_reads
 from aqua.infrastructure.periphery.serializing.from_document.to_model import (
     glass_of,
     maybe_result_of,
@@ -23,60 +36,238 @@ from aqua.infrastructure.periphery.serializing.from_document.to_model import (
 from aqua.infrastructure.periphery.serializing.from_document.to_native import (
     native_date_of,
 )
+from aqua.infrastructure.periphery.serializing.from_native.to_document import (
+    document_date_of,
+)
+from aqua.infrastructure.periphery.validation.decoders import (
+    Field,
+    New,
+    decoder_of,
+)
 from aqua.infrastructure.periphery.validation.objects import (
     StrictValidationObject,
 )
 
 
 class MongoUsers(Users):
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(
+        self,
+        client: AsyncMongoClient[Document],
+        *,
+        session: AsyncClientSession | None = None,
+        reads: MongoReads = primary_reads,
+    ) -> None:
+        self.__client = client
         self.__session = session
+        self.__reads = reads
+        self.__user_versions = dict[UUID, int]()
+        self.__day_versions = dict[UUID, int]()
+        self.__operation_batch = OperationBatch()
 
     @property
-    def session(self) -> AsyncClientSession:
+    def client(self) -> AsyncMongoClient[Document]:
+        return self.__client
+
+    @property
+    def session(self) -> AsyncClientSession | None:
         return self.__session
 
+    @property
+    def user_versions(self) -> dict[UUID, int]:
+        return self.__user_versions
+
+    @property
+    def day_versions(self) -> dict[UUID, int]:
+        return self.__day_versions
+
+    @property
+    def operation_batch(self) -> OperationBatch:
+        return self.__operation_batch
+
+    @asynccontextmanager
+    async def after(
+        self, causality_token: CausalityToken | None
+    ) -> AsyncIterator["MongoUsers"]:
+        if causality_token is None:
+            yield self
+            return
+
+        async with causal_session_with(self.client, causality_token) as session:
+            if session is None:
+                yield self
+            else:
+                yield MongoUsers(
+                    self.client, session=session, reads=self.__reads
+                )
+
+    @property
+    def __db(self) -> AsyncDatabase[Document]:
+        return db_with(self.client, self.__reads)
+
     async def user_with_id(self, user_id: UUID) -> User | None:
-        document = await self.session.client.db.users.find_one(user_id)
+        db = self.__db
+        user_document = await db.users.find_one(user_id, session=self.session)
+
+        if user_document is None:
+            return None
+
+        day_documents = db.days.find(
+            {"user_id": user_id}, session=self.session, comment="user days"
+        )
+        record_documents = db.records.find(
+            {"user_id": user_id},
+            sort={"recording_time": -1},
+            session=self.session,
+            comment="user records",
+        )
+
+        return self.__loaded_user_from(
+            user_document,
+            await day_documents.to_list(),
+            await record_documents.to_list(),
+        )
+
+    async def user_with_day(self, user_id: UUID, *, date_: date) -> User | None:
+        document_date = document_date_of(date_)
+        pipeline: list[Document] = [
+            {"$match": {"_id": user_id}},
+            {
+                "$lookup": {
+                    "from": "days",
+                    "pipeline": [
+                        {"$match": {"user_id": user_id, "date": document_date}}
+                    ],
+                    "as": "days",
+                }
+            },
+            {
+                "$lookup": {
+                    "from": "records",
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "user_id": user_id,
+                                "recording_time": in_date_range(document_date),
+                            }
+                        },
+                        {"$sort": {"recording_time": -1}},
+                    ],
+                    "as": "records",
+                }
+            },
+        ]
+        documents = await self.__db.users.aggregate(
+            pipeline, session=self.session, comment="user with day"
+        )
+        document = one_from(await documents.to_list())
 
-        return None if document is None else self.__loaded_user_from(document)
+        if document is None:
+            return None
 
-    def __loaded_user_from(self, document: dict[str, Any]) -> User:
-        user_object = StrictValidationObject(document)
+        return self.__loaded_user_from(
+            document, document["days"], document["records"]
+        )
+
+    async def user_with_days(
+        self, user_id: UUID, *, dates: Iterable[date]
+    ) -> User | None:
+        document_dates = sorted(set(map(document_date_of, dates)))
+
+        if not document_dates:
+            return await self.user_without_history(user_id)
+
+        record_time_ranges = [
+            {"recording_time": in_date_range(document_date)}
+            for document_date in document_dates
+        ]
+        pipeline: list[Document] = [
+            {"$match": {"_id": user_id}},
+            {
+                "$lookup": {
+                    "from": "days",
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "user_id": user_id,
+                                "date": {"$in": document_dates},
+                            }
+                        }
+                    ],
+                    "as": "days",
+                }
+            },
+            {
+                "$lookup": {
+                    "from": "records",
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "user_id": user_id,
+                                "$or": record_time_ranges,
+                            }
+                        },
+                        {"$sort": {"recording_time": -1}},
+                    ],
+                    "as": "records",
+                }
+            },
+        ]
+        documents = await self.__db.users.aggregate(
+            pipeline, session=self.session, comment="user with days"
+        )
+        document = one_from(await documents.to_list())
+
+        if document is None:
+            return None
+
+        return self.__loaded_user_from(
+            document, document["days"], document["records"]
+        )
+
+    async def user_with_record(
+        self, user_id: UUID, *, record_id: UUID
+    ) -> User | None:
+        record_document = await self.__db.records.find_one(
+            {"_id": record_id, "user_id": user_id},
+            projection={"recording_time": True},
+            session=self.session,
+            comment="record time",
+        )
+
+        if record_document is None:
+            return await self.user_without_history(user_id)
+
+        record_object = StrictValidationObject(record_document)
+        recording_time = record_object["recording_time", datetime]
 
-        days = Entities[Day]()
-        records = Entities[Record]()
+        return await self.user_with_day(user_id, date_=recording_time.date())
 
-        for day_document in user_object["days", list]:
+    async def user_without_history(self, user_id: UUID) -> User | None:
+        user_document = await self.__db.users.find_one(
+            user_id, session=self.session
+        )
+
+        if user_document is None:
+            return None
+
+        return self.__loaded_user_from(user_document, list(), list())
+
+    def __loaded_user_from(
+        self,
+        user_document: Document,
+        day_documents: list[Document],
+        record_documents: list[Document],
+    ) -> User:
+        user_object = StrictValidationObject(user_document)
+        self.__user_versions[user_object["_id", UUID]] = user_object[
+            "version", int
+        ]
+
+        for day_document in day_documents:
             day_object = StrictValidationObject(day_document)
-            day = Day(
-                id=day_object["_id", UUID],
-                events=list(),
-                user_id=user_object["_id", UUID],
-                date_=native_date_of(day_object["date", datetime]),
-                target=target_of(day_object["target", int]),
-                water_balance=water_balance_of(
-                    day_object["water_balance", int]
-                ),
-                pinned_result=maybe_result_of(
-                    day_object.n["pinned_result", int]
-                ),
-            )
-            days.add(day)
-
-        for record_document in user_object["records", list]:
-            record_object = StrictValidationObject(record_document)
-            record = Record(
-                id=record_object["_id", UUID],
-                events=list(),
-                user_id=user_object["_id", UUID],
-                drunk_water=water_of(record_object["drunk_water", int]),
-                recording_time=time_of(
-                    record_object["recording_time", datetime]
-                ),
-                is_cancelled=record_object["is_cancelled", bool],
-            )
-            records.add(record)
+            self.__day_versions[day_object["_id", UUID]] = day_object[
+                "version", int
+            ]
 
         return User(
             id=user_object["_id", UUID],
@@ -84,6 +275,37 @@ class MongoUsers(Users):
             target=target_of(user_object["target", int]),
             glass=glass_of(user_object["glass", int]),
             weight=maybe_weight_of(user_object["weight", int]),
-            days=days,
-            records=records,
+            days=Entities(map(loaded_day_from, day_documents)),
+            records=Entities(map(loaded_record_from, record_documents)),
         )
+
+
+loaded_day_from = decoder_of(
+    Day,
+    id=Field(key="_id", type_=UUID),
+    events=New(factory=list),
+    user_id=Field(key="user_id", type_=UUID),
+    date_=Field(key="date", type_=datetime, converted=native_date_of),
+    target=Field(key="target", type_=int, converted=target_of),
+    water_balance=Field(
+        key="water_balance", type_=int, converted=water_balance_of
+    ),
+    pinned_result=Field(
+        key="pinned_result",
+        type_=int,
+        converted=maybe_result_of,
+        is_strict=False,
+    ),
+)
+
+loaded_record_from = decoder_of(
+    Record,
+    id=Field(key="_id", type_=UUID),
+    events=New(factory=list),
+    user_id=Field(key="user_id", type_=UUID),
+    drunk_water=Field(key="drunk_water", type_=int, converted=water_of),
+    recording_time=Field(
+        key="recording_time", type_=datetime, converted=time_of
+    ),
+    is_cancelled=Field(key="is_cancelled", type_=bool),
+)
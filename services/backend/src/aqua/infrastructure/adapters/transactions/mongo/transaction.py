@@ -1,16 +1,31 @@
 from types import TracebackType
 from typing import Self, Type
 
-from pymongo import ReadPreference
+from pymongo import AsyncMongoClient, ReadPreference
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.errors import PyMongoError
 
+from aqua.application.ports.mappers import ConflictError
 from aqua.application.ports.transactions import Transaction, TransactionFor
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import (
+    DuplicateKeyError,
+    Operation,
+    OperationBatch,
+    execute,
+)
 
 
 class NestedTransactionError(Exception): ...
 
 
+class NoRollbackError(Exception): ...
+
+
+class NoSessionError(Exception): ...
+
+
 class MongoTransaction(Transaction):
     def __init__(self, session: AsyncClientSession) -> None:
         self.__session = session
@@ -48,4 +63,126 @@ class MongoTransaction(Transaction):
 
 class MongoTransactionForMongoUsers(TransactionFor[MongoUsers]):
     def __call__(self, mongo_users: MongoUsers) -> MongoTransaction:
+        if mongo_users.session is None:
+            raise NoSessionError
+
         return MongoTransaction(mongo_users.session)
+
+
+class MongoOptimisticTransaction(Transaction):
+    def __init__(
+        self,
+        client: AsyncMongoClient[Document],
+        *,
+        session: AsyncClientSession | None,
+        batch: OperationBatch,
+    ) -> None:
+        self._client = client
+        self._session = session
+        self.__batch = batch
+
+    async def rollback(self) -> None:
+        self.__batch.close()
+
+    async def __aenter__(self) -> Self:
+        if self.__batch.is_open:
+            raise NestedTransactionError
+
+        self.__batch.open()
+
+        return self
+
+    async def __aexit__(
+        self,
+        error_type: Type[BaseException] | None,
+        error: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if not self.__batch.is_open:
+            return
+
+        operations = self.__batch.close()
+
+        if error is not None:
+            return
+
+        try:
+            await self._execute(operations)
+        except DuplicateKeyError as duplicate_key_error:
+            raise ConflictError from duplicate_key_error
+        except PyMongoError as pymongo_error:
+            if not pymongo_error.has_error_label("TransientTransactionError"):
+                raise
+
+            raise ConflictError from pymongo_error
+
+    async def _execute(self, operations: tuple[Operation, ...]) -> None:
+        if len(operations) <= 1:
+            await execute(
+                operations,
+                client=self._client,
+                session=self._session,
+                comment="execute optimistic batch",
+            )
+            return
+
+        await _execute_in_transaction(
+            operations,
+            client=self._client,
+            session=self._session,
+            comment="execute optimistic batch",
+        )
+
+
+class MongoOptimisticTransactionForMongoUsers(TransactionFor[MongoUsers]):
+    def __call__(self, mongo_users: MongoUsers) -> MongoOptimisticTransaction:
+        return MongoOptimisticTransaction(
+            mongo_users.client,
+            session=mongo_users.session,
+            batch=mongo_users.operation_batch,
+        )
+
+
+class MongoBatchTransaction(MongoOptimisticTransaction):
+    async def _execute(self, operations: tuple[Operation, ...]) -> None:
+        await _execute_in_transaction(
+            operations,
+            client=self._client,
+            session=self._session,
+            comment="execute batch",
+        )
+
+
+class MongoBatchTransactionForMongoUsers(TransactionFor[MongoUsers]):
+    def __call__(self, mongo_users: MongoUsers) -> MongoBatchTransaction:
+        return MongoBatchTransaction(
+            mongo_users.client,
+            session=mongo_users.session,
+            batch=mongo_users.operation_batch,
+        )
+
+
+async def _execute_in_transaction(
+    operations: tuple[Operation, ...],
+    *,
+    client: AsyncMongoClient[Document],
+    session: AsyncClientSession | None,
+    comment: str,
+) -> None:
+    if session is None:
+        async with client.start_session() as new_session:
+            await _execute_in_transaction(
+                operations, client=client, session=new_session, comment=comment
+            )
+        return
+
+    async with await session.start_transaction(
+        read_preference=ReadPreference.PRIMARY
+    ):
+        await execute(
+            operations,
+            client=client,
+            session=session,
+            is_ordered=True,
+            comment=comment,
+        )
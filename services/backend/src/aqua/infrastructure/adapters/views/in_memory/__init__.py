@@ -1,3 +1,6 @@
+from aqua.infrastructure.adapters.views.in_memory import (
+    batch_writing_view_of as batch_writing_view_of,
+)
 from aqua.infrastructure.adapters.views.in_memory import (
     cancellation_view_of as cancellation_view_of,
 )
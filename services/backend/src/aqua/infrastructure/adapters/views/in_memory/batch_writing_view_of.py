@@ -0,0 +1,31 @@
+from datetime import date
+
+from aqua.application.ports.views import BatchWritingViewOf
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.root import (
+    BatchWritingOutput,
+    User,
+)
+from aqua.infrastructure.periphery.views.in_memory.batch_writing_view import (
+    InMemoryBatchWritingView,
+)
+
+
+class InMemoryBatchWritingViewOf(BatchWritingViewOf[InMemoryBatchWritingView]):
+    def __call__(
+        self, *, user: User, output: BatchWritingOutput
+    ) -> InMemoryBatchWritingView:
+        return InMemoryBatchWritingView(
+            user=user.without_aggregation(),
+            days=tuple(
+                day.without_aggregation()
+                for day in sorted(output.days, key=_date_of_day)
+            ),
+            new_records=tuple(
+                record.without_aggregation() for record in output.new_records
+            ),
+        )
+
+
+def _date_of_day(day: Day) -> date:
+    return day.date_
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Iterable
 
 from aqua.application.ports.views import CancellationViewOf
@@ -16,10 +15,10 @@ class InMemoryCancellationViewOf(CancellationViewOf[InMemoryCancellationView]):
         self, *, user: User, output: CancellationOutput
     ) -> InMemoryCancellationView:
         return InMemoryCancellationView(
-            user=deepcopy(user),
-            day=deepcopy(output.day),
-            cancelled_record=deepcopy(output.cancelled_record),
-            other_records=self.__viewable(user.records),
+            user=user.without_aggregation(),
+            day=output.day.without_aggregation(),
+            cancelled_record=output.cancelled_record.without_aggregation(),
+            other_records=self.__viewable(user.records_on(output.day.date_)),
         )
 
     def __viewable(self, records: Iterable[Record]) -> tuple[Record, ...]:
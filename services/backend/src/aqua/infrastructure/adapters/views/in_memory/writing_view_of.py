@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Iterable
 
 from aqua.application.ports.views import WritingViewOf
@@ -16,9 +15,9 @@ class InMemoryWritingViewOf(WritingViewOf[InMemoryWritingView]):
         self, *, user: User, output: WritingOutput
     ) -> InMemoryWritingView:
         return InMemoryWritingView(
-            user=deepcopy(user),
-            day=deepcopy(output.day),
-            new_record=deepcopy(output.new_record),
+            user=user.without_aggregation(),
+            day=output.day.without_aggregation(),
+            new_record=output.new_record.without_aggregation(),
             previous_records=self.__viewable(output.previous_records),
         )
 
@@ -1,6 +1,24 @@
+from aqua.infrastructure.adapters.views.mongo import (
+    analytics_view_from as analytics_view_from,
+)
 from aqua.infrastructure.adapters.views.mongo import (
     day_view_from as day_view_from,
 )
+from aqua.infrastructure.adapters.views.mongo import (
+    days_view_from as days_view_from,
+)
+from aqua.infrastructure.adapters.views.mongo import (
+    history_view_from as history_view_from,
+)
+from aqua.infrastructure.adapters.views.mongo import (
+    ledger_view_from as ledger_view_from,
+)
+from aqua.infrastructure.adapters.views.mongo import (
+    records_view_from as records_view_from,
+)
+from aqua.infrastructure.adapters.views.mongo import (
+    rollup_view_from as rollup_view_from,
+)
 from aqua.infrastructure.adapters.views.mongo import (
     user_view_from as user_view_from,
 )
@@ -0,0 +1,175 @@
+from array import array
+from asyncio import to_thread
+from datetime import date
+from uuid import UUID
+
+from pymongo.asynchronous.client_session import AsyncClientSession
+
+from aqua.application.analytics import Analytics, HistoryColumns, analytics_of
+from aqua.application.ports.views import AnalyticsViewFrom
+from aqua.domain.framework.iterable import one_from
+from aqua.domain.model.core.vos.target import Result
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.caches import Cache
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.ledgers import (
+    ledger_filter_of,
+    ledger_version_of,
+    ledger_version_projection,
+)
+from aqua.infrastructure.periphery.pymongo.reads import db_with, primary_reads
+from aqua.infrastructure.periphery.serializing.from_model.to_document import (
+    document_result_of,
+)
+from aqua.infrastructure.periphery.views.db.analytics_view import (
+    DBAnalyticsView,
+)
+
+
+class AnalyticsCache(Cache[UUID, Analytics]): ...
+
+
+_unix_epoch_ordinal = date(1970, 1, 1).toordinal()
+_milliseconds_per_day = 24 * 60 * 60 * 1000
+
+
+class DBAnalyticsViewFromMongoUsers(
+    AnalyticsViewFrom[MongoUsers, DBAnalyticsView]
+):
+    def __init__(
+        self, *, cache: AnalyticsCache, reads: MongoReads = primary_reads
+    ) -> None:
+        self.__cache = cache
+        self.__reads = reads
+
+    async def __call__(
+        self, mongo_users: MongoUsers, *, user_id: UUID, today: date
+    ) -> DBAnalyticsView:
+        async with mongo_users.client.start_session(
+            causal_consistency=True
+        ) as session:
+            analytics = await self.__analytics_of(
+                mongo_users, user_id=user_id, today=today, session=session
+            )
+
+        return DBAnalyticsView(
+            user_id=user_id,
+            date_=today,
+            good_day_streak=analytics.good_day_streak,
+            average_milliliters_by_weekday=(
+                analytics.average_milliliters_by_weekday
+            ),
+            glass_percentile_milliliters=(
+                analytics.glass_percentile_milliliters
+            ),
+        )
+
+    async def __analytics_of(
+        self,
+        mongo_users: MongoUsers,
+        *,
+        user_id: UUID,
+        today: date,
+        session: AsyncClientSession,
+    ) -> Analytics:
+        primary_db = db_with(mongo_users.client, primary_reads)
+        ledger_document = await primary_db.ledgers.find_one(
+            ledger_filter_of(user_id=user_id),
+            ledger_version_projection,
+            session=session,
+            comment="analytics version",
+        )
+        version = ledger_version_of(ledger_document)
+        analytics = self.__cache.get(user_id, tag=(today, version))
+
+        if analytics is not None:
+            return analytics
+
+        columns = await self.__columns_of(
+            mongo_users, user_id=user_id, session=session
+        )
+        analytics = await to_thread(analytics_of, columns, today=today)
+        self.__cache.put(user_id, analytics, tag=(today, version))
+
+        return analytics
+
+    async def __columns_of(
+        self,
+        mongo_users: MongoUsers,
+        *,
+        user_id: UUID,
+        session: AsyncClientSession,
+    ) -> HistoryColumns:
+        db = db_with(mongo_users.client, self.__reads)
+
+        day_documents = await db.days.aggregate(
+            _day_column_pipeline_of(user_id),
+            session=session,
+            comment="day analytics",
+        )
+        day_document = one_from(await day_documents.to_list()) or dict()
+
+        record_documents = await db.records.aggregate(
+            _record_column_pipeline_of(user_id),
+            session=session,
+            comment="record analytics",
+        )
+        record_document = one_from(await record_documents.to_list()) or dict()
+
+        return HistoryColumns(
+            day_ordinals=array("l", day_document.get("ordinals", ())),
+            day_milliliters=array("q", day_document.get("milliliters", ())),
+            good_day_flags=array("b", day_document.get("good_flags", ())),
+            record_milliliters=array(
+                "q", record_document.get("milliliters", ())
+            ),
+        )
+
+
+def _day_column_pipeline_of(user_id: UUID) -> list[Document]:
+    match_stage = {"$match": {"user_id": user_id}}
+    ordinal = {
+        "$add": [
+            {
+                "$toLong": {
+                    "$floor": {
+                        "$divide": [{"$toLong": "$date"}, _milliseconds_per_day]
+                    }
+                }
+            },
+            _unix_epoch_ordinal,
+        ]
+    }
+    good_flag = {
+        "$cond": [{"$eq": ["$result", document_result_of(Result.good)]}, 1, 0]
+    }
+
+    return [
+        match_stage,
+        {"$unionWith": {"coll": "archived_days", "pipeline": [match_stage]}},
+        {"$sort": {"date": 1}},
+        {
+            "$group": {
+                "_id": None,
+                "ordinals": {"$push": ordinal},
+                "milliliters": {"$push": "$water_balance"},
+                "good_flags": {"$push": good_flag},
+            }
+        },
+    ]
+
+
+def _record_column_pipeline_of(user_id: UUID) -> list[Document]:
+    match_stage = {"$match": {"user_id": user_id, "is_cancelled": False}}
+
+    return [
+        match_stage,
+        {
+            "$unionWith": {
+                "coll": "archived_records",
+                "pipeline": [match_stage],
+            }
+        },
+        {"$group": {"_id": None, "milliliters": {"$push": "$drunk_water"}}},
+    ]
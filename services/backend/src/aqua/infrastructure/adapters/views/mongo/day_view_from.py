@@ -1,15 +1,15 @@
-from datetime import date, datetime
-from typing import Iterable, cast
+from datetime import UTC, date, datetime
 from uuid import UUID
 
+from pymongo.asynchronous.collection import AsyncCollection
+
 from aqua.application.ports.views import DayViewFrom
 from aqua.domain.framework.iterable import one_from
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.envs import MongoReads
 from aqua.infrastructure.periphery.pymongo.document import Document
-from aqua.infrastructure.periphery.pymongo.operators import (
-    cond_about,
-    in_date_range,
-)
+from aqua.infrastructure.periphery.pymongo.operators import in_date_range
+from aqua.infrastructure.periphery.pymongo.reads import db_with, primary_reads
 from aqua.infrastructure.periphery.serializing.from_document.to_native import (
     native_datetime_of,
 )
@@ -20,6 +20,10 @@ from aqua.infrastructure.periphery.serializing.from_document.to_view import (
 from aqua.infrastructure.periphery.serializing.from_native.to_document import (
     document_date_of,
 )
+from aqua.infrastructure.periphery.validation.decoders import (
+    Field,
+    decoder_of,
+)
 from aqua.infrastructure.periphery.validation.objects import (
     StrictValidationObject,
 )
@@ -31,69 +35,108 @@ from aqua.infrastructure.periphery.views.db.day_view import (
 
 
 class DBDayViewFromMongoUsers(DayViewFrom[MongoUsers, DBDayView]):
+    def __init__(
+        self,
+        *,
+        current_day_reads: MongoReads = primary_reads,
+        past_day_reads: MongoReads = primary_reads,
+        causal_reads: MongoReads = primary_reads,
+    ) -> None:
+        self.__current_day_reads = current_day_reads
+        self.__past_day_reads = past_day_reads
+        self.__causal_reads = causal_reads
+
     async def __call__(
         self, mongo_users: MongoUsers, *, user_id: UUID, date_: date
     ) -> DBDayView:
+        db = db_with(mongo_users.client, self.__reads_for(mongo_users, date_))
+        document = await self.__document_of(
+            db.days, db.records, mongo_users, user_id=user_id, date_=date_
+        )
+
+        if document is None and date_ < datetime.now(UTC).date():
+            document = await self.__document_of(
+                db.archived_days,
+                db.archived_records,
+                mongo_users,
+                user_id=user_id,
+                date_=date_,
+            )
+
+        if document is None:
+            return empty_db_day_view_with(user_id=user_id, date_=date_)
+
+        return db_day_view_of(document, user_id=user_id, date_=date_)
+
+    async def __document_of(
+        self,
+        days: AsyncCollection[Document],
+        records: AsyncCollection[Document],
+        mongo_users: MongoUsers,
+        *,
+        user_id: UUID,
+        date_: date,
+    ) -> Document | None:
         document_date = document_date_of(date_)
         pipeline: list[Document] = [
-            {"$match": {"_id": user_id, "days.date": document_date}},
+            {"$match": {"user_id": user_id, "date": document_date}},
             {
-                "$project": {
-                    "days": {
-                        "$filter": {
-                            "input": "$days",
-                            "cond": {"$eq": ["$$this.date", document_date]},
-                        }
-                    },
-                    "records": {
-                        "$filter": {
-                            "input": "$records",
-                            "cond": {
-                                "$and": [
-                                    {"$eq": ["$$this.is_cancelled", False]},
-                                    *cond_about(
-                                        in_date_range(document_date),
-                                        field="$$this.recording_time",
-                                    ),
-                                ]
-                            },
-                        }
-                    },
+                "$lookup": {
+                    "from": records.name,
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "user_id": user_id,
+                                "recording_time": in_date_range(document_date),
+                                "is_cancelled": False,
+                            }
+                        },
+                        {"$sort": {"recording_time": -1}},
+                    ],
+                    "as": "records",
                 }
             },
         ]
-        documents = await mongo_users.session.client.db.users.aggregate(
-            pipeline, session=mongo_users.session
-        )
-        document = one_from(await documents.to_list())
+        documents = await days.aggregate(pipeline, session=mongo_users.session)
 
-        if document is None:
-            return empty_db_day_view_with(user_id=user_id, date_=date_)
+        return one_from(await documents.to_list())
 
-        day_object = StrictValidationObject(cast(Document, document["days"][0]))
-
-        return DBDayView(
-            user_id=user_id,
-            date_=date_,
-            target_water_balance_milliliters=day_object["target", int],
-            water_balance_milliliters=day_object["water_balance", int],
-            result_code=old_result_view_of(day_object["result", int]),
-            correct_result_code=old_result_view_of(
-                day_object["correct_result", int]
-            ),
-            pinned_result_code=old_maybe_result_view_of(
-                day_object.n["pinned_result", int]
-            ),
-            records=tuple(_records_from(document["records"])),
-        )
+    def __reads_for(self, mongo_users: MongoUsers, date_: date) -> MongoReads:
+        if mongo_users.session is not None:
+            return self.__causal_reads
 
+        if date_ < datetime.now(UTC).date():
+            return self.__past_day_reads
 
-def _records_from(documents: list[Document]) -> Iterable[DBDayViewRecordData]:
-    for record_object in map(StrictValidationObject, documents):
-        yield DBDayViewRecordData(
-            record_id=record_object["_id", UUID],
-            drunk_water_milliliters=record_object["drunk_water", int],
-            recording_time=native_datetime_of(
-                record_object["recording_time", datetime]
-            ),
-        )
+        return self.__current_day_reads
+
+
+def db_day_view_of(
+    document: Document, *, user_id: UUID, date_: date
+) -> DBDayView:
+    day_object = StrictValidationObject(document)
+
+    return DBDayView(
+        user_id=user_id,
+        date_=date_,
+        target_water_balance_milliliters=day_object["target", int],
+        water_balance_milliliters=day_object["water_balance", int],
+        result_code=old_result_view_of(day_object["result", int]),
+        correct_result_code=old_result_view_of(
+            day_object["correct_result", int]
+        ),
+        pinned_result_code=old_maybe_result_view_of(
+            day_object.n["pinned_result", int]
+        ),
+        records=tuple(map(_record_data_of, document["records"])),
+    )
+
+
+_record_data_of = decoder_of(
+    DBDayViewRecordData,
+    record_id=Field(key="_id", type_=UUID),
+    drunk_water_milliliters=Field(key="drunk_water", type_=int),
+    recording_time=Field(
+        key="recording_time", type_=datetime, converted=native_datetime_of
+    ),
+)
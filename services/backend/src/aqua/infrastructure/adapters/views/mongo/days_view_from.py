@@ -0,0 +1,115 @@
+from datetime import UTC, date, datetime, timedelta
+from typing import AsyncIterator
+from uuid import UUID
+
+from aqua.application.ports.views import DaysViewFrom
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.day_view_from import (
+    db_day_view_of,
+)
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operators import in_date_expr_range
+from aqua.infrastructure.periphery.pymongo.reads import db_with, primary_reads
+from aqua.infrastructure.periphery.serializing.from_document.to_native import (
+    native_date_of,
+)
+from aqua.infrastructure.periphery.serializing.from_native.to_document import (
+    document_date_of,
+)
+from aqua.infrastructure.periphery.views.db.day_view import DBDayView
+
+
+class DBDaysViewFromMongoUsers(DaysViewFrom[MongoUsers, DBDayView]):
+    def __init__(
+        self,
+        *,
+        current_day_reads: MongoReads = primary_reads,
+        past_day_reads: MongoReads = primary_reads,
+        causal_reads: MongoReads = primary_reads,
+        archive_horizon_days: int = 0,
+    ) -> None:
+        self.__current_day_reads = current_day_reads
+        self.__past_day_reads = past_day_reads
+        self.__causal_reads = causal_reads
+        self.__archive_horizon_days = archive_horizon_days
+
+    async def __call__(
+        self, mongo_users: MongoUsers, *, user_id: UUID, from_: date, to: date
+    ) -> AsyncIterator[DBDayView]:
+        date_range = {
+            "$gte": document_date_of(from_),
+            "$lte": document_date_of(to),
+        }
+        pipeline = _day_stages_of(
+            user_id=user_id, date_range=date_range, records_name="records"
+        )
+
+        if self.__is_archive_reached(from_):
+            archived_day_stages = _day_stages_of(
+                user_id=user_id,
+                date_range=date_range,
+                records_name="archived_records",
+            )
+            pipeline.append({
+                "$unionWith": {
+                    "coll": "archived_days",
+                    "pipeline": archived_day_stages,
+                }
+            })
+            pipeline.append({"$sort": {"date": 1}})
+
+        db = db_with(mongo_users.client, self.__reads_for(mongo_users, to))
+        documents = await db.days.aggregate(
+            pipeline, session=mongo_users.session, comment="view days"
+        )
+
+        async for document in documents:
+            yield db_day_view_of(
+                document,
+                user_id=user_id,
+                date_=native_date_of(document["date"]),
+            )
+
+    def __is_archive_reached(self, from_: date) -> bool:
+        today = datetime.now(UTC).date()
+        archive_horizon = today - timedelta(days=self.__archive_horizon_days)
+
+        return from_ < archive_horizon
+
+    def __reads_for(self, mongo_users: MongoUsers, to: date) -> MongoReads:
+        if mongo_users.session is not None:
+            return self.__causal_reads
+
+        if to < datetime.now(UTC).date():
+            return self.__past_day_reads
+
+        return self.__current_day_reads
+
+
+def _day_stages_of(
+    *, user_id: UUID, date_range: Document, records_name: str
+) -> list[Document]:
+    return [
+        {"$match": {"user_id": user_id, "date": date_range}},
+        {"$sort": {"date": 1}},
+        {
+            "$lookup": {
+                "from": records_name,
+                "let": {"date": "$date"},
+                "pipeline": [
+                    {
+                        "$match": {
+                            "user_id": user_id,
+                            "is_cancelled": False,
+                            "$expr": in_date_expr_range(
+                                "$recording_time", date_expr="$$date"
+                            ),
+                        }
+                    },
+                    {"$sort": {"recording_time": -1}},
+                ],
+                "as": "records",
+            }
+        },
+    ]
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import AsyncIterator
+from uuid import UUID
+
+from aqua.application.ports.views import HistoryViewFrom
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.reads import db_with, primary_reads
+from aqua.infrastructure.periphery.serializing.from_document.to_native import (
+    native_date_of,
+    native_datetime_of,
+)
+from aqua.infrastructure.periphery.serializing.from_document.to_view import (
+    old_maybe_result_view_of,
+    old_result_view_of,
+)
+from aqua.infrastructure.periphery.validation.decoders import (
+    Field,
+    decoder_of,
+)
+from aqua.infrastructure.periphery.views.db.history_view import (
+    DBHistoryDayRow,
+    DBHistoryRecordRow,
+    DBHistoryRow,
+)
+
+
+_day_row_of = decoder_of(
+    DBHistoryDayRow,
+    day_id=Field(key="_id", type_=UUID),
+    date_=Field(key="date", type_=datetime, converted=native_date_of),
+    target_water_balance_milliliters=Field(key="target", type_=int),
+    water_balance_milliliters=Field(key="water_balance", type_=int),
+    result_code=Field(key="result", type_=int, converted=old_result_view_of),
+    correct_result_code=Field(
+        key="correct_result", type_=int, converted=old_result_view_of
+    ),
+    pinned_result_code=Field(
+        key="pinned_result",
+        type_=int,
+        converted=old_maybe_result_view_of,
+        is_strict=False,
+    ),
+)
+
+_record_row_of = decoder_of(
+    DBHistoryRecordRow,
+    record_id=Field(key="_id", type_=UUID),
+    drunk_water_milliliters=Field(key="drunk_water", type_=int),
+    recording_time=Field(
+        key="recording_time", type_=datetime, converted=native_datetime_of
+    ),
+    is_cancelled=Field(key="is_cancelled", type_=bool),
+)
+
+
+class DBHistoryViewFromMongoUsers(HistoryViewFrom[MongoUsers, DBHistoryRow]):
+    def __init__(
+        self,
+        *,
+        reads: MongoReads = primary_reads,
+        causal_reads: MongoReads = primary_reads,
+        batch_size: int = 1000,
+    ) -> None:
+        self.__reads = reads
+        self.__causal_reads = causal_reads
+        self.__batch_size = batch_size
+
+    async def __call__(
+        self, mongo_users: MongoUsers, *, user_id: UUID
+    ) -> AsyncIterator[DBHistoryRow]:
+        reads = self.__reads
+
+        if mongo_users.session is not None:
+            reads = self.__causal_reads
+
+        db = db_with(mongo_users.client, reads)
+
+        for days in (db.archived_days, db.days):
+            day_documents = days.find(
+                {"user_id": user_id},
+                projection={"user_id": False, "version": False},
+                sort={"date": 1},
+                batch_size=self.__batch_size,
+                session=mongo_users.session,
+                comment="export day history",
+            )
+
+            async with day_documents:
+                async for day_document in day_documents:
+                    yield _day_row_of(day_document)
+
+        for records in (db.archived_records, db.records):
+            record_documents = records.find(
+                {"user_id": user_id},
+                projection={"user_id": False},
+                sort={"recording_time": 1, "_id": 1},
+                batch_size=self.__batch_size,
+                session=mongo_users.session,
+                comment="export record history",
+            )
+
+            async with record_documents:
+                async for record_document in record_documents:
+                    yield _record_row_of(record_document)
@@ -0,0 +1,45 @@
+from datetime import date
+from uuid import UUID
+
+from aqua.application.ports.views import LedgerViewFrom
+from aqua.domain.model.core.vos.ledger import Ledger, day_count_between
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.ledgers import (
+    ledger_filter_of,
+    ledger_of,
+    ledger_projection_between,
+)
+from aqua.infrastructure.periphery.pymongo.reads import db_with, primary_reads
+from aqua.infrastructure.periphery.views.db.ledger_view import DBLedgerView
+
+
+class DBLedgerViewFromMongoUsers(LedgerViewFrom[MongoUsers, DBLedgerView]):
+    def __init__(self, *, reads: MongoReads = primary_reads) -> None:
+        self.__reads = reads
+
+    async def __call__(
+        self, mongo_users: MongoUsers, *, user_id: UUID, from_: date, to: date
+    ) -> DBLedgerView:
+        document = None
+
+        if day_count_between(from_, to):
+            db = db_with(mongo_users.client, self.__reads)
+            document = await db.ledgers.find_one(
+                ledger_filter_of(user_id=user_id),
+                ledger_projection_between(from_=from_, to=to),
+                session=mongo_users.session,
+                comment="view ledger",
+            )
+
+        ledger = Ledger() if document is None else ledger_of(document)
+
+        return DBLedgerView(
+            user_id=user_id,
+            from_=from_,
+            to=to,
+            water_milliliters=ledger.water_between(from_, to).milliliters,
+            average_water_milliliters=(
+                ledger.average_water_between(from_, to).milliliters
+            ),
+        )
@@ -0,0 +1,102 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from aqua.application.ports.views import RecordsViewFrom
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.reads import db_with, primary_reads
+from aqua.infrastructure.periphery.pymongo.record_cursors import (
+    RecordCursor,
+    after_record_cursor,
+    encoded_record_cursor_of,
+    record_cursor_of,
+)
+from aqua.infrastructure.periphery.serializing.from_document.to_native import (
+    native_datetime_of,
+)
+from aqua.infrastructure.periphery.validation.decoders import (
+    Field,
+    decoder_of,
+)
+from aqua.infrastructure.periphery.views.db.records_view import (
+    DBRecordsView,
+    DBRecordsViewRecordData,
+)
+
+
+_record_data_of = decoder_of(
+    DBRecordsViewRecordData,
+    record_id=Field(key="_id", type_=UUID),
+    drunk_water_milliliters=Field(key="drunk_water", type_=int),
+    recording_time=Field(
+        key="recording_time", type_=datetime, converted=native_datetime_of
+    ),
+    is_cancelled=Field(key="is_cancelled", type_=bool),
+)
+
+
+class DBRecordsViewFromMongoUsers(
+    RecordsViewFrom[MongoUsers, RecordCursor, DBRecordsView]
+):
+    def __init__(
+        self,
+        *,
+        reads: MongoReads = primary_reads,
+        causal_reads: MongoReads = primary_reads,
+    ) -> None:
+        self.__reads = reads
+        self.__causal_reads = causal_reads
+
+    async def __call__(
+        self,
+        mongo_users: MongoUsers,
+        *,
+        user_id: UUID,
+        after: RecordCursor | None,
+        limit: int,
+        is_cancelled_hidden: bool,
+    ) -> DBRecordsView:
+        filter_: dict[str, Any] = {"user_id": user_id}
+
+        if is_cancelled_hidden:
+            filter_["is_cancelled"] = False
+
+        if after is not None:
+            filter_ |= after_record_cursor(after)
+
+        reads = self.__reads
+
+        if mongo_users.session is not None:
+            reads = self.__causal_reads
+
+        db = db_with(mongo_users.client, reads)
+        documents = list[Document]()
+
+        for collection in (db.records, db.archived_records):
+            documents.extend(
+                await collection.find(
+                    filter_,
+                    sort={"recording_time": -1, "_id": -1},
+                    limit=limit + 1 - len(documents),
+                    session=mongo_users.session,
+                    comment="view records",
+                ).to_list()
+            )
+
+            if len(documents) > limit:
+                break
+
+        page_documents = documents[:limit]
+        next_cursor = None
+
+        if len(documents) > limit and page_documents:
+            last_cursor = record_cursor_of(page_documents[-1])
+            next_cursor = encoded_record_cursor_of(last_cursor)
+
+        records = tuple(map(_record_data_of, page_documents))
+
+        return DBRecordsView(
+            user_id=user_id, records=records, next_cursor=next_cursor
+        )
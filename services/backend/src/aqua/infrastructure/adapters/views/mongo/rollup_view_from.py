@@ -0,0 +1,62 @@
+from datetime import date
+from uuid import UUID
+
+from aqua.application.ports.views import RollupViewFrom
+from aqua.application.rollups import Period, period_start_of
+from aqua.domain.model.core.vos.target import Result
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.reads import db_with, primary_reads
+from aqua.infrastructure.periphery.pymongo.rollups import (
+    day_count_field_of,
+    rollup_filter_of,
+)
+from aqua.infrastructure.periphery.validation.objects import (
+    StrictValidationObject,
+)
+from aqua.infrastructure.periphery.views.db.rollup_view import (
+    DBRollupView,
+    empty_db_rollup_view_with,
+)
+
+
+class DBRollupViewFromMongoUsers(RollupViewFrom[MongoUsers, DBRollupView]):
+    def __init__(self, *, reads: MongoReads = primary_reads) -> None:
+        self.__reads = reads
+
+    async def __call__(
+        self,
+        mongo_users: MongoUsers,
+        *,
+        user_id: UUID,
+        period: Period,
+        date_: date,
+    ) -> DBRollupView:
+        db = db_with(mongo_users.client, self.__reads)
+        document = await db.rollups.find_one(
+            rollup_filter_of(user_id=user_id, period=period, date_=date_),
+            session=mongo_users.session,
+            comment="view rollup",
+        )
+        start_date = period_start_of(period, date_)
+
+        if document is None:
+            return empty_db_rollup_view_with(
+                user_id=user_id, period_name=period.name, start_date=start_date
+            )
+
+        rollup_object = StrictValidationObject(document)
+
+        def day_count_of(result: Result) -> int:
+            return rollup_object.n[day_count_field_of(result), int] or 0
+
+        return DBRollupView(
+            user_id=user_id,
+            period_name=period.name,
+            start_date=start_date,
+            water_balance_milliliters=rollup_object["water_balance", int],
+            day_count=rollup_object["day_count", int],
+            good_day_count=day_count_of(Result.good),
+            not_enough_water_day_count=day_count_of(Result.not_enough_water),
+            excess_water_day_count=day_count_of(Result.excess_water),
+        )
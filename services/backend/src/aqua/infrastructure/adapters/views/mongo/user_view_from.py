@@ -1,15 +1,14 @@
 from datetime import date, datetime
-from typing import Iterable, cast
+from typing import cast
 from uuid import UUID
 
 from aqua.application.ports.views import UserViewFrom
 from aqua.domain.framework.iterable import one_from
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.envs import MongoReads
 from aqua.infrastructure.periphery.pymongo.document import Document
-from aqua.infrastructure.periphery.pymongo.operators import (
-    cond_about,
-    in_date_range,
-)
+from aqua.infrastructure.periphery.pymongo.operators import in_date_range
+from aqua.infrastructure.periphery.pymongo.reads import db_with, primary_reads
 from aqua.infrastructure.periphery.serializing.from_document.to_native import (
     native_datetime_of,
 )
@@ -20,6 +19,10 @@ from aqua.infrastructure.periphery.serializing.from_document.to_view import (
 from aqua.infrastructure.periphery.serializing.from_native.to_document import (
     document_date_of,
 )
+from aqua.infrastructure.periphery.validation.decoders import (
+    Field,
+    decoder_of,
+)
 from aqua.infrastructure.periphery.validation.objects import (
     StrictValidationObject,
 )
@@ -31,40 +34,50 @@ from aqua.infrastructure.periphery.views.db.user_view import (
 
 
 class DBUserViewFromMongoUsers(UserViewFrom[MongoUsers, DBUserView]):
+    def __init__(
+        self,
+        *,
+        reads: MongoReads = primary_reads,
+        causal_reads: MongoReads = primary_reads,
+    ) -> None:
+        self.__reads = reads
+        self.__causal_reads = causal_reads
+
     async def __call__(
         self, mongo_users: MongoUsers, *, user_id: UUID, date_: date
     ) -> DBUserView:
         document_date = document_date_of(date_)
-        pipeline = [
-            {"$match": {"_id": user_id, "days.date": document_date}},
+        pipeline: list[Document] = [
+            {"$match": {"_id": user_id}},
+            {
+                "$lookup": {
+                    "from": "days",
+                    "pipeline": [
+                        {"$match": {"user_id": user_id, "date": document_date}}
+                    ],
+                    "as": "days",
+                }
+            },
+            {"$match": {"days": {"$ne": []}}},
             {
-                "$project": {
-                    "glass": 1,
-                    "weight": 1,
-                    "days": {
-                        "$filter": {
-                            "input": "$days",
-                            "cond": {"$eq": ["$$this.date", document_date]},
-                        }
-                    },
-                    "records": {
-                        "$filter": {
-                            "input": "$records",
-                            "cond": {
-                                "$and": [
-                                    {"$eq": ["$$this.is_cancelled", False]},
-                                    *cond_about(
-                                        in_date_range(document_date),
-                                        field="$$this.recording_time",
-                                    ),
-                                ]
-                            },
-                        }
-                    },
+                "$lookup": {
+                    "from": "records",
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "user_id": user_id,
+                                "recording_time": in_date_range(document_date),
+                                "is_cancelled": False,
+                            }
+                        },
+                        {"$sort": {"recording_time": -1}},
+                    ],
+                    "as": "records",
                 }
             },
         ]
-        documents = await mongo_users.session.client.db.users.aggregate(
+        db = db_with(mongo_users.client, self.__reads_for(mongo_users))
+        documents = await db.users.aggregate(
             pipeline, session=mongo_users.session
         )
         document = one_from(await documents.to_list())
@@ -91,16 +104,21 @@ class DBUserViewFromMongoUsers(UserViewFrom[MongoUsers, DBUserView]):
             pinned_result_code=old_maybe_result_view_of(
                 day_object.n["pinned_result", int]
             ),
-            records=tuple(_records_from(document["records"])),
+            records=tuple(map(_record_data_of, document["records"])),
         )
 
+    def __reads_for(self, mongo_users: MongoUsers) -> MongoReads:
+        if mongo_users.session is not None:
+            return self.__causal_reads
 
-def _records_from(documents: list[Document]) -> Iterable[DBUserViewRecordData]:
-    for record_object in map(StrictValidationObject, documents):
-        yield DBUserViewRecordData(
-            record_id=record_object["_id", UUID],
-            drunk_water_milliliters=record_object["drunk_water", int],
-            recording_time=native_datetime_of(
-                record_object["recording_time", datetime]
-            ),
-        )
+        return self.__reads
+
+
+_record_data_of = decoder_of(
+    DBUserViewRecordData,
+    record_id=Field(key="_id", type_=UUID),
+    drunk_water_milliliters=Field(key="drunk_water", type_=int),
+    recording_time=Field(
+        key="recording_time", type_=datetime, converted=native_datetime_of
+    ),
+)
@@ -1,3 +1,5 @@
+from aqua.infrastructure.periphery import caches as caches
+from aqua.infrastructure.periphery import coalescing as coalescing
 from aqua.infrastructure.periphery import envs as envs
 from aqua.infrastructure.periphery import logs as logs
 from aqua.infrastructure.periphery import pymongo as pymongo
@@ -0,0 +1,39 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class _Entry[ValueT]:
+    value: ValueT
+    tag: Hashable
+
+
+class Cache[KeyT: Hashable, ValueT]:
+    def __init__(self, *, max_size: int) -> None:
+        self.__max_size = max_size
+        self.__entries = OrderedDict[KeyT, _Entry[ValueT]]()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: KeyT, *, tag: Hashable = None) -> ValueT | None:
+        entry = self.__entries.get(key)
+
+        if entry is None or entry.tag != tag:
+            return None
+
+        self.__entries.move_to_end(key)
+        return entry.value
+
+    def put(self, key: KeyT, value: ValueT, *, tag: Hashable = None) -> None:
+        self.__entries[key] = _Entry(value=value, tag=tag)
+        self.__entries.move_to_end(key)
+        _trim(self.__entries, max_size=self.__max_size)
+
+
+def _trim[KeyT, ValueT](
+    map_: OrderedDict[KeyT, ValueT], *, max_size: int
+) -> None:
+    while len(map_) > max_size:
+        map_.popitem(last=False)
@@ -0,0 +1,105 @@
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, Sequence
+
+
+type Perform[KeyT, InputT, OutputT] = Callable[
+    [KeyT, tuple[InputT, ...]], Awaitable[Sequence[OutputT]]
+]
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class _Batch[InputT, OutputT]:
+    inputs: list[InputT] = field(default_factory=list)
+    futures: list[asyncio.Future[OutputT]] = field(default_factory=list)
+    is_full: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+type _BatchKey[KeyT] = tuple[Perform[KeyT, Any, Any], KeyT]
+
+
+class Coalescer[KeyT: Hashable, InputT]:
+    def __init__(self, *, window_seconds: float, max_batch_size: int) -> None:
+        self.__window_seconds = window_seconds
+        self.__max_batch_size = max_batch_size
+        self.__batches = dict[_BatchKey[KeyT], _Batch[InputT, Any]]()
+        self.__flushes = set[asyncio.Task[None]]()
+
+    async def __call__[OutputT](
+        self,
+        key: KeyT,
+        input_: InputT,
+        *,
+        perform: Perform[KeyT, InputT, OutputT],
+    ) -> OutputT:
+        batch_key = (perform, key)
+        batch = self.__batches.get(batch_key)
+
+        if batch is None:
+            batch = _Batch()
+            self.__batches[batch_key] = batch
+
+            flush = asyncio.create_task(self.__flush(batch_key, batch))
+            self.__flushes.add(flush)
+            flush.add_done_callback(self.__flushes.discard)
+
+        future: asyncio.Future[OutputT] = (
+            asyncio.get_running_loop().create_future()
+        )
+        batch.inputs.append(input_)
+        batch.futures.append(future)
+
+        if len(batch.inputs) >= self.__max_batch_size:
+            self.__close(batch_key, batch)
+            batch.is_full.set()
+
+        return await future
+
+    async def __flush(
+        self, batch_key: _BatchKey[KeyT], batch: _Batch[InputT, Any]
+    ) -> None:
+        with suppress(TimeoutError):
+            async with asyncio.timeout(self.__window_seconds):
+                await batch.is_full.wait()
+
+        self.__close(batch_key, batch)
+        perform, key = batch_key
+
+        try:
+            outputs = await perform(key, tuple(batch.inputs))
+        except Exception as error:
+            if len(batch.inputs) > 1:
+                await self.__perform_one_by_one(perform, key, batch)
+            elif not batch.futures[0].done():
+                batch.futures[0].set_exception(error)
+        else:
+            for future, output in zip(batch.futures, outputs, strict=True):
+                if not future.done():
+                    future.set_result(output)
+        finally:
+            for future in batch.futures:
+                future.cancel()
+
+    async def __perform_one_by_one(
+        self,
+        perform: Perform[KeyT, InputT, Any],
+        key: KeyT,
+        batch: _Batch[InputT, Any],
+    ) -> None:
+        for input_, future in zip(batch.inputs, batch.futures, strict=True):
+            if future.done():
+                continue
+
+            try:
+                (output,) = await perform(key, (input_,))
+            except Exception as error:
+                future.set_exception(error)
+            else:
+                future.set_result(output)
+
+    def __close(
+        self, batch_key: _BatchKey[KeyT], batch: _Batch[InputT, Any]
+    ) -> None:
+        if self.__batches.get(batch_key) is batch:
+            del self.__batches[batch_key]
@@ -1,9 +1,102 @@
+from dataclasses import dataclass
+
 import typenv
 
 
+@dataclass(kw_only=True, frozen=True, slots=True)
+class MongoReads:
+    preference: str
+    max_staleness_seconds: int = -1
+    concern_level: str | None = None
+    tag_sets: tuple[dict[str, str], ...] = ()
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class MongoConnection:
+    max_pool_size: int | None = None
+    min_pool_size: int | None = None
+    max_idle_time_ms: int | None = None
+    max_connecting: int | None = None
+    wait_queue_timeout_ms: int | None = None
+    server_selection_timeout_ms: int | None = None
+    connect_timeout_ms: int | None = None
+    socket_timeout_ms: int | None = None
+    compressors: tuple[str, ...] = ()
+    zlib_compression_level: int | None = None
+
+
 _env = typenv.Env()
 _env.read_env(".env")
 
 
+def _mongo_reads(
+    name: str, *, preference: str, concern_level: str | None = None
+) -> MongoReads:
+    prefix = f"AQUA_{name}_MONGO"
+
+    return MongoReads(
+        preference=_env.str(f"{prefix}_READ_PREFERENCE", default=preference),
+        max_staleness_seconds=_env.int(
+            f"{prefix}_MAX_STALENESS_SECONDS", default=-1
+        ),
+        concern_level=_env.str(f"{prefix}_READ_CONCERN", default=concern_level),
+        tag_sets=tuple(_env.json(f"{prefix}_TAG_SETS", default=list())),
+    )
+
+
 is_dev = _env.bool("AQUA_DEV")
 mongo_uri = _env.str("AQUA_MONGO_URI")
+mongo_connection = MongoConnection(
+    max_pool_size=_env.int("AQUA_MONGO_MAX_POOL_SIZE", default=None),
+    min_pool_size=_env.int("AQUA_MONGO_MIN_POOL_SIZE", default=None),
+    max_idle_time_ms=_env.int("AQUA_MONGO_MAX_IDLE_TIME_MS", default=None),
+    max_connecting=_env.int("AQUA_MONGO_MAX_CONNECTING", default=None),
+    wait_queue_timeout_ms=_env.int(
+        "AQUA_MONGO_WAIT_QUEUE_TIMEOUT_MS", default=None
+    ),
+    server_selection_timeout_ms=_env.int(
+        "AQUA_MONGO_SERVER_SELECTION_TIMEOUT_MS", default=None
+    ),
+    connect_timeout_ms=_env.int("AQUA_MONGO_CONNECT_TIMEOUT_MS", default=None),
+    socket_timeout_ms=_env.int("AQUA_MONGO_SOCKET_TIMEOUT_MS", default=None),
+    compressors=tuple(_env.list("AQUA_MONGO_COMPRESSORS", default=list())),
+    zlib_compression_level=_env.int(
+        "AQUA_MONGO_ZLIB_COMPRESSION_LEVEL", default=None
+    ),
+)
+
+repo_mongo_reads = _mongo_reads("REPO", preference="primary")
+current_day_view_mongo_reads = _mongo_reads(
+    "CURRENT_DAY_VIEW", preference="primary"
+)
+past_day_view_mongo_reads = _mongo_reads(
+    "PAST_DAY_VIEW", preference="secondaryPreferred"
+)
+user_view_mongo_reads = _mongo_reads("USER_VIEW", preference="primary")
+records_view_mongo_reads = _mongo_reads("RECORDS_VIEW", preference="primary")
+history_view_mongo_reads = _mongo_reads(
+    "HISTORY_VIEW", preference="secondaryPreferred"
+)
+rollup_view_mongo_reads = _mongo_reads("ROLLUP_VIEW", preference="primary")
+ledger_view_mongo_reads = _mongo_reads("LEDGER_VIEW", preference="primary")
+analytics_view_mongo_reads = _mongo_reads(
+    "ANALYTICS_VIEW", preference="secondaryPreferred", concern_level="majority"
+)
+causal_view_mongo_reads = _mongo_reads(
+    "CAUSAL_VIEW", preference="secondaryPreferred", concern_level="majority"
+)
+
+archive_horizon_days = _env.int("AQUA_ARCHIVE_HORIZON_DAYS", default=365)
+archive_batch_size = _env.int("AQUA_ARCHIVE_BATCH_SIZE", default=500)
+archive_pause_seconds = _env.float("AQUA_ARCHIVE_PAUSE_SECONDS", default=0.1)
+
+max_viewed_day_count = _env.int("AQUA_MAX_VIEWED_DAY_COUNT", default=366)
+
+analytics_cache_size = _env.int("AQUA_ANALYTICS_CACHE_SIZE", default=10_000)
+
+water_writing_coalescing_window_seconds = _env.float(
+    "AQUA_WATER_WRITING_COALESCING_WINDOW_SECONDS", default=0
+)
+water_writing_max_coalesced_count = _env.int(
+    "AQUA_WATER_WRITING_MAX_COALESCED_COUNT", default=50
+)
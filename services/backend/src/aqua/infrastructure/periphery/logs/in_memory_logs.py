@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from uuid import UUID
 
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
@@ -40,3 +41,9 @@ class NewRecordLog:
 @dataclass(kw_only=True, frozen=True, slots=True)
 class RecordCancellationLog:
     record: Record
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class ConflictRetryLog:
+    user_id: UUID
+    attempt_number: int
@@ -5,3 +5,4 @@ new_day_state_log = "new day state"
 new_record_log = "new record"
 registered_user_log = "new user in aqua module"
 record_cancellation_log = "record was cancelled"
+conflict_retry_log = "retry after write conflict"
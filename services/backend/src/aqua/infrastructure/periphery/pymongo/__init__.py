@@ -1,4 +1,16 @@
+from aqua.infrastructure.periphery.pymongo import archive as archive
+from aqua.infrastructure.periphery.pymongo import causality as causality
 from aqua.infrastructure.periphery.pymongo import clients as clients
 from aqua.infrastructure.periphery.pymongo import document as document
+from aqua.infrastructure.periphery.pymongo import indexes as indexes
+from aqua.infrastructure.periphery.pymongo import ledgers as ledgers
 from aqua.infrastructure.periphery.pymongo import operations as operations
 from aqua.infrastructure.periphery.pymongo import operators as operators
+from aqua.infrastructure.periphery.pymongo import (
+    pool_metrics as pool_metrics,
+)
+from aqua.infrastructure.periphery.pymongo import reads as reads
+from aqua.infrastructure.periphery.pymongo import (
+    record_cursors as record_cursors,
+)
+from aqua.infrastructure.periphery.pymongo import rollups as rollups
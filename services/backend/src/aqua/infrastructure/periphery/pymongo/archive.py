@@ -0,0 +1,174 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import AsyncIterator
+from uuid import UUID
+
+from pymongo import AsyncMongoClient, ReadPreference
+from pymongo.asynchronous.client_session import AsyncClientSession
+
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.serializing.from_native.to_document import (
+    document_date_of,
+)
+
+
+archived_collection_names = {
+    "days": "archived_days",
+    "records": "archived_records",
+}
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class ArchivingOutput:
+    archived_day_count: int
+    archived_record_count: int
+
+    def __add__(self, output: "ArchivingOutput") -> "ArchivingOutput":
+        return ArchivingOutput(
+            archived_day_count=(
+                self.archived_day_count + output.archived_day_count
+            ),
+            archived_record_count=(
+                self.archived_record_count + output.archived_record_count
+            ),
+        )
+
+
+empty_archiving_output = ArchivingOutput(
+    archived_day_count=0, archived_record_count=0
+)
+
+
+async def archive_history(
+    client: AsyncMongoClient[Document],
+    *,
+    before: date,
+    batch_size: int = 500,
+    pause_seconds: float = 0,
+    after_user_id: UUID | None = None,
+) -> ArchivingOutput:
+    output = empty_archiving_output
+
+    async for user_id in _user_ids(client, after=after_user_id):
+        while True:
+            batch_output = await archive_history_batch(
+                client, user_id=user_id, before=before, batch_size=batch_size
+            )
+
+            if batch_output.archived_day_count == 0:
+                break
+
+            output += batch_output
+            await asyncio.sleep(pause_seconds)
+
+    return output
+
+
+async def archive_history_batch(
+    client: AsyncMongoClient[Document],
+    *,
+    user_id: UUID,
+    before: date,
+    batch_size: int,
+) -> ArchivingOutput:
+    async with (
+        client.start_session() as session,
+        await session.start_transaction(read_preference=ReadPreference.PRIMARY),
+    ):
+        return await _moved_batch(
+            client,
+            session,
+            user_id=user_id,
+            before=before,
+            batch_size=batch_size,
+        )
+
+
+async def _moved_batch(
+    client: AsyncMongoClient[Document],
+    session: AsyncClientSession,
+    *,
+    user_id: UUID,
+    before: date,
+    batch_size: int,
+) -> ArchivingOutput:
+    db = client.db
+    document_before = document_date_of(before)
+
+    day_documents = await db.days.find(
+        {"user_id": user_id, "date": {"$lt": document_before}},
+        sort={"date": 1},
+        limit=batch_size,
+        session=session,
+        comment="days to archive",
+    ).to_list()
+
+    if not day_documents:
+        return empty_archiving_output
+
+    records_before = document_before
+
+    if len(day_documents) == batch_size:
+        records_before = day_documents[-1]["date"] + timedelta(days=1)
+
+    record_documents = await db.records.find(
+        {"user_id": user_id, "recording_time": {"$lt": records_before}},
+        session=session,
+        comment="records to archive",
+    ).to_list()
+
+    await _moved(day_documents, "days", client=client, session=session)
+    await _moved(record_documents, "records", client=client, session=session)
+
+    return ArchivingOutput(
+        archived_day_count=len(day_documents),
+        archived_record_count=len(record_documents),
+    )
+
+
+async def _moved(
+    documents: list[Document],
+    collection_name: str,
+    *,
+    client: AsyncMongoClient[Document],
+    session: AsyncClientSession,
+) -> None:
+    if not documents:
+        return
+
+    archived_collection_name = archived_collection_names[collection_name]
+
+    await client.db[archived_collection_name].insert_many(
+        documents, session=session, comment="archive documents"
+    )
+    await client.db[collection_name].delete_many(
+        {"_id": {"$in": [document["_id"] for document in documents]}},
+        session=session,
+        comment="delete archived documents",
+    )
+
+
+async def _user_ids(
+    client: AsyncMongoClient[Document], *, after: UUID | None
+) -> AsyncIterator[UUID]:
+    page_size = 1000
+    last_user_id = after
+
+    while True:
+        filter_ = {} if last_user_id is None else {"_id": {"$gt": last_user_id}}
+        user_documents = await client.db.users.find(
+            filter_,
+            projection={"_id": True},
+            sort={"_id": 1},
+            limit=page_size,
+            comment="users to archive",
+        ).to_list()
+
+        for user_document in user_documents:
+            user_id: UUID = user_document["_id"]
+            last_user_id = user_id
+            yield user_id
+
+        if len(user_documents) < page_size:
+            return
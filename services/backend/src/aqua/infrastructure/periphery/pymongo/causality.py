@@ -0,0 +1,95 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, TypeIs
+
+from bson import decode, encode
+from bson.errors import BSONError
+from bson.timestamp import Timestamp
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import AsyncClientSession
+
+from aqua.infrastructure.periphery.pymongo.document import Document
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class CausalityToken:
+    operation_time: Timestamp
+    cluster_time: Document
+
+
+def causality_token_of(
+    session: AsyncClientSession | None,
+) -> CausalityToken | None:
+    if session is None:
+        return None
+
+    operation_time = session.operation_time
+    cluster_time = session.cluster_time
+
+    if operation_time is None or cluster_time is None:
+        return None
+
+    return CausalityToken(
+        operation_time=operation_time, cluster_time=dict(cluster_time)
+    )
+
+
+def encoded_causality_token_of(token: CausalityToken | None) -> str | None:
+    if token is None:
+        return None
+
+    document = {
+        "operation_time": token.operation_time,
+        "cluster_time": token.cluster_time,
+    }
+    return urlsafe_b64encode(encode(document)).decode()
+
+
+def decoded_causality_token_of(
+    encoded_token: str | None,
+) -> CausalityToken | None:
+    if encoded_token is None:
+        return None
+
+    try:
+        document = decode(urlsafe_b64decode(encoded_token))
+    except (Base64Error, BSONError, ValueError):
+        return None
+
+    operation_time = document.get("operation_time")
+    cluster_time = document.get("cluster_time")
+
+    if not isinstance(operation_time, Timestamp):
+        return None
+
+    if not _is_cluster_time(cluster_time):
+        return None
+
+    return CausalityToken(
+        operation_time=operation_time, cluster_time=cluster_time
+    )
+
+
+@asynccontextmanager
+async def causal_session_with(
+    client: AsyncMongoClient[Document], token: CausalityToken
+) -> AsyncIterator[AsyncClientSession | None]:
+    async with client.start_session(causal_consistency=True) as session:
+        try:
+            session.advance_cluster_time(token.cluster_time)
+            session.advance_operation_time(token.operation_time)
+        except (TypeError, ValueError):
+            yield None
+            return
+
+        yield session
+
+
+def _is_cluster_time(value: object) -> TypeIs[Document]:
+    return (
+        isinstance(value, dict)
+        and isinstance(value.get("clusterTime"), Timestamp)
+        and isinstance(value.get("signature"), dict)
+    )
@@ -1,18 +1,50 @@
+from typing import Any, Iterable
+
 from pymongo import AsyncMongoClient
+from pymongo.monitoring import CommandListener, ConnectionPoolListener
 
 from aqua.infrastructure.periphery import envs
+from aqua.infrastructure.periphery.envs import MongoConnection
 from aqua.infrastructure.periphery.pymongo.document import Document
 
 
 def client_with(
-    *, read_preference: str | None = None
+    *,
+    read_preference: str | None = None,
+    connection: MongoConnection | None = None,
+    pool_listeners: Iterable[ConnectionPoolListener] = (),
+    command_listeners: Iterable[CommandListener] = (),
 ) -> AsyncMongoClient[Document]:
     if read_preference is None:
         read_preference = "secondaryPreferred"
 
+    if connection is None:
+        connection = envs.mongo_connection
+
     return AsyncMongoClient(
         envs.mongo_uri,
         uuidRepresentation="standard",
         tz_aware=True,
         readPreference=read_preference,
+        event_listeners=[*pool_listeners, *command_listeners],
+        **connection_options_of(connection),
     )
+
+
+def connection_options_of(connection: MongoConnection) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "maxPoolSize": connection.max_pool_size,
+        "minPoolSize": connection.min_pool_size,
+        "maxIdleTimeMS": connection.max_idle_time_ms,
+        "maxConnecting": connection.max_connecting,
+        "waitQueueTimeoutMS": connection.wait_queue_timeout_ms,
+        "serverSelectionTimeoutMS": connection.server_selection_timeout_ms,
+        "connectTimeoutMS": connection.connect_timeout_ms,
+        "socketTimeoutMS": connection.socket_timeout_ms,
+        "zlibCompressionLevel": connection.zlib_compression_level,
+    }
+
+    if connection.compressors:
+        options["compressors"] = ",".join(connection.compressors)
+
+    return {name: value for name, value in options.items() if value is not None}
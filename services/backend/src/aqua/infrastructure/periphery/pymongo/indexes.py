@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Iterable, Literal
+
+from pymongo import AsyncMongoClient, IndexModel
+
+from aqua.infrastructure.periphery.pymongo.document import Document
+
+
+type Direction = Literal[1, -1]
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Index:
+    collection_name: str
+    keys: tuple[tuple[str, Direction], ...]
+    is_unique: bool = False
+
+    @property
+    def name(self) -> str:
+        return "_".join(
+            f"{field}_{direction}" for field, direction in self.keys
+        )
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return tuple(field for field, _ in self.keys)
+
+    def to_model(self) -> IndexModel:
+        return IndexModel(
+            list(self.keys), name=self.name, unique=self.is_unique
+        )
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class UnusedIndex:
+    collection_name: str
+    name: str
+
+
+indexes = (
+    Index(
+        collection_name="days",
+        keys=(("user_id", 1), ("date", 1)),
+        is_unique=True,
+    ),
+    Index(
+        collection_name="records",
+        keys=(("user_id", 1), ("recording_time", -1), ("_id", -1)),
+    ),
+    Index(
+        collection_name="records",
+        keys=(
+            ("user_id", 1),
+            ("is_cancelled", 1),
+            ("recording_time", -1),
+            ("_id", -1),
+        ),
+    ),
+    Index(
+        collection_name="rollups",
+        keys=(("user_id", 1), ("period", 1), ("start_date", 1)),
+        is_unique=True,
+    ),
+    Index(collection_name="ledgers", keys=(("user_id", 1),), is_unique=True),
+    Index(
+        collection_name="archived_days",
+        keys=(("user_id", 1), ("date", 1)),
+        is_unique=True,
+    ),
+    Index(
+        collection_name="archived_records",
+        keys=(("user_id", 1), ("recording_time", -1), ("_id", -1)),
+    ),
+    Index(
+        collection_name="archived_records",
+        keys=(
+            ("user_id", 1),
+            ("is_cancelled", 1),
+            ("recording_time", -1),
+            ("_id", -1),
+        ),
+    ),
+)
+
+
+async def ensure_indexes(
+    client: AsyncMongoClient[Document], *, indexes: Iterable[Index] = indexes
+) -> None:
+    for collection_name, collection_indexes in _by_collection(indexes):
+        await client.db[collection_name].create_indexes(
+            [index.to_model() for index in collection_indexes],
+            comment="ensure indexes",
+        )
+
+
+async def missing_indexes(
+    client: AsyncMongoClient[Document], *, indexes: Iterable[Index] = indexes
+) -> tuple[Index, ...]:
+    missing_indexes = list[Index]()
+
+    for collection_name, collection_indexes in _by_collection(indexes):
+        collection = client.db[collection_name]
+        index_information = await collection.index_information()
+        stored_indexes = {
+            (_keys_of(info["key"]), bool(info.get("unique")))
+            for info in index_information.values()
+        }
+
+        missing_indexes.extend(
+            index
+            for index in collection_indexes
+            if (index.keys, index.is_unique) not in stored_indexes
+        )
+
+    return tuple(missing_indexes)
+
+
+async def unused_indexes(
+    client: AsyncMongoClient[Document], *, indexes: Iterable[Index] = indexes
+) -> tuple[UnusedIndex, ...]:
+    unused_indexes = list[UnusedIndex]()
+    collection_names = {"users"} | {index.collection_name for index in indexes}
+
+    for collection_name in sorted(collection_names):
+        stats = await client.db[collection_name].aggregate([
+            {"$indexStats": {}},
+            {"$match": {"name": {"$ne": "_id_"}, "accesses.ops": 0}},
+        ])
+
+        async for stat in stats:
+            unused_index = UnusedIndex(
+                collection_name=collection_name, name=stat["name"]
+            )
+            unused_indexes.append(unused_index)
+
+    return tuple(unused_indexes)
+
+
+def _by_collection(
+    indexes: Iterable[Index],
+) -> Iterable[tuple[str, tuple[Index, ...]]]:
+    def collection_name_of(index: Index) -> str:
+        return index.collection_name
+
+    sorted_indexes = sorted(indexes, key=collection_name_of)
+
+    for collection_name, collection_indexes in groupby(
+        sorted_indexes, key=collection_name_of
+    ):
+        yield collection_name, tuple(collection_indexes)
+
+
+def _keys_of(
+    stored_keys: Iterable[tuple[str, int | float]],
+) -> tuple[tuple[str, int], ...]:
+    return tuple((field, int(direction)) for field, direction in stored_keys)
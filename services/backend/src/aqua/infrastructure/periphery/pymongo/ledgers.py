@@ -0,0 +1,164 @@
+from collections.abc import Iterable
+from dataclasses import replace
+from datetime import date
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+
+from aqua.domain.model.core.vos.ledger import (
+    Ledger,
+    summed_indexes_before,
+    summed_indexes_through,
+    updated_indexes_of,
+)
+from aqua.domain.model.primitives.vos.water import Water
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.indexes import (
+    ensure_indexes,
+    indexes,
+)
+from aqua.infrastructure.periphery.serializing.from_document.to_native import (
+    native_date_of,
+)
+from aqua.infrastructure.periphery.validation.objects import (
+    StrictValidationObject,
+)
+
+
+_rebuilt_ledger_collection_name = "rebuilt_ledgers"
+_rebuilt_ledger_batch_size = 500
+
+
+def ledger_filter_of(*, user_id: UUID) -> Document:
+    return {"user_id": user_id}
+
+
+def ledger_increments_with(*, milliliters: int, date_: date) -> Document:
+    increments: Document = {"version": 1}
+
+    if milliliters:
+        increments |= {
+            _partial_sum_field_of(index): milliliters
+            for index in updated_indexes_of(date_)
+        }
+
+    return increments
+
+
+ledger_version_projection = {"_id": False, "version": True}
+
+
+def ledger_version_of(document: Document | None) -> int:
+    if document is None:
+        return 0
+
+    return StrictValidationObject(document).n["version", int] or 0
+
+
+def ledger_projection_between(*, from_: date, to: date) -> Document:
+    indexes = {*summed_indexes_through(to), *summed_indexes_before(from_)}
+
+    return {"_id": False} | {
+        _partial_sum_field_of(index): True for index in sorted(indexes)
+    }
+
+
+def ledger_of(document: Document) -> Ledger:
+    partial_sums = StrictValidationObject(document).n["partial_sums", dict]
+    partial_sum_object = StrictValidationObject(partial_sums or dict())
+
+    return Ledger(
+        partial_sums={
+            int(index): partial_sum_object[index, int]
+            for index in partial_sums or dict()
+        }
+    )
+
+
+def ledger_document_of(*, user_id: UUID, ledger: Ledger) -> Document:
+    return {
+        "user_id": user_id,
+        "partial_sums": {
+            str(index): partial_sum
+            for index, partial_sum in ledger.partial_sums.items()
+        },
+    }
+
+
+async def rebuild_ledgers(client: AsyncMongoClient[Document]) -> None:
+    rebuilt_ledgers = client.db[_rebuilt_ledger_collection_name]
+    await rebuilt_ledgers.drop(comment="clear rebuilt ledgers")
+
+    rebuilt_ledger_indexes = (
+        replace(index, collection_name=_rebuilt_ledger_collection_name)
+        for index in indexes
+        if index.collection_name == "ledgers"
+    )
+    await ensure_indexes(client, indexes=rebuilt_ledger_indexes)
+
+    cursor = await client.db.days.aggregate(
+        [
+            {"$unionWith": "archived_days"},
+            {
+                "$group": {
+                    "_id": "$user_id",
+                    "days": {
+                        "$push": {
+                            "date": "$date",
+                            "water_balance": "$water_balance",
+                        }
+                    },
+                }
+            },
+            {
+                "$lookup": {
+                    "from": "ledgers",
+                    "localField": "_id",
+                    "foreignField": "user_id",
+                    "pipeline": [{"$project": ledger_version_projection}],
+                    "as": "ledgers",
+                }
+            },
+        ],
+        comment="rebuild ledgers",
+    )
+    ledger_documents = list[Document]()
+
+    async for document in cursor:
+        ledger = Ledger.of(_water_by_date_of(document["days"]))
+        ledger_document = ledger_document_of(
+            user_id=document["_id"], ledger=ledger
+        )
+        ledger_document["version"] = (
+            max(map(ledger_version_of, document["ledgers"]), default=0) + 1
+        )
+        ledger_documents.append(ledger_document)
+
+        if len(ledger_documents) >= _rebuilt_ledger_batch_size:
+            await rebuilt_ledgers.insert_many(
+                ledger_documents, comment="rebuild ledgers"
+            )
+            ledger_documents.clear()
+
+    if ledger_documents:
+        await rebuilt_ledgers.insert_many(
+            ledger_documents, comment="rebuild ledgers"
+        )
+
+    await rebuilt_ledgers.rename(
+        "ledgers", dropTarget=True, comment="replace ledgers"
+    )
+
+
+def _water_by_date_of(
+    day_documents: Iterable[Document],
+) -> Iterable[tuple[date, Water]]:
+    for day_document in day_documents:
+        date_ = native_date_of(day_document["date"])
+        milliliters = day_document["water_balance"]
+
+        yield date_, Water.trusted(milliliters=milliliters)
+
+
+def _partial_sum_field_of(index: int) -> str:
+    return f"partial_sums.{index}"
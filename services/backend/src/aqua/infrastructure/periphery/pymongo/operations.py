@@ -1,6 +1,7 @@
-from typing import Any, Iterable, Literal
+from typing import Iterable
 
 from pymongo import (
+    AsyncMongoClient,
     DeleteMany,
     DeleteOne,
     InsertOne,
@@ -9,6 +10,7 @@ from pymongo import (
     UpdateOne,
 )
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.errors import ClientBulkWriteException
 
 from aqua.infrastructure.periphery.pymongo.document import Document
 
@@ -22,56 +24,52 @@ type Operation = (
     | DeleteMany
 )
 type Put = UpdateOne
-type Map = UpdateOne
-type Push = UpdateOne
+type Insert = InsertOne[Document]
 
 
-type Sort = dict[str, Literal[1, -1]]
+class Error(Exception): ...
 
 
-class ArrayOperations:
-    def __init__(
-        self, *, namespace: str, prefix: str, sort: Sort | None = None
-    ) -> None:
-        self.__namespace = namespace
-        self.__prefix = prefix
-        self.__sort = sort
+class DuplicateKeyError(Error): ...
 
-    def to_map(self, document: Document, *, id: Any) -> Map:  # noqa: ANN401
-        return UpdateOne(
-            {"_id": id},
-            {"$set": self.__for_iteration(document)},
-            array_filters=[{f"{self.__prefix}._id": document["_id"]}],
-            namespace=self.__namespace,
-        )
 
-    def to_push(self, document: Document, *, id: Any) -> Push:  # noqa: ANN401
-        pushing = self.__pushing_of(document)
+class ClosedOperationBatchError(Error): ...
 
-        return UpdateOne(
-            {"_id": id}, pushing, upsert=True, namespace=self.__namespace
-        )
 
-    def __pushing_of(self, document: Document) -> Document:
-        params: Document = {"$each": [document]}
+_duplicate_key_error_code = 11000
+
+
+class OperationBatch:
+    def __init__(self) -> None:
+        self.__operations: list[Operation] | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.__operations is not None
+
+    def open(self) -> None:
+        self.__operations = list()
 
-        if self.__sort is not None:
-            params["$sort"] = self.__sort
+    def add_all(self, operations: Iterable[Operation]) -> None:
+        if self.__operations is None:
+            raise ClosedOperationBatchError
 
-        return {"$push": {f"{self.__prefix}s": params}}
+        self.__operations.extend(operations)
 
-    def __for_iteration(self, document: Document) -> Document:
-        return {
-            f"{self.__prefix}s.$[{self.__prefix}].{field_name}": field_value
-            for field_name, field_value in document.items()
-            if field_name != "_id"
-        }
+    def close(self) -> tuple[Operation, ...]:
+        operations = tuple(self.__operations or tuple())
+        self.__operations = None
+
+        return operations
 
 
 class RootOperations:
     def __init__(self, *, namespace: str) -> None:
         self.__namespace = namespace
 
+    def to_insert(self, document: Document) -> Insert:
+        return InsertOne(document, namespace=self.__namespace)
+
     def to_put(self, document: Document) -> Put:
         filter_ = {"_id": document["_id"]}
         command = {"$set": _command_of(document)}
@@ -80,24 +78,58 @@ class RootOperations:
             filter_, command, upsert=True, namespace=self.__namespace
         )
 
+    def to_put_versioned(
+        self, document: Document, *, version: int | None
+    ) -> Put:
+        filter_ = {"_id": document["_id"]}
+
+        if version is not None:
+            filter_["version"] = version
+
+        command = {"$set": _command_of(document), "$inc": {"version": 1}}
+
+        return UpdateOne(
+            filter_, command, upsert=True, namespace=self.__namespace
+        )
+
+    def to_increment(self, filter_: Document, increments: Document) -> Put:
+        command = {"$inc": increments}
+
+        return UpdateOne(
+            filter_, command, upsert=True, namespace=self.__namespace
+        )
+
 
 async def execute(
     raw_operations: Iterable[Operation],
     *,
-    session: AsyncClientSession,
+    client: AsyncMongoClient[Document],
+    session: AsyncClientSession | None = None,
     comment: str | None = None,
+    batch: OperationBatch | None = None,
+    is_ordered: bool = False,
 ) -> None:
+    if batch is not None and batch.is_open:
+        batch.add_all(raw_operations)
+        return
+
     operations = list(raw_operations)
 
     if not operations:
         return
 
-    await session.client.bulk_write(
-        operations,
-        session=session,
-        ordered=False,
-        comment=comment,
-    )
+    try:
+        await client.bulk_write(
+            operations,
+            session=session,
+            ordered=is_ordered,
+            comment=comment,
+        )
+    except ClientBulkWriteException as error:
+        if _has_duplicate_key_error(error):
+            raise DuplicateKeyError from error
+
+        raise
 
 
 def _command_of(document: Document) -> Document:
@@ -105,3 +137,12 @@ def _command_of(document: Document) -> Document:
     del command_document["_id"]
 
     return command_document
+
+
+def _has_duplicate_key_error(error: ClientBulkWriteException) -> bool:
+    write_errors: list[Document] = error.details.get("writeErrors", list())
+
+    return any(
+        write_error.get("code") == _duplicate_key_error_code
+        for write_error in write_errors
+    )
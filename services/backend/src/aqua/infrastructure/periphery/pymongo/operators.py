@@ -13,5 +13,18 @@ def in_date_range(document_date: DocumentDate) -> Document:
     }
 
 
+def in_date_expr_range(field: str, *, date_expr: str) -> Document:
+    next_date_expr = {
+        "$dateAdd": {"startDate": date_expr, "unit": "day", "amount": 1}
+    }
+
+    return {
+        "$and": [
+            {"$gte": [field, date_expr]},
+            {"$lt": [field, next_date_expr]},
+        ]
+    }
+
+
 def cond_about(query: Document, *, field: str) -> list[Document]:
     return [{operator: [field, operand]} for operator, operand in query.items()]
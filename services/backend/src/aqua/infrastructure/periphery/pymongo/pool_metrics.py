@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+
+from pymongo import monitoring
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class PoolMetricsSnapshot:
+    checked_out_connection_count: int
+    max_checked_out_connection_count: int
+    checkout_count: int
+    failed_checkout_count: int
+    total_checkout_wait_seconds: float
+    max_checkout_wait_seconds: float
+
+    @property
+    def average_checkout_wait_seconds(self) -> float:
+        checkout_attempt_count = (
+            self.checkout_count + self.failed_checkout_count
+        )
+
+        if checkout_attempt_count == 0:
+            return 0
+
+        return self.total_checkout_wait_seconds / checkout_attempt_count
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    def __init__(self) -> None:
+        self.__checked_out_connection_count = 0
+        self.__max_checked_out_connection_count = 0
+        self.__checkout_count = 0
+        self.__failed_checkout_count = 0
+        self.__total_checkout_wait_seconds = 0.0
+        self.__max_checkout_wait_seconds = 0.0
+
+    def snapshot(self) -> PoolMetricsSnapshot:
+        return PoolMetricsSnapshot(
+            checked_out_connection_count=self.__checked_out_connection_count,
+            max_checked_out_connection_count=(
+                self.__max_checked_out_connection_count
+            ),
+            checkout_count=self.__checkout_count,
+            failed_checkout_count=self.__failed_checkout_count,
+            total_checkout_wait_seconds=self.__total_checkout_wait_seconds,
+            max_checkout_wait_seconds=self.__max_checkout_wait_seconds,
+        )
+
+    def connection_checked_out(
+        self, event: monitoring.ConnectionCheckedOutEvent
+    ) -> None:
+        self.__checked_out_connection_count += 1
+        self.__max_checked_out_connection_count = max(
+            self.__max_checked_out_connection_count,
+            self.__checked_out_connection_count,
+        )
+        self.__checkout_count += 1
+        self.__add_wait(event.duration)
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        self.__failed_checkout_count += 1
+        self.__add_wait(event.duration)
+
+    def connection_checked_in(
+        self,
+        event: monitoring.ConnectionCheckedInEvent,  # noqa: ARG002
+    ) -> None:
+        self.__checked_out_connection_count -= 1
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None: ...
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None: ...
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None: ...
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None: ...
+
+    def connection_created(
+        self, event: monitoring.ConnectionCreatedEvent
+    ) -> None: ...
+
+    def connection_ready(
+        self, event: monitoring.ConnectionReadyEvent
+    ) -> None: ...
+
+    def connection_closed(
+        self, event: monitoring.ConnectionClosedEvent
+    ) -> None: ...
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None: ...
+
+    def __add_wait(self, duration: float | None) -> None:
+        if duration is None:
+            return
+
+        self.__total_checkout_wait_seconds += duration
+        self.__max_checkout_wait_seconds = max(
+            self.__max_checkout_wait_seconds, duration
+        )
@@ -0,0 +1,36 @@
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import (
+    _ServerMode,
+    make_read_preference,
+    read_pref_mode_from_name,
+)
+
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.document import Document
+
+
+primary_reads = MongoReads(preference="primary")
+
+
+def read_preference_of(reads: MongoReads) -> _ServerMode:
+    return make_read_preference(
+        read_pref_mode_from_name(reads.preference),
+        list(reads.tag_sets) or None,
+        reads.max_staleness_seconds,
+    )
+
+
+def read_concern_of(reads: MongoReads) -> ReadConcern:
+    return ReadConcern(reads.concern_level)
+
+
+def db_with(
+    client: AsyncMongoClient[Document], reads: MongoReads
+) -> AsyncDatabase[Document]:
+    return client.get_database(
+        "db",
+        read_preference=read_preference_of(reads),
+        read_concern=read_concern_of(reads),
+    )
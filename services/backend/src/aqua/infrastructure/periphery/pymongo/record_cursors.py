@@ -0,0 +1,72 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from bson import decode, encode
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from bson.errors import BSONError
+
+from aqua.infrastructure.periphery.pymongo.document import Document
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class RecordCursor:
+    recording_time: datetime
+    record_id: UUID
+
+
+_codec_options: CodecOptions[Document] = CodecOptions(
+    tz_aware=True, uuid_representation=UuidRepresentation.STANDARD
+)
+
+
+def record_cursor_of(record_document: Document) -> RecordCursor:
+    return RecordCursor(
+        recording_time=record_document["recording_time"],
+        record_id=record_document["_id"],
+    )
+
+
+def encoded_record_cursor_of(cursor: RecordCursor) -> str:
+    document = {
+        "recording_time": cursor.recording_time,
+        "record_id": cursor.record_id,
+    }
+    return urlsafe_b64encode(
+        encode(document, codec_options=_codec_options)
+    ).decode()
+
+
+def decoded_record_cursor_of(encoded_cursor: str) -> RecordCursor | None:
+    try:
+        document = decode(
+            urlsafe_b64decode(encoded_cursor), codec_options=_codec_options
+        )
+    except (Base64Error, BSONError, ValueError):
+        return None
+
+    recording_time = document.get("recording_time")
+    record_id = document.get("record_id")
+
+    if not isinstance(recording_time, datetime):
+        return None
+
+    if not isinstance(record_id, UUID):
+        return None
+
+    return RecordCursor(recording_time=recording_time, record_id=record_id)
+
+
+def after_record_cursor(cursor: RecordCursor) -> Document:
+    return {
+        "$or": [
+            {"recording_time": {"$lt": cursor.recording_time}},
+            {
+                "recording_time": cursor.recording_time,
+                "_id": {"$lt": cursor.record_id},
+            },
+        ]
+    }
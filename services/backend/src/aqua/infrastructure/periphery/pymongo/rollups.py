@@ -0,0 +1,110 @@
+from dataclasses import replace
+from datetime import date
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+
+from aqua.application.rollups import Period, period_start_of
+from aqua.domain.model.core.vos.target import Result
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.indexes import (
+    ensure_indexes,
+    indexes,
+)
+from aqua.infrastructure.periphery.serializing.from_model.to_document import (
+    document_result_of,
+)
+from aqua.infrastructure.periphery.serializing.from_native.to_document import (
+    document_date_of,
+)
+
+
+def rollup_filter_of(*, user_id: UUID, period: Period, date_: date) -> Document:
+    return {
+        "user_id": user_id,
+        "period": period.name,
+        "start_date": document_date_of(period_start_of(period, date_)),
+    }
+
+
+def day_count_field_of(result: Result) -> str:
+    return f"{result.name}_day_count"
+
+
+_rebuilt_rollup_collection_name = "rebuilt_rollups"
+
+
+def rollup_pipeline_of(
+    period: Period, *, into: str = "rollups"
+) -> list[Document]:
+    date_trunc: Document = {"date": "$date", "unit": period.name}
+
+    if period is Period.week:
+        date_trunc["startOfWeek"] = "monday"
+
+    result_day_counts = {
+        day_count_field_of(result): {
+            "$sum": {
+                "$cond": [
+                    {"$eq": ["$result", document_result_of(result)]},
+                    1,
+                    0,
+                ]
+            }
+        }
+        for result in Result
+    }
+
+    return [
+        {"$unionWith": "archived_days"},
+        {
+            "$group": {
+                "_id": {
+                    "user_id": "$user_id",
+                    "start_date": {"$dateTrunc": date_trunc},
+                },
+                "water_balance": {"$sum": "$water_balance"},
+                "day_count": {"$sum": 1},
+                **result_day_counts,
+            }
+        },
+        {
+            "$set": {
+                "user_id": "$_id.user_id",
+                "period": period.name,
+                "start_date": "$_id.start_date",
+            }
+        },
+        {"$unset": "_id"},
+        {
+            "$merge": {
+                "into": into,
+                "on": ["user_id", "period", "start_date"],
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }
+        },
+    ]
+
+
+async def rebuild_rollups(client: AsyncMongoClient[Document]) -> None:
+    rebuilt_rollups = client.db[_rebuilt_rollup_collection_name]
+    await rebuilt_rollups.drop(comment="clear rebuilt rollups")
+
+    rebuilt_rollup_indexes = (
+        replace(index, collection_name=_rebuilt_rollup_collection_name)
+        for index in indexes
+        if index.collection_name == "rollups"
+    )
+    await ensure_indexes(client, indexes=rebuilt_rollup_indexes)
+
+    for period in Period:
+        cursor = await client.db.days.aggregate(
+            rollup_pipeline_of(period, into=_rebuilt_rollup_collection_name),
+            comment="rebuild rollups",
+        )
+        await cursor.to_list()
+
+    await rebuilt_rollups.rename(
+        "rollups", dropTarget=True, comment="replace rollups"
+    )
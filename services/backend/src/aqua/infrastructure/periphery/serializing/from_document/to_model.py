@@ -34,14 +34,14 @@ def maybe_result_of(document_result: int | None) -> Result | None:
 
 
 def water_of(document_water: int) -> Water:
-    return Water.with_(milliliters=document_water).unwrap()
+    return Water.trusted(milliliters=document_water)
 
 
 def maybe_weight_of(maybe_document_weight: int | None) -> Weight | None:
     if maybe_document_weight is None:
         return None
 
-    return Weight.with_(kilograms=maybe_document_weight).unwrap()
+    return Weight.trusted(kilograms=maybe_document_weight)
 
 
 def glass_of(document_glass: int) -> Glass:
@@ -65,4 +65,4 @@ def maybe_target_of(maybe_document_target: int | None) -> Target | None:
 
 
 def time_of(document_time: datetime) -> Time:
-    return Time.with_(datetime_=native_datetime_of(document_time)).unwrap()
+    return Time.trusted(datetime_=native_datetime_of(document_time))
@@ -1,4 +1,4 @@
-from datetime import date, datetime, timezone
+from datetime import UTC, date, datetime, timedelta, timezone, tzinfo
 
 from aqua.infrastructure.periphery.pymongo.document import (
     DocumentDate,
@@ -11,9 +11,10 @@ def native_date_of(document_date: DocumentDate) -> date:
 
 
 def native_datetime_of(document_datetime: DocumentDatetime) -> datetime:
-    tz = document_datetime.tzinfo
-    timedelta = None if tz is None else tz.utcoffset(None)
-    native_tz = None if timedelta is None else timezone(timedelta)
+    native_tz = _native_tz_of(document_datetime.tzinfo)
+
+    if type(document_datetime) is datetime:
+        return document_datetime.replace(tzinfo=native_tz)
 
     return datetime(
         document_datetime.year,
@@ -26,3 +27,15 @@ def native_datetime_of(document_datetime: DocumentDatetime) -> datetime:
         native_tz,
         fold=document_datetime.fold,
     )
+
+
+def _native_tz_of(tz: tzinfo | None) -> timezone | None:
+    offset = None if tz is None else tz.utcoffset(None)
+
+    if offset is None:
+        return None
+
+    if offset == timedelta(0):
+        return UTC
+
+    return timezone(offset)
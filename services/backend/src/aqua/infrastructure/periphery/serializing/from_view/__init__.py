@@ -1,3 +1,9 @@
+from aqua.infrastructure.periphery.serializing.from_view import (
+    to_csv as to_csv,
+)
 from aqua.infrastructure.periphery.serializing.from_view import (
     to_model as to_model,
 )
+from aqua.infrastructure.periphery.serializing.from_view import (
+    to_ndjson as to_ndjson,
+)
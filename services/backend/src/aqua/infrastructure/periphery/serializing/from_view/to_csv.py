@@ -0,0 +1,77 @@
+import csv
+from io import StringIO
+
+from aqua.infrastructure.periphery.views.db.history_view import (
+    DBHistoryDayRow,
+    DBHistoryRecordRow,
+    DBHistoryRow,
+)
+
+
+type CSVCell = str | int | None
+
+
+csv_header = (
+    "kind",
+    "id",
+    "date",
+    "target_water_balance_milliliters",
+    "water_balance_milliliters",
+    "result_code",
+    "correct_result_code",
+    "pinned_result_code",
+    "drunk_water_milliliters",
+    "recording_time",
+    "is_cancelled",
+)
+
+
+class CSVLines:
+    def __init__(self) -> None:
+        self.__buffer = StringIO()
+        self.__writer = csv.writer(self.__buffer, lineterminator="\n")
+
+    def header(self) -> str:
+        return self.__line_of(csv_header)
+
+    def line_of(self, row: DBHistoryRow) -> str:
+        return self.__line_of(_cells_of(row))
+
+    def __line_of(self, cells: tuple[CSVCell, ...]) -> str:
+        self.__buffer.seek(0)
+        self.__buffer.truncate()
+        self.__writer.writerow(cells)
+
+        return self.__buffer.getvalue()
+
+
+def _cells_of(row: DBHistoryRow) -> tuple[CSVCell, ...]:
+    match row:
+        case DBHistoryDayRow():
+            return (
+                "day",
+                str(row.day_id),
+                row.date_.isoformat(),
+                row.target_water_balance_milliliters,
+                row.water_balance_milliliters,
+                row.result_code,
+                row.correct_result_code,
+                row.pinned_result_code,
+                None,
+                None,
+                None,
+            )
+        case DBHistoryRecordRow():
+            return (
+                "record",
+                str(row.record_id),
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                row.drunk_water_milliliters,
+                row.recording_time.isoformat(),
+                str(row.is_cancelled).lower(),
+            )
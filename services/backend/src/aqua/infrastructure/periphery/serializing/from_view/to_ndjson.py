@@ -0,0 +1,40 @@
+import json
+from typing import Any
+
+from aqua.infrastructure.periphery.views.db.history_view import (
+    DBHistoryDayRow,
+    DBHistoryRecordRow,
+    DBHistoryRow,
+)
+
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def ndjson_line_of(row: DBHistoryRow) -> str:
+    return _encoder.encode(_object_of(row)) + "\n"
+
+
+def _object_of(row: DBHistoryRow) -> dict[str, Any]:
+    match row:
+        case DBHistoryDayRow():
+            return {
+                "kind": "day",
+                "id": str(row.day_id),
+                "date": row.date_.isoformat(),
+                "target_water_balance_milliliters": (
+                    row.target_water_balance_milliliters
+                ),
+                "water_balance_milliliters": row.water_balance_milliliters,
+                "result_code": row.result_code,
+                "correct_result_code": row.correct_result_code,
+                "pinned_result_code": row.pinned_result_code,
+            }
+        case DBHistoryRecordRow():
+            return {
+                "kind": "record",
+                "id": str(row.record_id),
+                "drunk_water_milliliters": row.drunk_water_milliliters,
+                "recording_time": row.recording_time.isoformat(),
+                "is_cancelled": row.is_cancelled,
+            }
@@ -1,3 +1,4 @@
 from aqua.infrastructure.periphery.validation import casted_to as casted_to
+from aqua.infrastructure.periphery.validation import decoders as decoders
 from aqua.infrastructure.periphery.validation import error as error
 from aqua.infrastructure.periphery.validation import objects as objects
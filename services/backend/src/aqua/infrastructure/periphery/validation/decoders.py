@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+from aqua.infrastructure.periphery.validation.error import ValidationError
+
+
+type Decoder[T] = Callable[[Mapping[str, Any]], T]
+type Reader = Callable[[Mapping[str, Any]], Any]
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Field:
+    key: str
+    type_: type[Any]
+    converted: Callable[[Any], Any] | None = None
+    is_strict: bool = True
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class New:
+    factory: Callable[[], Any]
+
+
+type Spec = Field | New
+
+
+def decoder_of[T](factory: Callable[..., T], **specs: Spec) -> Decoder[T]:
+    readers = tuple(
+        (argument_name, _reader_of(spec))
+        for argument_name, spec in specs.items()
+    )
+
+    def decode(document: Mapping[str, Any]) -> T:
+        return factory(**{
+            argument_name: read(document) for argument_name, read in readers
+        })
+
+    return decode
+
+
+def _reader_of(spec: Spec) -> Reader:
+    if isinstance(spec, New):
+        factory = spec.factory
+        return lambda _: factory()
+
+    read = _field_reader_of(spec)
+    converted = spec.converted
+
+    if converted is None:
+        return read
+
+    return lambda document: converted(read(document))
+
+
+def _field_reader_of(spec: Field) -> Reader:
+    key = spec.key
+    type_ = spec.type_
+
+    if spec.is_strict:
+
+        def read_strictly(document: Mapping[str, Any]) -> Any:  # noqa: ANN401
+            value = document.get(key)
+
+            if not isinstance(value, type_):
+                raise ValidationError
+
+            return value
+
+        return read_strictly
+
+    def read(document: Mapping[str, Any]) -> Any:  # noqa: ANN401
+        value = document.get(key)
+        return value if isinstance(value, type_) else None
+
+    return read
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DBAnalyticsView:
+    user_id: UUID
+    date_: date
+    good_day_streak: int
+    average_milliliters_by_weekday: tuple[int, ...]
+    glass_percentile_milliliters: int | None
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from uuid import UUID
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DBHistoryDayRow:
+    day_id: UUID
+    date_: date
+    target_water_balance_milliliters: int
+    water_balance_milliliters: int
+    result_code: int
+    correct_result_code: int
+    pinned_result_code: int | None
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DBHistoryRecordRow:
+    record_id: UUID
+    drunk_water_milliliters: int
+    recording_time: datetime
+    is_cancelled: bool
+
+
+type DBHistoryRow = DBHistoryDayRow | DBHistoryRecordRow
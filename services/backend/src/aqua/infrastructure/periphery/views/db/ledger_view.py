@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DBLedgerView:
+    user_id: UUID
+    from_: date
+    to: date
+    water_milliliters: int
+    average_water_milliliters: int
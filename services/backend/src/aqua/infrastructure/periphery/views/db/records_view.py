@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DBRecordsViewRecordData:
+    record_id: UUID
+    drunk_water_milliliters: int
+    recording_time: datetime
+    is_cancelled: bool
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DBRecordsView:
+    user_id: UUID
+    records: tuple[DBRecordsViewRecordData, ...]
+    next_cursor: str | None
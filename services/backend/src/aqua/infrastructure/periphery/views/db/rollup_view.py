@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DBRollupView:
+    user_id: UUID
+    period_name: str
+    start_date: date
+    water_balance_milliliters: int
+    day_count: int
+    good_day_count: int
+    not_enough_water_day_count: int
+    excess_water_day_count: int
+
+    @property
+    def average_water_balance_milliliters(self) -> int:
+        if self.day_count == 0:
+            return 0
+
+        return self.water_balance_milliliters // self.day_count
+
+
+def empty_db_rollup_view_with(
+    *, user_id: UUID, period_name: str, start_date: date
+) -> DBRollupView:
+    return DBRollupView(
+        user_id=user_id,
+        period_name=period_name,
+        start_date=start_date,
+        water_balance_milliliters=0,
+        day_count=0,
+        good_day_count=0,
+        not_enough_water_day_count=0,
+        excess_water_day_count=0,
+    )
@@ -1,3 +1,6 @@
+from aqua.infrastructure.periphery.views.in_memory import (
+    batch_writing_view as batch_writing_view,
+)
 from aqua.infrastructure.periphery.views.in_memory import (
     cancellation_view as cancellation_view,
 )
@@ -1,2 +1,3 @@
+from aqua.presentation import cli as cli
 from aqua.presentation import di as di
 from aqua.presentation import periphery as periphery
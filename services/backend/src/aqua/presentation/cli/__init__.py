@@ -0,0 +1,3 @@
+from aqua.presentation.cli import archive as archive
+from aqua.presentation.cli import indexes as indexes
+from aqua.presentation.cli import rollups as rollups
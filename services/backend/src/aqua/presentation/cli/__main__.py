@@ -0,0 +1,39 @@
+import asyncio
+import sys
+from argparse import ArgumentParser
+from uuid import UUID
+
+from aqua.presentation.cli import archive, indexes, rollups
+
+
+def main() -> None:
+    parser = ArgumentParser(prog="aqua")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    index_parser = commands.add_parser("indexes")
+    index_parser.add_argument("action", choices=["ensure", "report"])
+
+    rollup_parser = commands.add_parser("rollups")
+    rollup_parser.add_argument("action", choices=["rebuild"])
+
+    archive_parser = commands.add_parser("archive")
+    archive_parser.add_argument("action", choices=["run"])
+    archive_parser.add_argument("--after-user-id", type=UUID, default=None)
+
+    arguments = parser.parse_args()
+
+    match arguments.command, arguments.action:
+        case "indexes", "ensure":
+            exit_code = asyncio.run(indexes.ensure())
+        case "indexes", "report":
+            exit_code = asyncio.run(indexes.report())
+        case "rollups", "rebuild":
+            exit_code = asyncio.run(rollups.rebuild())
+        case "archive", "run":
+            exit_code = asyncio.run(archive.run(arguments.after_user_id))
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
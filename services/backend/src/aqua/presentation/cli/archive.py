@@ -0,0 +1,32 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from aqua.application.archive import archive_horizon_date_of
+from aqua.infrastructure.periphery import envs
+from aqua.infrastructure.periphery.pymongo.archive import archive_history
+from aqua.infrastructure.periphery.pymongo.clients import client_with
+
+
+async def run(after_user_id: UUID | None = None) -> int:
+    client = client_with(read_preference="primary")
+    before = archive_horizon_date_of(
+        datetime.now(UTC).date(), horizon_days=envs.archive_horizon_days
+    )
+
+    try:
+        output = await archive_history(
+            client,
+            before=before,
+            batch_size=envs.archive_batch_size,
+            pause_seconds=envs.archive_pause_seconds,
+            after_user_id=after_user_id,
+        )
+    finally:
+        await client.close()
+
+    print(
+        f"archived {output.archived_day_count} days"
+        f" and {output.archived_record_count} records before {before}"
+    )
+
+    return 0
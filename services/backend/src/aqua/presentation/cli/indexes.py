@@ -0,0 +1,33 @@
+from aqua.infrastructure.periphery.pymongo import indexes
+from aqua.infrastructure.periphery.pymongo.clients import client_with
+
+
+async def ensure() -> int:
+    client = client_with(read_preference="primary")
+
+    try:
+        await indexes.ensure_indexes(client)
+    finally:
+        await client.close()
+
+    return 0
+
+
+async def report() -> int:
+    client = client_with(read_preference="primary")
+
+    try:
+        missing_indexes = await indexes.missing_indexes(client)
+        unused_indexes = await indexes.unused_indexes(client)
+    finally:
+        await client.close()
+
+    for index in missing_indexes:
+        print(f"missing index: {index.collection_name}.{index.name}")
+
+    for unused_index in unused_indexes:
+        print(
+            f"unused index: {unused_index.collection_name}.{unused_index.name}"
+        )
+
+    return 1 if missing_indexes else 0
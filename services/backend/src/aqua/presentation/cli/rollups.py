@@ -0,0 +1,15 @@
+from aqua.infrastructure.periphery.pymongo.clients import client_with
+from aqua.infrastructure.periphery.pymongo.ledgers import rebuild_ledgers
+from aqua.infrastructure.periphery.pymongo.rollups import rebuild_rollups
+
+
+async def rebuild() -> int:
+    client = client_with(read_preference="primary")
+
+    try:
+        await rebuild_rollups(client)
+        await rebuild_ledgers(client)
+    finally:
+        await client.close()
+
+    return 0
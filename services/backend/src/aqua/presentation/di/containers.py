@@ -6,8 +6,11 @@ from aqua.presentation.di import providers
 adapter_container = make_async_container(
     providers.MongoProvider(),
     providers.LoggerProvider(),
+    providers.MetricsProvider(),
+    providers.CoalescingProvider(),
     providers.MapperProvider(),
     providers.RepoProvider(),
+    providers.ReadRepoProvider(),
     providers.TransactionProvider(),
     providers.ViewProvider(),
 )
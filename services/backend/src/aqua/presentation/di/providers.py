@@ -1,10 +1,12 @@
 from typing import Annotated, AsyncIterable
+from uuid import UUID
 
 from dishka import FromComponent, Provider, Scope, provide
 from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import AsyncClientSession
 
 from aqua.application.ports.loggers import Logger
+from aqua.application.retries import RetryMetrics
 from aqua.infrastructure.adapters.loggers.structlog.dev_logger import (
     StructlogDevLogger,
 )
@@ -14,15 +16,25 @@ from aqua.infrastructure.adapters.loggers.structlog.prod_logger import (
 from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.mongo.ledger_mapper import (
+    MongoLedgerMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
     MongoRecordMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.mongo.rollup_mapper import (
+    MongoRollupMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
     MongoUserMapperTo,
 )
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.adapters.transactions.mongo.transaction import (
-    MongoTransactionForMongoUsers,
+    MongoBatchTransactionForMongoUsers,
+    MongoOptimisticTransactionForMongoUsers,
+)
+from aqua.infrastructure.adapters.views.in_memory.batch_writing_view_of import (
+    InMemoryBatchWritingViewOf,
 )
 from aqua.infrastructure.adapters.views.in_memory.cancellation_view_of import (
     InMemoryCancellationViewOf,
@@ -33,15 +45,37 @@ from aqua.infrastructure.adapters.views.in_memory.registration_view_of import (
 from aqua.infrastructure.adapters.views.in_memory.writing_view_of import (
     InMemoryWritingViewOf,
 )
+from aqua.infrastructure.adapters.views.mongo.analytics_view_from import (
+    AnalyticsCache,
+    DBAnalyticsViewFromMongoUsers,
+)
 from aqua.infrastructure.adapters.views.mongo.day_view_from import (
     DBDayViewFromMongoUsers,
 )
+from aqua.infrastructure.adapters.views.mongo.days_view_from import (
+    DBDaysViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.history_view_from import (
+    DBHistoryViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.ledger_view_from import (
+    DBLedgerViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.records_view_from import (
+    DBRecordsViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.rollup_view_from import (
+    DBRollupViewFromMongoUsers,
+)
 from aqua.infrastructure.adapters.views.mongo.user_view_from import (
     DBUserViewFromMongoUsers,
 )
 from aqua.infrastructure.periphery import envs
+from aqua.infrastructure.periphery.coalescing import Coalescer
 from aqua.infrastructure.periphery.pymongo.clients import client_with
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.indexes import ensure_indexes
+from aqua.infrastructure.periphery.pymongo.pool_metrics import PoolMetrics
 
 
 class NoConncetionError(Exception): ...
@@ -51,8 +85,16 @@ class MongoProvider(Provider):
     component = "mongo"
 
     @provide(scope=Scope.APP)
-    async def get_client(self) -> AsyncIterable[AsyncMongoClient[Document]]:
-        client = client_with()
+    def get_pool_metrics(self) -> PoolMetrics:
+        return PoolMetrics()
+
+    @provide(scope=Scope.APP)
+    async def get_client(
+        self, pool_metrics: PoolMetrics
+    ) -> AsyncIterable[AsyncMongoClient[Document]]:
+        client = client_with(pool_listeners=[pool_metrics])
+        await ensure_indexes(client)
+
         yield client
         await client.close()
 
@@ -72,12 +114,31 @@ class LoggerProvider(Provider):
         return StructlogDevLogger() if envs.is_dev else StructlogProdLogger()
 
 
+class MetricsProvider(Provider):
+    component = "metrics"
+
+    @provide(scope=Scope.APP)
+    def get_retry_metrics(self) -> RetryMetrics:
+        return RetryMetrics()
+
+
+class CoalescingProvider(Provider):
+    component = "coalescing"
+
+    @provide(scope=Scope.APP)
+    def get_water_writing_coalescer(self) -> Coalescer[UUID, int | None]:
+        return Coalescer(
+            window_seconds=envs.water_writing_coalescing_window_seconds,
+            max_batch_size=envs.water_writing_max_coalesced_count,
+        )
+
+
 class MapperProvider(Provider):
     component = "mappers"
 
     @provide(scope=Scope.APP)
     def get_mongo_day_mapper_to(self) -> MongoDayMapperTo:
-        return MongoDayMapperTo()
+        return MongoDayMapperTo(archive_horizon_days=envs.archive_horizon_days)
 
     @provide(scope=Scope.APP)
     def get_mongo_user_mapper_to(self) -> MongoUserMapperTo:
@@ -87,25 +148,52 @@ class MapperProvider(Provider):
     def get_mongo_record_mapper_to(self) -> MongoRecordMapperTo:
         return MongoRecordMapperTo()
 
+    @provide(scope=Scope.APP)
+    def get_mongo_rollup_mapper_to(self) -> MongoRollupMapperTo:
+        return MongoRollupMapperTo()
+
+    @provide(scope=Scope.APP)
+    def get_mongo_ledger_mapper_to(self) -> MongoLedgerMapperTo:
+        return MongoLedgerMapperTo()
+
 
 class RepoProvider(Provider):
     component = "repos"
 
     @provide(scope=Scope.REQUEST)
     def get_mongo_users(
-        self, session: Annotated[AsyncClientSession, FromComponent("mongo")]
+        self,
+        client: Annotated[AsyncMongoClient[Document], FromComponent("mongo")],
+        session: Annotated[AsyncClientSession, FromComponent("mongo")],
     ) -> MongoUsers:
-        return MongoUsers(session)
+        return MongoUsers(client, session=session, reads=envs.repo_mongo_reads)
+
+
+class ReadRepoProvider(Provider):
+    component = "read_repos"
+
+    @provide(scope=Scope.REQUEST)
+    def get_mongo_users(
+        self,
+        client: Annotated[AsyncMongoClient[Document], FromComponent("mongo")],
+    ) -> MongoUsers:
+        return MongoUsers(client, reads=envs.repo_mongo_reads)
 
 
 class TransactionProvider(Provider):
     component = "transactions"
 
     @provide(scope=Scope.APP)
-    def get_mongo_transaction_for_mongo_users(
+    def get_mongo_optimistic_transaction_for_mongo_users(
         self,
-    ) -> MongoTransactionForMongoUsers:
-        return MongoTransactionForMongoUsers()
+    ) -> MongoOptimisticTransactionForMongoUsers:
+        return MongoOptimisticTransactionForMongoUsers()
+
+    @provide(scope=Scope.APP)
+    def get_mongo_batch_transaction_for_mongo_users(
+        self,
+    ) -> MongoBatchTransactionForMongoUsers:
+        return MongoBatchTransactionForMongoUsers()
 
 
 class ViewProvider(Provider):
@@ -113,11 +201,61 @@ class ViewProvider(Provider):
 
     @provide(scope=Scope.APP)
     def get_day_view_from_mongo_users(self) -> DBDayViewFromMongoUsers:
-        return DBDayViewFromMongoUsers()
+        return DBDayViewFromMongoUsers(
+            current_day_reads=envs.current_day_view_mongo_reads,
+            past_day_reads=envs.past_day_view_mongo_reads,
+            causal_reads=envs.causal_view_mongo_reads,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_days_view_from_mongo_users(self) -> DBDaysViewFromMongoUsers:
+        return DBDaysViewFromMongoUsers(
+            current_day_reads=envs.current_day_view_mongo_reads,
+            past_day_reads=envs.past_day_view_mongo_reads,
+            causal_reads=envs.causal_view_mongo_reads,
+            archive_horizon_days=envs.archive_horizon_days,
+        )
 
     @provide(scope=Scope.APP)
     def get_user_view_from_mongo_users(self) -> DBUserViewFromMongoUsers:
-        return DBUserViewFromMongoUsers()
+        return DBUserViewFromMongoUsers(
+            reads=envs.user_view_mongo_reads,
+            causal_reads=envs.causal_view_mongo_reads,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_records_view_from_mongo_users(self) -> DBRecordsViewFromMongoUsers:
+        return DBRecordsViewFromMongoUsers(
+            reads=envs.records_view_mongo_reads,
+            causal_reads=envs.causal_view_mongo_reads,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_history_view_from_mongo_users(self) -> DBHistoryViewFromMongoUsers:
+        return DBHistoryViewFromMongoUsers(
+            reads=envs.history_view_mongo_reads,
+            causal_reads=envs.causal_view_mongo_reads,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_rollup_view_from_mongo_users(self) -> DBRollupViewFromMongoUsers:
+        return DBRollupViewFromMongoUsers(reads=envs.rollup_view_mongo_reads)
+
+    @provide(scope=Scope.APP)
+    def get_ledger_view_from_mongo_users(self) -> DBLedgerViewFromMongoUsers:
+        return DBLedgerViewFromMongoUsers(reads=envs.ledger_view_mongo_reads)
+
+    @provide(scope=Scope.APP)
+    def get_analytics_cache(self) -> AnalyticsCache:
+        return AnalyticsCache(max_size=envs.analytics_cache_size)
+
+    @provide(scope=Scope.APP)
+    def get_analytics_view_from_mongo_users(
+        self, cache: AnalyticsCache
+    ) -> DBAnalyticsViewFromMongoUsers:
+        return DBAnalyticsViewFromMongoUsers(
+            cache=cache, reads=envs.analytics_view_mongo_reads
+        )
 
     @provide(scope=Scope.APP)
     def get_cancellation_view_of(self) -> InMemoryCancellationViewOf:
@@ -130,3 +268,7 @@ class ViewProvider(Provider):
     @provide(scope=Scope.APP)
     def get_writing_view_of(self) -> InMemoryWritingViewOf:
         return InMemoryWritingViewOf()
+
+    @provide(scope=Scope.APP)
+    def get_batch_writing_view_of(self) -> InMemoryBatchWritingViewOf:
+        return InMemoryBatchWritingViewOf()
@@ -2,7 +2,23 @@ from aqua.presentation.periphery.facade import (
     cancel_record as cancel_record,
 )
 from aqua.presentation.periphery.facade import close as close
+from aqua.presentation.periphery.facade import (
+    export_history as export_history,
+)
+from aqua.presentation.periphery.facade import (
+    read_analytics as read_analytics,
+)
 from aqua.presentation.periphery.facade import read_day as read_day
+from aqua.presentation.periphery.facade import read_days as read_days
+from aqua.presentation.periphery.facade import read_ledger as read_ledger
+from aqua.presentation.periphery.facade import (
+    read_mongo_pool_metrics as read_mongo_pool_metrics,
+)
+from aqua.presentation.periphery.facade import read_records as read_records
+from aqua.presentation.periphery.facade import (
+    read_retry_metrics as read_retry_metrics,
+)
+from aqua.presentation.periphery.facade import read_rollup as read_rollup
 from aqua.presentation.periphery.facade import read_user as read_user
 from aqua.presentation.periphery.facade import (
     register_user as register_user,
@@ -10,3 +26,6 @@ from aqua.presentation.periphery.facade import (
 from aqua.presentation.periphery.facade import (
     write_water as write_water,
 )
+from aqua.presentation.periphery.facade import (
+    write_water_batch as write_water_batch,
+)
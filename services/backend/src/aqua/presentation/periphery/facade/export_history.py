@@ -0,0 +1,65 @@
+from typing import AsyncIterator, Literal
+from uuid import UUID
+
+from aqua.application.cases.view_history import view_history
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.history_view_from import (
+    DBHistoryViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.serializing.from_view.to_csv import (
+    CSVLines,
+)
+from aqua.infrastructure.periphery.serializing.from_view.to_ndjson import (
+    ndjson_line_of,
+)
+from aqua.infrastructure.periphery.views.db.history_view import DBHistoryRow
+from aqua.presentation.di.containers import adapter_container
+
+
+type Format = Literal["ndjson", "csv"]
+
+chunk_size = 64 * 1024
+
+
+async def perform(user_id: UUID, format_: Format) -> AsyncIterator[str]:
+    async with adapter_container() as container:
+        rows = view_history(
+            user_id,
+            view_from=await container.get(DBHistoryViewFromMongoUsers, "views"),
+            users=await container.get(MongoUsers, "read_repos"),
+        )
+
+        async for chunk in _chunks_of(_lines_of(rows, format_)):
+            yield chunk
+
+
+async def _lines_of(
+    rows: AsyncIterator[DBHistoryRow], format_: Format
+) -> AsyncIterator[str]:
+    match format_:
+        case "ndjson":
+            async for row in rows:
+                yield ndjson_line_of(row)
+        case "csv":
+            csv_lines = CSVLines()
+            yield csv_lines.header()
+
+            async for row in rows:
+                yield csv_lines.line_of(row)
+
+
+async def _chunks_of(lines: AsyncIterator[str]) -> AsyncIterator[str]:
+    chunk_lines = list[str]()
+    current_chunk_size = 0
+
+    async for line in lines:
+        chunk_lines.append(line)
+        current_chunk_size += len(line)
+
+        if current_chunk_size >= chunk_size:
+            yield "".join(chunk_lines)
+            chunk_lines.clear()
+            current_chunk_size = 0
+
+    if chunk_lines:
+        yield "".join(chunk_lines)
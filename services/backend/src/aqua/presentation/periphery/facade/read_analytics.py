@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+from aqua.application.cases.view_analytics import view_analytics
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.analytics_view_from import (
+    DBAnalyticsViewFromMongoUsers,
+)
+from aqua.presentation.di.containers import adapter_container
+
+
+@dataclass(kw_only=True, frozen=True)
+class Output:
+    user_id: UUID
+    date_: date
+    good_day_streak: int
+    average_milliliters_by_weekday: tuple[int, ...]
+    glass_percentile_milliliters: int | None
+
+
+async def perform(user_id: UUID) -> Output:
+    async with adapter_container() as container:
+        view = await view_analytics(
+            user_id,
+            datetime.now(UTC).date(),
+            view_from=await container.get(
+                DBAnalyticsViewFromMongoUsers, "views"
+            ),
+            users=await container.get(MongoUsers, "read_repos"),
+        )
+
+    return Output(
+        user_id=view.user_id,
+        date_=view.date_,
+        good_day_streak=view.good_day_streak,
+        average_milliliters_by_weekday=view.average_milliliters_by_weekday,
+        glass_percentile_milliliters=view.glass_percentile_milliliters,
+    )
@@ -7,6 +7,9 @@ from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.adapters.views.mongo.day_view_from import (
     DBDayViewFromMongoUsers,
 )
+from aqua.infrastructure.periphery.pymongo.causality import (
+    decoded_causality_token_of,
+)
 from aqua.presentation.di.containers import adapter_container
 
 
@@ -35,14 +38,21 @@ class Error(Exception): ...
 class NoUserError(Error): ...
 
 
-async def perform(user_id: UUID, date_: date) -> Output:
+async def perform(
+    user_id: UUID, date_: date, causality_token: str | None = None
+) -> Output:
     async with adapter_container() as container:
-        view = await view_day(
-            user_id,
-            date_,
-            view_from=await container.get(DBDayViewFromMongoUsers, "views"),
-            users=await container.get(MongoUsers, "repos"),
-        )
+        users = await container.get(MongoUsers, "read_repos")
+
+        async with users.after(
+            decoded_causality_token_of(causality_token)
+        ) as users:
+            view = await view_day(
+                user_id,
+                date_,
+                view_from=await container.get(DBDayViewFromMongoUsers, "views"),
+                users=users,
+            )
 
     records = tuple(
         Output.RecordData(
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import AsyncIterator
+from uuid import UUID
+
+from aqua.application.cases.view_days import view_days
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.days_view_from import (
+    DBDaysViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery import envs
+from aqua.infrastructure.periphery.pymongo.causality import (
+    decoded_causality_token_of,
+)
+from aqua.infrastructure.periphery.views.db.day_view import DBDayView
+from aqua.presentation.di.containers import adapter_container
+
+
+@dataclass(kw_only=True, frozen=True)
+class RecordData:
+    record_id: UUID
+    drunk_water_milliliters: int
+    recording_time: datetime
+
+
+@dataclass(kw_only=True, frozen=True)
+class Output:
+    user_id: UUID
+    target_water_balance_milliliters: int
+    date_: date
+    water_balance_milliliters: int
+    result_code: int
+    real_result_code: int
+    is_result_pinned: bool
+    records: tuple[RecordData, ...]
+
+
+class Error(Exception): ...
+
+
+class TooLongRangeError(Error): ...
+
+
+class ReversedRangeError(Error): ...
+
+
+def perform(
+    user_id: UUID,
+    from_: date,
+    to: date,
+    causality_token: str | None = None,
+) -> AsyncIterator[Output]:
+    if to < from_:
+        raise ReversedRangeError
+
+    if (to - from_).days >= envs.max_viewed_day_count:
+        raise TooLongRangeError
+
+    return _outputs_of(user_id, from_, to, causality_token)
+
+
+async def _outputs_of(
+    user_id: UUID,
+    from_: date,
+    to: date,
+    causality_token: str | None,
+) -> AsyncIterator[Output]:
+    async with adapter_container() as container:
+        users = await container.get(MongoUsers, "read_repos")
+
+        async with users.after(
+            decoded_causality_token_of(causality_token)
+        ) as users:
+            views = view_days(
+                user_id,
+                from_,
+                to,
+                view_from=await container.get(
+                    DBDaysViewFromMongoUsers, "views"
+                ),
+                users=users,
+            )
+
+            async for view in views:
+                yield _output_of(view)
+
+
+def _output_of(view: DBDayView) -> Output:
+    records = tuple(
+        RecordData(
+            record_id=record_view.record_id,
+            drunk_water_milliliters=record_view.drunk_water_milliliters,
+            recording_time=record_view.recording_time,
+        )
+        for record_view in view.records
+    )
+
+    return Output(
+        user_id=view.user_id,
+        date_=view.date_,
+        target_water_balance_milliliters=(
+            view.target_water_balance_milliliters or 0
+        ),
+        water_balance_milliliters=view.water_balance_milliliters,
+        result_code=view.result_code,
+        real_result_code=view.correct_result_code,
+        is_result_pinned=view.pinned_result_code is not None,
+        records=records,
+    )
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+from aqua.application.cases.view_ledger import view_ledger
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.ledger_view_from import (
+    DBLedgerViewFromMongoUsers,
+)
+from aqua.presentation.di.containers import adapter_container
+
+
+@dataclass(kw_only=True, frozen=True)
+class Output:
+    user_id: UUID
+    from_: date
+    to: date
+    water_milliliters: int
+    average_water_milliliters: int
+
+
+async def perform(user_id: UUID, from_: date, to: date) -> Output:
+    async with adapter_container() as container:
+        view = await view_ledger(
+            user_id,
+            from_,
+            to,
+            view_from=await container.get(DBLedgerViewFromMongoUsers, "views"),
+            users=await container.get(MongoUsers, "read_repos"),
+        )
+
+    return Output(
+        user_id=view.user_id,
+        from_=view.from_,
+        to=view.to,
+        water_milliliters=view.water_milliliters,
+        average_water_milliliters=view.average_water_milliliters,
+    )
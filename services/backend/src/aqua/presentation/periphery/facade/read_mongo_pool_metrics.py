@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from aqua.infrastructure.periphery.pymongo.pool_metrics import PoolMetrics
+from aqua.presentation.di.containers import adapter_container
+
+
+@dataclass(kw_only=True, frozen=True)
+class Output:
+    checked_out_connection_count: int
+    max_checked_out_connection_count: int
+    checkout_count: int
+    failed_checkout_count: int
+    average_checkout_wait_seconds: float
+    max_checkout_wait_seconds: float
+
+
+async def perform() -> Output:
+    pool_metrics = await adapter_container.get(PoolMetrics, "mongo")
+    snapshot = pool_metrics.snapshot()
+
+    return Output(
+        checked_out_connection_count=snapshot.checked_out_connection_count,
+        max_checked_out_connection_count=(
+            snapshot.max_checked_out_connection_count
+        ),
+        checkout_count=snapshot.checkout_count,
+        failed_checkout_count=snapshot.failed_checkout_count,
+        average_checkout_wait_seconds=snapshot.average_checkout_wait_seconds,
+        max_checkout_wait_seconds=snapshot.max_checkout_wait_seconds,
+    )
@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from aqua.application.cases.view_records import view_records
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.records_view_from import (
+    DBRecordsViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.causality import (
+    decoded_causality_token_of,
+)
+from aqua.infrastructure.periphery.pymongo.record_cursors import (
+    RecordCursor,
+    decoded_record_cursor_of,
+)
+from aqua.presentation.di.containers import adapter_container
+
+
+@dataclass(kw_only=True, frozen=True)
+class Output:
+    user_id: UUID
+
+    @dataclass(kw_only=True, frozen=True)
+    class RecordData:
+        record_id: UUID
+        drunk_water_milliliters: int
+        recording_time: datetime
+        is_cancelled: bool
+
+    records: tuple[RecordData, ...]
+    next_cursor: str | None
+
+
+class Error(Exception): ...
+
+
+class InvalidCursorError(Error): ...
+
+
+class InvalidLimitError(Error): ...
+
+
+max_limit = 100
+
+
+async def perform(
+    user_id: UUID,
+    cursor: str | None = None,
+    limit: int = 50,
+    *,
+    is_cancelled_hidden: bool = False,
+    causality_token: str | None = None,
+) -> Output:
+    if not 0 < limit <= max_limit:
+        raise InvalidLimitError
+
+    after: RecordCursor | None = None
+
+    if cursor is not None:
+        after = decoded_record_cursor_of(cursor)
+
+        if after is None:
+            raise InvalidCursorError
+
+    async with adapter_container() as container:
+        users = await container.get(MongoUsers, "read_repos")
+        view_from = await container.get(DBRecordsViewFromMongoUsers, "views")
+
+        async with users.after(
+            decoded_causality_token_of(causality_token)
+        ) as users:
+            view = await view_records(
+                user_id,
+                after=after,
+                limit=limit,
+                is_cancelled_hidden=is_cancelled_hidden,
+                view_from=view_from,
+                users=users,
+            )
+
+    records = tuple(
+        Output.RecordData(
+            record_id=record_view.record_id,
+            drunk_water_milliliters=record_view.drunk_water_milliliters,
+            recording_time=record_view.recording_time,
+            is_cancelled=record_view.is_cancelled,
+        )
+        for record_view in view.records
+    )
+
+    return Output(
+        user_id=view.user_id, records=records, next_cursor=view.next_cursor
+    )
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from aqua.application.retries import RetryMetrics
+from aqua.presentation.di.containers import adapter_container
+
+
+@dataclass(kw_only=True, frozen=True)
+class Output:
+    retry_count: int
+    exhausted_retry_count: int
+
+
+async def perform() -> Output:
+    retry_metrics = await adapter_container.get(RetryMetrics, "metrics")
+    snapshot = retry_metrics.snapshot()
+
+    return Output(
+        retry_count=snapshot.retry_count,
+        exhausted_retry_count=snapshot.exhausted_retry_count,
+    )
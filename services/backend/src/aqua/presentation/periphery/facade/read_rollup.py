@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Literal
+from uuid import UUID
+
+from aqua.application.cases.view_rollup import view_rollup
+from aqua.application.rollups import Period
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.rollup_view_from import (
+    DBRollupViewFromMongoUsers,
+)
+from aqua.presentation.di.containers import adapter_container
+
+
+@dataclass(kw_only=True, frozen=True)
+class Output:
+    user_id: UUID
+    period: Literal["week", "month"]
+    start_date: date
+    water_balance_milliliters: int
+    average_water_balance_milliliters: int
+    day_count: int
+    good_day_count: int
+    not_enough_water_day_count: int
+    excess_water_day_count: int
+
+
+async def perform(
+    user_id: UUID, date_: date, period: Literal["week", "month"]
+) -> Output:
+    async with adapter_container() as container:
+        view = await view_rollup(
+            user_id,
+            date_,
+            period=Period[period],
+            view_from=await container.get(DBRollupViewFromMongoUsers, "views"),
+            users=await container.get(MongoUsers, "read_repos"),
+        )
+
+    average_milliliters = view.average_water_balance_milliliters
+
+    return Output(
+        user_id=view.user_id,
+        period=period,
+        start_date=view.start_date,
+        water_balance_milliliters=view.water_balance_milliliters,
+        average_water_balance_milliliters=average_milliliters,
+        day_count=view.day_count,
+        good_day_count=view.good_day_count,
+        not_enough_water_day_count=view.not_enough_water_day_count,
+        excess_water_day_count=view.excess_water_day_count,
+    )
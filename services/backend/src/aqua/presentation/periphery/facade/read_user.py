@@ -7,6 +7,9 @@ from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.adapters.views.mongo.user_view_from import (
     DBUserViewFromMongoUsers,
 )
+from aqua.infrastructure.periphery.pymongo.causality import (
+    decoded_causality_token_of,
+)
 from aqua.presentation.di.containers import adapter_container
 
 
@@ -37,13 +40,22 @@ class Error(Exception): ...
 class NoUserError(Error): ...
 
 
-async def perform(user_id: UUID) -> Output | None:
+async def perform(
+    user_id: UUID, causality_token: str | None = None
+) -> Output | None:
     async with adapter_container() as container:
-        view = await view_user(
-            user_id,
-            view_from=await container.get(DBUserViewFromMongoUsers, "views"),
-            users=await container.get(MongoUsers, "repos"),
-        )
+        users = await container.get(MongoUsers, "read_repos")
+
+        async with users.after(
+            decoded_causality_token_of(causality_token)
+        ) as users:
+            view = await view_user(
+                user_id,
+                view_from=await container.get(
+                    DBUserViewFromMongoUsers, "views"
+                ),
+                users=users,
+            )
 
     if view is None:
         return None
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import AsyncIterator
 from uuid import UUID
 
+from pymongo.asynchronous.client_session import AsyncClientSession
 from result import Err, Ok
 
 from aqua.application.cases.register_user import (
@@ -10,6 +11,10 @@ from aqua.application.cases.register_user import (
     register_user,
 )
 from aqua.application.ports.loggers import Logger
+from aqua.application.ports.mappers import (
+    ConflictError as _ConflictApplicationError,
+)
+from aqua.application.retries import RetryMetrics
 from aqua.domain.model.core.aggregates.user.root import (
     NoWeightForSuitableWaterBalanceError,
 )
@@ -19,19 +24,29 @@ from aqua.domain.model.core.vos.water_balance import (
 from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.mongo.ledger_mapper import (
+    MongoLedgerMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
     MongoRecordMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.mongo.rollup_mapper import (
+    MongoRollupMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
     MongoUserMapperTo,
 )
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.adapters.transactions.mongo.transaction import (
-    MongoTransactionForMongoUsers,
+    MongoOptimisticTransactionForMongoUsers,
 )
 from aqua.infrastructure.adapters.views.in_memory.registration_view_of import (
     InMemoryRegistrationViewOf,
 )
+from aqua.infrastructure.periphery.pymongo.causality import (
+    causality_token_of,
+    encoded_causality_token_of,
+)
 from aqua.infrastructure.periphery.serializing.from_model.to_view import (
     glass_view_of,
     maybe_weight_view_of,
@@ -46,6 +61,7 @@ class Output:
     target_water_balance_milliliters: int
     glass_milliliters: int
     weight_kilograms: int | None
+    causality_token: str | None
 
 
 class Error(Exception): ...
@@ -63,6 +79,9 @@ class NoWeightForWaterBalanceError(Error): ...
 class ExtremeWeightForWaterBalanceError(Error): ...
 
 
+class ConflictError(Error): ...
+
+
 @asynccontextmanager
 async def perform(
     user_id: UUID,
@@ -70,36 +89,53 @@ async def perform(
     glass_milliliters: int | None,
     weight_kilograms: int | None,
 ) -> AsyncIterator[Output]:
-    async with adapter_container() as container, register_user(
-        user_id,
-        water_balance_milliliters,
-        glass_milliliters,
-        weight_kilograms,
-        view_of=await container.get(InMemoryRegistrationViewOf, "views"),
-        users=await container.get(MongoUsers, "repos"),
-        transaction_for=await container.get(
-            MongoTransactionForMongoUsers, "transactions"
-        ),
-        logger=await container.get(Logger, "loggers"),
-        user_mapper_to=await container.get(MongoUserMapperTo, "mappers"),
-        record_mapper_to=await container.get(MongoRecordMapperTo, "mappers"),
-        day_mapper_to=await container.get(MongoDayMapperTo, "mappers"),
-    ) as result:
-        match result:
-            case Err(ExtremeWeightForSuitableWaterBalanceError()):
-                raise ExtremeWeightForWaterBalanceError
-            case Err(NoWeightForSuitableWaterBalanceError()):
-                raise NoWeightForWaterBalanceError
-            case Err(NegativeWeightKilogramsError()):
-                raise IncorrectWeightAmountError
-            case Err(_):
-                raise IncorrectWaterAmountError
-            case Ok(view):
-                user = view.user
-
-        yield Output(
-            user_id=user.id,
-            target_water_balance_milliliters=target_view_of(user.target),
-            weight_kilograms=maybe_weight_view_of(user.weight),
-            glass_milliliters=glass_view_of(user.glass),
-        )
+    try:
+        async with adapter_container() as container, register_user(
+            user_id,
+            water_balance_milliliters,
+            glass_milliliters,
+            weight_kilograms,
+            view_of=await container.get(InMemoryRegistrationViewOf, "views"),
+            users=await container.get(MongoUsers, "repos"),
+            transaction_for=await container.get(
+                MongoOptimisticTransactionForMongoUsers, "transactions"
+            ),
+            logger=await container.get(Logger, "loggers"),
+            retry_metrics=await container.get(RetryMetrics, "metrics"),
+            user_mapper_to=await container.get(MongoUserMapperTo, "mappers"),
+            record_mapper_to=await container.get(
+                MongoRecordMapperTo, "mappers"
+            ),
+            day_mapper_to=await container.get(MongoDayMapperTo, "mappers"),
+            rollup_mapper_to=await container.get(
+                MongoRollupMapperTo, "mappers"
+            ),
+            ledger_mapper_to=await container.get(
+                MongoLedgerMapperTo, "mappers"
+            ),
+        ) as result:
+            match result:
+                case Err(ExtremeWeightForSuitableWaterBalanceError()):
+                    raise ExtremeWeightForWaterBalanceError
+                case Err(NoWeightForSuitableWaterBalanceError()):
+                    raise NoWeightForWaterBalanceError
+                case Err(NegativeWeightKilogramsError()):
+                    raise IncorrectWeightAmountError
+                case Err(_):
+                    raise IncorrectWaterAmountError
+                case Ok(view):
+                    user = view.user
+
+            yield Output(
+                user_id=user.id,
+                target_water_balance_milliliters=target_view_of(user.target),
+                weight_kilograms=maybe_weight_view_of(user.weight),
+                glass_milliliters=glass_view_of(user.glass),
+                causality_token=encoded_causality_token_of(
+                    causality_token_of(
+                        await container.get(AsyncClientSession, "mongo")
+                    )
+                ),
+            )
+    except _ConflictApplicationError as error:
+        raise ConflictError from error
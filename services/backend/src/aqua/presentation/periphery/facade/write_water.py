@@ -1,11 +1,18 @@
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import AsyncIterator
+from typing import AsyncIterator, Iterable, Sequence
 from uuid import UUID
 
+from pymongo.asynchronous.client_session import AsyncClientSession
 from result import Err, Ok
 
+from aqua.application.cases.write_coalesced_water import (
+    NoUserError as _NoCoalescedUserApplicationError,
+)
+from aqua.application.cases.write_coalesced_water import (
+    write_coalesced_water,
+)
 from aqua.application.cases.write_water import (
     NoUserError as _NoUserApplicationError,
 )
@@ -13,26 +20,49 @@ from aqua.application.cases.write_water import (
     write_water,
 )
 from aqua.application.ports.loggers import Logger
+from aqua.application.ports.mappers import (
+    ArchivedDayError as _ArchivedDayApplicationError,
+)
+from aqua.application.ports.mappers import (
+    ConflictError as _ConflictApplicationError,
+)
+from aqua.application.retries import RetryMetrics
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
     Record,
 )
-from aqua.domain.model.primitives.vos.water import NegativeWaterAmountError
+from aqua.domain.model.primitives.vos.water import (
+    NegativeWaterAmountError,
+    Water,
+)
 from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.mongo.ledger_mapper import (
+    MongoLedgerMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
     MongoRecordMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.mongo.rollup_mapper import (
+    MongoRollupMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
     MongoUserMapperTo,
 )
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
 from aqua.infrastructure.adapters.transactions.mongo.transaction import (
-    MongoTransactionForMongoUsers,
+    MongoOptimisticTransactionForMongoUsers,
 )
 from aqua.infrastructure.adapters.views.in_memory.writing_view_of import (
     InMemoryWritingViewOf,
 )
+from aqua.infrastructure.periphery import envs
+from aqua.infrastructure.periphery.coalescing import Coalescer
+from aqua.infrastructure.periphery.pymongo.causality import (
+    causality_token_of,
+    encoded_causality_token_of,
+)
 from aqua.infrastructure.periphery.serializing.from_model.to_view import (
     old_result_view_of,
     target_view_of,
@@ -61,6 +91,7 @@ class Output:
     is_result_pinned: bool
     previous_records: tuple[RecordData, ...]
     new_record: RecordData
+    causality_token: str | None
 
 
 class Error(Exception): ...
@@ -72,45 +103,153 @@ class IncorrectWaterAmountError(Error): ...
 class NoUserError(Error): ...
 
 
+class IncorrectRecordingTimeError(Error): ...
+
+
+class ConflictError(Error): ...
+
+
 @asynccontextmanager
 async def perform(
     user_id: UUID, milliliters: int | None
 ) -> AsyncIterator[Output]:
-    async with adapter_container() as container, write_water(
-        user_id,
-        milliliters,
-        view_of=await container.get(InMemoryWritingViewOf, "views"),
-        users=await container.get(MongoUsers, "repos"),
-        transaction_for=await container.get(
-            MongoTransactionForMongoUsers, "transactions"
-        ),
-        logger=await container.get(Logger, "loggers"),
-        user_mapper_to=await container.get(MongoUserMapperTo, "mappers"),
-        record_mapper_to=await container.get(MongoRecordMapperTo, "mappers"),
-        day_mapper_to=await container.get(MongoDayMapperTo, "mappers"),
-    ) as view_result:
-        match view_result:
-            case Err(_NoUserApplicationError()):
-                raise NoUserError
-            case Err(NegativeWaterAmountError()):
-                raise IncorrectWaterAmountError
-            case Ok(view):
-                user = view.user
-                day = view.day
-                new_record = view.new_record
-                previous_records = view.previous_records
-
-        yield Output(
-            user_id=user.id,
-            date_=day.date_,
-            target_water_balance_milliliters=target_view_of(day.target),
-            water_balance_milliliters=water_balance_view_of(day.water_balance),
-            result_code=old_result_view_of(day.result),
-            real_result_code=old_result_view_of(day.correct_result),
-            is_result_pinned=day.is_result_pinned,
-            new_record=_record_data_of(new_record),
-            previous_records=tuple(map(_record_data_of, previous_records)),
-        )
+    if milliliters is not None and isinstance(
+        Water.with_(milliliters=milliliters), Err
+    ):
+        raise IncorrectWaterAmountError
+
+    try:
+        if envs.water_writing_coalescing_window_seconds > 0:
+            coalescer = await adapter_container.get(
+                Coalescer[UUID, int | None], "coalescing"
+            )
+            output = await coalescer(
+                user_id, milliliters, perform=_output_of_writes
+            )
+        else:
+            output = await _output_of_write(user_id, milliliters)
+    except _ConflictApplicationError as error:
+        raise ConflictError from error
+    except _ArchivedDayApplicationError as error:
+        raise IncorrectRecordingTimeError from error
+
+    yield output
+
+
+async def _output_of_writes(
+    user_id: UUID, milliliters_of_writes: Sequence[int | None]
+) -> tuple[Output, ...]:
+    if len(milliliters_of_writes) == 1:
+        return (await _output_of_write(user_id, milliliters_of_writes[0]),)
+
+    async with adapter_container() as container:
+        session = await container.get(AsyncClientSession, "mongo")
+
+        async with write_coalesced_water(
+            user_id,
+            milliliters_of_writes,
+            view_of=await container.get(InMemoryWritingViewOf, "views"),
+            users=await container.get(MongoUsers, "repos"),
+            transaction_for=await container.get(
+                MongoOptimisticTransactionForMongoUsers, "transactions"
+            ),
+            logger=await container.get(Logger, "loggers"),
+            retry_metrics=await container.get(RetryMetrics, "metrics"),
+            user_mapper_to=await container.get(MongoUserMapperTo, "mappers"),
+            record_mapper_to=await container.get(
+                MongoRecordMapperTo, "mappers"
+            ),
+            day_mapper_to=await container.get(MongoDayMapperTo, "mappers"),
+            rollup_mapper_to=await container.get(
+                MongoRollupMapperTo, "mappers"
+            ),
+            ledger_mapper_to=await container.get(
+                MongoLedgerMapperTo, "mappers"
+            ),
+        ) as view_result:
+            match view_result:
+                case Err(_NoCoalescedUserApplicationError()):
+                    raise NoUserError
+                case Err(NegativeWaterAmountError()):
+                    raise IncorrectWaterAmountError
+                case Ok(views):
+                    pass
+
+            return tuple(
+                _output_of(
+                    user_id=view.user.id,
+                    day=view.day,
+                    new_record=view.new_record,
+                    previous_records=view.previous_records,
+                    session=session,
+                )
+                for view in views
+            )
+
+
+async def _output_of_write(user_id: UUID, milliliters: int | None) -> Output:
+    async with adapter_container() as container:
+        session = await container.get(AsyncClientSession, "mongo")
+
+        async with write_water(
+            user_id,
+            milliliters,
+            view_of=await container.get(InMemoryWritingViewOf, "views"),
+            users=await container.get(MongoUsers, "repos"),
+            transaction_for=await container.get(
+                MongoOptimisticTransactionForMongoUsers, "transactions"
+            ),
+            logger=await container.get(Logger, "loggers"),
+            retry_metrics=await container.get(RetryMetrics, "metrics"),
+            user_mapper_to=await container.get(MongoUserMapperTo, "mappers"),
+            record_mapper_to=await container.get(
+                MongoRecordMapperTo, "mappers"
+            ),
+            day_mapper_to=await container.get(MongoDayMapperTo, "mappers"),
+            rollup_mapper_to=await container.get(
+                MongoRollupMapperTo, "mappers"
+            ),
+            ledger_mapper_to=await container.get(
+                MongoLedgerMapperTo, "mappers"
+            ),
+        ) as view_result:
+            match view_result:
+                case Err(_NoUserApplicationError()):
+                    raise NoUserError
+                case Err(NegativeWaterAmountError()):
+                    raise IncorrectWaterAmountError
+                case Ok(view):
+                    pass
+
+            return _output_of(
+                user_id=view.user.id,
+                day=view.day,
+                new_record=view.new_record,
+                previous_records=view.previous_records,
+                session=session,
+            )
+
+
+def _output_of(
+    *,
+    user_id: UUID,
+    day: Day,
+    new_record: Record,
+    previous_records: Iterable[Record],
+    session: AsyncClientSession,
+) -> Output:
+    return Output(
+        user_id=user_id,
+        date_=day.date_,
+        target_water_balance_milliliters=target_view_of(day.target),
+        water_balance_milliliters=water_balance_view_of(day.water_balance),
+        result_code=old_result_view_of(day.result),
+        real_result_code=old_result_view_of(day.correct_result),
+        is_result_pinned=day.is_result_pinned,
+        new_record=_record_data_of(new_record),
+        previous_records=tuple(map(_record_data_of, previous_records)),
+        causality_token=encoded_causality_token_of(causality_token_of(session)),
+    )
 
 
 def _record_data_of(record: Record) -> RecordData:
@@ -0,0 +1,224 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from typing import AsyncIterator, Iterable
+from uuid import UUID
+
+from pymongo.asynchronous.client_session import AsyncClientSession
+from result import Err, Ok
+
+from aqua.application.cases.write_water_batch import (
+    ArchivedRecordingTimeError as _ArchivedRecordingTimeApplicationError,
+)
+from aqua.application.cases.write_water_batch import (
+    FutureRecordingTimeError as _FutureRecordingTimeApplicationError,
+)
+from aqua.application.cases.write_water_batch import (
+    NoUserError as _NoUserApplicationError,
+)
+from aqua.application.cases.write_water_batch import (
+    write_water_batch,
+)
+from aqua.application.ports.loggers import Logger
+from aqua.application.ports.mappers import (
+    ArchivedDayError as _ArchivedDayApplicationError,
+)
+from aqua.application.ports.mappers import (
+    ConflictError as _ConflictApplicationError,
+)
+from aqua.application.retries import RetryMetrics
+from aqua.domain.model.primitives.vos.time import NotUTCTimeError
+from aqua.domain.model.primitives.vos.water import NegativeWaterAmountError
+from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
+    MongoDayMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.ledger_mapper import (
+    MongoLedgerMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
+    MongoRecordMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.rollup_mapper import (
+    MongoRollupMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
+    MongoUserMapperTo,
+)
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.transactions.mongo.transaction import (
+    MongoBatchTransactionForMongoUsers,
+)
+from aqua.infrastructure.adapters.views.in_memory.batch_writing_view_of import (
+    InMemoryBatchWritingViewOf,
+)
+from aqua.infrastructure.periphery import envs
+from aqua.infrastructure.periphery.pymongo.causality import (
+    causality_token_of,
+    encoded_causality_token_of,
+)
+from aqua.infrastructure.periphery.serializing.from_model.to_view import (
+    old_result_view_of,
+    target_view_of,
+    time_view_of,
+    water_balance_view_of,
+    water_view_of,
+)
+from aqua.presentation.di.containers import adapter_container
+
+
+@dataclass(kw_only=True, frozen=True)
+class Input:
+    milliliters: int
+    recording_time: datetime
+
+
+@dataclass(kw_only=True, frozen=True)
+class RecordData:
+    record_id: UUID
+    drunk_water_milliliters: int
+    recording_time: datetime
+
+
+@dataclass(kw_only=True, frozen=True)
+class DayData:
+    date_: date
+    target_water_balance_milliliters: int
+    water_balance_milliliters: int
+    result_code: int
+    real_result_code: int
+    is_result_pinned: bool
+
+
+@dataclass(kw_only=True, frozen=True)
+class Output:
+    user_id: UUID
+    days: tuple[DayData, ...]
+    new_records: tuple[RecordData, ...]
+    causality_token: str | None
+
+
+class Error(Exception): ...
+
+
+class IncorrectWaterAmountError(Error): ...
+
+
+class IncorrectRecordingTimeError(Error): ...
+
+
+class TooManyEntriesError(Error): ...
+
+
+class NoUserError(Error): ...
+
+
+class ConflictError(Error): ...
+
+
+max_entry_count = 500
+
+
+@asynccontextmanager
+async def perform(
+    user_id: UUID, inputs: Iterable[Input]
+) -> AsyncIterator[Output]:
+    raw_entries = [
+        (input_.milliliters, _utc_time_of(input_.recording_time))
+        for input_ in inputs
+    ]
+
+    if len(raw_entries) > max_entry_count:
+        raise TooManyEntriesError
+
+    async with adapter_container() as container:
+        session = await container.get(AsyncClientSession, "mongo")
+
+        try:
+            async with write_water_batch(
+                user_id,
+                raw_entries,
+                view_of=await container.get(
+                    InMemoryBatchWritingViewOf, "views"
+                ),
+                users=await container.get(MongoUsers, "repos"),
+                transaction_for=await container.get(
+                    MongoBatchTransactionForMongoUsers, "transactions"
+                ),
+                logger=await container.get(Logger, "loggers"),
+                retry_metrics=await container.get(RetryMetrics, "metrics"),
+                user_mapper_to=await container.get(
+                    MongoUserMapperTo, "mappers"
+                ),
+                record_mapper_to=await container.get(
+                    MongoRecordMapperTo, "mappers"
+                ),
+                day_mapper_to=await container.get(MongoDayMapperTo, "mappers"),
+                rollup_mapper_to=await container.get(
+                    MongoRollupMapperTo, "mappers"
+                ),
+                ledger_mapper_to=await container.get(
+                    MongoLedgerMapperTo, "mappers"
+                ),
+                archive_horizon_days=envs.archive_horizon_days,
+            ) as view_result:
+                match view_result:
+                    case Err(_NoUserApplicationError()):
+                        raise NoUserError
+                    case Err(NegativeWaterAmountError()):
+                        raise IncorrectWaterAmountError
+                    case Err(NotUTCTimeError()):
+                        raise IncorrectRecordingTimeError
+                    case Err(_FutureRecordingTimeApplicationError()):
+                        raise IncorrectRecordingTimeError
+                    case Err(_ArchivedRecordingTimeApplicationError()):
+                        raise IncorrectRecordingTimeError
+                    case Ok(view):
+                        pass
+
+                days = tuple(
+                    DayData(
+                        date_=day.date_,
+                        target_water_balance_milliliters=target_view_of(
+                            day.target
+                        ),
+                        water_balance_milliliters=water_balance_view_of(
+                            day.water_balance
+                        ),
+                        result_code=old_result_view_of(day.result),
+                        real_result_code=old_result_view_of(day.correct_result),
+                        is_result_pinned=day.is_result_pinned,
+                    )
+                    for day in view.days
+                )
+                new_records = tuple(
+                    RecordData(
+                        record_id=record.id,
+                        drunk_water_milliliters=water_view_of(
+                            record.drunk_water
+                        ),
+                        recording_time=time_view_of(record.recording_time),
+                    )
+                    for record in view.new_records
+                )
+                causality_token = encoded_causality_token_of(
+                    causality_token_of(session)
+                )
+
+                yield Output(
+                    user_id=view.user.id,
+                    days=days,
+                    new_records=new_records,
+                    causality_token=causality_token,
+                )
+
+        except _ConflictApplicationError as error:
+            raise ConflictError from error
+        except _ArchivedDayApplicationError as error:
+            raise IncorrectRecordingTimeError from error
+
+
+def _utc_time_of(time: datetime) -> datetime:
+    if time.tzinfo is None:
+        return time
+
+    return time.astimezone(UTC)
@@ -0,0 +1,33 @@
+import os
+import tracemalloc
+from time import perf_counter
+from typing import Callable
+
+from pytest import mark
+
+
+benchmark = mark.skipif(
+    os.environ.get("AQUA_BENCHMARKS") != "true",
+    reason="benchmarks run only with AQUA_BENCHMARKS=true",
+)
+
+
+def seconds_of(action: Callable[[], object], *, times: int = 1) -> float:
+    start = perf_counter()
+
+    for _ in range(times):
+        action()
+
+    return perf_counter() - start
+
+
+def peak_bytes_of(action: Callable[[], object]) -> int:
+    tracemalloc.start()
+
+    try:
+        action()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak_bytes
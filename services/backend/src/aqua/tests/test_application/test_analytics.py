@@ -0,0 +1,108 @@
+from datetime import date
+
+from pytest import mark
+
+from aqua.application.analytics import (
+    HistoryColumns,
+    analytics_of,
+    average_milliliters_by_weekday_of,
+    glass_percentile_milliliters_of,
+    good_day_streak_of,
+)
+
+
+def columns_with(
+    days: dict[date, tuple[int, bool]] | None = None,
+    record_milliliters: tuple[int, ...] = tuple(),
+) -> HistoryColumns:
+    sorted_days = sorted((days or dict()).items())
+
+    return HistoryColumns(
+        day_ordinals=[date_.toordinal() for date_, _ in sorted_days],
+        day_milliliters=[milliliters for _, (milliliters, _) in sorted_days],
+        good_day_flags=[is_good for _, (_, is_good) in sorted_days],
+        record_milliliters=record_milliliters,
+    )
+
+
+streak_days = {
+    date(2000, 1, 1): (2000, True),
+    date(2000, 1, 3): (2000, True),
+    date(2000, 1, 4): (1000, False),
+    date(2000, 1, 5): (2000, True),
+    date(2000, 1, 6): (2000, True),
+    date(2000, 1, 7): (500, False),
+}
+
+
+@mark.parametrize(
+    ("today", "streak"),
+    [
+        (date(2000, 1, 9), 0),
+        (date(2000, 1, 8), 0),
+        (date(2000, 1, 7), 2),
+        (date(2000, 1, 6), 2),
+        (date(2000, 1, 4), 1),
+        (date(2000, 1, 3), 1),
+        (date(2000, 1, 2), 1),
+    ],
+)
+def test_good_day_streak(today: date, streak: int) -> None:
+    columns = columns_with({
+        date_: day for date_, day in streak_days.items() if date_ <= today
+    })
+
+    assert good_day_streak_of(columns, today=today) == streak
+
+
+def test_good_day_streak_without_days() -> None:
+    assert good_day_streak_of(columns_with(), today=date(2000, 1, 1)) == 0
+
+
+def test_average_milliliters_by_weekday() -> None:
+    columns = columns_with({
+        date(2024, 1, 1): (1000, True),
+        date(2024, 1, 8): (2000, True),
+        date(2024, 1, 3): (1500, True),
+        date(2024, 1, 7): (700, False),
+    })
+
+    assert average_milliliters_by_weekday_of(columns) == (
+        1500,
+        0,
+        1500,
+        0,
+        0,
+        0,
+        700,
+    )
+
+
+@mark.parametrize(
+    ("record_milliliters", "percentile"),
+    [
+        (tuple(), None),
+        ((250,), 250),
+        ((100, 210, 290), 274),
+        (tuple(range(1, 101)), 90),
+    ],
+)
+def test_glass_percentile_milliliters(
+    record_milliliters: tuple[int, ...], percentile: int | None
+) -> None:
+    columns = columns_with(record_milliliters=record_milliliters)
+
+    assert glass_percentile_milliliters_of(columns) == percentile
+
+
+def test_analytics_of() -> None:
+    analytics = analytics_of(
+        columns_with(
+            {date(2024, 1, 1): (2000, True)}, record_milliliters=(200, 300)
+        ),
+        today=date(2024, 1, 1),
+    )
+
+    assert analytics.good_day_streak == 1
+    assert analytics.average_milliliters_by_weekday[0] == 2000
+    assert analytics.glass_percentile_milliliters == 290
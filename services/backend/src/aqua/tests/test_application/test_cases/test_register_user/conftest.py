@@ -13,6 +13,7 @@ from aqua.application.cases.register_user import (
 from aqua.application.cases.register_user import (
     register_user as case,
 )
+from aqua.application.retries import RetryMetrics
 from aqua.domain.model.core.aggregates.user.root import (
     NoWeightForSuitableWaterBalanceError,
 )
@@ -25,9 +26,15 @@ from aqua.infrastructure.adapters.loggers.in_memory_logger import (
 from aqua.infrastructure.adapters.mappers.in_memory.day_mapper import (
     InMemoryDayMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.in_memory.ledger_mapper import (
+    InMemoryLedgerMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.in_memory.record_mapper import (
     InMemoryRecordMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.in_memory.rollup_mapper import (
+    InMemoryRollupMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.in_memory.user_mapper import (
     InMemoryUserMapperTo,
 )
@@ -70,12 +77,14 @@ class Context:
     register_user: RegisterUser
     users: InMemoryUsers
     logger: InMemoryLogger
+    rollup_mapper_to: InMemoryRollupMapperTo
 
 
 @fixture
 def context() -> Context:
     users = InMemoryUsers()
     logger = InMemoryLogger()
+    rollup_mapper_to = InMemoryRollupMapperTo()
 
     async def register_user(
         user_id: UUID, target: int | None, glass: int | None, weight: int | None
@@ -98,10 +107,18 @@ def context() -> Context:
             users=users,
             transaction_for=_InMemoryStorageTransactionFor(),
             logger=logger,
+            retry_metrics=RetryMetrics(),
             user_mapper_to=InMemoryUserMapperTo(),
             day_mapper_to=InMemoryDayMapperTo(),
             record_mapper_to=InMemoryRecordMapperTo(),
+            rollup_mapper_to=rollup_mapper_to,
+            ledger_mapper_to=InMemoryLedgerMapperTo(),
         ) as result:
             return result
 
-    return Context(register_user=register_user, users=users, logger=logger)
+    return Context(
+        register_user=register_user,
+        users=users,
+        logger=logger,
+        rollup_mapper_to=rollup_mapper_to,
+    )
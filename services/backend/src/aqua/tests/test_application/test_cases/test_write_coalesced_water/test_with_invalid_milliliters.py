@@ -0,0 +1,26 @@
+from pytest import mark
+from result import Err
+
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.domain.model.primitives.vos.water import (
+    NegativeWaterAmountError,
+)
+from aqua.tests.test_application.test_cases.test_write_coalesced_water.conftest import (  # noqa: E501
+    Context,
+)
+
+
+@mark.asyncio
+async def test_result(context_with_user1: Context, user1: User) -> None:
+    result = await context_with_user1.write_coalesced_water(
+        user1.id, (100, -500)
+    )
+
+    assert result == Err(NegativeWaterAmountError())
+
+
+@mark.asyncio
+async def test_storage(context_with_user1: Context, user1: User) -> None:
+    await context_with_user1.write_coalesced_water(user1.id, (100, -500))
+
+    assert len(context_with_user1.users.storage.records) == 3
@@ -0,0 +1,109 @@
+from datetime import UTC
+
+from dirty_equals import IsNow
+from pytest import mark
+
+from aqua.application.rollups import DayChange
+from aqua.domain.framework.entity import FrozenEntities
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Record,
+)
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.domain.model.core.vos.target import Result
+from aqua.domain.model.core.vos.water_balance import WaterBalance
+from aqua.domain.model.primitives.vos.water import Water
+from aqua.tests.test_application.test_cases.test_write_coalesced_water.conftest import (  # noqa: E501
+    Context,
+)
+
+
+milliliters_of_writes = (100, None, 250)
+
+
+@mark.asyncio
+async def test_result(
+    context_with_user1: Context,
+    user1: User,
+    user1_day2: Day,
+    user1_day2_record1: Record,
+    user1_day2_record2: Record,
+) -> None:
+    context = context_with_user1
+
+    view1, view2, view3 = (
+        await context.write_coalesced_water(user1.id, milliliters_of_writes)
+    ).unwrap()
+
+    assert view1.new_record.drunk_water == Water.with_(milliliters=100).unwrap()
+    assert view2.new_record.drunk_water == Water.with_(milliliters=300).unwrap()
+    assert view3.new_record.drunk_water == Water.with_(milliliters=250).unwrap()
+    assert view3.new_record.recording_time.datetime_ == IsNow(tz=UTC)
+
+    assert view1.previous_records == (user1_day2_record2, user1_day2_record1)
+    assert FrozenEntities(view3.previous_records) == FrozenEntities([
+        user1_day2_record1,
+        user1_day2_record2,
+        view1.new_record,
+        view2.new_record,
+    ])
+
+    assert view1.day.date_ == user1_day2.date_
+    assert view1.day.water_balance == WaterBalance(
+        water=Water.with_(milliliters=750).unwrap()
+    )
+    assert view2.day.water_balance == WaterBalance(
+        water=Water.with_(milliliters=1050).unwrap()
+    )
+    assert view3.day.water_balance == WaterBalance(
+        water=Water.with_(milliliters=1300).unwrap()
+    )
+    assert view1.day.result is Result.not_enough_water
+    assert view3.day.result is Result.excess_water
+
+
+@mark.asyncio
+async def test_storage(  # noqa: PLR0917
+    context_with_user1: Context,
+    user1: User,
+    user1_day1: Day,
+    user1_day1_record1: Record,
+    user1_day2_record1: Record,
+    user1_day2_record2: Record,
+) -> None:
+    context = context_with_user1
+
+    views = (
+        await context.write_coalesced_water(user1.id, milliliters_of_writes)
+    ).unwrap()
+
+    days = FrozenEntities([views[-1].day, user1_day1])
+    records = FrozenEntities([
+        user1_day1_record1,
+        user1_day2_record2,
+        user1_day2_record1,
+        *(view.new_record for view in views),
+    ])
+
+    assert context.users.storage.days == days
+    assert context.users.storage.records == records
+
+
+@mark.asyncio
+async def test_day_changes(
+    context_with_user1: Context, user1: User, user1_day2: Day
+) -> None:
+    context = context_with_user1
+
+    await context.write_coalesced_water(user1.id, milliliters_of_writes)
+
+    assert context.rollup_mapper_to.day_changes == (
+        DayChange(
+            user_id=user1.id,
+            date_=user1_day2.date_,
+            water_milliliters=650,
+            is_day_new=False,
+            previous_result=Result.not_enough_water,
+            result=Result.excess_water,
+        ),
+    )
@@ -0,0 +1,25 @@
+from uuid import uuid4
+
+from pytest import mark
+from result import Err
+
+from aqua.application.cases.write_coalesced_water import (
+    NoUserError,
+)
+from aqua.tests.test_application.test_cases.test_write_coalesced_water.conftest import (  # noqa: E501
+    Context,
+)
+
+
+@mark.asyncio
+async def test_result(context: Context) -> None:
+    result = await context.write_coalesced_water(uuid4(), (None, 100))
+
+    assert result == Err(NoUserError())
+
+
+@mark.asyncio
+async def test_storage(context: Context) -> None:
+    await context.write_coalesced_water(uuid4(), (None, 100))
+
+    assert not context.users
@@ -12,6 +12,7 @@ from aqua.application.cases.write_water import (
 from aqua.application.cases.write_water import (
     write_water as case,
 )
+from aqua.application.retries import RetryMetrics
 from aqua.domain.framework.entity import Entities
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
@@ -37,9 +38,15 @@ from aqua.infrastructure.adapters.loggers.in_memory_logger import (
 from aqua.infrastructure.adapters.mappers.in_memory.day_mapper import (
     InMemoryDayMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.in_memory.ledger_mapper import (
+    InMemoryLedgerMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.in_memory.record_mapper import (
     InMemoryRecordMapperTo,
 )
+from aqua.infrastructure.adapters.mappers.in_memory.rollup_mapper import (
+    InMemoryRollupMapperTo,
+)
 from aqua.infrastructure.adapters.mappers.in_memory.user_mapper import (
     InMemoryUserMapperTo,
 )
@@ -73,12 +80,14 @@ class Context:
     write_water: WriteWater
     users: InMemoryUsers
     logger: InMemoryLogger
+    rollup_mapper_to: InMemoryRollupMapperTo
 
 
 @fixture
 def context() -> Context:
     users = InMemoryUsers()
     logger = InMemoryLogger()
+    rollup_mapper_to = InMemoryRollupMapperTo()
 
     async def write_water(
         user_id: UUID, water: int | None
@@ -90,13 +99,21 @@ def context() -> Context:
             users=users,
             transaction_for=_InMemoryStorageTransactionFor(),
             logger=logger,
+            retry_metrics=RetryMetrics(),
             user_mapper_to=InMemoryUserMapperTo(),
             day_mapper_to=InMemoryDayMapperTo(),
             record_mapper_to=InMemoryRecordMapperTo(),
+            rollup_mapper_to=rollup_mapper_to,
+            ledger_mapper_to=InMemoryLedgerMapperTo(),
         ) as result:
             return result
 
-    return Context(write_water=write_water, users=users, logger=logger)
+    return Context(
+        write_water=write_water,
+        users=users,
+        logger=logger,
+        rollup_mapper_to=rollup_mapper_to,
+    )
 
 
 @fixture
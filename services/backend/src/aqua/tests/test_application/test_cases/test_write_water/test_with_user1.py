@@ -3,6 +3,7 @@ from datetime import UTC
 from dirty_equals import IsNow
 from pytest import mark
 
+from aqua.application.rollups import DayChange
 from aqua.domain.framework.entity import FrozenEntities
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.aggregates.user.internal.entities.record import (
@@ -94,3 +95,22 @@ async def test_logs(context_with_user1: Context, user1: User) -> None:
     assert context.logger.new_day_state_logs == (new_day_log,)
     assert context.logger.new_record_logs == (new_record_log,)
     assert context.logger.record_cancellation_logs == tuple()
+
+
+@mark.asyncio
+async def test_day_changes(
+    context_with_user1: Context, user1: User, user1_day2: Day
+) -> None:
+    context = context_with_user1
+
+    await context.write_water(user1.id, None)
+
+    day_change = DayChange(
+        user_id=user1.id,
+        date_=user1_day2.date_,
+        water_milliliters=300,
+        is_day_new=False,
+        previous_result=Result.not_enough_water,
+        result=Result.good,
+    )
+    assert context.rollup_mapper_to.day_changes == (day_change,)
@@ -3,6 +3,7 @@ from datetime import UTC, datetime
 from dirty_equals import IsNow
 from pytest import mark
 
+from aqua.application.rollups import DayChange
 from aqua.domain.framework.entity import FrozenEntities
 from aqua.domain.model.core.aggregates.user.root import User
 from aqua.domain.model.core.vos.target import Result
@@ -67,3 +68,20 @@ async def test_logs(context_with_user2: Context, user2: User) -> None:
     assert context.logger.new_day_state_logs == tuple()
     assert context.logger.new_record_logs == (new_record_log,)
     assert context.logger.record_cancellation_logs == tuple()
+
+
+@mark.asyncio
+async def test_day_changes(context_with_user2: Context, user2: User) -> None:
+    context = context_with_user2
+
+    view = (await context.write_water(user2.id, None)).unwrap()
+
+    day_change = DayChange(
+        user_id=user2.id,
+        date_=view.day.date_,
+        water_milliliters=300,
+        is_day_new=True,
+        previous_result=None,
+        result=Result.not_enough_water,
+    )
+    assert context.rollup_mapper_to.day_changes == (day_change,)
@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from typing import Awaitable, Callable, Iterable, TypeAlias
+from uuid import UUID
+
+from pytest import fixture
+from result import Result
+
+from aqua.application.cases.write_water_batch import (
+    EntryError,
+    NoUserError,
+)
+from aqua.application.cases.write_water_batch import (
+    write_water_batch as case,
+)
+from aqua.application.retries import RetryMetrics
+from aqua.domain.framework.entity import Entities
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Record,
+)
+from aqua.domain.model.core.aggregates.user.root import (
+    User,
+)
+from aqua.domain.model.core.vos.glass import Glass
+from aqua.domain.model.core.vos.target import Target
+from aqua.domain.model.core.vos.water_balance import (
+    WaterBalance,
+)
+from aqua.domain.model.primitives.vos.time import Time
+from aqua.domain.model.primitives.vos.water import Water
+from aqua.domain.model.primitives.vos.weight import Weight
+from aqua.infrastructure.adapters.loggers.in_memory_logger import (
+    InMemoryLogger,
+)
+from aqua.infrastructure.adapters.mappers.in_memory.day_mapper import (
+    InMemoryDayMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.in_memory.ledger_mapper import (
+    InMemoryLedgerMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.in_memory.record_mapper import (
+    InMemoryRecordMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.in_memory.rollup_mapper import (
+    InMemoryRollupMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.in_memory.user_mapper import (
+    InMemoryUserMapperTo,
+)
+from aqua.infrastructure.adapters.repos.in_memory.users import InMemoryUsers
+from aqua.infrastructure.adapters.transactions.in_memory import (
+    storage_transaction as _storage_transaction,
+)
+from aqua.infrastructure.adapters.views.in_memory.batch_writing_view_of import (
+    InMemoryBatchWritingViewOf,
+)
+from aqua.infrastructure.periphery.views.in_memory.batch_writing_view import (
+    InMemoryBatchWritingView,
+)
+
+
+_InMemoryStorageTransactionFor: TypeAlias = (
+    _storage_transaction.InMemoryStorageTransactionFor
+)
+
+
+type WriteWaterBatch = Callable[
+    [UUID, Iterable[tuple[int, datetime]]],
+    Awaitable[Result[InMemoryBatchWritingView, NoUserError | EntryError]],
+]
+
+
+archive_horizon_days = 100 * 365
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Context:
+    write_water_batch: WriteWaterBatch
+    users: InMemoryUsers
+    logger: InMemoryLogger
+    rollup_mapper_to: InMemoryRollupMapperTo
+
+
+@fixture
+def context() -> Context:
+    users = InMemoryUsers()
+    logger = InMemoryLogger()
+    rollup_mapper_to = InMemoryRollupMapperTo()
+
+    async def write_water_batch(
+        user_id: UUID, entries: Iterable[tuple[int, datetime]]
+    ) -> Result[InMemoryBatchWritingView, NoUserError | EntryError]:
+        async with case(
+            user_id,
+            entries,
+            view_of=InMemoryBatchWritingViewOf(),
+            users=users,
+            transaction_for=_InMemoryStorageTransactionFor(),
+            logger=logger,
+            retry_metrics=RetryMetrics(),
+            user_mapper_to=InMemoryUserMapperTo(),
+            day_mapper_to=InMemoryDayMapperTo(),
+            record_mapper_to=InMemoryRecordMapperTo(),
+            rollup_mapper_to=rollup_mapper_to,
+            ledger_mapper_to=InMemoryLedgerMapperTo(),
+            archive_horizon_days=archive_horizon_days,
+        ) as result:
+            return result
+
+    return Context(
+        write_water_batch=write_water_batch,
+        users=users,
+        logger=logger,
+        rollup_mapper_to=rollup_mapper_to,
+    )
+
+
+@fixture
+def user1_day1() -> Day:
+    return Day(
+        id=UUID(int=10),
+        events=list(),
+        user_id=UUID(int=1),
+        date_=date(2000, 1, 1),
+        target=Target(
+            water_balance=WaterBalance(
+                water=Water.with_(milliliters=2000).unwrap()
+            )
+        ),
+        water_balance=WaterBalance(water=Water.with_(milliliters=200).unwrap()),
+        pinned_result=None,
+    )
+
+
+@fixture
+def user1_day1_record1() -> Record:
+    return Record(
+        id=UUID(int=100),
+        events=list(),
+        user_id=UUID(int=1),
+        drunk_water=Water.with_(milliliters=200).unwrap(),
+        recording_time=(
+            Time.with_(datetime_=datetime(2000, 1, 1, tzinfo=UTC)).unwrap()
+        ),
+        is_cancelled=False,
+    )
+
+
+@fixture
+def user1(user1_day1: Day, user1_day1_record1: Record) -> User:
+    return User(
+        id=UUID(int=1),
+        events=list(),
+        weight=Weight.with_(kilograms=70).unwrap(),
+        target=Target(
+            water_balance=WaterBalance(
+                water=Water.with_(milliliters=1000).unwrap()
+            )
+        ),
+        glass=Glass(capacity=Water.with_(milliliters=300).unwrap()),
+        days=Entities([user1_day1]),
+        records=Entities([user1_day1_record1]),
+    )
+
+
+@fixture
+def context_with_user1(
+    context: Context,
+    user1: User,
+    user1_day1: Day,
+    user1_day1_record1: Record,
+) -> Context:
+    context.users.add_user(user1)
+    context.users.add_day(user1_day1)
+    context.users.add_record(user1_day1_record1)
+
+    return context
@@ -0,0 +1,88 @@
+from datetime import UTC, datetime, timedelta
+
+from pytest import mark
+from result import Err, Ok
+
+from aqua.application.cases.write_water_batch import (
+    ArchivedRecordingTimeError,
+    FutureRecordingTimeError,
+)
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.domain.model.primitives.vos.time import NotUTCTimeError
+from aqua.domain.model.primitives.vos.water import NegativeWaterAmountError
+from aqua.tests.test_application.test_cases.test_write_water_batch.conftest import (  # noqa: E501
+    Context,
+    archive_horizon_days,
+)
+
+
+valid_entry = (300, datetime(2000, 1, 1, 10, tzinfo=UTC))
+
+
+@mark.asyncio
+async def test_with_negative_water(
+    context_with_user1: Context, user1: User
+) -> None:
+    context = context_with_user1
+    entries = [valid_entry, (-1, datetime(2000, 1, 1, 11, tzinfo=UTC))]
+
+    result = await context.write_water_batch(user1.id, entries)
+
+    assert result == Err(NegativeWaterAmountError())
+    assert len(context.users.storage.records) == 1
+
+
+@mark.asyncio
+async def test_with_naive_time(
+    context_with_user1: Context, user1: User
+) -> None:
+    context = context_with_user1
+    entries = [valid_entry, (300, datetime(2000, 1, 1, 11))]
+
+    result = await context.write_water_batch(user1.id, entries)
+
+    assert result == Err(NotUTCTimeError())
+    assert len(context.users.storage.records) == 1
+
+
+@mark.asyncio
+async def test_with_future_time(
+    context_with_user1: Context, user1: User
+) -> None:
+    context = context_with_user1
+    entries = [valid_entry, (300, datetime.now(UTC) + timedelta(days=1))]
+
+    result = await context.write_water_batch(user1.id, entries)
+
+    assert result == Err(FutureRecordingTimeError())
+    assert len(context.users.storage.records) == 1
+    assert context.logger.is_empty
+
+
+@mark.asyncio
+async def test_with_archived_time(
+    context_with_user1: Context, user1: User
+) -> None:
+    context = context_with_user1
+    archived_time = datetime.now(UTC) - timedelta(days=archive_horizon_days + 1)
+    entries = [valid_entry, (300, archived_time)]
+
+    result = await context.write_water_batch(user1.id, entries)
+
+    assert result == Err(ArchivedRecordingTimeError())
+    assert len(context.users.storage.records) == 1
+    assert context.logger.is_empty
+
+
+@mark.asyncio
+async def test_with_horizon_time(
+    context_with_user1: Context, user1: User
+) -> None:
+    context = context_with_user1
+    horizon_time = datetime.now(UTC) - timedelta(days=archive_horizon_days)
+    entries = [valid_entry, (300, horizon_time)]
+
+    result = await context.write_water_batch(user1.id, entries)
+
+    assert isinstance(result, Ok)
+    assert len(context.users.storage.records) == 3
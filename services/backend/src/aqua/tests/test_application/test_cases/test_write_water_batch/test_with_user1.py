@@ -0,0 +1,116 @@
+from datetime import UTC, date, datetime
+
+from pytest import mark
+
+from aqua.application.rollups import DayChange
+from aqua.domain.model.core.aggregates.user.internal.entities.day import (
+    NewWaterBalance,
+)
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.domain.model.core.vos.target import Result
+from aqua.domain.model.core.vos.water_balance import WaterBalance
+from aqua.domain.model.primitives.vos.water import Water
+from aqua.tests.test_application.test_cases.test_write_water_batch.conftest import (  # noqa: E501
+    Context,
+)
+
+
+entries = (
+    (300, datetime(2000, 1, 1, 10, tzinfo=UTC)),
+    (500, datetime(2000, 1, 2, 9, tzinfo=UTC)),
+    (250, datetime(2000, 1, 1, 18, tzinfo=UTC)),
+)
+
+
+@mark.asyncio
+async def test_days(context_with_user1: Context, user1: User) -> None:
+    context = context_with_user1
+
+    view = (await context.write_water_batch(user1.id, entries)).unwrap()
+
+    day1, day2 = view.days
+
+    assert day1.date_ == date(2000, 1, 1)
+    assert day1.water_balance == WaterBalance(
+        water=Water.with_(milliliters=750).unwrap()
+    )
+    assert len(day1.events_with_type(NewWaterBalance)) == 1
+    assert day2.date_ == date(2000, 1, 2)
+    assert day2.target == user1.target
+    assert day2.water_balance == WaterBalance(
+        water=Water.with_(milliliters=500).unwrap()
+    )
+    assert day2.result is Result.not_enough_water
+
+
+@mark.asyncio
+async def test_records(context_with_user1: Context, user1: User) -> None:
+    context = context_with_user1
+
+    view = (await context.write_water_batch(user1.id, entries)).unwrap()
+
+    record_values = {
+        (record.drunk_water.milliliters, record.recording_time.datetime_)
+        for record in view.new_records
+    }
+
+    assert record_values == set(entries)
+
+
+@mark.asyncio
+async def test_storage(context_with_user1: Context, user1: User) -> None:
+    context = context_with_user1
+
+    view = (await context.write_water_batch(user1.id, entries)).unwrap()
+
+    stored_day1 = context.users.day_with_user_id_and_date(
+        user_id=user1.id, date_=date(2000, 1, 1)
+    )
+    stored_day2 = context.users.day_with_user_id_and_date(
+        user_id=user1.id, date_=date(2000, 1, 2)
+    )
+
+    assert (stored_day1, stored_day2) == view.days
+    assert len(context.users.storage.records) == 4
+
+
+@mark.asyncio
+async def test_logs(context_with_user1: Context, user1: User) -> None:
+    context = context_with_user1
+
+    await context.write_water_batch(user1.id, entries)
+
+    assert len(context.logger.new_day_logs) == 1
+    assert len(context.logger.new_day_state_logs) == 1
+    assert len(context.logger.new_record_logs) == 3
+
+
+@mark.asyncio
+async def test_day_changes(context_with_user1: Context, user1: User) -> None:
+    context = context_with_user1
+
+    await context.write_water_batch(user1.id, entries)
+
+    day_changes = {
+        day_change.date_: day_change
+        for day_change in context.rollup_mapper_to.day_changes
+    }
+
+    assert day_changes == {
+        date(2000, 1, 1): DayChange(
+            user_id=user1.id,
+            date_=date(2000, 1, 1),
+            water_milliliters=550,
+            is_day_new=False,
+            previous_result=Result.not_enough_water,
+            result=Result.not_enough_water,
+        ),
+        date(2000, 1, 2): DayChange(
+            user_id=user1.id,
+            date_=date(2000, 1, 2),
+            water_milliliters=500,
+            is_day_new=True,
+            previous_result=None,
+            result=Result.not_enough_water,
+        ),
+    }
@@ -0,0 +1,29 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from pytest import mark
+from result import Err
+
+from aqua.application.cases.write_water_batch import (
+    NoUserError,
+)
+from aqua.tests.test_application.test_cases.test_write_water_batch.conftest import (  # noqa: E501
+    Context,
+)
+
+
+entries = [(300, datetime(2000, 1, 1, 10, tzinfo=UTC))]
+
+
+@mark.asyncio
+async def test_result(context: Context) -> None:
+    result = await context.write_water_batch(uuid4(), entries)
+
+    assert result == Err(NoUserError())
+
+
+@mark.asyncio
+async def test_storage(context: Context) -> None:
+    await context.write_water_batch(uuid4(), entries)
+
+    assert not context.users
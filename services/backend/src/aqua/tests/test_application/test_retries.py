@@ -0,0 +1,106 @@
+from uuid import UUID
+
+from pytest import raises
+
+from aqua.application.ports.mappers import ArchivedDayError, ConflictError
+from aqua.application.retries import (
+    RetryMetrics,
+    RetryMetricsSnapshot,
+    retried,
+)
+from aqua.infrastructure.adapters.loggers.in_memory_logger import (
+    InMemoryLogger,
+)
+from aqua.infrastructure.periphery.logs.in_memory_logs import ConflictRetryLog
+
+
+class Attempt:
+    def __init__(self, *, conflict_count: int) -> None:
+        self.conflict_count = conflict_count
+        self.call_count = 0
+
+    async def __call__(self) -> int:
+        self.call_count += 1
+
+        if self.call_count <= self.conflict_count:
+            raise ConflictError
+
+        return self.call_count
+
+
+async def test_without_conflicts() -> None:
+    attempt = Attempt(conflict_count=0)
+    logger = InMemoryLogger()
+    metrics = RetryMetrics()
+
+    result = await retried(
+        attempt, user_id=UUID(int=1), logger=logger, metrics=metrics
+    )
+
+    assert result == 1
+    assert not logger.conflict_retry_logs
+    assert metrics.snapshot() == RetryMetricsSnapshot(
+        retry_count=0, exhausted_retry_count=0
+    )
+
+
+async def test_with_conflicts() -> None:
+    attempt = Attempt(conflict_count=2)
+    logger = InMemoryLogger()
+    metrics = RetryMetrics()
+
+    result = await retried(
+        attempt, user_id=UUID(int=1), logger=logger, metrics=metrics
+    )
+
+    assert result == 3
+    assert logger.conflict_retry_logs == (
+        ConflictRetryLog(user_id=UUID(int=1), attempt_number=1),
+        ConflictRetryLog(user_id=UUID(int=1), attempt_number=2),
+    )
+    assert metrics.snapshot() == RetryMetricsSnapshot(
+        retry_count=2, exhausted_retry_count=0
+    )
+
+
+async def test_with_too_many_conflicts() -> None:
+    attempt = Attempt(conflict_count=3)
+    logger = InMemoryLogger()
+    metrics = RetryMetrics()
+
+    with raises(ConflictError):
+        await retried(
+            attempt,
+            user_id=UUID(int=1),
+            logger=logger,
+            metrics=metrics,
+            max_attempt_count=3,
+        )
+
+    assert attempt.call_count == 3
+    assert len(logger.conflict_retry_logs) == 2
+    assert metrics.snapshot() == RetryMetricsSnapshot(
+        retry_count=2, exhausted_retry_count=1
+    )
+
+
+async def test_with_archived_day() -> None:
+    logger = InMemoryLogger()
+    metrics = RetryMetrics()
+    call_count = 0
+
+    async def attempt() -> int:  # noqa: RUF029
+        nonlocal call_count
+        call_count += 1
+        raise ArchivedDayError
+
+    with raises(ArchivedDayError):
+        await retried(
+            attempt, user_id=UUID(int=1), logger=logger, metrics=metrics
+        )
+
+    assert call_count == 1
+    assert not logger.conflict_retry_logs
+    assert metrics.snapshot() == RetryMetricsSnapshot(
+        retry_count=0, exhausted_retry_count=0
+    )
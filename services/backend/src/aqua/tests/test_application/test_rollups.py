@@ -0,0 +1,81 @@
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+from pytest import mark
+
+from aqua.application.rollups import (
+    DayChange,
+    Period,
+    day_changes_of,
+    period_start_of,
+)
+from aqua.domain.framework.effects.searchable import SearchableEffect
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Record,
+    cancel,
+)
+from aqua.domain.model.core.vos.target import Result, Target
+from aqua.domain.model.core.vos.water_balance import WaterBalance
+from aqua.domain.model.primitives.vos.time import Time
+from aqua.domain.model.primitives.vos.water import Water
+
+
+def water_balance_with(milliliters: int) -> WaterBalance:
+    return WaterBalance(water=Water.with_(milliliters=milliliters).unwrap())
+
+
+def day_with(milliliters: int) -> Day:
+    return Day(
+        id=UUID(int=1),
+        events=list(),
+        user_id=UUID(int=2),
+        date_=date(2000, 1, 5),
+        target=Target(water_balance=water_balance_with(2000)),
+        water_balance=water_balance_with(milliliters),
+        pinned_result=None,
+    )
+
+
+def record_with(milliliters: int) -> Record:
+    return Record(
+        id=UUID(int=3),
+        events=list(),
+        user_id=UUID(int=2),
+        drunk_water=Water.with_(milliliters=milliliters).unwrap(),
+        recording_time=Time.with_(
+            datetime_=datetime(2000, 1, 5, 12, tzinfo=UTC)
+        ).unwrap(),
+        is_cancelled=False,
+    )
+
+
+@mark.parametrize(
+    ("period", "start_date"),
+    [(Period.week, date(2000, 1, 3)), (Period.month, date(2000, 1, 1))],
+)
+def test_period_start(period: Period, start_date: date) -> None:
+    assert period_start_of(period, date(2000, 1, 5)) == start_date
+
+
+def test_day_changes_with_cancelled_record() -> None:
+    effect = SearchableEffect()
+    day = day_with(2000)
+    record = record_with(500)
+
+    cancel(record, effect=effect).unwrap()
+    day.ignore(record, effect=effect)
+
+    day_change = DayChange(
+        user_id=UUID(int=2),
+        date_=date(2000, 1, 5),
+        water_milliliters=-500,
+        is_day_new=False,
+        previous_result=Result.good,
+        result=Result.not_enough_water,
+    )
+    assert day_changes_of(effect) == (day_change,)
+
+
+def test_day_changes_without_days() -> None:
+    assert day_changes_of(SearchableEffect()) == tuple()
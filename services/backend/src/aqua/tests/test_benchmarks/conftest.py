@@ -0,0 +1 @@
+from aqua.tests.test_infrastructure.fixtures import *
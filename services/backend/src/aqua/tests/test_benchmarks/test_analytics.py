@@ -0,0 +1,58 @@
+from array import array
+from datetime import date, timedelta
+from typing import Callable
+
+from pytest import fixture
+
+from aqua.application.analytics import HistoryColumns, analytics_of
+from aqua.tests.benchmarks import benchmark, seconds_of
+
+
+_start_date = date(2020, 1, 1)
+_day_count = 5 * 365
+_record_count = _day_count * 10
+
+
+@fixture
+def multi_year_columns() -> HistoryColumns:
+    return HistoryColumns(
+        day_ordinals=array(
+            "l",
+            (
+                (_start_date + timedelta(days=day_number)).toordinal()
+                for day_number in range(_day_count)
+            ),
+        ),
+        day_milliliters=array(
+            "q",
+            (500 + day_number * 37 % 2500 for day_number in range(_day_count)),
+        ),
+        good_day_flags=array(
+            "b", (day_number % 10 < 7 for day_number in range(_day_count))
+        ),
+        record_milliliters=array(
+            "q",
+            (
+                50 + record_number * 7919 % 450
+                for record_number in range(_record_count)
+            ),
+        ),
+    )
+
+
+@benchmark
+def test_analytics_of_multi_year_history(
+    multi_year_columns: HistoryColumns,
+    record_property: Callable[[str, object], None],
+) -> None:
+    today = _start_date + timedelta(days=_day_count - 1)
+    analytics = analytics_of(multi_year_columns, today=today)
+
+    assert analytics.glass_percentile_milliliters is not None
+
+    record_property(
+        "analytics_seconds",
+        seconds_of(
+            lambda: analytics_of(multi_year_columns, today=today), times=20
+        ),
+    )
@@ -0,0 +1,74 @@
+import tracemalloc
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from bson.tz_util import utc as bson_utc
+from pymongo import AsyncMongoClient
+
+from aqua.application.cases.view_history import view_history
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.history_view_from import (
+    DBHistoryViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.serializing.from_view.to_csv import (
+    CSVLines,
+)
+from aqua.tests.benchmarks import benchmark
+
+
+_user_id = UUID(int=2)
+_record_count = 1_000_000
+_insertion_chunk_size = 10_000
+_memory_ceiling = 32 * 1024 * 1024
+
+
+async def insert_records(client: AsyncMongoClient[Document]) -> None:
+    start_time = datetime(2000, 1, 1, tzinfo=bson_utc)
+
+    for chunk_start in range(0, _record_count, _insertion_chunk_size):
+        chunk_end = min(chunk_start + _insertion_chunk_size, _record_count)
+        documents = [
+            {
+                "_id": UUID(int=number + 1),
+                "user_id": _user_id,
+                "drunk_water": 100 + number % 500,
+                "recording_time": start_time + timedelta(minutes=number),
+                "is_cancelled": number % 10 == 0,
+            }
+            for number in range(chunk_start, chunk_end)
+        ]
+        await client.db.records.insert_many(
+            documents, ordered=False, comment="add benchmark records"
+        )
+
+
+@benchmark
+async def test_export_history_memory(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    await insert_records(mongo_client)
+
+    rows = view_history(
+        _user_id,
+        view_from=DBHistoryViewFromMongoUsers(),
+        users=MongoUsers(mongo_client),
+    )
+    csv_lines = CSVLines()
+    csv_lines.header()
+    exported_row_count = 0
+
+    tracemalloc.start()
+
+    try:
+        async for row in rows:
+            csv_lines.line_of(row)
+            exported_row_count += 1
+
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert exported_row_count == _record_count
+    assert peak < _memory_ceiling
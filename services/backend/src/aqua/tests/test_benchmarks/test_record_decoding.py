@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+from bson.tz_util import utc as bson_utc
+
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Record,
+)
+from aqua.domain.model.primitives.vos.time import Time
+from aqua.domain.model.primitives.vos.water import Water
+from aqua.infrastructure.adapters.repos.mongo.users import loaded_record_from
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.validation.objects import (
+    StrictValidationObject,
+)
+from aqua.tests.benchmarks import benchmark, seconds_of
+
+
+_start_time = datetime(2000, 1, 1, 12, tzinfo=bson_utc)
+
+
+def record_documents_of(*, user_id: UUID, count: int) -> list[Document]:
+    return [
+        {
+            "_id": uuid4(),
+            "user_id": user_id,
+            "drunk_water": 200,
+            "recording_time": _start_time + timedelta(minutes=number),
+            "is_cancelled": False,
+        }
+        for number in range(count)
+    ]
+
+
+def rebuilt_datetime_of(document_datetime: datetime) -> datetime:
+    tz = document_datetime.tzinfo
+    timedelta = None if tz is None else tz.utcoffset(None)
+    native_tz = None if timedelta is None else timezone(timedelta)
+
+    return datetime(
+        document_datetime.year,
+        document_datetime.month,
+        document_datetime.day,
+        document_datetime.hour,
+        document_datetime.minute,
+        document_datetime.second,
+        document_datetime.microsecond,
+        native_tz,
+        fold=document_datetime.fold,
+    )
+
+
+def record_with_validation_object(record_document: Document) -> Record:
+    record_object = StrictValidationObject(record_document)
+    recording_time = rebuilt_datetime_of(
+        record_object["recording_time", datetime]
+    )
+
+    return Record(
+        id=record_object["_id", UUID],
+        events=list(),
+        user_id=record_object["user_id", UUID],
+        drunk_water=Water.with_(
+            milliliters=record_object["drunk_water", int]
+        ).unwrap(),
+        recording_time=Time.with_(datetime_=recording_time).unwrap(),
+        is_cancelled=record_object["is_cancelled", bool],
+    )
+
+
+def decoding_seconds(
+    decode: Callable[[Document], Any], documents: list[Document]
+) -> float:
+    def decode_all() -> None:
+        for document in documents:
+            decode(document)
+
+    return min(seconds_of(decode_all) for _ in range(3))
+
+
+@benchmark
+def test_record_decoding_of_user_with_50k_records(
+    record_property: Callable[[str, object], None],
+) -> None:
+    documents = record_documents_of(user_id=uuid4(), count=50_000)
+
+    assert loaded_record_from(documents[0]) == (
+        record_with_validation_object(documents[0])
+    )
+
+    record_property(
+        "validation_object_seconds",
+        decoding_seconds(record_with_validation_object, documents),
+    )
+    record_property(
+        "decoder_seconds", decoding_seconds(loaded_record_from, documents)
+    )
@@ -0,0 +1,62 @@
+from datetime import UTC, datetime, timedelta
+from typing import Callable
+
+from result import Result
+
+from aqua.domain.model.primitives.vos.time import Time
+from aqua.domain.model.primitives.vos.water import Water
+from aqua.tests.benchmarks import benchmark, peak_bytes_of, seconds_of
+
+
+_start_time = datetime(2000, 1, 1, 12, tzinfo=UTC)
+
+
+@benchmark
+def test_trusted_value_objects_of_user_with_50k_records(
+    record_property: Callable[[str, object], None],
+) -> None:
+    recording_times = [
+        _start_time + timedelta(minutes=number) for number in range(50_000)
+    ]
+
+    def validated_value_objects() -> list[tuple[Water, Time]]:
+        return [
+            (
+                Water.with_(milliliters=200).unwrap(),
+                Time.with_(datetime_=recording_time).unwrap(),
+            )
+            for recording_time in recording_times
+        ]
+
+    def validated_value_object_results() -> list[
+        tuple[Result[Water, object], Result[Time, object]]
+    ]:
+        return [
+            (
+                Water.with_(milliliters=200),
+                Time.with_(datetime_=recording_time),
+            )
+            for recording_time in recording_times
+        ]
+
+    def trusted_value_objects() -> list[tuple[Water, Time]]:
+        return [
+            (
+                Water.trusted(milliliters=200),
+                Time.trusted(datetime_=recording_time),
+            )
+            for recording_time in recording_times
+        ]
+
+    record_property(
+        "validated_peak_bytes", peak_bytes_of(validated_value_object_results)
+    )
+    record_property("trusted_peak_bytes", peak_bytes_of(trusted_value_objects))
+    record_property(
+        "validated_seconds",
+        min(seconds_of(validated_value_objects) for _ in range(3)),
+    )
+    record_property(
+        "trusted_seconds",
+        min(seconds_of(trusted_value_objects) for _ in range(3)),
+    )
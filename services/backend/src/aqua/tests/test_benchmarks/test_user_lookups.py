@@ -0,0 +1,207 @@
+from datetime import UTC, date, datetime, timedelta
+from typing import Callable
+from uuid import UUID, uuid4
+
+from pytest import fixture
+
+from aqua.domain.framework.effects.searchable import SearchableEffect
+from aqua.domain.framework.entity import Entities
+from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
+from aqua.domain.model.core.aggregates.user.internal.entities.record import (
+    Record,
+)
+from aqua.domain.model.core.aggregates.user.root import User
+from aqua.domain.model.core.vos.glass import Glass
+from aqua.domain.model.core.vos.target import Target
+from aqua.domain.model.core.vos.water_balance import WaterBalance
+from aqua.domain.model.primitives.vos.time import Time
+from aqua.domain.model.primitives.vos.water import Water
+from aqua.infrastructure.adapters.views.in_memory.cancellation_view_of import (
+    InMemoryCancellationViewOf,
+)
+from aqua.tests.benchmarks import benchmark, seconds_of
+
+
+_start_time = datetime(2000, 1, 1, 12, tzinfo=UTC)
+
+
+def user_with_history(*, record_count: int, records_per_day: int) -> User:
+    user_id = uuid4()
+    target = Target(
+        water_balance=WaterBalance(water=Water.with_(milliliters=2000).unwrap())
+    )
+    day_water = Water.with_(milliliters=200 * records_per_day).unwrap()
+    records = Entities[Record]()
+    days = Entities[Day]()
+
+    for record_number in range(record_count):
+        day_number, minute = divmod(record_number, records_per_day)
+        record_time = _start_time + timedelta(days=day_number, minutes=minute)
+        records.add(
+            Record(
+                id=uuid4(),
+                events=list(),
+                user_id=user_id,
+                drunk_water=Water.with_(milliliters=200).unwrap(),
+                recording_time=Time.with_(datetime_=record_time).unwrap(),
+                is_cancelled=False,
+            )
+        )
+
+    for day_number in range(record_count // records_per_day):
+        days.add(
+            Day(
+                id=uuid4(),
+                events=list(),
+                user_id=user_id,
+                date_=(_start_time + timedelta(days=day_number)).date(),
+                target=target,
+                water_balance=WaterBalance(water=day_water),
+                pinned_result=None,
+            )
+        )
+
+    return User(
+        id=user_id,
+        events=list(),
+        weight=None,
+        target=target,
+        glass=Glass(capacity=Water.with_(milliliters=200).unwrap()),
+        days=days,
+        records=records,
+    )
+
+
+@fixture
+def small_user() -> User:
+    return user_with_history(record_count=100, records_per_day=10)
+
+
+@fixture
+def large_user() -> User:
+    return user_with_history(record_count=20_000, records_per_day=10)
+
+
+def write_water_seconds(user: User, *, times: int) -> float:
+    current_time = Time.with_(datetime_=_start_time).unwrap()
+
+    def write_water() -> None:
+        user.write_water(current_time=current_time, effect=SearchableEffect())
+
+    write_water()
+
+    return seconds_of(write_water, times=times)
+
+
+def record_with_linear_scan(user: User, record_id: UUID) -> Record | None:
+    for record in user.records:
+        if record.id == record_id:
+            return record
+
+    return None
+
+
+def date_of_record(record: Record) -> date:
+    return record.recording_time.datetime_.date()
+
+
+def records_on_with_linear_scan(user: User, date_: date) -> tuple[Record, ...]:
+    return tuple(
+        record for record in user.records if date_of_record(record) == date_
+    )
+
+
+@benchmark
+def test_write_water_against_history_length(
+    small_user: User,
+    large_user: User,
+    record_property: Callable[[str, object], None],
+) -> None:
+    record_property(
+        "small_user_seconds", write_water_seconds(small_user, times=200)
+    )
+    record_property(
+        "large_user_seconds", write_water_seconds(large_user, times=200)
+    )
+
+
+@benchmark
+def test_indexed_lookups_against_linear_scans(
+    large_user: User,
+    record_property: Callable[[str, object], None],
+) -> None:
+    user = large_user
+    last_record_id = list(user.records)[-1].id
+    date_ = _start_time.date()
+
+    assert user.records.with_id(last_record_id) == (
+        record_with_linear_scan(user, last_record_id)
+    )
+    assert user.records.with_key(date_of_record, date_) == (
+        records_on_with_linear_scan(user, date_)
+    )
+
+    linear_seconds = seconds_of(
+        lambda: (
+            record_with_linear_scan(user, last_record_id),
+            records_on_with_linear_scan(user, date_),
+        ),
+        times=20,
+    )
+    indexed_seconds = seconds_of(
+        lambda: (
+            user.records.with_id(last_record_id),
+            user.records.with_key(date_of_record, date_),
+        ),
+        times=20,
+    )
+
+    record_property("linear_seconds", linear_seconds)
+    record_property("indexed_seconds", indexed_seconds)
+
+
+@benchmark
+def test_without_aggregation_against_history_length(
+    small_user: User,
+    large_user: User,
+    record_property: Callable[[str, object], None],
+) -> None:
+    record_property(
+        "small_user_seconds",
+        seconds_of(small_user.without_aggregation, times=200),
+    )
+    record_property(
+        "large_user_seconds",
+        seconds_of(large_user.without_aggregation, times=200),
+    )
+
+
+def cancellation_view_seconds(user: User, *, times: int) -> float:
+    record = list(user.records)[-1]
+    output = user.cancel_record(
+        record_id=record.id, effect=SearchableEffect()
+    ).unwrap()
+    view_of = InMemoryCancellationViewOf()
+
+    view = view_of(user=user, output=output)
+    assert view.other_records
+    assert all(
+        date_of_record(other_record) == output.day.date_
+        for other_record in view.other_records
+    )
+
+    return seconds_of(lambda: view_of(user=user, output=output), times=times)
+
+
+@benchmark
+def test_cancellation_view_against_history_length(
+    small_user: User,
+    large_user: User,
+    record_property: Callable[[str, object], None],
+) -> None:
+    record_property(
+        "small_user_seconds", cancellation_view_seconds(small_user, times=200)
+    )
+    record_property(
+        "large_user_seconds", cancellation_view_seconds(large_user, times=200)
+    )
@@ -0,0 +1,72 @@
+from datetime import date
+from statistics import quantiles
+from time import perf_counter
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+
+from aqua.application.cases.view_day import view_day
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.day_view_from import (
+    DBDayViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.tests.benchmarks import benchmark
+
+
+_view_from = DBDayViewFromMongoUsers()
+_user_id = UUID(int=2)
+_date = date(2000, 1, 1)
+
+
+async def latencies_of(
+    action: Callable[[], Awaitable[object]], *, times: int
+) -> list[float]:
+    latencies = list[float]()
+
+    for _ in range(times):
+        start = perf_counter()
+        await action()
+        latencies.append(perf_counter() - start)
+
+    return latencies
+
+
+def percentiles_of(latencies: list[float]) -> tuple[float, float]:
+    percentiles = quantiles(latencies, n=100)
+
+    return percentiles[49], percentiles[98]
+
+
+@benchmark
+async def test_view_day_without_session(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    record_property: Callable[[str, object], None],
+) -> None:
+    async def view_with_session() -> None:
+        async with mongo_client.start_session() as session:
+            users = MongoUsers(mongo_client, session=session)
+            await view_day(_user_id, _date, view_from=_view_from, users=users)
+
+    async def view_without_session() -> None:
+        users = MongoUsers(mongo_client)
+        await view_day(_user_id, _date, view_from=_view_from, users=users)
+
+    await latencies_of(view_with_session, times=50)
+    await latencies_of(view_without_session, times=50)
+
+    before_p50, before_p99 = percentiles_of(
+        await latencies_of(view_with_session, times=1000)
+    )
+    after_p50, after_p99 = percentiles_of(
+        await latencies_of(view_without_session, times=1000)
+    )
+
+    record_property("before_p50_seconds", before_p50)
+    record_property("before_p99_seconds", before_p99)
+    record_property("after_p50_seconds", after_p50)
+    record_property("after_p99_seconds", after_p99)
+
+    assert after_p50 < before_p50 * 1.5
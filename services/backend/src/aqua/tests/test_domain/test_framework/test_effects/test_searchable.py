@@ -66,3 +66,45 @@ def test_cancel() -> None:
     assert not effect.entities_that(X)
     assert not effect.entities_that(Y)
     assert not effect.entities_that(Z)
+
+
+def test_entities_that_with_event() -> None:
+    x1 = X(id=0, events=[1])
+    x2 = X(id=1, events=[1, "a"])
+    x3 = X(id=2, events=["a"])
+    x4 = X(id=3, events=list())
+    y1 = Y(id=0, events=[1])
+
+    effect = SearchableEffect([x1, x2, x3, x4, y1])
+
+    assert effect.entities_that(X, with_event=int) == FrozenEntities([x1, x2])
+    assert effect.entities_that(X, with_event=object) == FrozenEntities([
+        x1,
+        x2,
+        x3,
+    ])
+    assert effect.entities_that(X, without_event=int) == FrozenEntities([
+        x3,
+        x4,
+    ])
+    assert effect.entities_that(
+        X, with_event=int, without_event=str
+    ) == FrozenEntities([x1])
+    assert not effect.entities_that(Z, with_event=int)
+
+
+def test_entities_that_with_new_event() -> None:
+    x1 = X(id=0, events=list())
+    x2 = X(id=1, events=[1])
+
+    effect = SearchableEffect([x1, x2])
+
+    x1.events.append(1)
+    x2.events.clear()
+    effect.consider(x1, x2)
+
+    assert effect.entities_that(X, with_event=int) == FrozenEntities([x1])
+
+    effect.ignore(x1)
+
+    assert not effect.entities_that(X, with_event=int)
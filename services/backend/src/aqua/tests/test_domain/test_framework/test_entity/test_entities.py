@@ -7,6 +7,10 @@ from aqua.domain.framework.entity import Entities, Entity, FrozenEntities
 class X(Entity[int, int | str | float]): ...
 
 
+def parity_of(x: X) -> int:
+    return x.id % 2
+
+
 def test_add() -> None:
     a = X(id=0, events=list())
     b = X(id=1, events=list())
@@ -66,3 +70,55 @@ def test_with_event() -> None:
     entities_with_event = entities.with_event(int)
 
     assert entities_with_event == FrozenEntities([a, d])
+
+
+def test_with_id() -> None:
+    a = X(id=0, events=list())
+    b = X(id=1, events=list())
+
+    entities = Entities[X]([a, b])
+
+    assert entities.with_id(1) is b
+    assert entities.with_id(2) is None
+
+
+def test_with_key() -> None:
+    a = X(id=0, events=list())
+    b = X(id=1, events=list())
+    c = X(id=2, events=list())
+
+    entities = Entities[X]([a, b, c])
+
+    assert entities.with_key(parity_of, 0) == (a, c)
+    assert entities.with_key(parity_of, 1) == (b,)
+    assert entities.with_key(parity_of, 2) == tuple()
+
+
+def test_with_key_after_add_and_remove() -> None:
+    a = X(id=0, events=list())
+    b = X(id=1, events=list())
+    c = X(id=2, events=list())
+    d = X(id=3, events=list())
+
+    entities = Entities[X]([a, b])
+    entities.with_key(parity_of, 0)
+
+    entities.add(c)
+    entities.add(d)
+    entities.remove(a)
+    entities.remove(b)
+
+    assert entities.with_key(parity_of, 0) == (c,)
+    assert entities.with_key(parity_of, 1) == (d,)
+
+
+def test_with_key_after_add_with_conflict() -> None:
+    a = X(id=0, events=[1])
+    b = X(id=0, events=[2])
+
+    entities = Entities[X]([a])
+    entities.with_key(parity_of, 0)
+
+    entities.add(b)
+
+    assert entities.with_key(parity_of, 0) == (b,)
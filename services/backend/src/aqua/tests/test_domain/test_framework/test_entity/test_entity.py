@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from aqua.domain.framework.entity import Entity
+from aqua.domain.framework.entity import Entities, Entity, Mutated
 
 
 @dataclass(kw_only=True)
@@ -8,6 +8,12 @@ class X(Entity[int, int | str | float]):
     x: int
 
 
+@dataclass(kw_only=True)
+class Y(Entity[int, Mutated["Y"]]):
+    y: int
+    xs: Entities[X]
+
+
 def test_events_with_type() -> None:
     x = X(id=0, x=4, events=[0, 1, 2.0, "3", 4, 5.0, "6"])
 
@@ -28,3 +34,19 @@ def test_false_eq_with_x() -> None:
     b = X(id=1, x=5, events=[])
 
     assert a != b
+
+
+def test_without_aggregation() -> None:
+    y = Y(id=0, y=4, xs=Entities([X(id=1, x=1, events=[])]), events=[])
+    y.events.append(Mutated(entity=y))
+
+    cloned_y = y.without_aggregation()
+
+    assert cloned_y is not y
+    assert cloned_y.id == 0
+    assert cloned_y.y == 4
+    assert cloned_y.xs == Entities()
+    assert len(y.xs) == 1
+    assert cloned_y.events is not y.events
+    assert cloned_y.events[0].entity is cloned_y
+    assert y.events[0].entity is y
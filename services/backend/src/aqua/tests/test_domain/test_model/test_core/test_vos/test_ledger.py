@@ -0,0 +1,155 @@
+from datetime import date, timedelta
+from random import Random
+
+from aqua.domain.model.core.vos.ledger import (
+    Ledger,
+    day_count_between,
+    ledger_capacity,
+    summed_indexes_before,
+    summed_indexes_through,
+    updated_indexes_of,
+)
+from aqua.domain.model.primitives.vos.water import Water
+
+
+start_date = date(2000, 1, 1)
+
+
+def water_by_date_with(seed: int) -> list[tuple[date, Water]]:
+    random = Random(seed)  # noqa: S311
+
+    return [
+        (
+            start_date + timedelta(days=random.randrange(60)),
+            Water.trusted(milliliters=random.randrange(3000)),
+        )
+        for _ in range(random.randrange(40))
+    ]
+
+
+def ranges_with(seed: int) -> list[tuple[date, date]]:
+    random = Random(-seed)  # noqa: S311
+    ranges = list[tuple[date, date]]()
+
+    for _ in range(100):
+        from_ = start_date + timedelta(days=random.randrange(-10, 70))
+        to = from_ + timedelta(days=random.randrange(-3, 40))
+        ranges.append((from_, to))
+
+    return ranges
+
+
+def naive_milliliters_between(
+    water_by_date: list[tuple[date, Water]], from_: date, to: date
+) -> int:
+    return sum(
+        water.milliliters
+        for date_, water in water_by_date
+        if from_ <= date_ <= to
+    )
+
+
+seeds = range(50)
+
+
+def test_water_between() -> None:
+    for seed in seeds:
+        water_by_date = water_by_date_with(seed)
+        ledger = Ledger.of(water_by_date)
+
+        for from_, to in ranges_with(seed):
+            expected_milliliters = naive_milliliters_between(
+                water_by_date, from_, to
+            )
+
+            assert ledger.water_between(from_, to) == Water.trusted(
+                milliliters=expected_milliliters
+            )
+
+
+def test_average_water_between() -> None:
+    for seed in seeds:
+        water_by_date = water_by_date_with(seed)
+        ledger = Ledger.of(water_by_date)
+
+        for from_, to in ranges_with(seed):
+            day_count = (to - from_).days + 1
+            expected_milliliters = (
+                naive_milliliters_between(water_by_date, from_, to) // day_count
+                if day_count > 0
+                else 0
+            )
+
+            assert ledger.average_water_between(from_, to) == Water.trusted(
+                milliliters=expected_milliliters
+            )
+
+
+def test_with_added() -> None:
+    for seed in seeds:
+        water_by_date = water_by_date_with(seed)
+        ledger = Ledger()
+
+        for date_, water in water_by_date:
+            ledger = ledger.with_added(water.milliliters, on=date_)
+
+        assert ledger == Ledger.of(water_by_date)
+
+
+def test_with_negative_added() -> None:
+    ledger = (
+        Ledger()
+        .with_added(500, on=date(2000, 1, 1))
+        .with_added(300, on=date(2000, 1, 3))
+        .with_added(-500, on=date(2000, 1, 1))
+    )
+
+    assert ledger.water_between(date(2000, 1, 1), date(2000, 1, 5)) == (
+        Water.trusted(milliliters=300)
+    )
+
+
+def test_empty_ledger() -> None:
+    ledger = Ledger.of([])
+
+    assert ledger.water_between(date(2000, 1, 1), date(2000, 1, 5)) == (
+        Water.trusted(milliliters=0)
+    )
+
+
+def test_day_count_between() -> None:
+    assert day_count_between(date(2000, 1, 1), date(2000, 1, 1)) == 1
+    assert day_count_between(date(2000, 1, 1), date(2000, 1, 31)) == 31
+    assert day_count_between(date(2000, 1, 2), date(2000, 1, 1)) == 0
+
+
+def test_water_between_partially_loaded_ledger() -> None:
+    for seed in seeds:
+        ledger = Ledger.of(water_by_date_with(seed))
+
+        for from_, to in ranges_with(seed):
+            indexes = {
+                *summed_indexes_through(to),
+                *summed_indexes_before(from_),
+            }
+            partial_ledger = Ledger(
+                partial_sums={
+                    index: ledger.partial_sums[index]
+                    for index in indexes
+                    if index in ledger.partial_sums
+                }
+            )
+
+            assert partial_ledger.water_between(from_, to) == (
+                ledger.water_between(from_, to)
+            )
+
+
+def test_index_count() -> None:
+    max_index_count = ledger_capacity.bit_length()
+
+    for date_ in (date.min, date(2000, 1, 1), date.max):
+        assert 0 < len(updated_indexes_of(date_)) <= max_index_count
+        assert len(summed_indexes_through(date_)) <= max_index_count
+
+    assert summed_indexes_before(date.min) == ()
@@ -16,3 +16,12 @@ def test_not_utc_time() -> None:
 
 def test_utc_time() -> None:
     Time.with_(datetime_=datetime(2006, 1, 1, tzinfo=UTC)).unwrap()
+
+
+def test_trusted() -> None:
+    datetime_ = datetime(2006, 1, 1, tzinfo=UTC)
+
+    time = Time.trusted(datetime_=datetime_)
+
+    assert time == Time.with_(datetime_=datetime_).unwrap()
+    assert time.is_safe
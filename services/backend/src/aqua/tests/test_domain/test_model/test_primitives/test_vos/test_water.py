@@ -24,3 +24,10 @@ def test_sum() -> None:
     sum_ = water1 + water2
 
     assert sum_ == expected_sum
+
+
+def test_trusted() -> None:
+    water = Water.trusted(milliliters=250)
+
+    assert water == Water.with_(milliliters=250).unwrap()
+    assert water.is_safe
@@ -14,3 +14,10 @@ def test_invalid_amount() -> None:
     result = Weight.with_(kilograms=-1)
 
     assert result == Err(NegativeWeightAmountError())
+
+
+def test_trusted() -> None:
+    weight = Weight.trusted(kilograms=70)
+
+    assert weight == Weight.with_(kilograms=70).unwrap()
+    assert weight.is_safe
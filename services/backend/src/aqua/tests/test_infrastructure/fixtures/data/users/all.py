@@ -15,3 +15,13 @@ def user_documents(
     user2_document: Document,
 ) -> list[Document]:
     return [user1_document, user2_document]
+
+
+@fixture
+def day_documents(user2_day_documents: list[Document]) -> list[Document]:
+    return [*user2_day_documents]
+
+
+@fixture
+def record_documents(user2_record_documents: list[Document]) -> list[Document]:
+    return [*user2_record_documents]
@@ -38,6 +38,5 @@ def user1_document() -> Document:
         "target": 2000,
         "glass": 200,
         "weight": 70,
-        "days": [],
-        "records": [],
+        "version": 0,
     }
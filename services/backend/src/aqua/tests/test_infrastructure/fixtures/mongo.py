@@ -10,11 +10,14 @@ from aqua.infrastructure.periphery.pymongo.clients import (
     client_with,
 )
 from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.indexes import ensure_indexes
 
 
 @fixture(scope="session")
 async def mongo_client() -> AsyncIterable[AsyncMongoClient[Document]]:
     client = client_with(read_preference="primary")
+    await ensure_indexes(client)
+
     yield client
     await client.close()
 
@@ -35,15 +38,41 @@ async def empty_mongo(
     await mongo_client.db.users.delete_many(
         {}, session=mongo_session, comment="clear test users"
     )
+    await mongo_client.db.days.delete_many(
+        {}, session=mongo_session, comment="clear test days"
+    )
+    await mongo_client.db.records.delete_many(
+        {}, session=mongo_session, comment="clear test records"
+    )
+    await mongo_client.db.rollups.delete_many(
+        {}, session=mongo_session, comment="clear test rollups"
+    )
+    await mongo_client.db.ledgers.delete_many(
+        {}, session=mongo_session, comment="clear test ledgers"
+    )
+    await mongo_client.db.archived_days.delete_many(
+        {}, session=mongo_session, comment="clear test archived days"
+    )
+    await mongo_client.db.archived_records.delete_many(
+        {}, session=mongo_session, comment="clear test archived records"
+    )
 
 
 @fixture
-async def full_mongo(
+async def full_mongo(  # noqa: PLR0917
     empty_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user_documents: list[Document],
+    day_documents: list[Document],
+    record_documents: list[Document],
 ) -> None:
     await mongo_client.db.users.insert_many(
         user_documents, session=mongo_session, comment="add test users"
     )
+    await mongo_client.db.days.insert_many(
+        day_documents, session=mongo_session, comment="add test days"
+    )
+    await mongo_client.db.records.insert_many(
+        record_documents, session=mongo_session, comment="add test records"
+    )
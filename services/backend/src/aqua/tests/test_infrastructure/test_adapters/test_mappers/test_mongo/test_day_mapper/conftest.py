@@ -1,3 +1,4 @@
+from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import (
     AsyncClientSession as AsyncMongoSession,
 )
@@ -6,8 +7,11 @@ from pytest import fixture
 from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapper,
 )
+from aqua.infrastructure.periphery.pymongo.document import Document
 
 
 @fixture
-def day_mapper(mongo_session: AsyncMongoSession) -> MongoDayMapper:
-    return MongoDayMapper(mongo_session)
+def day_mapper(
+    mongo_client: AsyncMongoClient[Document], mongo_session: AsyncMongoSession
+) -> MongoDayMapper:
+    return MongoDayMapper(mongo_client, session=mongo_session)
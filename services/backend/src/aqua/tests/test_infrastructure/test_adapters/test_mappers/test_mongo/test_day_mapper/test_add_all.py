@@ -1,8 +1,12 @@
+from uuid import UUID
+
 from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import (
     AsyncClientSession as AsyncMongoSession,
 )
+from pytest import raises
 
+from aqua.application.ports.mappers import ConflictError
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapper,
@@ -15,32 +19,46 @@ async def test_with_user2_days(  # noqa: PLR0917
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user2_days: list[Day],
-    user2_document: Document,
+    user2_day_documents: list[Document],
     day_mapper: MongoDayMapper,
 ) -> None:
     await day_mapper.add_all(user2_days)
 
-    del user2_document["records"]
-    del user2_document["target"]
-    del user2_document["glass"]
-    del user2_document["weight"]
-
-    async_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_documents = mongo_client.db.days.find({}, session=mongo_session)
     stored_documents = [document async for document in async_documents]
 
-    assert [user2_document] == stored_documents
+    assert user2_day_documents == stored_documents
 
 
 async def test_without_users(
     full_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
-    user_documents: list[Document],
+    day_documents: list[Document],
     day_mapper: MongoDayMapper,
 ) -> None:
     await day_mapper.add_all([])
 
-    async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_db_documents = mongo_client.db.days.find({}, session=mongo_session)
     db_documents = [document async for document in async_db_documents]
 
-    assert user_documents == db_documents
+    assert day_documents == db_documents
+
+
+async def test_with_stored_user2_day1(  # noqa: PLR0917
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    user2_day1: Day,
+    day_documents: list[Document],
+    day_mapper: MongoDayMapper,
+) -> None:
+    user2_day1.id = UUID(int=100)
+
+    with raises(ConflictError):
+        await day_mapper.add_all([user2_day1])
+
+    async_documents = mongo_client.db.days.find({}, session=mongo_session)
+    stored_documents = [document async for document in async_documents]
+
+    assert day_documents == stored_documents
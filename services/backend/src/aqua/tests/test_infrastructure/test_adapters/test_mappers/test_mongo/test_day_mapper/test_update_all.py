@@ -1,8 +1,12 @@
+from datetime import date
+
 from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import (
     AsyncClientSession as AsyncMongoSession,
 )
+from pytest import raises
 
+from aqua.application.ports.mappers import ArchivedDayError, ConflictError
 from aqua.domain.model.core.aggregates.user.internal.entities.day import Day
 from aqua.domain.model.core.vos.target import Target
 from aqua.domain.model.core.vos.water_balance import (
@@ -12,6 +16,7 @@ from aqua.domain.model.primitives.vos.water import Water
 from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
     MongoDayMapper,
 )
+from aqua.infrastructure.periphery.pymongo.archive import archive_history
 from aqua.infrastructure.periphery.pymongo.document import Document
 
 
@@ -20,7 +25,7 @@ async def test_with_user2_day2(  # noqa: PLR0917
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user2_day2: Day,
-    user_documents: list[Document],
+    day_documents: list[Document],
     day_mapper: MongoDayMapper,
 ) -> None:
     user2_day2.target = Target(
@@ -31,24 +36,101 @@ async def test_with_user2_day2(  # noqa: PLR0917
 
     await day_mapper.update_all([user2_day2])
 
-    user_documents[1]["days"][1]["target"] = 5_000_000
+    day_documents[1]["target"] = 5_000_000
+    day_documents[1]["version"] = 1
 
-    async_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_documents = mongo_client.db.days.find({}, session=mongo_session)
     stored_documents = [document async for document in async_documents]
 
-    assert user_documents == stored_documents
+    assert day_documents == stored_documents
 
 
 async def test_without_users(
     full_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
-    user_documents: list[Document],
+    day_documents: list[Document],
     day_mapper: MongoDayMapper,
 ) -> None:
     await day_mapper.update_all([])
 
-    async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_db_documents = mongo_client.db.days.find({}, session=mongo_session)
     db_documents = [document async for document in async_db_documents]
 
-    assert user_documents == db_documents
+    assert day_documents == db_documents
+
+
+async def test_with_actual_user2_day2_version(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    user2_day2: Day,
+    day_documents: list[Document],
+) -> None:
+    versions = {user2_day2.id: 0}
+    day_mapper = MongoDayMapper(
+        mongo_client, session=mongo_session, versions=versions
+    )
+
+    await day_mapper.update_all([user2_day2])
+
+    day_documents[1]["version"] = 1
+
+    async_documents = mongo_client.db.days.find({}, session=mongo_session)
+    stored_documents = [document async for document in async_documents]
+
+    assert day_documents == stored_documents
+    assert versions == {user2_day2.id: 1}
+
+
+async def test_with_stale_user2_day2_version(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    user2_day2: Day,
+    day_documents: list[Document],
+) -> None:
+    day_mapper = MongoDayMapper(
+        mongo_client, session=mongo_session, versions={user2_day2.id: 4}
+    )
+    user2_day2.target = Target(
+        water_balance=WaterBalance(
+            water=Water.with_(milliliters=5_000_000).unwrap()
+        )
+    )
+
+    with raises(ConflictError):
+        await day_mapper.update_all([user2_day2])
+
+    async_documents = mongo_client.db.days.find({}, session=mongo_session)
+    stored_documents = [document async for document in async_documents]
+
+    assert day_documents == stored_documents
+
+
+async def test_with_archived_user2_day2(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    user2_day2: Day,
+) -> None:
+    await archive_history(mongo_client, before=date(2000, 1, 6))
+    day_mapper = MongoDayMapper(
+        mongo_client,
+        session=mongo_session,
+        versions={user2_day2.id: 0},
+        archive_horizon_days=0,
+    )
+
+    with raises(ArchivedDayError):
+        await day_mapper.update_all([user2_day2])
+
+    day_count = await mongo_client.db.days.count_documents(
+        {}, session=mongo_session
+    )
+    archived_day_ids = await mongo_client.db.archived_days.distinct(
+        "_id", session=mongo_session
+    )
+
+    assert day_count == 0
+    assert user2_day2.id in archived_day_ids
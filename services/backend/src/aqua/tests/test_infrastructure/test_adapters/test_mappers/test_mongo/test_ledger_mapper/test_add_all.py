@@ -0,0 +1,165 @@
+from datetime import date
+from uuid import UUID
+
+from bson import ObjectId
+from dirty_equals import IsInstance
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import (
+    AsyncClientSession as AsyncMongoSession,
+)
+
+from aqua.application.rollups import DayChange
+from aqua.domain.model.core.vos.ledger import Ledger, updated_indexes_of
+from aqua.domain.model.core.vos.target import Result
+from aqua.domain.model.primitives.vos.water import Water
+from aqua.infrastructure.adapters.mappers.mongo.ledger_mapper import (
+    MongoLedgerMapper,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.ledgers import (
+    ledger_document_of,
+    rebuild_ledgers,
+)
+
+
+day_changes = (
+    DayChange(
+        user_id=UUID(int=2),
+        date_=date(2000, 1, 1),
+        water_milliliters=500,
+        is_day_new=True,
+        previous_result=None,
+        result=Result.not_enough_water,
+    ),
+    DayChange(
+        user_id=UUID(int=2),
+        date_=date(2000, 1, 5),
+        water_milliliters=0,
+        is_day_new=True,
+        previous_result=None,
+        result=Result.not_enough_water,
+    ),
+    DayChange(
+        user_id=UUID(int=2),
+        date_=date(2000, 1, 5),
+        water_milliliters=100,
+        is_day_new=False,
+        previous_result=Result.not_enough_water,
+        result=Result.good,
+    ),
+)
+
+expected_ledger = Ledger.of([
+    (date(2000, 1, 1), Water.trusted(milliliters=500)),
+    (date(2000, 1, 5), Water.trusted(milliliters=100)),
+])
+
+
+def expected_document_with(*, version: int) -> Document:
+    return {
+        "_id": IsInstance(ObjectId),
+        **ledger_document_of(user_id=UUID(int=2), ledger=expected_ledger),
+        "version": version,
+    }
+
+
+async def stored_document(
+    mongo_client: AsyncMongoClient[Document], mongo_session: AsyncMongoSession
+) -> Document | None:
+    return await mongo_client.db.ledgers.find_one(
+        {"user_id": UUID(int=2)}, session=mongo_session
+    )
+
+
+async def test_with_user2_day_changes(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    ledger_mapper: MongoLedgerMapper,
+) -> None:
+    await ledger_mapper.add_all(day_changes)
+
+    assert await stored_document(mongo_client, mongo_session) == (
+        expected_document_with(version=3)
+    )
+
+
+async def test_with_reversed_user2_day_changes(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    ledger_mapper: MongoLedgerMapper,
+) -> None:
+    for day_change in reversed(day_changes):
+        await ledger_mapper.add_all([day_change])
+
+    assert await stored_document(mongo_client, mongo_session) == (
+        expected_document_with(version=3)
+    )
+
+
+async def test_touched_partial_sum_count(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    ledger_mapper: MongoLedgerMapper,
+) -> None:
+    await ledger_mapper.add_all(day_changes[:1])
+
+    document = await stored_document(mongo_client, mongo_session)
+
+    assert document is not None
+    assert len(document["partial_sums"]) == len(
+        updated_indexes_of(date(2000, 1, 1))
+    )
+
+
+async def test_without_water(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    ledger_mapper: MongoLedgerMapper,
+) -> None:
+    await ledger_mapper.add_all(day_changes[1:2])
+
+    assert await stored_document(mongo_client, mongo_session) == {
+        "_id": IsInstance(ObjectId),
+        "user_id": UUID(int=2),
+        "version": 1,
+    }
+
+
+async def test_rebuild_of_user2_days(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+) -> None:
+    await rebuild_ledgers(mongo_client)
+
+    assert await stored_document(mongo_client, mongo_session) == (
+        expected_document_with(version=1)
+    )
+
+
+async def test_rebuild_over_stale_ledger(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+) -> None:
+    stale_ledger = Ledger.of([(date(1990, 1, 1), Water.trusted(milliliters=1))])
+    await mongo_client.db.ledgers.insert_one(
+        ledger_document_of(user_id=UUID(int=2), ledger=stale_ledger)
+        | {"version": 3},
+        session=mongo_session,
+    )
+
+    await rebuild_ledgers(mongo_client)
+
+    collection_names = await mongo_client.db.list_collection_names()
+    index_information = await mongo_client.db.ledgers.index_information()
+
+    assert await stored_document(mongo_client, mongo_session) == (
+        expected_document_with(version=4)
+    )
+    assert "rebuilt_ledgers" not in collection_names
+    assert index_information["user_id_1"]["unique"]
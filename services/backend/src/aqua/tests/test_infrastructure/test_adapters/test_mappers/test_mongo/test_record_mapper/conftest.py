@@ -1,3 +1,4 @@
+from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import (
     AsyncClientSession as AsyncMongoSession,
 )
@@ -6,8 +7,11 @@ from pytest import fixture
 from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
     MongoRecordMapper,
 )
+from aqua.infrastructure.periphery.pymongo.document import Document
 
 
 @fixture
-def record_mapper(mongo_session: AsyncMongoSession) -> MongoRecordMapper:
-    return MongoRecordMapper(mongo_session)
+def record_mapper(
+    mongo_client: AsyncMongoClient[Document], mongo_session: AsyncMongoSession
+) -> MongoRecordMapper:
+    return MongoRecordMapper(mongo_client, session=mongo_session)
@@ -18,31 +18,31 @@ async def test_with_user2_record3(  # noqa: PLR0917
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
     user2_record2: Record,
-    user_documents: list[Document],
+    record_documents: list[Document],
     record_mapper: MongoRecordMapper,
 ) -> None:
     user2_record2.drunk_water = Water.with_(milliliters=5_000_000).unwrap()
 
     await record_mapper.update_all([user2_record2])
 
-    user_documents[1]["records"][1]["drunk_water"] = 5_000_000
+    record_documents[1]["drunk_water"] = 5_000_000
 
-    async_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_documents = mongo_client.db.records.find({}, session=mongo_session)
     stored_documents = [document async for document in async_documents]
 
-    assert user_documents == stored_documents
+    assert record_documents == stored_documents
 
 
 async def test_without_users(
     full_mongo: None,  # noqa: ARG001
     mongo_client: AsyncMongoClient[Document],
     mongo_session: AsyncMongoSession,
-    user_documents: list[Document],
+    record_documents: list[Document],
     record_mapper: MongoRecordMapper,
 ) -> None:
     await record_mapper.update_all([])
 
-    async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
+    async_db_documents = mongo_client.db.records.find({}, session=mongo_session)
     db_documents = [document async for document in async_db_documents]
 
-    assert user_documents == db_documents
+    assert record_documents == db_documents
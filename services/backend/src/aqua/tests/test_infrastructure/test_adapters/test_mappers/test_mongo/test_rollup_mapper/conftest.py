@@ -0,0 +1,17 @@
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import (
+    AsyncClientSession as AsyncMongoSession,
+)
+from pytest import fixture
+
+from aqua.infrastructure.adapters.mappers.mongo.rollup_mapper import (
+    MongoRollupMapper,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+
+
+@fixture
+def rollup_mapper(
+    mongo_client: AsyncMongoClient[Document], mongo_session: AsyncMongoSession
+) -> MongoRollupMapper:
+    return MongoRollupMapper(mongo_client, session=mongo_session)
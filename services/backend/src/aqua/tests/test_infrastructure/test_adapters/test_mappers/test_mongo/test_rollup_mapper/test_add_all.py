@@ -0,0 +1,175 @@
+from datetime import date, datetime
+from uuid import UUID
+
+from bson import ObjectId
+from bson.tz_util import utc as bson_utc
+from dirty_equals import IsInstance
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import (
+    AsyncClientSession as AsyncMongoSession,
+)
+
+from aqua.application.rollups import DayChange
+from aqua.domain.model.core.vos.target import Result
+from aqua.infrastructure.adapters.mappers.mongo.rollup_mapper import (
+    MongoRollupMapper,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.rollups import rebuild_rollups
+
+
+day_changes = (
+    DayChange(
+        user_id=UUID(int=2),
+        date_=date(2000, 1, 1),
+        water_milliliters=500,
+        is_day_new=True,
+        previous_result=None,
+        result=Result.not_enough_water,
+    ),
+    DayChange(
+        user_id=UUID(int=2),
+        date_=date(2000, 1, 5),
+        water_milliliters=0,
+        is_day_new=True,
+        previous_result=None,
+        result=Result.not_enough_water,
+    ),
+    DayChange(
+        user_id=UUID(int=2),
+        date_=date(2000, 1, 5),
+        water_milliliters=100,
+        is_day_new=False,
+        previous_result=Result.not_enough_water,
+        result=Result.good,
+    ),
+)
+
+
+def rollup_document_with(
+    *,
+    period: str,
+    start_date: datetime,
+    water_balance: int,
+    day_count: int,
+    good_day_count: int,
+    not_enough_water_day_count: int,
+) -> Document:
+    return {
+        "_id": IsInstance(ObjectId),
+        "user_id": UUID(int=2),
+        "period": period,
+        "start_date": start_date,
+        "water_balance": water_balance,
+        "day_count": day_count,
+        "good_day_count": good_day_count,
+        "not_enough_water_day_count": not_enough_water_day_count,
+        "excess_water_day_count": 0,
+    }
+
+
+def sorted_documents(documents: list[Document]) -> list[Document]:
+    return sorted(
+        documents,
+        key=lambda document: (document["period"], document["start_date"]),
+    )
+
+
+async def stored_rollup_documents(
+    mongo_client: AsyncMongoClient[Document], mongo_session: AsyncMongoSession
+) -> list[Document]:
+    documents = await mongo_client.db.rollups.find(
+        {}, session=mongo_session
+    ).to_list()
+
+    return sorted_documents([
+        {"excess_water_day_count": 0, **document} for document in documents
+    ])
+
+
+expected_documents = sorted_documents([
+    rollup_document_with(
+        period="month",
+        start_date=datetime(2000, 1, 1, tzinfo=bson_utc),
+        water_balance=600,
+        day_count=2,
+        good_day_count=1,
+        not_enough_water_day_count=1,
+    ),
+    rollup_document_with(
+        period="week",
+        start_date=datetime(1999, 12, 27, tzinfo=bson_utc),
+        water_balance=500,
+        day_count=1,
+        good_day_count=0,
+        not_enough_water_day_count=1,
+    ),
+    rollup_document_with(
+        period="week",
+        start_date=datetime(2000, 1, 3, tzinfo=bson_utc),
+        water_balance=100,
+        day_count=1,
+        good_day_count=1,
+        not_enough_water_day_count=0,
+    ),
+])
+
+
+async def test_with_user2_day_changes(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+    rollup_mapper: MongoRollupMapper,
+) -> None:
+    await rollup_mapper.add_all(day_changes)
+
+    stored_documents = await stored_rollup_documents(
+        mongo_client, mongo_session
+    )
+
+    assert stored_documents == expected_documents
+
+
+async def test_rebuild_of_user2_days(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+) -> None:
+    await rebuild_rollups(mongo_client)
+
+    stored_documents = await stored_rollup_documents(
+        mongo_client, mongo_session
+    )
+
+    assert stored_documents == expected_documents
+
+
+async def test_rebuild_over_stale_rollups(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+) -> None:
+    stale_document = rollup_document_with(
+        period="year",
+        start_date=datetime(1990, 1, 1, tzinfo=bson_utc),
+        water_balance=100,
+        day_count=1,
+        good_day_count=1,
+        not_enough_water_day_count=0,
+    )
+    del stale_document["_id"]
+    await mongo_client.db.rollups.insert_one(
+        stale_document, session=mongo_session
+    )
+
+    await rebuild_rollups(mongo_client)
+
+    stored_documents = await stored_rollup_documents(
+        mongo_client, mongo_session
+    )
+    collection_names = await mongo_client.db.list_collection_names()
+    index_information = await mongo_client.db.rollups.index_information()
+
+    assert stored_documents == expected_documents
+    assert "rebuilt_rollups" not in collection_names
+    assert index_information["user_id_1_period_1_start_date_1"]["unique"]
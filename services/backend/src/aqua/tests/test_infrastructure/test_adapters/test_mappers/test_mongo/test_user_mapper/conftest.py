@@ -1,3 +1,4 @@
+from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import (
     AsyncClientSession as AsyncMongoSession,
 )
@@ -6,8 +7,11 @@ from pytest import fixture
 from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
     MongoUserMapper,
 )
+from aqua.infrastructure.periphery.pymongo.document import Document
 
 
 @fixture
-def user_mapper(mongo_session: AsyncMongoSession) -> MongoUserMapper:
-    return MongoUserMapper(mongo_session)
+def user_mapper(
+    mongo_client: AsyncMongoClient[Document], mongo_session: AsyncMongoSession
+) -> MongoUserMapper:
+    return MongoUserMapper(mongo_client, session=mongo_session)
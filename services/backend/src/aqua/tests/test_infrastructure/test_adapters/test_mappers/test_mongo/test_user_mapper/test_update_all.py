@@ -25,6 +25,7 @@ async def test_with_mutated_user1(  # noqa: PLR0917
     await user_mapper.update_all([user1])
 
     user_documents[0]["glass"] = 5_000_000
+    user_documents[0]["version"] = 1
 
     async_db_documents = mongo_client.db.users.find({}, session=mongo_session)
     db_documents = [document async for document in async_db_documents]
@@ -1,11 +1,15 @@
+from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import (
     AsyncClientSession as AsyncMongoSession,
 )
 from pytest import fixture
 
 from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.periphery.pymongo.document import Document
 
 
 @fixture
-def mongo_users(mongo_session: AsyncMongoSession) -> MongoUsers:
-    return MongoUsers(mongo_session)
+def mongo_users(
+    mongo_client: AsyncMongoClient[Document], mongo_session: AsyncMongoSession
+) -> MongoUsers:
+    return MongoUsers(mongo_client, session=mongo_session)
@@ -0,0 +1,72 @@
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import (
+    AsyncClientSession as AsyncMongoSession,
+)
+from pytest import raises
+
+from aqua.application.ports.mappers import ConflictError
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.transactions.mongo.transaction import (
+    MongoBatchTransactionForMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import (
+    RootOperations,
+    execute,
+)
+
+
+users_operations = RootOperations(namespace="db.users")
+days_operations = RootOperations(namespace="db.days")
+
+
+async def test_one_write_on_exit(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+) -> None:
+    users = MongoUsers(mongo_client, session=mongo_session)
+    user_document = {"_id": UUID(int=0), "x": 4}
+    day_document = {"_id": UUID(int=1), "y": 5}
+
+    async with MongoBatchTransactionForMongoUsers()(users):
+        await execute(
+            [users_operations.to_insert(user_document)],
+            client=mongo_client,
+            batch=users.operation_batch,
+        )
+        await execute(
+            [days_operations.to_insert(day_document)],
+            client=mongo_client,
+            batch=users.operation_batch,
+        )
+
+        assert await mongo_client.db.users.count_documents({}) == 0
+
+    assert await mongo_client.db.users.find().to_list() == [user_document]
+    assert await mongo_client.db.days.find().to_list() == [day_document]
+
+
+async def test_conflict(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+) -> None:
+    users = MongoUsers(mongo_client, session=mongo_session)
+    await mongo_client.db.users.insert_one({"_id": UUID(int=0)})
+
+    with raises(ConflictError):
+        async with MongoBatchTransactionForMongoUsers()(users):
+            await execute(
+                [
+                    days_operations.to_insert({"_id": UUID(int=1)}),
+                    users_operations.to_insert({"_id": UUID(int=0)}),
+                ],
+                client=mongo_client,
+                batch=users.operation_batch,
+            )
+
+    assert await mongo_client.db.days.count_documents({}) == 0
+    assert not users.operation_batch.is_open
@@ -0,0 +1,129 @@
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import (
+    AsyncClientSession as AsyncMongoSession,
+)
+from pytest import raises
+
+from aqua.application.ports.mappers import ConflictError
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.transactions.mongo.transaction import (
+    MongoOptimisticTransactionForMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.operations import (
+    RootOperations,
+    execute,
+)
+
+
+days_operations = RootOperations(namespace="db.days")
+records_operations = RootOperations(namespace="db.records")
+ledgers_operations = RootOperations(namespace="db.ledgers")
+
+
+async def test_one_write_on_exit(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+) -> None:
+    users = MongoUsers(mongo_client, session=mongo_session)
+    day_document = {"_id": UUID(int=1), "version": 0}
+    record_document = {"_id": UUID(int=2)}
+
+    async with MongoOptimisticTransactionForMongoUsers()(users):
+        await execute(
+            [days_operations.to_insert(day_document)],
+            client=mongo_client,
+            batch=users.operation_batch,
+        )
+        await execute(
+            [records_operations.to_insert(record_document)],
+            client=mongo_client,
+            batch=users.operation_batch,
+        )
+
+        assert await mongo_client.db.days.count_documents({}) == 0
+
+    assert await mongo_client.db.days.find().to_list() == [day_document]
+    assert await mongo_client.db.records.find().to_list() == [record_document]
+
+
+async def test_conflict(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+) -> None:
+    users = MongoUsers(mongo_client, session=mongo_session)
+    await mongo_client.db.days.insert_one({"_id": UUID(int=1), "version": 1})
+
+    with raises(ConflictError):
+        async with MongoOptimisticTransactionForMongoUsers()(users):
+            await execute(
+                [
+                    days_operations.to_put_versioned(
+                        {"_id": UUID(int=1), "x": 4}, version=0
+                    ),
+                    records_operations.to_insert({"_id": UUID(int=2)}),
+                ],
+                client=mongo_client,
+                batch=users.operation_batch,
+            )
+
+    assert await mongo_client.db.days.find().to_list() == [
+        {"_id": UUID(int=1), "version": 1}
+    ]
+    assert await mongo_client.db.records.count_documents({}) == 0
+    assert not users.operation_batch.is_open
+
+
+async def test_no_partial_writes_on_conflict(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    mongo_session: AsyncMongoSession,
+) -> None:
+    users = MongoUsers(mongo_client, session=mongo_session)
+    await mongo_client.db.records.insert_one({"_id": UUID(int=2)})
+
+    with raises(ConflictError):
+        async with MongoOptimisticTransactionForMongoUsers()(users):
+            await execute(
+                [
+                    days_operations.to_put_versioned(
+                        {"_id": UUID(int=1), "x": 4}, version=None
+                    ),
+                    ledgers_operations.to_increment(
+                        {"_id": UUID(int=3)}, {"milliliters": 100}
+                    ),
+                    records_operations.to_insert({"_id": UUID(int=2)}),
+                ],
+                client=mongo_client,
+                batch=users.operation_batch,
+            )
+
+    assert await mongo_client.db.days.count_documents({}) == 0
+    assert await mongo_client.db.ledgers.count_documents({}) == 0
+
+
+async def test_no_partial_writes_without_session(
+    empty_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    users = MongoUsers(mongo_client)
+    await mongo_client.db.records.insert_one({"_id": UUID(int=2)})
+
+    with raises(ConflictError):
+        async with MongoOptimisticTransactionForMongoUsers()(users):
+            await execute(
+                [
+                    ledgers_operations.to_increment(
+                        {"_id": UUID(int=3)}, {"milliliters": 100}
+                    ),
+                    records_operations.to_insert({"_id": UUID(int=2)}),
+                ],
+                client=mongo_client,
+                batch=users.operation_batch,
+            )
+
+    assert await mongo_client.db.ledgers.count_documents({}) == 0
@@ -0,0 +1,84 @@
+from datetime import date
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+from pytest import fixture
+
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.analytics_view_from import (
+    AnalyticsCache,
+    DBAnalyticsViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.views.db.analytics_view import (
+    DBAnalyticsView,
+)
+
+
+@fixture
+def analytics_cache() -> AnalyticsCache:
+    return AnalyticsCache(max_size=10)
+
+
+@fixture
+def analytics_view_from(
+    analytics_cache: AnalyticsCache,
+) -> DBAnalyticsViewFromMongoUsers:
+    return DBAnalyticsViewFromMongoUsers(cache=analytics_cache)
+
+
+async def test_view(
+    full_mongo: None,  # noqa: ARG001
+    analytics_view_from: DBAnalyticsViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    view = await analytics_view_from(
+        MongoUsers(mongo_client), user_id=UUID(int=2), today=date(2000, 1, 6)
+    )
+
+    assert view == DBAnalyticsView(
+        user_id=UUID(int=2),
+        date_=date(2000, 1, 6),
+        good_day_streak=1,
+        average_milliliters_by_weekday=(0, 0, 100, 0, 0, 500, 0),
+        glass_percentile_milliliters=274,
+    )
+
+
+async def test_cached_view(
+    full_mongo: None,  # noqa: ARG001
+    analytics_view_from: DBAnalyticsViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    users = MongoUsers(mongo_client)
+    await analytics_view_from(
+        users, user_id=UUID(int=2), today=date(2000, 1, 6)
+    )
+    await mongo_client.db.records.delete_many({})
+
+    cached_view = await analytics_view_from(
+        users, user_id=UUID(int=2), today=date(2000, 1, 6)
+    )
+    await mongo_client.db.ledgers.update_one(
+        {"user_id": UUID(int=2)}, {"$inc": {"version": 1}}, upsert=True
+    )
+    view = await analytics_view_from(
+        users, user_id=UUID(int=2), today=date(2000, 1, 6)
+    )
+
+    assert cached_view.glass_percentile_milliliters == 274
+    assert view.glass_percentile_milliliters is None
+
+
+async def test_without_user(
+    full_mongo: None,  # noqa: ARG001
+    analytics_view_from: DBAnalyticsViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    view = await analytics_view_from(
+        MongoUsers(mongo_client), user_id=UUID(int=100), today=date(2000, 1, 6)
+    )
+
+    assert view.good_day_streak == 0
+    assert view.average_milliliters_by_weekday == (0,) * 7
+    assert view.glass_percentile_milliliters is None
@@ -0,0 +1,148 @@
+from datetime import date
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+from pytest import fixture
+
+from aqua.infrastructure.adapters.repos.mongo.users import (
+    MongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.day_view_from import (
+    DBDayViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.days_view_from import (
+    DBDaysViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.records_view_from import (
+    DBRecordsViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.archive import (
+    ArchivingOutput,
+    archive_history,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.record_cursors import (
+    decoded_record_cursor_of,
+)
+from aqua.infrastructure.periphery.views.db.day_view import DBDayView
+
+
+@fixture
+async def archived_mongo(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    await archive_history(mongo_client, before=date(2000, 1, 3), batch_size=1)
+
+
+async def test_archiving(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    output = await archive_history(
+        mongo_client, before=date(2000, 1, 3), batch_size=1
+    )
+
+    archived_day_ids = await mongo_client.db.archived_days.distinct("_id")
+    day_ids = await mongo_client.db.days.distinct("_id")
+    archived_record_ids = await mongo_client.db.archived_records.distinct("_id")
+    record_ids = await mongo_client.db.records.distinct("_id")
+
+    assert output == ArchivingOutput(
+        archived_day_count=1, archived_record_count=3
+    )
+    assert archived_day_ids == [UUID(int=1)]
+    assert day_ids == [UUID(int=2)]
+    assert sorted(archived_record_ids) == [
+        UUID(int=2),
+        UUID(int=3),
+        UUID(int=4),
+    ]
+    assert record_ids == [UUID(int=1)]
+
+
+async def test_rearchiving(
+    archived_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    output = await archive_history(
+        mongo_client, before=date(2000, 1, 3), batch_size=1
+    )
+
+    assert output == ArchivingOutput(
+        archived_day_count=0, archived_record_count=0
+    )
+
+
+async def test_day_view(
+    archived_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    user2_day1_db_view: DBDayView,
+) -> None:
+    view = await DBDayViewFromMongoUsers()(
+        MongoUsers(mongo_client), user_id=UUID(int=2), date_=date(2000, 1, 1)
+    )
+
+    assert view == user2_day1_db_view
+
+
+async def test_days_view(
+    archived_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    views = DBDaysViewFromMongoUsers()(
+        MongoUsers(mongo_client),
+        user_id=UUID(int=2),
+        from_=date(2000, 1, 1),
+        to=date(2000, 1, 5),
+    )
+
+    assert [view.date_ async for view in views] == [
+        date(2000, 1, 1),
+        date(2000, 1, 5),
+    ]
+
+
+async def test_days_view_before_archive_horizon(
+    archived_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    views = DBDaysViewFromMongoUsers(archive_horizon_days=1_000_000)(
+        MongoUsers(mongo_client),
+        user_id=UUID(int=2),
+        from_=date(2000, 1, 1),
+        to=date(2000, 1, 5),
+    )
+
+    assert [view.date_ async for view in views] == [date(2000, 1, 5)]
+
+
+async def test_records_view_pages(
+    archived_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    records_view_from = DBRecordsViewFromMongoUsers()
+    users = MongoUsers(mongo_client)
+    record_ids = list[UUID]()
+    next_cursor: str | None = None
+
+    for _ in range(4):
+        after = (
+            None
+            if next_cursor is None
+            else decoded_record_cursor_of(next_cursor)
+        )
+        view = await records_view_from(
+            users,
+            user_id=UUID(int=2),
+            after=after,
+            limit=3,
+            is_cancelled_hidden=False,
+        )
+        record_ids.extend(record.record_id for record in view.records)
+        next_cursor = view.next_cursor
+
+        if next_cursor is None:
+            break
+
+    assert record_ids == [UUID(int=1), UUID(int=2), UUID(int=3), UUID(int=4)]
@@ -1,9 +1,7 @@
 from datetime import date
 from uuid import UUID
 
-from pymongo.asynchronous.client_session import (
-    AsyncClientSession as AsyncMongoSession,
-)
+from pymongo import AsyncMongoClient
 from pytest import fixture
 
 from aqua.infrastructure.adapters.repos.mongo.users import (
@@ -12,6 +10,11 @@ from aqua.infrastructure.adapters.repos.mongo.users import (
 from aqua.infrastructure.adapters.views.mongo.day_view_from import (
     DBDayViewFromMongoUsers,
 )
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.causality import (
+    causality_token_of,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
 from aqua.infrastructure.periphery.views.db.day_view import (
     DBDayView,
     empty_db_day_view_with,
@@ -26,11 +29,11 @@ def day_view_from() -> DBDayViewFromMongoUsers:
 async def test_with_user2_day1(
     full_mongo: None,  # noqa: ARG001
     day_view_from: DBDayViewFromMongoUsers,
-    mongo_session: AsyncMongoSession,
+    mongo_client: AsyncMongoClient[Document],
     user2_day1_db_view: DBDayView,
 ) -> None:
     result_view = await day_view_from(
-        MongoUsers(mongo_session),
+        MongoUsers(mongo_client),
         user_id=UUID(int=2),
         date_=date(2000, 1, 1),
     )
@@ -38,16 +41,42 @@ async def test_with_user2_day1(
     assert result_view == user2_day1_db_view
 
 
+async def test_after_causality_token(
+    full_mongo: None,  # noqa: ARG001
+    mongo_client: AsyncMongoClient[Document],
+    user2_day1_db_view: DBDayView,
+) -> None:
+    async with mongo_client.start_session() as session:
+        await mongo_client.db.days.find_one(
+            {"user_id": UUID(int=2)}, session=session
+        )
+        causality_token = causality_token_of(session)
+
+    day_view_from = DBDayViewFromMongoUsers(
+        causal_reads=MongoReads(
+            preference="secondaryPreferred", concern_level="majority"
+        )
+    )
+
+    async with MongoUsers(mongo_client).after(causality_token) as users:
+        result_view = await day_view_from(
+            users, user_id=UUID(int=2), date_=date(2000, 1, 1)
+        )
+
+    assert causality_token is not None
+    assert result_view == user2_day1_db_view
+
+
 async def test_without_user(
     empty_mongo: None,  # noqa: ARG001
     day_view_from: DBDayViewFromMongoUsers,
-    mongo_session: AsyncMongoSession,
+    mongo_client: AsyncMongoClient[Document],
 ) -> None:
     user_id = UUID(int=0)
     date_ = date(2006, 1, 1)
 
     result_view = await day_view_from(
-        MongoUsers(mongo_session), user_id=user_id, date_=date_
+        MongoUsers(mongo_client), user_id=user_id, date_=date_
     )
 
     assert result_view == empty_db_day_view_with(user_id=user_id, date_=date_)
@@ -0,0 +1,67 @@
+from datetime import date
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+from pytest import fixture
+
+from aqua.infrastructure.adapters.repos.mongo.users import (
+    MongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.days_view_from import (
+    DBDaysViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.views.db.day_view import DBDayView
+
+
+@fixture
+def days_view_from() -> DBDaysViewFromMongoUsers:
+    return DBDaysViewFromMongoUsers()
+
+
+async def test_with_user2_day1(
+    full_mongo: None,  # noqa: ARG001
+    days_view_from: DBDaysViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+    user2_day1_db_view: DBDayView,
+) -> None:
+    result_views = days_view_from(
+        MongoUsers(mongo_client),
+        user_id=UUID(int=2),
+        from_=date(2000, 1, 1),
+        to=date(2000, 1, 4),
+    )
+
+    assert [view async for view in result_views] == [user2_day1_db_view]
+
+
+async def test_order(
+    full_mongo: None,  # noqa: ARG001
+    days_view_from: DBDaysViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    result_views = days_view_from(
+        MongoUsers(mongo_client),
+        user_id=UUID(int=2),
+        from_=date(1999, 1, 1),
+        to=date(2001, 1, 1),
+    )
+
+    dates = [view.date_ async for view in result_views]
+
+    assert dates == [date(2000, 1, 1), date(2000, 1, 5)]
+
+
+async def test_without_user(
+    empty_mongo: None,  # noqa: ARG001
+    days_view_from: DBDaysViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    result_views = days_view_from(
+        MongoUsers(mongo_client),
+        user_id=UUID(int=0),
+        from_=date(2006, 1, 1),
+        to=date(2006, 2, 1),
+    )
+
+    assert [view async for view in result_views] == []
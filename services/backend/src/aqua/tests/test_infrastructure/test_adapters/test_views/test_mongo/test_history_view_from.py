@@ -0,0 +1,56 @@
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+from pytest import fixture
+
+from aqua.infrastructure.adapters.repos.mongo.users import (
+    MongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.history_view_from import (
+    DBHistoryViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.views.db.history_view import (
+    DBHistoryDayRow,
+    DBHistoryRecordRow,
+)
+
+
+@fixture
+def history_view_from() -> DBHistoryViewFromMongoUsers:
+    return DBHistoryViewFromMongoUsers(batch_size=2)
+
+
+async def test_rows(
+    full_mongo: None,  # noqa: ARG001
+    history_view_from: DBHistoryViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    rows = history_view_from(MongoUsers(mongo_client), user_id=UUID(int=2))
+    ids = list[tuple[str, UUID]]()
+
+    async for row in rows:
+        match row:
+            case DBHistoryDayRow():
+                ids.append(("day", row.day_id))
+            case DBHistoryRecordRow():
+                ids.append(("record", row.record_id))
+
+    assert ids == [
+        ("day", UUID(int=1)),
+        ("day", UUID(int=2)),
+        ("record", UUID(int=4)),
+        ("record", UUID(int=3)),
+        ("record", UUID(int=2)),
+        ("record", UUID(int=1)),
+    ]
+
+
+async def test_without_user(
+    full_mongo: None,  # noqa: ARG001
+    history_view_from: DBHistoryViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    rows = history_view_from(MongoUsers(mongo_client), user_id=UUID(int=100))
+
+    assert [row async for row in rows] == []
@@ -0,0 +1,99 @@
+from datetime import date, timedelta
+from random import Random
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+from pytest import fixture
+
+from aqua.application.rollups import DayChange
+from aqua.domain.model.core.vos.target import Result
+from aqua.infrastructure.adapters.mappers.mongo.ledger_mapper import (
+    MongoLedgerMapper,
+)
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.ledger_view_from import (
+    DBLedgerViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.ledgers import rebuild_ledgers
+from aqua.infrastructure.periphery.views.db.ledger_view import DBLedgerView
+
+
+@fixture
+def ledger_view_from() -> DBLedgerViewFromMongoUsers:
+    return DBLedgerViewFromMongoUsers()
+
+
+async def test_view(
+    full_mongo: None,  # noqa: ARG001
+    ledger_view_from: DBLedgerViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    await rebuild_ledgers(mongo_client)
+
+    view = await ledger_view_from(
+        MongoUsers(mongo_client),
+        user_id=UUID(int=2),
+        from_=date(2000, 1, 2),
+        to=date(2000, 1, 9),
+    )
+
+    assert view == DBLedgerView(
+        user_id=UUID(int=2),
+        from_=date(2000, 1, 2),
+        to=date(2000, 1, 9),
+        water_milliliters=100,
+        average_water_milliliters=12,
+    )
+
+
+async def test_view_without_ledger(
+    empty_mongo: None,  # noqa: ARG001
+    ledger_view_from: DBLedgerViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    view = await ledger_view_from(
+        MongoUsers(mongo_client),
+        user_id=UUID(int=2),
+        from_=date(2000, 1, 1),
+        to=date(2000, 1, 9),
+    )
+
+    assert view.water_milliliters == 0
+    assert view.average_water_milliliters == 0
+
+
+async def test_view_against_naive_sum(
+    empty_mongo: None,  # noqa: ARG001
+    ledger_view_from: DBLedgerViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    random = Random(4)  # noqa: S311
+    start_date = date(2000, 1, 1)
+    day_changes = [
+        DayChange(
+            user_id=UUID(int=2),
+            date_=start_date + timedelta(days=random.randrange(30)),
+            water_milliliters=random.randrange(1000),
+            is_day_new=False,
+            previous_result=Result.not_enough_water,
+            result=Result.not_enough_water,
+        )
+        for _ in range(20)
+    ]
+    await MongoLedgerMapper(mongo_client).add_all(day_changes)
+
+    for _ in range(20):
+        from_ = start_date + timedelta(days=random.randrange(-5, 35))
+        to = from_ + timedelta(days=random.randrange(-2, 20))
+        expected_milliliters = sum(
+            day_change.water_milliliters
+            for day_change in day_changes
+            if from_ <= day_change.date_ <= to
+        )
+
+        view = await ledger_view_from(
+            MongoUsers(mongo_client), user_id=UUID(int=2), from_=from_, to=to
+        )
+
+        assert view.water_milliliters == expected_milliliters
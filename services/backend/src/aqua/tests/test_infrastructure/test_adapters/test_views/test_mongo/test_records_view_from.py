@@ -0,0 +1,86 @@
+from uuid import UUID
+
+from pymongo import AsyncMongoClient
+from pytest import fixture
+
+from aqua.infrastructure.adapters.repos.mongo.users import (
+    MongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.records_view_from import (
+    DBRecordsViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+from aqua.infrastructure.periphery.pymongo.record_cursors import (
+    decoded_record_cursor_of,
+)
+
+
+@fixture
+def records_view_from() -> DBRecordsViewFromMongoUsers:
+    return DBRecordsViewFromMongoUsers()
+
+
+async def test_pages(
+    full_mongo: None,  # noqa: ARG001
+    records_view_from: DBRecordsViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    users = MongoUsers(mongo_client)
+    record_ids = list[UUID]()
+    next_cursor: str | None = None
+
+    for _ in range(3):
+        after = (
+            None
+            if next_cursor is None
+            else decoded_record_cursor_of(next_cursor)
+        )
+        view = await records_view_from(
+            users,
+            user_id=UUID(int=2),
+            after=after,
+            limit=3,
+            is_cancelled_hidden=False,
+        )
+        record_ids.extend(record.record_id for record in view.records)
+        next_cursor = view.next_cursor
+
+        if next_cursor is None:
+            break
+
+    assert record_ids == [UUID(int=1), UUID(int=2), UUID(int=3), UUID(int=4)]
+
+
+async def test_last_page_without_next_cursor(
+    full_mongo: None,  # noqa: ARG001
+    records_view_from: DBRecordsViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    view = await records_view_from(
+        MongoUsers(mongo_client),
+        user_id=UUID(int=2),
+        after=None,
+        limit=4,
+        is_cancelled_hidden=False,
+    )
+
+    assert len(view.records) == 4
+    assert view.next_cursor is None
+
+
+async def test_without_cancelled(
+    full_mongo: None,  # noqa: ARG001
+    records_view_from: DBRecordsViewFromMongoUsers,
+    mongo_client: AsyncMongoClient[Document],
+) -> None:
+    view = await records_view_from(
+        MongoUsers(mongo_client),
+        user_id=UUID(int=2),
+        after=None,
+        limit=10,
+        is_cancelled_hidden=True,
+    )
+
+    record_ids = [record.record_id for record in view.records]
+
+    assert record_ids == [UUID(int=1), UUID(int=3), UUID(int=4)]
@@ -0,0 +1,25 @@
+from aqua.infrastructure.periphery.caches import Cache
+
+
+def test_get() -> None:
+    cache = Cache[str, int](max_size=2)
+
+    cache.put("a", 1, tag="x")
+
+    assert cache.get("a", tag="x") == 1
+    assert cache.get("a", tag="y") is None
+    assert cache.get("b", tag="x") is None
+
+
+def test_max_size() -> None:
+    cache = Cache[str, int](max_size=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
@@ -0,0 +1,129 @@
+import asyncio
+
+from pytest import raises
+
+from aqua.infrastructure.periphery.coalescing import Coalescer
+
+
+class PerformingError(Exception): ...
+
+
+class Performing:
+    def __init__(self) -> None:
+        self.batches = list[tuple[str, tuple[int, ...]]]()
+
+    async def __call__(self, key: str, inputs: tuple[int, ...]) -> list[str]:
+        self.batches.append((key, inputs))
+
+        if -1 in inputs:
+            raise PerformingError
+
+        return [f"{key}{input_}" for input_ in inputs]
+
+
+def coalescer_with(
+    *, window_seconds: float = 0.01, max_batch_size: int = 10
+) -> Coalescer[str, int]:
+    return Coalescer(
+        window_seconds=window_seconds, max_batch_size=max_batch_size
+    )
+
+
+async def test_concurrent_calls() -> None:
+    performing = Performing()
+    coalescer = coalescer_with()
+
+    outputs = list(
+        await asyncio.gather(
+            coalescer("a", 1, perform=performing),
+            coalescer("a", 2, perform=performing),
+            coalescer("a", 3, perform=performing),
+        )
+    )
+
+    assert outputs == ["a1", "a2", "a3"]
+    assert performing.batches == [("a", (1, 2, 3))]
+
+
+async def test_concurrent_calls_with_different_keys() -> None:
+    performing = Performing()
+    coalescer = coalescer_with()
+
+    outputs = list(
+        await asyncio.gather(
+            coalescer("a", 1, perform=performing),
+            coalescer("b", 2, perform=performing),
+            coalescer("a", 3, perform=performing),
+        )
+    )
+
+    assert outputs == ["a1", "b2", "a3"]
+    assert sorted(performing.batches) == [("a", (1, 3)), ("b", (2,))]
+
+
+async def test_sequential_calls() -> None:
+    performing = Performing()
+    coalescer = coalescer_with()
+
+    await coalescer("a", 1, perform=performing)
+    await coalescer("a", 2, perform=performing)
+
+    assert performing.batches == [("a", (1,)), ("a", (2,))]
+
+
+async def test_full_batch() -> None:
+    performing = Performing()
+    coalescer = coalescer_with(window_seconds=60, max_batch_size=2)
+
+    async with asyncio.timeout(1):
+        outputs = list(
+            await asyncio.gather(
+                coalescer("a", 1, perform=performing),
+                coalescer("a", 2, perform=performing),
+            )
+        )
+
+    assert outputs == ["a1", "a2"]
+    assert performing.batches == [("a", (1, 2))]
+
+
+async def test_concurrent_calls_with_different_performings() -> None:
+    performing1 = Performing()
+    performing2 = Performing()
+    coalescer = coalescer_with()
+
+    outputs = list(
+        await asyncio.gather(
+            coalescer("a", 1, perform=performing1),
+            coalescer("a", 2, perform=performing2),
+        )
+    )
+
+    assert outputs == ["a1", "a2"]
+    assert performing1.batches == [("a", (1,))]
+    assert performing2.batches == [("a", (2,))]
+
+
+async def test_error() -> None:
+    performing = Performing()
+    coalescer = coalescer_with()
+
+    results = await asyncio.gather(
+        coalescer("a", 1, perform=performing),
+        coalescer("a", -1, perform=performing),
+        coalescer("a", 3, perform=performing),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "a1"
+    assert type(results[1]) is PerformingError
+    assert results[2] == "a3"
+    assert performing.batches == [
+        ("a", (1, -1, 3)),
+        ("a", (1,)),
+        ("a", (-1,)),
+        ("a", (3,)),
+    ]
+
+    with raises(PerformingError):
+        await coalescer("a", -1, perform=performing)
@@ -0,0 +1,79 @@
+from base64 import urlsafe_b64encode
+
+from bson import encode
+from bson.timestamp import Timestamp
+from pymongo import AsyncMongoClient
+
+from aqua.infrastructure.periphery.pymongo.causality import (
+    CausalityToken,
+    causal_session_with,
+    causality_token_of,
+    decoded_causality_token_of,
+    encoded_causality_token_of,
+)
+from aqua.infrastructure.periphery.pymongo.document import Document
+
+
+token = CausalityToken(
+    operation_time=Timestamp(1, 2),
+    cluster_time={
+        "clusterTime": Timestamp(1, 3),
+        "signature": {"hash": bytes(20), "keyId": 0},
+    },
+)
+
+
+def test_decoding_of_encoded_token() -> None:
+    encoded_token = encoded_causality_token_of(token)
+
+    assert decoded_causality_token_of(encoded_token) == token
+
+
+def test_without_token() -> None:
+    assert encoded_causality_token_of(None) is None
+    assert decoded_causality_token_of(None) is None
+
+
+def test_decoding_of_invalid_token() -> None:
+    assert decoded_causality_token_of("token") is None
+
+
+def test_decoding_of_truncated_token() -> None:
+    encoded_token = encoded_causality_token_of(token)
+    assert encoded_token is not None
+
+    assert decoded_causality_token_of(encoded_token[:-8]) is None
+
+
+def test_without_session() -> None:
+    assert causality_token_of(None) is None
+
+
+def test_decoding_of_token_without_cluster_time() -> None:
+    document = {"operation_time": Timestamp(1, 1), "cluster_time": {}}
+    encoded_token = urlsafe_b64encode(encode(document)).decode()
+
+    assert decoded_causality_token_of(encoded_token) is None
+
+
+def test_decoding_of_token_without_signature() -> None:
+    document = {
+        "operation_time": Timestamp(1, 1),
+        "cluster_time": {"clusterTime": Timestamp(1, 1)},
+    }
+    encoded_token = urlsafe_b64encode(encode(document)).decode()
+
+    assert decoded_causality_token_of(encoded_token) is None
+
+
+async def test_session_with_forged_token() -> None:
+    forged_token = CausalityToken(
+        operation_time=Timestamp(1, 1), cluster_time={"clusterTime": 4}
+    )
+    client = AsyncMongoClient[Document]("mongodb://127.0.0.1:1", connect=False)
+
+    try:
+        async with causal_session_with(client, forged_token) as session:
+            assert session is None
+    finally:
+        await client.close()
@@ -0,0 +1,28 @@
+from aqua.infrastructure.periphery.envs import MongoConnection
+from aqua.infrastructure.periphery.pymongo.clients import (
+    connection_options_of,
+)
+
+
+def test_default_connection() -> None:
+    assert connection_options_of(MongoConnection()) == {}
+
+
+def test_configured_connection() -> None:
+    connection = MongoConnection(
+        max_pool_size=50,
+        min_pool_size=5,
+        max_idle_time_ms=60_000,
+        server_selection_timeout_ms=5000,
+        compressors=("zstd", "zlib"),
+        zlib_compression_level=6,
+    )
+
+    assert connection_options_of(connection) == {
+        "maxPoolSize": 50,
+        "minPoolSize": 5,
+        "maxIdleTimeMS": 60_000,
+        "serverSelectionTimeoutMS": 5000,
+        "compressors": "zstd,zlib",
+        "zlibCompressionLevel": 6,
+    }
@@ -0,0 +1,8 @@
+from aqua.infrastructure.periphery.pymongo.indexes import Index
+
+
+index = Index(collection_name="x", keys=(("a", 1), ("b", -1)))
+
+
+def test_index_name() -> None:
+    assert index.name == "a_1_b_-1"
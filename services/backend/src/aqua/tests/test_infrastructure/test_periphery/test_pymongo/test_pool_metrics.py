@@ -0,0 +1,53 @@
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+)
+
+from aqua.infrastructure.periphery.pymongo.pool_metrics import (
+    PoolMetrics,
+    PoolMetricsSnapshot,
+)
+
+
+_address = ("localhost", 27017)
+
+
+def test_without_events() -> None:
+    snapshot = PoolMetrics().snapshot()
+
+    assert snapshot == PoolMetricsSnapshot(
+        checked_out_connection_count=0,
+        max_checked_out_connection_count=0,
+        checkout_count=0,
+        failed_checkout_count=0,
+        total_checkout_wait_seconds=0,
+        max_checkout_wait_seconds=0,
+    )
+    assert snapshot.average_checkout_wait_seconds == 0
+
+
+def test_with_events() -> None:
+    pool_metrics = PoolMetrics()
+
+    pool_metrics.connection_checked_out(
+        ConnectionCheckedOutEvent(_address, 1, 0.25)
+    )
+    pool_metrics.connection_checked_out(
+        ConnectionCheckedOutEvent(_address, 2, 0.75)
+    )
+    pool_metrics.connection_checked_in(ConnectionCheckedInEvent(_address, 1))
+    pool_metrics.connection_check_out_failed(
+        ConnectionCheckOutFailedEvent(_address, "timeout", 2.0)
+    )
+    snapshot = pool_metrics.snapshot()
+
+    assert snapshot == PoolMetricsSnapshot(
+        checked_out_connection_count=1,
+        max_checked_out_connection_count=2,
+        checkout_count=2,
+        failed_checkout_count=1,
+        total_checkout_wait_seconds=3.0,
+        max_checkout_wait_seconds=2.0,
+    )
+    assert snapshot.average_checkout_wait_seconds == 1.0
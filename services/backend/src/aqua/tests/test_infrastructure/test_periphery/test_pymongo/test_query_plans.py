@@ -0,0 +1,167 @@
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+from pymongo import AsyncMongoClient, monitoring
+
+from aqua.application.rollups import Period
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.views.mongo.analytics_view_from import (
+    AnalyticsCache,
+    DBAnalyticsViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.day_view_from import (
+    DBDayViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.days_view_from import (
+    DBDaysViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.history_view_from import (
+    DBHistoryViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.ledger_view_from import (
+    DBLedgerViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.records_view_from import (
+    DBRecordsViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.rollup_view_from import (
+    DBRollupViewFromMongoUsers,
+)
+from aqua.infrastructure.adapters.views.mongo.user_view_from import (
+    DBUserViewFromMongoUsers,
+)
+from aqua.infrastructure.periphery.pymongo.clients import client_with
+from aqua.infrastructure.periphery.pymongo.document import Document
+
+
+_explainable_command_names = frozenset({
+    "find",
+    "aggregate",
+    "count",
+    "distinct",
+    "update",
+    "delete",
+    "findAndModify",
+})
+_session_field_names = frozenset({
+    "lsid",
+    "txnNumber",
+    "autocommit",
+    "startTransaction",
+    "readConcern",
+    "writeConcern",
+})
+
+_user_id = UUID(int=2)
+_date = date(2000, 1, 1)
+
+
+class RecordedCommands(monitoring.CommandListener):
+    def __init__(self) -> None:
+        self.commands = list[tuple[str, Document]]()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name not in _explainable_command_names:
+            return
+
+        command = {
+            name: value
+            for name, value in event.command.items()
+            if not name.startswith("$") and name not in _session_field_names
+        }
+        self.commands.append((event.database_name, command))
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None: ...
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None: ...
+
+
+def has_collection_scan(explanation: Any) -> bool:  # noqa: ANN401
+    if isinstance(explanation, list):
+        return any(has_collection_scan(part) for part in explanation)
+
+    if not isinstance(explanation, dict):
+        return False
+
+    if explanation.get("stage") == "COLLSCAN":
+        return True
+
+    if explanation.get("collectionScans", 0) > 0:
+        return True
+
+    return any(
+        has_collection_scan(value)
+        for name, value in explanation.items()
+        if name != "rejectedPlans"
+    )
+
+
+async def read_through_all_paths(client: AsyncMongoClient[Document]) -> None:
+    users = MongoUsers(client)
+
+    await users.user_with_id(_user_id)
+    await users.user_with_day(_user_id, date_=_date)
+    await users.user_with_days(_user_id, dates=[_date, date(2000, 1, 5)])
+    await users.user_with_record(_user_id, record_id=UUID(int=1))
+    await users.user_without_history(_user_id)
+
+    await DBDayViewFromMongoUsers()(users, user_id=_user_id, date_=_date)
+    await DBUserViewFromMongoUsers()(users, user_id=_user_id, date_=_date)
+    await DBRollupViewFromMongoUsers()(
+        users, user_id=_user_id, period=Period.week, date_=_date
+    )
+    await DBLedgerViewFromMongoUsers()(
+        users, user_id=_user_id, from_=_date, to=date(2000, 1, 9)
+    )
+    await DBAnalyticsViewFromMongoUsers(cache=AnalyticsCache(max_size=1))(
+        users, user_id=_user_id, today=date(2000, 1, 6)
+    )
+
+    for is_cancelled_hidden in (False, True):
+        await DBRecordsViewFromMongoUsers()(
+            users,
+            user_id=_user_id,
+            after=None,
+            limit=3,
+            is_cancelled_hidden=is_cancelled_hidden,
+        )
+
+    days_views = DBDaysViewFromMongoUsers()(
+        users, user_id=_user_id, from_=_date, to=date(2000, 1, 9)
+    )
+    [view async for view in days_views]
+
+    history_rows = DBHistoryViewFromMongoUsers(batch_size=2)(
+        users, user_id=_user_id
+    )
+    [row async for row in history_rows]
+
+
+async def test_read_paths_without_collection_scans(
+    full_mongo: None,  # noqa: ARG001
+) -> None:
+    recorded_commands = RecordedCommands()
+    client = client_with(
+        read_preference="primary", command_listeners=[recorded_commands]
+    )
+
+    try:
+        await read_through_all_paths(client)
+
+        assert recorded_commands.commands
+
+        scanning_commands = list[Document]()
+
+        for database_name, command in recorded_commands.commands:
+            explanation = await client[database_name].command({
+                "explain": command,
+                "verbosity": "executionStats",
+            })
+
+            if has_collection_scan(explanation):
+                scanning_commands.append(command)
+    finally:
+        await client.close()
+
+    assert scanning_commands == []
@@ -0,0 +1,46 @@
+from pymongo.errors import ConfigurationError
+from pytest import raises
+
+from aqua.infrastructure.periphery.envs import MongoReads
+from aqua.infrastructure.periphery.pymongo.reads import (
+    primary_reads,
+    read_concern_of,
+    read_preference_of,
+)
+
+
+def test_primary_read_preference() -> None:
+    read_preference = read_preference_of(primary_reads)
+
+    assert read_preference.mongos_mode == "primary"
+
+
+def test_secondary_read_preference() -> None:
+    reads = MongoReads(
+        preference="secondaryPreferred",
+        max_staleness_seconds=120,
+        tag_sets=({"region": "eu"},),
+    )
+
+    read_preference = read_preference_of(reads)
+
+    assert read_preference.mongos_mode == "secondaryPreferred"
+    assert read_preference.max_staleness == 120
+    assert read_preference.tag_sets == [{"region": "eu"}]
+
+
+def test_primary_read_preference_with_tag_sets() -> None:
+    reads = MongoReads(preference="primary", tag_sets=({"region": "eu"},))
+
+    with raises(ConfigurationError):
+        read_preference_of(reads)
+
+
+def test_default_read_concern() -> None:
+    assert read_concern_of(primary_reads).level is None
+
+
+def test_majority_read_concern() -> None:
+    reads = MongoReads(preference="nearest", concern_level="majority")
+
+    assert read_concern_of(reads).level == "majority"
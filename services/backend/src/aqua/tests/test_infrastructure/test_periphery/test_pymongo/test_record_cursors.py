@@ -0,0 +1,24 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from aqua.infrastructure.periphery.pymongo.record_cursors import (
+    RecordCursor,
+    decoded_record_cursor_of,
+    encoded_record_cursor_of,
+)
+
+
+cursor = RecordCursor(
+    recording_time=datetime(2000, 1, 1, 10, 30, tzinfo=UTC),
+    record_id=UUID(int=4),
+)
+
+
+def test_decoding_of_encoded_cursor() -> None:
+    encoded_cursor = encoded_record_cursor_of(cursor)
+
+    assert decoded_record_cursor_of(encoded_cursor) == cursor
+
+
+def test_decoding_of_invalid_cursor() -> None:
+    assert decoded_record_cursor_of("cursor") is None
@@ -0,0 +1,87 @@
+from uuid import UUID
+
+from pymongo import monitoring
+
+from aqua.application.cases.write_water import write_water
+from aqua.application.retries import RetryMetrics
+from aqua.infrastructure.adapters.loggers.in_memory_logger import (
+    InMemoryLogger,
+)
+from aqua.infrastructure.adapters.mappers.mongo.day_mapper import (
+    MongoDayMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.ledger_mapper import (
+    MongoLedgerMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.record_mapper import (
+    MongoRecordMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.rollup_mapper import (
+    MongoRollupMapperTo,
+)
+from aqua.infrastructure.adapters.mappers.mongo.user_mapper import (
+    MongoUserMapperTo,
+)
+from aqua.infrastructure.adapters.repos.mongo.users import MongoUsers
+from aqua.infrastructure.adapters.transactions.mongo.transaction import (
+    MongoOptimisticTransactionForMongoUsers,
+)
+from aqua.infrastructure.adapters.views.in_memory.writing_view_of import (
+    InMemoryWritingViewOf,
+)
+from aqua.infrastructure.periphery.pymongo.clients import client_with
+
+
+_user_id = UUID(int=2)
+
+
+class RecordedCommandNames(monitoring.CommandListener):
+    def __init__(self) -> None:
+        self.command_names = list[str]()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self.command_names.append(event.command_name)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None: ...
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None: ...
+
+
+async def test_write_water_into_stored_day(
+    full_mongo: None,  # noqa: ARG001
+) -> None:
+    recorded_command_names = RecordedCommandNames()
+    client = client_with(
+        read_preference="primary", command_listeners=[recorded_command_names]
+    )
+
+    async def write() -> None:
+        async with client.start_session() as session, write_water(
+            _user_id,
+            300,
+            view_of=InMemoryWritingViewOf(),
+            users=MongoUsers(client, session=session),
+            transaction_for=MongoOptimisticTransactionForMongoUsers(),
+            logger=InMemoryLogger(),
+            retry_metrics=RetryMetrics(),
+            user_mapper_to=MongoUserMapperTo(),
+            day_mapper_to=MongoDayMapperTo(),
+            record_mapper_to=MongoRecordMapperTo(),
+            rollup_mapper_to=MongoRollupMapperTo(),
+            ledger_mapper_to=MongoLedgerMapperTo(),
+        ) as result:
+            assert result.is_ok()
+
+    try:
+        await write()
+        recorded_command_names.command_names.clear()
+        await write()
+        command_names = list(recorded_command_names.command_names)
+    finally:
+        await client.close()
+
+    assert command_names == [
+        "aggregate",
+        "bulkWrite",
+        "commitTransaction",
+    ]
@@ -0,0 +1,80 @@
+import json
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+from aqua.infrastructure.periphery.serializing.from_view.to_csv import (
+    CSVLines,
+)
+from aqua.infrastructure.periphery.serializing.from_view.to_ndjson import (
+    ndjson_line_of,
+)
+from aqua.infrastructure.periphery.views.db.history_view import (
+    DBHistoryDayRow,
+    DBHistoryRecordRow,
+)
+
+
+_day_row = DBHistoryDayRow(
+    day_id=UUID(int=1),
+    date_=date(2000, 1, 1),
+    target_water_balance_milliliters=2000,
+    water_balance_milliliters=500,
+    result_code=2,
+    correct_result_code=2,
+    pinned_result_code=None,
+)
+_record_row = DBHistoryRecordRow(
+    record_id=UUID(int=2),
+    drunk_water_milliliters=290,
+    recording_time=datetime(2000, 1, 1, 15, 30, tzinfo=UTC),
+    is_cancelled=True,
+)
+
+
+def test_ndjson_day_line() -> None:
+    line = ndjson_line_of(_day_row)
+
+    assert line.endswith("\n")
+    assert json.loads(line) == {
+        "kind": "day",
+        "id": str(UUID(int=1)),
+        "date": "2000-01-01",
+        "target_water_balance_milliliters": 2000,
+        "water_balance_milliliters": 500,
+        "result_code": 2,
+        "correct_result_code": 2,
+        "pinned_result_code": None,
+    }
+
+
+def test_ndjson_record_line() -> None:
+    line = ndjson_line_of(_record_row)
+
+    assert json.loads(line) == {
+        "kind": "record",
+        "id": str(UUID(int=2)),
+        "drunk_water_milliliters": 290,
+        "recording_time": "2000-01-01T15:30:00+00:00",
+        "is_cancelled": True,
+    }
+
+
+def test_csv_lines() -> None:
+    csv_lines = CSVLines()
+
+    lines = [
+        csv_lines.header(),
+        csv_lines.line_of(_day_row),
+        csv_lines.line_of(_record_row),
+    ]
+
+    assert lines == [
+        (
+            "kind,id,date,target_water_balance_milliliters,"
+            "water_balance_milliliters,result_code,correct_result_code,"
+            "pinned_result_code,drunk_water_milliliters,recording_time,"
+            "is_cancelled\n"
+        ),
+        f"day,{UUID(int=1)},2000-01-01,2000,500,2,2,,,,\n",
+        f"record,{UUID(int=2)},,,,,,,290,2000-01-01T15:30:00+00:00,true\n",
+    ]
@@ -0,0 +1,32 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+from bson.tz_util import FixedOffset
+from bson.tz_util import utc as bson_utc
+
+from aqua.infrastructure.periphery.serializing.from_document.to_native import (
+    native_datetime_of,
+)
+
+
+def test_datetime_with_bson_utc() -> None:
+    document_datetime = datetime(2000, 1, 1, 12, tzinfo=bson_utc)
+
+    native_datetime = native_datetime_of(document_datetime)
+
+    assert native_datetime == document_datetime
+    assert native_datetime.tzinfo is UTC
+
+
+def test_datetime_with_offset() -> None:
+    document_datetime = datetime(2000, 1, 1, 12, tzinfo=FixedOffset(180, "+3"))
+
+    native_datetime = native_datetime_of(document_datetime)
+
+    assert native_datetime == document_datetime
+    assert native_datetime.tzinfo == timezone(timedelta(hours=3))
+
+
+def test_naive_datetime() -> None:
+    native_datetime = native_datetime_of(datetime(2000, 1, 1, 12))
+
+    assert native_datetime.tzinfo is None
@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from pytest import raises
+
+from aqua.infrastructure.periphery.validation.decoders import (
+    Field,
+    New,
+    decoder_of,
+)
+from aqua.infrastructure.periphery.validation.error import ValidationError
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class Data:
+    id: UUID
+    tags: list[str]
+    milliliters: str
+    weight: int | None
+
+
+_data_of = decoder_of(
+    Data,
+    id=Field(key="_id", type_=UUID),
+    tags=New(factory=list),
+    milliliters=Field(key="water", type_=int, converted=str),
+    weight=Field(key="weight", type_=int, is_strict=False),
+)
+
+
+def test_valid_document() -> None:
+    data = _data_of({"_id": UUID(int=1), "water": 200, "weight": 70})
+
+    assert data == Data(id=UUID(int=1), tags=[], milliliters="200", weight=70)
+
+
+def test_new_values_are_not_shared() -> None:
+    data1 = _data_of({"_id": UUID(int=1), "water": 200})
+    data2 = _data_of({"_id": UUID(int=1), "water": 200})
+
+    assert data1.tags is not data2.tags
+
+
+def test_not_strict_field_with_invalid_type() -> None:
+    data = _data_of({"_id": UUID(int=1), "water": 200, "weight": "70"})
+
+    assert data.weight is None
+
+
+def test_missing_strict_field() -> None:
+    with raises(ValidationError):
+        _data_of({"_id": UUID(int=1)})
+
+
+def test_strict_field_with_invalid_type() -> None:
+    with raises(ValidationError):
+        _data_of({"_id": str(UUID(int=1)), "water": 200})
@@ -4,18 +4,18 @@ from auth.domain.models.access.aggregates import account as _account
 
 
 async def log_effect(effect: SearchableEffect, logger: Logger) -> None:
-    sessoins = effect.entities_that(_account.internal.entities.session.Session)
+    session = _account.internal.entities.session
 
-    extended_sessions = sessoins.with_event(
-        _account.internal.entities.session.Extended
+    extended_sessions = effect.entities_that(
+        session.Session, with_event=session.Extended
     )
 
-    replaced_sessions = sessoins.with_event(
-        _account.internal.entities.session.Replaced
+    replaced_sessions = effect.entities_that(
+        session.Session, with_event=session.Replaced
     )
 
-    cancelled_sessions = sessoins.with_event(
-        _account.internal.entities.session.Cancelled
+    cancelled_sessions = effect.entities_that(
+        session.Session, with_event=session.Cancelled
     )
 
     for extended_session in extended_sessions:
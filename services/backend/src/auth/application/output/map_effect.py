@@ -39,10 +39,8 @@ async def map_effect(effect: SearchableEffect, mappers: Mappers) -> None:
         if mapper is None:
             raise NoMapperError
 
-        entities = effect.entities_that(entity_type)
-
-        created_entities = entities.with_event(Created)
-        mutated_entities = entities.with_event(Mutated)
+        created_entities = effect.entities_that(entity_type, with_event=Created)
+        mutated_entities = effect.entities_that(entity_type, with_event=Mutated)
 
         await mapper.add_all(frozenset(created_entities))
         await mapper.update_all(frozenset(mutated_entities))
@@ -1,7 +1,7 @@
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import AsyncIterator, Literal
+from typing import AsyncIterator, Iterable, Literal
 from uuid import UUID
 
 from aqua.presentation.periphery import facade as aqua
@@ -30,6 +30,7 @@ class RegisterUserOutputData:
     target_water_balance_milliliters: int
     glass_milliliters: int
     weight_kilograms: int | None
+    causality_token: str | None
 
 
 @asynccontextmanager
@@ -45,6 +46,7 @@ async def register_user(
     | Literal["incorrect_weight_amount"]
     | Literal["no_weight_for_water_balance"]
     | Literal["extreme_weight_for_water_balance"]
+    | Literal["conflict"]
 ]:
     register_user = aqua.register_user.perform(
         auth_user_id,
@@ -62,6 +64,7 @@ async def register_user(
                     target_water_balance_milliliters=target,
                     glass_milliliters=result.glass_milliliters,
                     weight_kilograms=result.weight_kilograms,
+                    causality_token=result.causality_token,
                 )
             except Exception as error:
                 raise ErrorWrapper(error) from None
@@ -73,6 +76,8 @@ async def register_user(
         yield "no_weight_for_water_balance"
     except aqua.register_user.ExtremeWeightForWaterBalanceError:
         yield "extreme_weight_for_water_balance"
+    except aqua.register_user.ConflictError:
+        yield "conflict"
     except ErrorWrapper as wrapper:
         raise wrapper.error from wrapper.error
     except Exception as error:
@@ -90,6 +95,7 @@ class WriteWaterOutputData:
     date_: date
     previous_records: tuple[RecordData, ...]
     new_record: RecordData
+    causality_token: str | None
 
 
 @asynccontextmanager
@@ -101,6 +107,8 @@ async def write_water(
     | Error
     | Literal["no_user"]
     | Literal["incorrect_water_amount"]
+    | Literal["incorrect_recording_time"]
+    | Literal["conflict"]
 ]:
     try:
         async with aqua.write_water.perform(user_id, milliliters) as result:
@@ -119,6 +127,7 @@ async def write_water(
                     date_=result.date_,
                     previous_records=previous_records,
                     new_record=_record_data_of(result.new_record),
+                    causality_token=result.causality_token,
                 )
             except Exception as error:
                 raise ErrorWrapper(error) from None
@@ -126,6 +135,10 @@ async def write_water(
         yield "no_user"
     except aqua.write_water.IncorrectWaterAmountError:
         yield "incorrect_water_amount"
+    except aqua.write_water.IncorrectRecordingTimeError:
+        yield "incorrect_recording_time"
+    except aqua.write_water.ConflictError:
+        yield "conflict"
     except ErrorWrapper as wrapper:
         raise wrapper.error from wrapper.error
     except Exception as error:
@@ -140,6 +153,99 @@ def _record_data_of(data: aqua.write_water.RecordData) -> RecordData:
     )
 
 
+@dataclass(kw_only=True, frozen=True, slots=True)
+class WaterEntryData:
+    milliliters: int
+    recording_time: datetime
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class DayData:
+    date_: date
+    target_water_balance_milliliters: int
+    water_balance_milliliters: int
+    result_code: int
+    real_result_code: int
+    is_result_pinned: bool
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class WriteWaterBatchOutputData:
+    user_id: UUID
+    days: tuple[DayData, ...]
+    new_records: tuple[RecordData, ...]
+    causality_token: str | None
+
+
+@asynccontextmanager
+async def write_water_batch(
+    user_id: UUID,
+    entries: Iterable[WaterEntryData],
+) -> AsyncIterator[
+    WriteWaterBatchOutputData
+    | Error
+    | Literal["no_user"]
+    | Literal["incorrect_water_amount"]
+    | Literal["incorrect_recording_time"]
+    | Literal["too_many_entries"]
+    | Literal["conflict"]
+]:
+    inputs = [
+        aqua.write_water_batch.Input(
+            milliliters=entry.milliliters,
+            recording_time=entry.recording_time,
+        )
+        for entry in entries
+    ]
+
+    try:
+        async with aqua.write_water_batch.perform(user_id, inputs) as result:
+            try:
+                days = tuple(
+                    DayData(
+                        date_=day.date_,
+                        target_water_balance_milliliters=(
+                            day.target_water_balance_milliliters
+                        ),
+                        water_balance_milliliters=day.water_balance_milliliters,
+                        result_code=day.result_code,
+                        real_result_code=day.real_result_code,
+                        is_result_pinned=day.is_result_pinned,
+                    )
+                    for day in result.days
+                )
+                new_records = tuple(
+                    RecordData(
+                        record_id=record.record_id,
+                        drunk_water_milliliters=record.drunk_water_milliliters,
+                        recording_time=record.recording_time,
+                    )
+                    for record in result.new_records
+                )
+                yield WriteWaterBatchOutputData(
+                    user_id=result.user_id,
+                    days=days,
+                    new_records=new_records,
+                    causality_token=result.causality_token,
+                )
+            except Exception as error:
+                raise ErrorWrapper(error) from None
+    except aqua.write_water_batch.NoUserError:
+        yield "no_user"
+    except aqua.write_water_batch.IncorrectWaterAmountError:
+        yield "incorrect_water_amount"
+    except aqua.write_water_batch.IncorrectRecordingTimeError:
+        yield "incorrect_recording_time"
+    except aqua.write_water_batch.TooManyEntriesError:
+        yield "too_many_entries"
+    except aqua.write_water_batch.ConflictError:
+        yield "conflict"
+    except ErrorWrapper as wrapper:
+        raise wrapper.error from wrapper.error
+    except Exception as error:
+        yield Error(unexpected_error=error)
+
+
 @dataclass(kw_only=True, frozen=True, slots=True)
 class ReadDayOutputData:
     user_id: UUID
@@ -153,10 +259,10 @@ class ReadDayOutputData:
 
 
 async def read_day(
-    user_id: UUID, date_: date
+    user_id: UUID, date_: date, causality_token: str | None = None
 ) -> ReadDayOutputData | Error | Literal["no_user"]:
     try:
-        result = await aqua.read_day.perform(user_id, date_)
+        result = await aqua.read_day.perform(user_id, date_, causality_token)
     except aqua.read_day.NoUserError:
         return "no_user"
     except Exception as error:
@@ -183,6 +289,152 @@ async def read_day(
     )
 
 
+def read_days(
+    user_id: UUID,
+    from_: date,
+    to: date,
+    causality_token: str | None = None,
+) -> (
+    AsyncIterator[ReadDayOutputData | Error]
+    | Literal["too_long_range"]
+    | Literal["reversed_range"]
+):
+    try:
+        results = aqua.read_days.perform(user_id, from_, to, causality_token)
+    except aqua.read_days.TooLongRangeError:
+        return "too_long_range"
+    except aqua.read_days.ReversedRangeError:
+        return "reversed_range"
+
+    return _read_day_outputs_of(results)
+
+
+async def _read_day_outputs_of(
+    results: AsyncIterator[aqua.read_days.Output],
+) -> AsyncIterator[ReadDayOutputData | Error]:
+    try:
+        async for result in results:
+            records = tuple(
+                RecordData(
+                    record_id=record.record_id,
+                    drunk_water_milliliters=record.drunk_water_milliliters,
+                    recording_time=record.recording_time,
+                )
+                for record in result.records
+            )
+            yield ReadDayOutputData(
+                user_id=result.user_id,
+                date_=result.date_,
+                target_water_balance_milliliters=(
+                    result.target_water_balance_milliliters
+                ),
+                water_balance_milliliters=result.water_balance_milliliters,
+                result_code=result.result_code,
+                real_result_code=result.real_result_code,
+                is_result_pinned=result.is_result_pinned,
+                records=records,
+            )
+    except Exception as error:
+        yield Error(unexpected_error=error)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class ReadRecordsOutputData:
+    @dataclass(kw_only=True, frozen=True, slots=True)
+    class RecordData:
+        record_id: UUID
+        drunk_water_milliliters: int
+        recording_time: datetime
+        is_cancelled: bool
+
+    user_id: UUID
+    records: tuple[RecordData, ...]
+    next_cursor: str | None
+
+
+async def read_records(
+    user_id: UUID,
+    cursor: str | None,
+    limit: int,
+    *,
+    is_cancelled_hidden: bool,
+    causality_token: str | None = None,
+) -> (
+    ReadRecordsOutputData
+    | Error
+    | Literal["invalid_cursor"]
+    | Literal["invalid_limit"]
+):
+    try:
+        result = await aqua.read_records.perform(
+            user_id,
+            cursor,
+            limit,
+            is_cancelled_hidden=is_cancelled_hidden,
+            causality_token=causality_token,
+        )
+    except aqua.read_records.InvalidCursorError:
+        return "invalid_cursor"
+    except aqua.read_records.InvalidLimitError:
+        return "invalid_limit"
+    except Exception as error:
+        return Error(unexpected_error=error)
+
+    records = tuple(
+        ReadRecordsOutputData.RecordData(
+            record_id=record.record_id,
+            drunk_water_milliliters=record.drunk_water_milliliters,
+            recording_time=record.recording_time,
+            is_cancelled=record.is_cancelled,
+        )
+        for record in result.records
+    )
+    return ReadRecordsOutputData(
+        user_id=result.user_id,
+        records=records,
+        next_cursor=result.next_cursor,
+    )
+
+
+type HistoryFormat = Literal["ndjson", "csv"]
+
+
+async def export_history(
+    user_id: UUID, format_: HistoryFormat
+) -> AsyncIterator[str | Error]:
+    chunks = aqua.export_history.perform(user_id, format_)
+
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except Exception as error:
+        yield Error(unexpected_error=error)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class ReadAnalyticsOutputData:
+    user_id: UUID
+    date_: date
+    good_day_streak: int
+    average_milliliters_by_weekday: tuple[int, ...]
+    glass_percentile_milliliters: int | None
+
+
+async def read_analytics(user_id: UUID) -> ReadAnalyticsOutputData | Error:
+    try:
+        result = await aqua.read_analytics.perform(user_id)
+    except Exception as error:
+        return Error(unexpected_error=error)
+
+    return ReadAnalyticsOutputData(
+        user_id=result.user_id,
+        date_=result.date_,
+        good_day_streak=result.good_day_streak,
+        average_milliliters_by_weekday=result.average_milliliters_by_weekday,
+        glass_percentile_milliliters=result.glass_percentile_milliliters,
+    )
+
+
 @dataclass(kw_only=True, frozen=True, slots=True)
 class ReadUserOutputData:
     user_id: UUID
@@ -198,10 +450,10 @@ class ReadUserOutputData:
 
 
 async def read_user(
-    user_id: UUID,
+    user_id: UUID, causality_token: str | None = None
 ) -> ReadUserOutputData | Error | Literal["no_user"]:
     try:
-        result = await aqua.read_user.perform(user_id)
+        result = await aqua.read_user.perform(user_id, causality_token)
     except Exception as error:
         return Error(unexpected_error=error)
 
@@ -242,18 +494,31 @@ class CancelRecordOutputData:
     is_result_pinned: bool
     cancelled_record: RecordData
     other_records: tuple[RecordData, ...]
+    causality_token: str | None
 
 
 @asynccontextmanager
 async def cancel_record(
     user_id: UUID, record_id: UUID
-) -> AsyncIterator[CancelRecordOutputData | Error | Literal["no_record"]]:
+) -> AsyncIterator[
+    CancelRecordOutputData
+    | Error
+    | Literal["no_record"]
+    | Literal["incorrect_recording_time"]
+    | Literal["conflict"]
+]:
     try:
         async with aqua.cancel_record.perform(user_id, record_id) as result:
             try:
                 if result == "no_record":
                     yield "no_record"
                     return
+                if result == "conflict":
+                    yield "conflict"
+                    return
+                if result == "incorrect_recording_time":
+                    yield "incorrect_recording_time"
+                    return
 
                 other_records = tuple(
                     RecordData(
@@ -282,6 +547,7 @@ async def cancel_record(
                     is_result_pinned=result.is_result_pinned,
                     cancelled_record=cancelled_record,
                     other_records=other_records,
+                    causality_token=result.causality_token,
                 )
             except Exception as error:
                 raise ErrorWrapper(error) from None
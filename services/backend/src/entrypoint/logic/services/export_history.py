@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, Literal
+from uuid import UUID
+
+from entrypoint.infrastructure.facades.clients import aqua, auth
+from entrypoint.infrastructure.facades.loggers import aqua_logger, auth_logger
+
+
+@dataclass(kw_only=True, frozen=True)
+class OutputData:
+    auth_output: auth.AuthenticateUserOutputData
+    aqua_output: AsyncIterator[str]
+
+
+type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
+
+
+async def export_history(
+    session_id: UUID, format_: aqua.HistoryFormat
+) -> Output:
+    async with auth.authenticate_user(session_id) as auth_result:
+        ...
+
+    if isinstance(auth_result, auth.Error):
+        await auth_logger.log_error(auth_result)
+        return "error"
+    if not isinstance(auth_result, auth.AuthenticateUserOutputData):
+        return "not_authenticated"
+
+    aqua_results = aqua.export_history(auth_result.user_id, format_)
+
+    return OutputData(
+        auth_output=auth_result, aqua_output=_logged(aqua_results)
+    )
+
+
+async def _logged(
+    aqua_results: AsyncIterator[str | aqua.Error],
+) -> AsyncIterator[str]:
+    async for aqua_result in aqua_results:
+        if isinstance(aqua_result, aqua.Error):
+            await aqua_logger.log_error(aqua_result)
+            raise aqua_result.unexpected_error
+
+        yield aqua_result
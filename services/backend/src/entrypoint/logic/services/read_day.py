@@ -19,7 +19,9 @@ class OutputData:
 type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
 
 
-async def read_day(session_id: UUID, date_: date) -> Output:
+async def read_day(
+    session_id: UUID, date_: date, causality_token: str | None = None
+) -> Output:
     async with auth.authenticate_user(session_id) as auth_result:
         ...
 
@@ -29,7 +31,9 @@ async def read_day(session_id: UUID, date_: date) -> Output:
     if not isinstance(auth_result, auth.AuthenticateUserOutputData):
         return "not_authenticated"
 
-    aqua_result = await aqua.read_day(auth_result.user_id, date_)
+    aqua_result = await aqua.read_day(
+        auth_result.user_id, date_, causality_token
+    )
 
     if isinstance(aqua_result, aqua.Error):
         await aqua_logger.log_error(aqua_result)
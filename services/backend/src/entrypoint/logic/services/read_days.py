@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import AsyncIterator, Literal
+from uuid import UUID
+
+from entrypoint.infrastructure.facades.clients import aqua, auth
+from entrypoint.infrastructure.facades.loggers import aqua_logger, auth_logger
+
+
+@dataclass(kw_only=True, frozen=True)
+class OutputData:
+    auth_output: auth.AuthenticateUserOutputData
+    aqua_output: AsyncIterator[aqua.ReadDayOutputData]
+
+
+type Output = (
+    OutputData
+    | Literal["error"]
+    | Literal["not_authenticated"]
+    | Literal["too_long_range"]
+    | Literal["reversed_range"]
+)
+
+
+async def read_days(
+    session_id: UUID,
+    from_: date,
+    to: date,
+    causality_token: str | None = None,
+) -> Output:
+    async with auth.authenticate_user(session_id) as auth_result:
+        ...
+
+    if isinstance(auth_result, auth.Error):
+        await auth_logger.log_error(auth_result)
+        return "error"
+    if not isinstance(auth_result, auth.AuthenticateUserOutputData):
+        return "not_authenticated"
+
+    aqua_results = aqua.read_days(
+        auth_result.user_id, from_, to, causality_token
+    )
+
+    if aqua_results == "too_long_range":
+        return "too_long_range"
+
+    if aqua_results == "reversed_range":
+        return "reversed_range"
+
+    return OutputData(
+        auth_output=auth_result, aqua_output=_logged(aqua_results)
+    )
+
+
+async def _logged(
+    aqua_results: AsyncIterator[aqua.ReadDayOutputData | aqua.Error],
+) -> AsyncIterator[aqua.ReadDayOutputData]:
+    async for aqua_result in aqua_results:
+        if isinstance(aqua_result, aqua.Error):
+            await aqua_logger.log_error(aqua_result)
+            raise aqua_result.unexpected_error
+
+        yield aqua_result
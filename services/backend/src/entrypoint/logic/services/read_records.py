@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from typing import Literal
+from uuid import UUID
+
+from entrypoint.infrastructure.facades.clients import aqua, auth
+from entrypoint.infrastructure.facades.loggers import aqua_logger, auth_logger
+
+
+type AquaOutput = (
+    aqua.ReadRecordsOutputData
+    | Literal["error"]
+    | Literal["invalid_cursor"]
+    | Literal["invalid_limit"]
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class OutputData:
+    auth_output: auth.AuthenticateUserOutputData
+    aqua_output: AquaOutput
+
+
+type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
+
+
+async def read_records(
+    session_id: UUID,
+    cursor: str | None,
+    limit: int,
+    *,
+    is_cancelled_hidden: bool,
+    causality_token: str | None = None,
+) -> Output:
+    async with auth.authenticate_user(session_id) as auth_result:
+        ...
+
+    if isinstance(auth_result, auth.Error):
+        await auth_logger.log_error(auth_result)
+        return "error"
+    if not isinstance(auth_result, auth.AuthenticateUserOutputData):
+        return "not_authenticated"
+
+    aqua_result = await aqua.read_records(
+        auth_result.user_id,
+        cursor,
+        limit,
+        is_cancelled_hidden=is_cancelled_hidden,
+        causality_token=causality_token,
+    )
+
+    aqua_output: AquaOutput
+
+    if isinstance(aqua_result, aqua.Error):
+        await aqua_logger.log_error(aqua_result)
+        aqua_output = "error"
+    else:
+        aqua_output = aqua_result
+
+    return OutputData(auth_output=auth_result, aqua_output=aqua_output)
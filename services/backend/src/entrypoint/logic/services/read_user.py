@@ -16,7 +16,9 @@ class OutputData:
 type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
 
 
-async def read_user(session_id: UUID) -> Output:
+async def read_user(
+    session_id: UUID, causality_token: str | None = None
+) -> Output:
     async with auth.authenticate_user(session_id) as authentication_result:
         ...
 
@@ -28,7 +30,7 @@ async def read_user(session_id: UUID) -> Output:
 
     user_id = authentication_result.user_id
 
-    aqua_result = await aqua.read_user(user_id)
+    aqua_result = await aqua.read_user(user_id, causality_token)
     if isinstance(aqua_result, aqua.Error):
         await aqua_logger.log_error(aqua_result)
 
@@ -23,6 +23,7 @@ type Output = (
     | Literal["taken_username"]
     | Literal["empty_username"]
     | Literal["week_password"]
+    | Literal["conflict"]
 )
 
 
@@ -10,6 +10,8 @@ type AquaOutput = (
     aqua.WriteWaterOutputData
     | Literal["error"]
     | Literal["incorrect_water_amount"]
+    | Literal["incorrect_recording_time"]
+    | Literal["conflict"]
 )
 
 
@@ -42,12 +44,15 @@ async def write_water(session_id: UUID, milliliters: int | None) -> Output:
 
         aqua_output: AquaOutput
 
-        if (
-            isinstance(aqua_result, aqua.WriteWaterOutputData)
-            or aqua_result == "incorrect_water_amount"
-        ):
-            aqua_output = aqua_result
-        else:
-            aqua_output = "error"
+        match aqua_result:
+            case (
+                aqua.WriteWaterOutputData()
+                | "incorrect_water_amount"
+                | "incorrect_recording_time"
+                | "conflict"
+            ):
+                aqua_output = aqua_result
+            case _:
+                aqua_output = "error"
 
         return OutputData(auth_output=auth_result, aqua_output=aqua_output)
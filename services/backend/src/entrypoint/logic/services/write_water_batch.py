@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Iterable, Literal
+from uuid import UUID
+
+from entrypoint.infrastructure.facades.clients import aqua, auth
+from entrypoint.infrastructure.facades.loggers import aqua_logger, auth_logger
+
+
+type AquaOutput = (
+    aqua.WriteWaterBatchOutputData
+    | Literal["error"]
+    | Literal["incorrect_water_amount"]
+    | Literal["incorrect_recording_time"]
+    | Literal["conflict"]
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class OutputData:
+    auth_output: auth.AuthenticateUserOutputData
+    aqua_output: AquaOutput
+
+
+type Output = OutputData | Literal["error"] | Literal["not_authenticated"]
+
+
+async def write_water_batch(
+    session_id: UUID, entries: Iterable[aqua.WaterEntryData]
+) -> Output:
+    async with auth.authenticate_user(session_id) as auth_result:
+        ...
+
+    if isinstance(auth_result, auth.Error):
+        await auth_logger.log_error(auth_result)
+        return "error"
+    if not isinstance(auth_result, auth.AuthenticateUserOutputData):
+        return "not_authenticated"
+
+    user_id = auth_result.user_id
+
+    async with aqua.write_water_batch(user_id, entries) as aqua_result:
+        if isinstance(aqua_result, aqua.Error):
+            await aqua_logger.log_error(aqua_result)
+        if aqua_result == "no_user":
+            await aqua_logger.log_no_user_from_other_parts(user_id)
+
+        aqua_output: AquaOutput
+
+        match aqua_result:
+            case (
+                aqua.WriteWaterBatchOutputData()
+                | "incorrect_water_amount"
+                | "incorrect_recording_time"
+                | "conflict"
+            ):
+                aqua_output = aqua_result
+            case _:
+                aqua_output = "error"
+
+        return OutputData(auth_output=auth_result, aqua_output=aqua_output)
@@ -1,6 +1,6 @@
 from typing import Annotated, TypeAlias
 
-from fastapi import Depends
+from fastapi import Cookie, Depends
 from fastapi.security import APIKeyCookie
 
 from entrypoint.presentation.fastapi.views import cookies
@@ -23,3 +23,8 @@ optional_session_cookie_scheme = APIKeyCookie(
 optional_session_id_cookie: TypeAlias = Annotated[
     str | None, Depends(optional_session_cookie_scheme)
 ]
+
+
+optional_causality_token_cookie: TypeAlias = Annotated[
+    str | None, Cookie(alias=cookies.CausalityTokenCookie.name)
+]
@@ -10,9 +10,24 @@ from entrypoint.presentation.fastapi.controllers.routes import (
 from entrypoint.presentation.fastapi.controllers.routes import (
     create_record as create_record,
 )
+from entrypoint.presentation.fastapi.controllers.routes import (
+    create_records as create_records,
+)
+from entrypoint.presentation.fastapi.controllers.routes import (
+    export_history as export_history,
+)
+from entrypoint.presentation.fastapi.controllers.routes import (
+    read_analytics as read_analytics,
+)
 from entrypoint.presentation.fastapi.controllers.routes import (
     read_day as read_day,
 )
+from entrypoint.presentation.fastapi.controllers.routes import (
+    read_days as read_days,
+)
+from entrypoint.presentation.fastapi.controllers.routes import (
+    read_records as read_records,
+)
 from entrypoint.presentation.fastapi.controllers.routes import (
     read_user as read_user,
 )
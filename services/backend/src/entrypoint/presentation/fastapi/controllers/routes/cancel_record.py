@@ -8,9 +8,16 @@ from entrypoint.presentation.fastapi.controllers import cookies
 from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
 from entrypoint.presentation.fastapi.controllers.routers import router
 from entrypoint.presentation.fastapi.controllers.tags import Tag
+from entrypoint.presentation.fastapi.views.cookies import CausalityTokenCookie
+from entrypoint.presentation.fastapi.views.responses.bad.conflict import (
+    conflict_response_model,
+)
 from entrypoint.presentation.fastapi.views.responses.bad.fault import (
     fault_response_model,
 )
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_recording_time import (  # noqa: E501
+    invalid_recording_time_response_model,
+)
 from entrypoint.presentation.fastapi.views.responses.bad.invalid_session_id_hex import (  # noqa: E501
     invalid_session_id_hex_response_model,
 )
@@ -42,10 +49,12 @@ class CancelRecordRequestModel(BaseModel):
     status_code=cancelled_record_response_model.status_code,
     responses=to_doc(
         fault_response_model,
+        conflict_response_model,
         invalid_session_id_hex_response_model,
         not_authenticated_response_model,
         cancelled_record_response_model,
         no_record_response_model,
+        invalid_recording_time_response_model,
     ),
 )
 async def cancel_record(
@@ -71,6 +80,12 @@ async def cancel_record(
     if result.aqua_output == "no_record":
         return no_record_response_model.to_response()
 
+    if result.aqua_output == "incorrect_recording_time":
+        return invalid_recording_time_response_model.to_response()
+
+    if result.aqua_output == "conflict":
+        return conflict_response_model.to_response()
+
     target = result.aqua_output.target_water_balance_milliliters
     body = CancelledRecordSchema(
         user_id=result.aqua_output.user_id,
@@ -86,4 +101,9 @@ async def cancel_record(
         ),
     )
 
-    return cancelled_record_response_model.to_response(body)
+    response = cancelled_record_response_model.to_response(body)
+
+    causality_token_cookie = CausalityTokenCookie(response)
+    causality_token_cookie.set(result.aqua_output.causality_token)
+
+    return response
@@ -6,9 +6,16 @@ from entrypoint.presentation.fastapi.controllers import cookies
 from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
 from entrypoint.presentation.fastapi.controllers.routers import router
 from entrypoint.presentation.fastapi.controllers.tags import Tag
+from entrypoint.presentation.fastapi.views.cookies import CausalityTokenCookie
+from entrypoint.presentation.fastapi.views.responses.bad.conflict import (
+    conflict_response_model,
+)
 from entrypoint.presentation.fastapi.views.responses.bad.fault import (
     fault_response_model,
 )
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_recording_time import (  # noqa: E501
+    invalid_recording_time_response_model,
+)
 from entrypoint.presentation.fastapi.views.responses.bad.invalid_session_id_hex import (  # noqa: E501
     invalid_session_id_hex_response_model,
 )
@@ -40,9 +47,11 @@ class CreateRecordRequestModel(BaseModel):
     status_code=new_record_response_model.status_code,
     responses=to_doc(
         fault_response_model,
+        conflict_response_model,
         not_authenticated_response_model,
         invalid_session_id_hex_response_model,
         invalid_water_amount_response_model,
+        invalid_recording_time_response_model,
         new_record_response_model,
     ),
 )
@@ -69,6 +78,12 @@ async def create_record(
     if result.aqua_output == "incorrect_water_amount":
         return invalid_water_amount_response_model.to_response()
 
+    if result.aqua_output == "incorrect_recording_time":
+        return invalid_recording_time_response_model.to_response()
+
+    if result.aqua_output == "conflict":
+        return conflict_response_model.to_response()
+
     target_water_balance_milliliters = (
         result.aqua_output.target_water_balance_milliliters
     )
@@ -86,4 +101,9 @@ async def create_record(
         new_record=RecordSchema.of(result.aqua_output.new_record),
     )
 
-    return new_record_response_model.to_response(body)
+    response = new_record_response_model.to_response(body)
+
+    causality_token_cookie = CausalityTokenCookie(response)
+    causality_token_cookie.set(result.aqua_output.causality_token)
+
+    return response
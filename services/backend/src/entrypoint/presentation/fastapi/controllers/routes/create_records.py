@@ -0,0 +1,116 @@
+from datetime import datetime
+
+from fastapi import Response
+from pydantic import BaseModel, Field
+
+from entrypoint.infrastructure.facades.clients.aqua import WaterEntryData
+from entrypoint.logic.services.write_water_batch import (
+    write_water_batch as service,
+)
+from entrypoint.presentation.fastapi.controllers import cookies
+from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
+from entrypoint.presentation.fastapi.controllers.routers import router
+from entrypoint.presentation.fastapi.controllers.tags import Tag
+from entrypoint.presentation.fastapi.views.cookies import CausalityTokenCookie
+from entrypoint.presentation.fastapi.views.responses.bad.conflict import (
+    conflict_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.fault import (
+    fault_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_recording_time import (  # noqa: E501
+    invalid_recording_time_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_session_id_hex import (  # noqa: E501
+    invalid_session_id_hex_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_water_amount import (  # noqa: E501
+    invalid_water_amount_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.not_authenticated import (  # noqa: E501
+    not_authenticated_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    to_doc,
+)
+from entrypoint.presentation.fastapi.views.responses.common.record import (
+    RecordSchema,
+)
+from entrypoint.presentation.fastapi.views.responses.ok.record.new_records import (  # noqa: E501
+    NewRecordsDaySchema,
+    NewRecordsSchema,
+    new_records_response_model,
+)
+
+
+class CreateRecordsEntryRequestModel(BaseModel):
+    water_milliliters: int
+    recording_time: datetime
+
+
+class CreateRecordsRequestModel(BaseModel):
+    records: list[CreateRecordsEntryRequestModel] = Field(max_length=500)
+
+
+@router.post(
+    "/user/records/batch",
+    tags=[Tag.current_user_endpoints],
+    status_code=new_records_response_model.status_code,
+    responses=to_doc(
+        fault_response_model,
+        conflict_response_model,
+        not_authenticated_response_model,
+        invalid_session_id_hex_response_model,
+        invalid_water_amount_response_model,
+        invalid_recording_time_response_model,
+        new_records_response_model,
+    ),
+)
+async def create_records(
+    request_model: CreateRecordsRequestModel,
+    session_id_hex: cookies.session_id_cookie,
+) -> Response:
+    session_id = valid_id_of(session_id_hex)
+
+    if session_id is None:
+        return invalid_session_id_hex_response_model.to_response()
+
+    entries = [
+        WaterEntryData(
+            milliliters=entry.water_milliliters,
+            recording_time=entry.recording_time,
+        )
+        for entry in request_model.records
+    ]
+    result = await service(session_id, entries)
+
+    if result == "error":
+        return fault_response_model.to_response()
+
+    if result == "not_authenticated":
+        return not_authenticated_response_model.to_response()
+
+    if result.aqua_output == "error":
+        return fault_response_model.to_response()
+
+    if result.aqua_output == "incorrect_water_amount":
+        return invalid_water_amount_response_model.to_response()
+
+    if result.aqua_output == "incorrect_recording_time":
+        return invalid_recording_time_response_model.to_response()
+
+    if result.aqua_output == "conflict":
+        return conflict_response_model.to_response()
+
+    body = NewRecordsSchema(
+        user_id=result.aqua_output.user_id,
+        days=tuple(map(NewRecordsDaySchema.of, result.aqua_output.days)),
+        new_records=tuple(map(RecordSchema.of, result.aqua_output.new_records)),
+    )
+
+    response = new_records_response_model.to_response(body)
+
+    causality_token_cookie = CausalityTokenCookie(response)
+    causality_token_cookie.set(result.aqua_output.causality_token)
+
+    return response
@@ -0,0 +1,75 @@
+from typing import Annotated, Any
+
+from fastapi import Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from entrypoint.infrastructure.facades.clients import aqua
+from entrypoint.logic.services.export_history import (
+    export_history as service,
+)
+from entrypoint.presentation.fastapi.controllers import cookies
+from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
+from entrypoint.presentation.fastapi.controllers.routers import router
+from entrypoint.presentation.fastapi.controllers.tags import Tag
+from entrypoint.presentation.fastapi.views.responses.bad.fault import (
+    fault_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_session_id_hex import (  # noqa: E501
+    invalid_session_id_hex_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.not_authenticated import (  # noqa: E501
+    not_authenticated_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    to_doc,
+)
+
+
+_media_types: dict[aqua.HistoryFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+_ok_doc: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "content": {media_type: {} for media_type in _media_types.values()}
+    }
+}
+
+
+@router.get(
+    "/user/history",
+    tags=[Tag.current_user_endpoints],
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses=to_doc(
+        fault_response_model,
+        not_authenticated_response_model,
+        invalid_session_id_hex_response_model,
+    )
+    | _ok_doc,
+)
+async def export_history(
+    session_id_hex: cookies.session_id_cookie,
+    format_: Annotated[aqua.HistoryFormat, Query(alias="format")] = "ndjson",
+) -> Response:
+    session_id = valid_id_of(session_id_hex)
+
+    if session_id is None:
+        return invalid_session_id_hex_response_model.to_response()
+
+    result = await service(session_id, format_)
+
+    if result == "error":
+        return fault_response_model.to_response()
+
+    if result == "not_authenticated":
+        return not_authenticated_response_model.to_response()
+
+    file_name = f"history.{format_}"
+
+    return StreamingResponse(
+        result.aqua_output,
+        media_type=_media_types[format_],
+        headers={"Content-Disposition": f'attachment; filename="{file_name}"'},
+    )
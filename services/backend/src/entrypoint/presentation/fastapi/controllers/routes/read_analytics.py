@@ -0,0 +1,65 @@
+from fastapi import Response
+
+from entrypoint.logic.services.read_analytics import read_analytics as service
+from entrypoint.presentation.fastapi.controllers import cookies
+from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
+from entrypoint.presentation.fastapi.controllers.routers import router
+from entrypoint.presentation.fastapi.controllers.tags import Tag
+from entrypoint.presentation.fastapi.views.responses.bad.fault import (
+    fault_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_session_id_hex import (  # noqa: E501
+    invalid_session_id_hex_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.not_authenticated import (  # noqa: E501
+    not_authenticated_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    to_doc,
+)
+from entrypoint.presentation.fastapi.views.responses.ok.user.analytics import (
+    AnalyticsSchema,
+    analytics_response_model,
+)
+
+
+@router.get(
+    "/user/analytics",
+    tags=[Tag.current_user_endpoints],
+    status_code=analytics_response_model.status_code,
+    responses=to_doc(
+        fault_response_model,
+        not_authenticated_response_model,
+        invalid_session_id_hex_response_model,
+        analytics_response_model,
+    ),
+)
+async def read_analytics(session_id_hex: cookies.session_id_cookie) -> Response:
+    session_id = valid_id_of(session_id_hex)
+
+    if session_id is None:
+        return invalid_session_id_hex_response_model.to_response()
+
+    result = await service(session_id)
+
+    if result == "error":
+        return fault_response_model.to_response()
+
+    if result == "not_authenticated":
+        return not_authenticated_response_model.to_response()
+
+    if result.aqua_output is None:
+        return fault_response_model.to_response()
+
+    aqua_output = result.aqua_output
+    body = AnalyticsSchema(
+        user_id=aqua_output.user_id,
+        date_=aqua_output.date_,
+        good_day_streak=aqua_output.good_day_streak,
+        average_milliliters_by_weekday=(
+            aqua_output.average_milliliters_by_weekday
+        ),
+        glass_percentile_milliliters=aqua_output.glass_percentile_milliliters,
+    )
+
+    return analytics_response_model.to_response(body)
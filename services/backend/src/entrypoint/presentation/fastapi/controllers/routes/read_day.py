@@ -42,13 +42,14 @@ from entrypoint.presentation.fastapi.views.responses.ok.day.day import (
 async def read_day(
     session_id_hex: cookies.session_id_cookie,
     date_: date,
+    causality_token: cookies.optional_causality_token_cookie = None,
 ) -> Response:
     session_id = valid_id_of(session_id_hex)
 
     if session_id is None:
         return invalid_session_id_hex_response_model.to_response()
 
-    result = await service(session_id, date_)
+    result = await service(session_id, date_, causality_token)
 
     if result == "error":
         return fault_response_model.to_response()
@@ -0,0 +1,99 @@
+from datetime import date
+from typing import Annotated, AsyncIterator
+
+from fastapi import Query, Response
+
+from entrypoint.infrastructure.facades.clients import aqua
+from entrypoint.logic.services.read_days import read_days as service
+from entrypoint.presentation.fastapi.controllers import cookies
+from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
+from entrypoint.presentation.fastapi.controllers.routers import router
+from entrypoint.presentation.fastapi.controllers.tags import Tag
+from entrypoint.presentation.fastapi.views.responses.bad.fault import (
+    fault_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_session_id_hex import (  # noqa: E501
+    invalid_session_id_hex_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.not_authenticated import (  # noqa: E501
+    not_authenticated_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.reversed_day_range import (  # noqa: E501
+    reversed_day_range_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.too_long_day_range import (  # noqa: E501
+    too_long_day_range_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    to_doc,
+)
+from entrypoint.presentation.fastapi.views.responses.common.record import (
+    RecordSchema,
+)
+from entrypoint.presentation.fastapi.views.responses.ok.day.day import (
+    DaySchema,
+)
+from entrypoint.presentation.fastapi.views.responses.ok.day.days import (
+    days_response_model,
+)
+
+
+@router.get(
+    "/user/days",
+    tags=[Tag.current_user_endpoints],
+    status_code=days_response_model.status_code,
+    responses=to_doc(
+        fault_response_model,
+        not_authenticated_response_model,
+        invalid_session_id_hex_response_model,
+        too_long_day_range_response_model,
+        reversed_day_range_response_model,
+        days_response_model,
+    ),
+)
+async def read_days(
+    session_id_hex: cookies.session_id_cookie,
+    from_: Annotated[date, Query(alias="from")],
+    to: date,
+    causality_token: cookies.optional_causality_token_cookie = None,
+) -> Response:
+    session_id = valid_id_of(session_id_hex)
+
+    if session_id is None:
+        return invalid_session_id_hex_response_model.to_response()
+
+    result = await service(session_id, from_, to, causality_token)
+
+    if result == "error":
+        return fault_response_model.to_response()
+
+    if result == "not_authenticated":
+        return not_authenticated_response_model.to_response()
+
+    if result == "too_long_range":
+        return too_long_day_range_response_model.to_response()
+
+    if result == "reversed_range":
+        return reversed_day_range_response_model.to_response()
+
+    return days_response_model.to_array_streaming_response(
+        _schemas_of(result.aqua_output)
+    )
+
+
+async def _schemas_of(
+    aqua_outputs: AsyncIterator[aqua.ReadDayOutputData],
+) -> AsyncIterator[DaySchema]:
+    async for aqua_output in aqua_outputs:
+        yield DaySchema(
+            user_id=aqua_output.user_id,
+            target_water_balance_milliliters=(
+                aqua_output.target_water_balance_milliliters
+            ),
+            date_=aqua_output.date_,
+            water_balance_milliliters=aqua_output.water_balance_milliliters,
+            result_code=aqua_output.result_code,
+            real_result_code=aqua_output.real_result_code,
+            is_result_pinned=aqua_output.is_result_pinned,
+            records=tuple(map(RecordSchema.of, aqua_output.records)),
+        )
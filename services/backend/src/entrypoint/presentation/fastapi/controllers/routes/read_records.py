@@ -0,0 +1,84 @@
+from typing import Annotated
+
+from fastapi import Query, Response
+
+from entrypoint.logic.services.read_records import read_records as service
+from entrypoint.presentation.fastapi.controllers import cookies
+from entrypoint.presentation.fastapi.controllers.parsers import valid_id_of
+from entrypoint.presentation.fastapi.controllers.routers import router
+from entrypoint.presentation.fastapi.controllers.tags import Tag
+from entrypoint.presentation.fastapi.views.responses.bad.fault import (
+    fault_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_cursor import (
+    invalid_cursor_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.invalid_session_id_hex import (  # noqa: E501
+    invalid_session_id_hex_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.not_authenticated import (  # noqa: E501
+    not_authenticated_response_model,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    to_doc,
+)
+from entrypoint.presentation.fastapi.views.responses.ok.record.records import (
+    RecordsPageItemSchema,
+    RecordsSchema,
+    records_response_model,
+)
+
+
+@router.get(
+    "/user/records",
+    tags=[Tag.current_user_endpoints],
+    status_code=records_response_model.status_code,
+    responses=to_doc(
+        fault_response_model,
+        not_authenticated_response_model,
+        invalid_session_id_hex_response_model,
+        invalid_cursor_response_model,
+        records_response_model,
+    ),
+)
+async def read_records(
+    session_id_hex: cookies.session_id_cookie,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    hide_cancelled: bool = False,
+    causality_token: cookies.optional_causality_token_cookie = None,
+) -> Response:
+    session_id = valid_id_of(session_id_hex)
+
+    if session_id is None:
+        return invalid_session_id_hex_response_model.to_response()
+
+    result = await service(
+        session_id,
+        cursor,
+        limit,
+        is_cancelled_hidden=hide_cancelled,
+        causality_token=causality_token,
+    )
+
+    if result == "error":
+        return fault_response_model.to_response()
+
+    if result == "not_authenticated":
+        return not_authenticated_response_model.to_response()
+
+    if result.aqua_output == "invalid_cursor":
+        return invalid_cursor_response_model.to_response()
+
+    if isinstance(result.aqua_output, str):
+        return fault_response_model.to_response()
+
+    body = RecordsSchema(
+        user_id=result.aqua_output.user_id,
+        records=tuple(
+            map(RecordsPageItemSchema.of, result.aqua_output.records)
+        ),
+        next_cursor=result.aqua_output.next_cursor,
+    )
+
+    return records_response_model.to_response(body)
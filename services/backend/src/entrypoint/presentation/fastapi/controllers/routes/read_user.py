@@ -39,13 +39,16 @@ from entrypoint.presentation.fastapi.views.responses.ok.user.user import (
         user_response_model,
     ),
 )
-async def read_user(session_id_hex: cookies.session_id_cookie) -> Response:
+async def read_user(
+    session_id_hex: cookies.session_id_cookie,
+    causality_token: cookies.optional_causality_token_cookie = None,
+) -> Response:
     session_id = valid_id_of(session_id_hex)
 
     if session_id is None:
         return invalid_session_id_hex_response_model.to_response()
 
-    result = await service(session_id)
+    result = await service(session_id, causality_token)
 
     if result == "error":
         return fault_response_model.to_response()
@@ -9,7 +9,13 @@ from entrypoint.presentation.fastapi.controllers.parsers import (
 )
 from entrypoint.presentation.fastapi.controllers.routers import router
 from entrypoint.presentation.fastapi.controllers.tags import Tag
-from entrypoint.presentation.fastapi.views.cookies import SessionCookie
+from entrypoint.presentation.fastapi.views.cookies import (
+    CausalityTokenCookie,
+    SessionCookie,
+)
+from entrypoint.presentation.fastapi.views.responses.bad.conflict import (
+    conflict_response_model,
+)
 from entrypoint.presentation.fastapi.views.responses.bad.empty_username import (
     empty_username_response_model,
 )
@@ -60,6 +66,7 @@ class RegisterUserRequestModel(BaseModel):
     status_code=registered_user_response_model.status_code,
     responses=to_doc(
         fault_response_model,
+        conflict_response_model,
         invalid_session_id_hex_response_model,
         invalid_water_amount_response_model,
         invalid_weight_amount_response_model,
@@ -71,7 +78,7 @@ class RegisterUserRequestModel(BaseModel):
         registered_user_response_model,
     ),
 )
-async def register_user(
+async def register_user(  # noqa: C901
     request_model: RegisterUserRequestModel,
     session_id_hex: cookies.optional_session_id_cookie = None,
 ) -> Response:
@@ -113,6 +120,9 @@ async def register_user(
     if result == "week_password":
         return week_password_response_model.to_response()
 
+    if result == "conflict":
+        return conflict_response_model.to_response()
+
     target = result.aqua_output.target_water_balance_milliliters
     body = RegisteredUserSchema(
         user_id=result.auth_output.user_id,
@@ -126,4 +136,7 @@ async def register_user(
     session_cookie = SessionCookie(response)
     session_cookie.set(result.auth_output.new_session_id)
 
+    causality_token_cookie = CausalityTokenCookie(response)
+    causality_token_cookie.set(result.aqua_output.causality_token)
+
     return response
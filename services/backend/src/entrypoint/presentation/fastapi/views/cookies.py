@@ -15,3 +15,16 @@ class SessionCookie:
 
     def delete(self) -> None:
         self.__response.delete_cookie(self.name, httponly=True)
+
+
+class CausalityTokenCookie:
+    name: ClassVar = "causality_token"
+
+    def __init__(self, response: Response) -> None:
+        self.__response = response
+
+    def set(self, causality_token: str | None) -> None:
+        if causality_token is not None:
+            self.__response.set_cookie(
+                self.name, causality_token, httponly=True
+            )
@@ -0,0 +1,19 @@
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.presentation.fastapi.views.responses.common.detail import (
+    Detail,
+    DetailPartSchema,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+
+
+class ConflictSchema(BaseModel):
+    detail: Detail = [DetailPartSchema(type="ConflictError", msg="")]
+
+
+conflict_response_model = ResponseModel(
+    ConflictSchema, status.HTTP_409_CONFLICT
+)
@@ -0,0 +1,24 @@
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.presentation.fastapi.views.responses.common.detail import (
+    Detail,
+    DetailPartSchema,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+
+
+class InvalidCursorSchema(BaseModel):
+    detail: Detail = [
+        DetailPartSchema(
+            type="InvalidCursorError",
+            msg="cursor must be a value of `next_cursor` from a previous page",
+        )
+    ]
+
+
+invalid_cursor_response_model = ResponseModel(
+    InvalidCursorSchema, status.HTTP_400_BAD_REQUEST
+)
@@ -0,0 +1,24 @@
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.presentation.fastapi.views.responses.common.detail import (
+    Detail,
+    DetailPartSchema,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+
+
+class InvalidRecordingTimeSchema(BaseModel):
+    detail: Detail = [
+        DetailPartSchema(
+            type="InvalidRecordingTimeError",
+            msg="recording time should be timezone-aware and not in the future",
+        )
+    ]
+
+
+invalid_recording_time_response_model = ResponseModel(
+    InvalidRecordingTimeSchema, status.HTTP_400_BAD_REQUEST
+)
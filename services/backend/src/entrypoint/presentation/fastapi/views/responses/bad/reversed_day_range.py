@@ -0,0 +1,24 @@
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.presentation.fastapi.views.responses.common.detail import (
+    Detail,
+    DetailPartSchema,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+
+
+class ReversedDayRangeSchema(BaseModel):
+    detail: Detail = [
+        DetailPartSchema(
+            type="ReversedDayRangeError",
+            msg="`to` should not be earlier than `from`",
+        )
+    ]
+
+
+reversed_day_range_response_model = ResponseModel(
+    ReversedDayRangeSchema, status.HTTP_400_BAD_REQUEST
+)
@@ -0,0 +1,24 @@
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.presentation.fastapi.views.responses.common.detail import (
+    Detail,
+    DetailPartSchema,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+
+
+class TooLongDayRangeSchema(BaseModel):
+    detail: Detail = [
+        DetailPartSchema(
+            type="TooLongDayRangeError",
+            msg="the range is longer than the maximum number of days",
+        )
+    ]
+
+
+too_long_day_range_response_model = ResponseModel(
+    TooLongDayRangeSchema, status.HTTP_400_BAD_REQUEST
+)
@@ -1,8 +1,17 @@
 from collections import defaultdict
-from typing import Any, Callable, Generic, Mapping, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Mapping,
+    TypeVar,
+    Union,
+)
 
 from fastapi import BackgroundTasks, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 
@@ -49,6 +58,36 @@ class ResponseModel(Generic[BaseModelT_co]):
 
         return self.__extended(response)
 
+    def to_array_streaming_response(
+        self,
+        item_models: AsyncIterable[BaseModel],
+        *,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTasks | None = None,
+    ) -> Response:
+        response = StreamingResponse(
+            _json_array_chunks_of(item_models),
+            self.__status_code,
+            headers,
+            "application/json",
+            background,
+        )
+
+        return self.__extended(response)
+
+
+async def _json_array_chunks_of(
+    item_models: AsyncIterable[BaseModel],
+) -> AsyncIterator[str]:
+    separator = "["
+
+    async for item_model in item_models:
+        yield separator
+        yield item_model.model_dump_json()
+        separator = ","
+
+    yield "[]" if separator == "[" else "]"
+
 
 def to_doc(*response_models: ResponseModel[BaseModel]) -> _Doc:
     body_types_by_status_code: dict[int, list[type[BaseModel]]]
@@ -0,0 +1,16 @@
+from fastapi import status
+from pydantic import RootModel
+
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+from entrypoint.presentation.fastapi.views.responses.ok.day.day import (
+    DaySchema,
+)
+
+
+class DaysSchema(RootModel[tuple[DaySchema, ...]]):
+    root: tuple[DaySchema, ...] = ()
+
+
+days_response_model = ResponseModel(DaysSchema, status.HTTP_200_OK)
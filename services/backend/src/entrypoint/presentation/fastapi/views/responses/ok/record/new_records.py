@@ -0,0 +1,46 @@
+from datetime import date
+from uuid import UUID
+
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.infrastructure.facades.clients.aqua import DayData
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+from entrypoint.presentation.fastapi.views.responses.common.record import (
+    RecordSchema,
+)
+
+
+class NewRecordsDaySchema(BaseModel):
+    date_: date
+    target_water_balance_milliliters: int
+    water_balance_milliliters: int
+    result_code: int
+    real_result_code: int
+    is_result_pinned: bool
+
+    @classmethod
+    def of(cls, day_data: DayData) -> "NewRecordsDaySchema":
+        return NewRecordsDaySchema(
+            date_=day_data.date_,
+            target_water_balance_milliliters=(
+                day_data.target_water_balance_milliliters
+            ),
+            water_balance_milliliters=day_data.water_balance_milliliters,
+            result_code=day_data.result_code,
+            real_result_code=day_data.real_result_code,
+            is_result_pinned=day_data.is_result_pinned,
+        )
+
+
+class NewRecordsSchema(BaseModel):
+    user_id: UUID
+    days: tuple[NewRecordsDaySchema, ...]
+    new_records: tuple[RecordSchema, ...]
+
+
+new_records_response_model = ResponseModel(
+    NewRecordsSchema, status.HTTP_201_CREATED
+)
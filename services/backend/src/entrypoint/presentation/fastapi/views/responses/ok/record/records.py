@@ -0,0 +1,39 @@
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.infrastructure.facades.clients.aqua import (
+    ReadRecordsOutputData,
+)
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+
+
+class RecordsPageItemSchema(BaseModel):
+    record_id: UUID
+    drunk_water_milliliters: int
+    recording_time: datetime
+    is_cancelled: bool
+
+    @classmethod
+    def of(
+        cls, record_data: ReadRecordsOutputData.RecordData
+    ) -> "RecordsPageItemSchema":
+        return RecordsPageItemSchema(
+            record_id=record_data.record_id,
+            drunk_water_milliliters=record_data.drunk_water_milliliters,
+            recording_time=record_data.recording_time,
+            is_cancelled=record_data.is_cancelled,
+        )
+
+
+class RecordsSchema(BaseModel):
+    user_id: UUID
+    records: tuple[RecordsPageItemSchema, ...]
+    next_cursor: str | None
+
+
+records_response_model = ResponseModel(RecordsSchema, status.HTTP_200_OK)
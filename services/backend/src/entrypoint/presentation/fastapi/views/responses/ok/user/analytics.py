@@ -0,0 +1,20 @@
+from datetime import date
+from uuid import UUID
+
+from fastapi import status
+from pydantic import BaseModel
+
+from entrypoint.presentation.fastapi.views.responses.common.model import (
+    ResponseModel,
+)
+
+
+class AnalyticsSchema(BaseModel):
+    user_id: UUID
+    date_: date
+    good_day_streak: int
+    average_milliliters_by_weekday: tuple[int, ...]
+    glass_percentile_milliliters: int | None
+
+
+analytics_response_model = ResponseModel(AnalyticsSchema, status.HTTP_200_OK)
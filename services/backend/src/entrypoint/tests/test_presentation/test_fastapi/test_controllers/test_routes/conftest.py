@@ -1,8 +1,11 @@
+from contextlib import asynccontextmanager
 from typing import AsyncIterator
+from uuid import UUID
 
 from httpx import ASGITransport, AsyncClient
-from pytest import fixture
+from pytest import MonkeyPatch, fixture
 
+from entrypoint.infrastructure.facades.clients import auth
 from entrypoint.presentation.fastapi.app import app
 
 
@@ -14,3 +17,25 @@ async def client() -> AsyncIterator[AsyncClient]:
 
     async with client_:
         yield client_
+
+
+@fixture
+def authenticated_user_id(monkeypatch: MonkeyPatch) -> UUID:
+    user_id = UUID(int=1)
+
+    @asynccontextmanager
+    async def authenticate_user(  # noqa: RUF029
+        session_id: UUID,
+    ) -> AsyncIterator[auth.AuthenticateUserOutputData]:
+        yield auth.AuthenticateUserOutputData(
+            user_id=user_id, session_id=session_id
+        )
+
+    monkeypatch.setattr(auth, "authenticate_user", authenticate_user)
+
+    return user_id
+
+
+@fixture
+def session_cookies() -> dict[str, str]:
+    return {"session_id": UUID(int=2).hex}
@@ -0,0 +1,78 @@
+from uuid import UUID
+
+from httpx import AsyncClient
+from pytest import MonkeyPatch, mark
+
+from aqua.application.ports.mappers import ArchivedDayError, ConflictError
+from aqua.infrastructure.periphery import envs
+from aqua.presentation.periphery.facade import write_water
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_exhausted_retries(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,  # noqa: ARG001
+    session_cookies: dict[str, str],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    async def output_of_write(  # noqa: RUF029
+        user_id: UUID,  # noqa: ARG001
+        milliliters: int | None,  # noqa: ARG001
+    ) -> write_water.Output:
+        raise ConflictError
+
+    monkeypatch.setattr(envs, "water_writing_coalescing_window_seconds", 0)
+    monkeypatch.setattr(write_water, "_output_of_write", output_of_write)
+
+    client.cookies.update(session_cookies)
+    response = await client.post(
+        "/api/0.1v/user/records", json={"water_milliliters": 200}
+    )
+
+    if stage == "json":
+        assert response.json() == {
+            "detail": [{"type": "ConflictError", "msg": ""}]
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 409
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_archived_day(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,  # noqa: ARG001
+    session_cookies: dict[str, str],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    async def output_of_write(  # noqa: RUF029
+        user_id: UUID,  # noqa: ARG001
+        milliliters: int | None,  # noqa: ARG001
+    ) -> write_water.Output:
+        raise ArchivedDayError
+
+    monkeypatch.setattr(envs, "water_writing_coalescing_window_seconds", 0)
+    monkeypatch.setattr(write_water, "_output_of_write", output_of_write)
+
+    client.cookies.update(session_cookies)
+    response = await client.post(
+        "/api/0.1v/user/records", json={"water_milliliters": 200}
+    )
+
+    if stage == "json":
+        assert response.json() == {
+            "detail": [
+                {
+                    "type": "InvalidRecordingTimeError",
+                    "msg": (
+                        "recording time should be timezone-aware and not "
+                        "in the future"
+                    ),
+                }
+            ]
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 400
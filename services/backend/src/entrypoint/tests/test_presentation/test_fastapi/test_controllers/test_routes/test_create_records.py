@@ -0,0 +1,154 @@
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import AsyncIterator, Iterable
+from uuid import UUID
+
+from httpx import AsyncClient
+from pytest import MonkeyPatch, mark
+
+from aqua.presentation.periphery.facade import write_water_batch
+
+
+@mark.parametrize("stage", ("json", "status_code", "cookies"))
+async def test_with_valid_records(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,
+    session_cookies: dict[str, str],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    @asynccontextmanager
+    async def perform(  # noqa: RUF029
+        user_id: UUID, inputs: Iterable[write_water_batch.Input]
+    ) -> AsyncIterator[write_water_batch.Output]:
+        yield write_water_batch.Output(
+            user_id=user_id,
+            days=(
+                write_water_batch.DayData(
+                    date_=date(2000, 1, 1),
+                    target_water_balance_milliliters=2000,
+                    water_balance_milliliters=sum(
+                        input_.milliliters for input_ in inputs
+                    ),
+                    result_code=1,
+                    real_result_code=1,
+                    is_result_pinned=False,
+                ),
+            ),
+            new_records=tuple(
+                write_water_batch.RecordData(
+                    record_id=UUID(int=record_number + 3),
+                    drunk_water_milliliters=input_.milliliters,
+                    recording_time=input_.recording_time,
+                )
+                for record_number, input_ in enumerate(inputs)
+            ),
+            causality_token="token",  # noqa: S106
+        )
+
+    monkeypatch.setattr(write_water_batch, "perform", perform)
+
+    client.cookies.update(session_cookies)
+    response = await client.post(
+        "/api/0.1v/user/records/batch",
+        json={
+            "records": [
+                {
+                    "water_milliliters": 200,
+                    "recording_time": "2000-01-01T08:00:00Z",
+                },
+                {
+                    "water_milliliters": 300,
+                    "recording_time": "2000-01-01T12:00:00Z",
+                },
+            ]
+        },
+    )
+
+    if stage == "json":
+        assert response.json() == {
+            "user_id": str(authenticated_user_id),
+            "days": [
+                {
+                    "date_": "2000-01-01",
+                    "target_water_balance_milliliters": 2000,
+                    "water_balance_milliliters": 500,
+                    "result_code": 1,
+                    "real_result_code": 1,
+                    "is_result_pinned": False,
+                }
+            ],
+            "new_records": [
+                {
+                    "record_id": str(UUID(int=3)),
+                    "drunk_water_milliliters": 200,
+                    "recording_time": "2000-01-01T08:00:00Z",
+                },
+                {
+                    "record_id": str(UUID(int=4)),
+                    "drunk_water_milliliters": 300,
+                    "recording_time": "2000-01-01T12:00:00Z",
+                },
+            ],
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 201
+
+    if stage == "cookies":
+        assert response.cookies["causality_token"] == "token"  # noqa: S105
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_recording_time_without_timezone(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,  # noqa: ARG001
+    session_cookies: dict[str, str],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    @asynccontextmanager
+    async def perform(  # noqa: RUF029
+        user_id: UUID,  # noqa: ARG001
+        inputs: Iterable[write_water_batch.Input],
+    ) -> AsyncIterator[write_water_batch.Output]:
+        if any(input_.recording_time.tzinfo is None for input_ in inputs):
+            raise write_water_batch.IncorrectRecordingTimeError
+
+        yield write_water_batch.Output(
+            user_id=UUID(int=1),
+            days=(),
+            new_records=(),
+            causality_token=None,
+        )
+
+    monkeypatch.setattr(write_water_batch, "perform", perform)
+
+    client.cookies.update(session_cookies)
+    response = await client.post(
+        "/api/0.1v/user/records/batch",
+        json={
+            "records": [
+                {
+                    "water_milliliters": 200,
+                    "recording_time": "2000-01-01T08:00:00",
+                }
+            ]
+        },
+    )
+
+    if stage == "json":
+        assert response.json() == {
+            "detail": [
+                {
+                    "type": "InvalidRecordingTimeError",
+                    "msg": (
+                        "recording time should be timezone-aware and not "
+                        "in the future"
+                    ),
+                }
+            ]
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 400
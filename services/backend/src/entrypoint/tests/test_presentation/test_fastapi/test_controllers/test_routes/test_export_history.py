@@ -0,0 +1,66 @@
+from typing import AsyncIterator
+from uuid import UUID
+
+from httpx import AsyncClient
+from pytest import MonkeyPatch, mark
+
+from aqua.presentation.periphery.facade import export_history
+
+
+@mark.parametrize("stage", ("text", "headers", "status_code"))
+async def test_with_csv_format(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,  # noqa: ARG001
+    session_cookies: dict[str, str],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    async def perform(  # noqa: RUF029
+        user_id: UUID,  # noqa: ARG001
+        format_: export_history.Format,
+    ) -> AsyncIterator[str]:
+        yield f"{format_}\n"
+        yield "line\n"
+
+    monkeypatch.setattr(export_history, "perform", perform)
+
+    client.cookies.update(session_cookies)
+    response = await client.get(
+        "/api/0.1v/user/history", params={"format": "csv"}
+    )
+
+    if stage == "text":
+        assert response.text == "csv\nline\n"
+
+    if stage == "headers":
+        assert response.headers["content-type"].startswith("text/csv")
+        assert response.headers["content-disposition"] == (
+            'attachment; filename="history.csv"'
+        )
+
+    if stage == "status_code":
+        assert response.status_code == 200
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_invalid_session_id_hex(
+    stage: str, client: AsyncClient
+) -> None:
+    client.cookies.update({"session_id": "invalid"})
+    response = await client.get("/api/0.1v/user/history")
+
+    if stage == "json":
+        assert response.json() == {
+            "detail": [
+                {
+                    "type": "InvalidSessionIDHEXError",
+                    "msg": (
+                        "session id hex must be a 32-character hexadecimal "
+                        "string"
+                    ),
+                }
+            ]
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 400
@@ -0,0 +1,70 @@
+from datetime import date
+from uuid import UUID
+
+from httpx import AsyncClient
+from pytest import MonkeyPatch, mark
+
+from aqua.presentation.periphery.facade import read_analytics
+
+
+class ReadingError(Exception): ...
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_history(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,
+    session_cookies: dict[str, str],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    async def perform(user_id: UUID) -> read_analytics.Output:  # noqa: RUF029
+        return read_analytics.Output(
+            user_id=user_id,
+            date_=date(2000, 1, 7),
+            good_day_streak=3,
+            average_milliliters_by_weekday=(2000, 0, 0, 0, 0, 1500, 0),
+            glass_percentile_milliliters=300,
+        )
+
+    monkeypatch.setattr(read_analytics, "perform", perform)
+
+    client.cookies.update(session_cookies)
+    response = await client.get("/api/0.1v/user/analytics")
+
+    if stage == "json":
+        assert response.json() == {
+            "user_id": str(authenticated_user_id),
+            "date_": "2000-01-07",
+            "good_day_streak": 3,
+            "average_milliliters_by_weekday": [2000, 0, 0, 0, 0, 1500, 0],
+            "glass_percentile_milliliters": 300,
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 200
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_unavailable_storage(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,  # noqa: ARG001
+    session_cookies: dict[str, str],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    async def perform(user_id: UUID) -> read_analytics.Output:  # noqa: ARG001, RUF029
+        raise ReadingError
+
+    monkeypatch.setattr(read_analytics, "perform", perform)
+
+    client.cookies.update(session_cookies)
+    response = await client.get("/api/0.1v/user/analytics")
+
+    if stage == "json":
+        assert response.json() == {
+            "detail": [{"type": "InternalError", "msg": "service unavailable"}]
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 500
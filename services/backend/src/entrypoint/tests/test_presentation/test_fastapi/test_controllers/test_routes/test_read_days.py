@@ -0,0 +1,124 @@
+from datetime import UTC, date, datetime
+from typing import AsyncIterator
+from uuid import UUID
+
+from httpx import AsyncClient
+from pytest import MonkeyPatch, mark
+
+from aqua.presentation.periphery.facade import read_days
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_valid_range(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,
+    session_cookies: dict[str, str],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    async def outputs_of(  # noqa: RUF029
+        user_id: UUID,
+        from_: date,
+        to: date,  # noqa: ARG001
+        causality_token: str | None,  # noqa: ARG001
+    ) -> AsyncIterator[read_days.Output]:
+        yield read_days.Output(
+            user_id=user_id,
+            target_water_balance_milliliters=2000,
+            date_=from_,
+            water_balance_milliliters=200,
+            result_code=1,
+            real_result_code=1,
+            is_result_pinned=False,
+            records=(
+                read_days.RecordData(
+                    record_id=UUID(int=3),
+                    drunk_water_milliliters=200,
+                    recording_time=datetime(2000, 1, 1, 12, tzinfo=UTC),
+                ),
+            ),
+        )
+
+    monkeypatch.setattr(read_days, "_outputs_of", outputs_of)
+
+    client.cookies.update(session_cookies)
+    response = await client.get(
+        "/api/0.1v/user/days", params={"from": "2000-01-01", "to": "2000-01-07"}
+    )
+
+    if stage == "json":
+        assert response.json() == [
+            {
+                "user_id": str(authenticated_user_id),
+                "target_water_balance_milliliters": 2000,
+                "date_": "2000-01-01",
+                "water_balance_milliliters": 200,
+                "result_code": 1,
+                "real_result_code": 1,
+                "is_result_pinned": False,
+                "records": [
+                    {
+                        "record_id": str(UUID(int=3)),
+                        "drunk_water_milliliters": 200,
+                        "recording_time": "2000-01-01T12:00:00Z",
+                    }
+                ],
+            }
+        ]
+
+    if stage == "status_code":
+        assert response.status_code == 200
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_too_long_range(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,  # noqa: ARG001
+    session_cookies: dict[str, str],
+) -> None:
+    client.cookies.update(session_cookies)
+    response = await client.get(
+        "/api/0.1v/user/days", params={"from": "2000-01-01", "to": "2002-01-01"}
+    )
+
+    if stage == "json":
+        assert response.json() == {
+            "detail": [
+                {
+                    "type": "TooLongDayRangeError",
+                    "msg": (
+                        "the range is longer than the maximum number of days"
+                    ),
+                }
+            ]
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 400
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_reversed_range(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,  # noqa: ARG001
+    session_cookies: dict[str, str],
+) -> None:
+    client.cookies.update(session_cookies)
+    response = await client.get(
+        "/api/0.1v/user/days", params={"from": "2000-01-07", "to": "2000-01-01"}
+    )
+
+    if stage == "json":
+        assert response.json() == {
+            "detail": [
+                {
+                    "type": "ReversedDayRangeError",
+                    "msg": "`to` should not be earlier than `from`",
+                }
+            ]
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 400
@@ -0,0 +1,88 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+from httpx import AsyncClient
+from pytest import MonkeyPatch, mark
+
+from aqua.presentation.periphery.facade import read_records
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_first_page(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,
+    session_cookies: dict[str, str],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    async def perform(  # noqa: RUF029
+        user_id: UUID,
+        cursor: str | None = None,  # noqa: ARG001
+        limit: int = 50,  # noqa: ARG001
+        *,
+        is_cancelled_hidden: bool = False,  # noqa: ARG001
+        causality_token: str | None = None,  # noqa: ARG001
+    ) -> read_records.Output:
+        return read_records.Output(
+            user_id=user_id,
+            records=(
+                read_records.Output.RecordData(
+                    record_id=UUID(int=3),
+                    drunk_water_milliliters=200,
+                    recording_time=datetime(2000, 1, 1, 12, tzinfo=UTC),
+                    is_cancelled=True,
+                ),
+            ),
+            next_cursor="cursor",
+        )
+
+    monkeypatch.setattr(read_records, "perform", perform)
+
+    client.cookies.update(session_cookies)
+    response = await client.get("/api/0.1v/user/records", params={"limit": 1})
+
+    if stage == "json":
+        assert response.json() == {
+            "user_id": str(authenticated_user_id),
+            "records": [
+                {
+                    "record_id": str(UUID(int=3)),
+                    "drunk_water_milliliters": 200,
+                    "recording_time": "2000-01-01T12:00:00Z",
+                    "is_cancelled": True,
+                }
+            ],
+            "next_cursor": "cursor",
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 200
+
+
+@mark.parametrize("stage", ("json", "status_code"))
+async def test_with_invalid_cursor(
+    stage: str,
+    client: AsyncClient,
+    authenticated_user_id: UUID,  # noqa: ARG001
+    session_cookies: dict[str, str],
+) -> None:
+    client.cookies.update(session_cookies)
+    response = await client.get(
+        "/api/0.1v/user/records", params={"cursor": "invalid"}
+    )
+
+    if stage == "json":
+        assert response.json() == {
+            "detail": [
+                {
+                    "type": "InvalidCursorError",
+                    "msg": (
+                        "cursor must be a value of `next_cursor` from a "
+                        "previous page"
+                    ),
+                }
+            ]
+        }
+
+    if stage == "status_code":
+        assert response.status_code == 400